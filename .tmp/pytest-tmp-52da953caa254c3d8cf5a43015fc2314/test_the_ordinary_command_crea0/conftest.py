@@ -0,0 +1,35 @@
+
+import shutil
+import uuid
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent / ".tmp"
+PREFIX = "pytest-tmp-"
+
+
+def _new_basetemp():
+    ROOT.mkdir(parents=True, exist_ok=True)
+    return ROOT / f"{PREFIX}{uuid.uuid4().hex}"
+
+
+def _cleanup(keep):
+    if not ROOT.is_dir():
+        return
+    for candidate in ROOT.glob(f"{PREFIX}*"):
+        if candidate == keep:
+            continue
+        try:
+            shutil.rmtree(candidate)
+        except OSError:
+            continue
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.option.basetemp is not None:
+        return
+    run_dir = _new_basetemp()
+    config.option.basetemp = str(run_dir)
+    _cleanup(keep=run_dir)
@@ -0,0 +1,9 @@
+
+def test_uses_tmp_path(tmp_path):
+    # tmp_path is "<basetemp>/<this test's numbered dir>" — printing
+    # its parent reports the basetemp pytest_configure() actually
+    # picked, without needing to parse pytest's own -v/--basetemp
+    # banner output.
+    print("BASETEMP_MARKER:" + str(tmp_path.parent))
+    (tmp_path / "marker.txt").write_text("hi")
+    assert (tmp_path / "marker.txt").exists()
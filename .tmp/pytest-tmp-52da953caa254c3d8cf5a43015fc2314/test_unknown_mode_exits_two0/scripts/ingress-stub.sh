@@ -0,0 +1,5 @@
+#!/usr/bin/env bash
+case "$1" in
+  open) exit "${STUB_OPEN_EXIT:-0}" ;;
+  close) exit "${STUB_CLOSE_EXIT:-0}" ;;
+esac
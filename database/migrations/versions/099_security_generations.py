@@ -0,0 +1,282 @@
+"""Per-campaign security generation counter for cached access resolution
+
+Revision ID: 099_security_generations
+Revises: 098_ai_domain_fk_indexes
+Create Date: 2026-08-21 09:00:00.000000
+
+Purpose:
+    `dnd_ai.api.access.require_campaign_capability` runs
+    `dnd_ai.domain.access.resolve_access_context` — five `security.*`
+    queries — on every campaign-scoped request, even though the answer
+    changes only when a GM edits memberships, roles, relationships, or
+    grants, or when one of those rows reaches its own `expires_at`.
+    `dnd_ai.api.access_cache.AccessContextCache` now caches a resolved
+    `AccessContext` per (user, campaign) across requests; this migration
+    gives that cache something authoritative to invalidate against. Every
+    write to a row `resolve_access_context` reads bumps a per-campaign
+    counter in the *same transaction* as the write itself, so a cached
+    entry tagged with an older generation is never served once the change
+    that superseded it has committed — no application-side invalidation
+    hook for a future writer to forget (including one that writes these
+    tables outside the API entirely, e.g. a support script or a future
+    migration's data fix).
+
+Forward migration:
+    `security.campaign_security_generations` — one row per campaign
+    (`campaign_id` PK, `ON DELETE CASCADE` with the campaign itself),
+    `generation BIGINT NOT NULL DEFAULT 1`, `updated_at` (maintained by
+    the shared `core.set_updated_at()`, conventions §10.4). Backfilled with
+    one row per existing campaign; `tr_campaigns_create_security_generation`
+    (`AFTER INSERT ON campaign.campaigns`) creates the row for every new
+    one.
+
+    `security.bump_campaign_security_generation()` — a row-level `AFTER
+    INSERT OR UPDATE OR DELETE` trigger function parameterized by
+    `TG_ARGV[0]`, the name of the column on the firing row that identifies
+    its campaign: `campaign_id` directly (`security.campaign_memberships`,
+    `security.campaign_invitations`, `security.resource_grants`) or
+    `campaign_membership_id`, resolved through `security.
+    campaign_memberships` (`security.membership_roles`, `security.
+    membership_character_relationships`, `security.access_group_
+    memberships`). Both OLD and NEW are bumped on UPDATE, so a row moved
+    between memberships (never done by any command today, but not
+    forbidden either) invalidates both sides. `security.
+    campaign_invitations` does not itself feed `resolve_access_context`;
+    it is covered anyway because accepting one is exactly when a brand-new
+    membership becomes resolvable, and a bumped generation there costs one
+    UPDATE on a table no request path writes frequently.
+
+    `security.bump_all_campaign_security_generations()` — a
+    statement-level trigger function for the shared lookup/template tables
+    every campaign's resolution also depends on (`security.roles`,
+    `security.role_capabilities`, `security.capabilities`, `security.
+    membership_statuses`, `security.character_relationship_type_
+    capabilities`). No application command writes these today — they are
+    seeded by migrations — so bumping every campaign's row on such a write
+    is the honest, simple answer rather than working out which campaigns a
+    system-template role change actually reaches.
+
+Rollback:
+    Supported. Drops every trigger, both trigger functions, the campaign
+    insert trigger/function, and the table, in reverse order. The
+    application's access cache keys its validity off this table; a
+    downgraded schema must be paired with an application build that
+    predates it (or runs with `DND_AI_ACCESS_CONTEXT_CACHE_MAX_ENTRIES=0`).
+
+Data implications:
+    Backfills one `generation = 1` row per existing `campaign.campaigns`
+    row. No existing data changes. Counters only ever increase; their
+    absolute value carries no meaning beyond "different from the one a
+    cache entry was resolved at."
+
+Locking considerations:
+    `CREATE TABLE` plus a backfill from `campaign.campaigns` (one row per
+    campaign — a small table). `CREATE TRIGGER` takes a `SHARE ROW
+    EXCLUSIVE` lock on each security table it attaches to, briefly.
+
+    At runtime every security write now also `UPDATE`s its campaign's
+    generation row, so two concurrent transactions writing security rows
+    for the *same* campaign serialize on that row until the first commits.
+    Security edits are GM-driven and rare relative to reads; that
+    serialization is the price of the counter being transactionally exact.
+    A statement-level bump from the shared tables locks every campaign's
+    row — acceptable only because those tables are migration-seeded.
+
+See: database/migrations/versions/080_security_identity_and_access.py
+     (every table these triggers attach to)
+     src/dnd_ai/domain/access.py (resolve_access_context — the reader
+     whose inputs this counter summarizes; read_campaign_security_
+     generation)
+     src/dnd_ai/api/access_cache.py (AccessContextCache — the only
+     consumer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "099_security_generations"
+down_revision = "098_ai_domain_fk_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, column identifying the firing row's campaign) for the row-level
+# bump trigger — see the module docstring's "Forward migration" section.
+_CAMPAIGN_SCOPED_TABLES = (
+    ("campaign_memberships", "campaign_id"),
+    ("campaign_invitations", "campaign_id"),
+    ("resource_grants", "campaign_id"),
+    ("membership_roles", "campaign_membership_id"),
+    ("membership_character_relationships", "campaign_membership_id"),
+    ("access_group_memberships", "campaign_membership_id"),
+)
+
+_SHARED_TABLES = (
+    "roles",
+    "role_capabilities",
+    "capabilities",
+    "membership_statuses",
+    "character_relationship_type_capabilities",
+)
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        CREATE TABLE security.campaign_security_generations (
+            campaign_id  UUID PRIMARY KEY
+                            REFERENCES campaign.campaigns(campaign_id) ON DELETE CASCADE,
+            generation   BIGINT NOT NULL DEFAULT 1,
+            updated_at   TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+    """)
+    op.execute("""
+        COMMENT ON TABLE security.campaign_security_generations IS
+        'One monotonically increasing counter per campaign, bumped by trigger in '
+        'the same transaction as any write to a security row that '
+        'dnd_ai.domain.access.resolve_access_context reads for that campaign. '
+        'The invalidation key for the API layer''s cross-request AccessContext '
+        'cache — never an authorization input in its own right.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN security.campaign_security_generations.generation IS
+        'Incremented on every write to the campaign''s memberships, invitations, '
+        'role assignments, character relationships, access-group memberships, '
+        'or resource grants, and on every write to the shared role/capability '
+        'lookup tables. Only equality with a previously read value is meaningful.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_campaign_security_generations_set_updated_at
+        BEFORE UPDATE ON security.campaign_security_generations
+        FOR EACH ROW EXECUTE FUNCTION core.set_updated_at();
+    """)
+    op.execute("""
+        INSERT INTO security.campaign_security_generations (campaign_id)
+        SELECT campaign_id FROM campaign.campaigns;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION security.create_campaign_security_generation()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            INSERT INTO security.campaign_security_generations (campaign_id)
+            VALUES (NEW.campaign_id);
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION security.create_campaign_security_generation() IS
+        'Creates the security.campaign_security_generations row for a new '
+        'campaign.campaigns row, so every campaign always has a counter to bump.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_campaigns_create_security_generation
+        AFTER INSERT ON campaign.campaigns
+        FOR EACH ROW EXECUTE FUNCTION security.create_campaign_security_generation();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION security.bump_campaign_security_generation()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            v_key_column  TEXT := TG_ARGV[0];
+            v_keys        UUID[] := ARRAY[]::UUID[];
+        BEGIN
+            IF TG_OP <> 'DELETE' THEN
+                v_keys := v_keys || (to_jsonb(NEW) ->> v_key_column)::UUID;
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                v_keys := v_keys || (to_jsonb(OLD) ->> v_key_column)::UUID;
+            END IF;
+
+            IF v_key_column = 'campaign_membership_id' THEN
+                UPDATE security.campaign_security_generations g
+                SET generation = g.generation + 1
+                WHERE g.campaign_id IN (
+                    SELECT cm.campaign_id
+                    FROM security.campaign_memberships cm
+                    WHERE cm.campaign_membership_id = ANY (v_keys)
+                );
+            ELSE
+                UPDATE security.campaign_security_generations g
+                SET generation = g.generation + 1
+                WHERE g.campaign_id = ANY (v_keys);
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION security.bump_campaign_security_generation() IS
+        'Row-level AFTER trigger: bumps security.campaign_security_generations for '
+        'the campaign named by the firing row''s TG_ARGV[0] column — campaign_id '
+        'directly, or campaign_membership_id resolved through '
+        'security.campaign_memberships. Bumps both OLD and NEW on UPDATE.';
+    """)
+    for table, key_column in _CAMPAIGN_SCOPED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER tr_{table}_bump_security_generation
+            AFTER INSERT OR UPDATE OR DELETE ON security.{table}
+            FOR EACH ROW
+            EXECUTE FUNCTION security.bump_campaign_security_generation('{key_column}');
+        """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION security.bump_all_campaign_security_generations()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE security.campaign_security_generations
+            SET generation = generation + 1;
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION security.bump_all_campaign_security_generations() IS
+        'Statement-level AFTER trigger for the shared role/capability/status '
+        'lookup tables every campaign''s access resolution depends on: bumps '
+        'every campaign''s security generation. Those tables are seeded by '
+        'migrations, not written by application commands.';
+    """)
+    for table in _SHARED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER tr_{table}_bump_security_generations
+            AFTER INSERT OR UPDATE OR DELETE ON security.{table}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION security.bump_all_campaign_security_generations();
+        """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    for table in reversed(_SHARED_TABLES):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS tr_{table}_bump_security_generations ON security.{table};"
+        )
+    op.execute("DROP FUNCTION IF EXISTS security.bump_all_campaign_security_generations();")
+
+    for table, _key_column in reversed(_CAMPAIGN_SCOPED_TABLES):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS tr_{table}_bump_security_generation ON security.{table};"
+        )
+    op.execute("DROP FUNCTION IF EXISTS security.bump_campaign_security_generation();")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_campaigns_create_security_generation ON campaign.campaigns;"
+    )
+    op.execute("DROP FUNCTION IF EXISTS security.create_campaign_security_generation();")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_campaign_security_generations_set_updated_at "
+        "ON security.campaign_security_generations;"
+    )
+    op.execute("DROP TABLE IF EXISTS security.campaign_security_generations;")
@@ -0,0 +1,164 @@
+"""Per-system credential generation for cached Foundry-adapter authentication
+
+Revision ID: 100_foundry_key_generation
+Revises: 099_security_generations
+Create Date: 2026-08-22 09:00:00.000000
+
+Purpose:
+    `dnd_ai.domain.access.resolve_foundry_system_principal` rehashes the
+    presented key and joins `integration.external_systems`, `security.
+    users`, and `core.lifecycle_statuses` on every Foundry-adapter request
+    — the highest-volume client during combat — although the answer only
+    changes when a key is rotated, a system is deactivated or rebound, or
+    the bound user's lifecycle status changes.
+    `dnd_ai.api.foundry_principal_cache.FoundryPrincipalCache` now caches
+    a resolved principal per (external system, key hash); this migration
+    gives it a counter to invalidate against, bumped in the *same
+    transaction* as any of those changes, the same approach revision 099
+    takes for campaign access.
+
+Forward migration:
+    `integration.external_systems.credential_generation BIGINT NOT NULL
+    DEFAULT 1`.
+
+    `integration.bump_external_system_credential_generation()` — a
+    row-level `BEFORE UPDATE` trigger on `integration.external_systems`
+    that increments the row's own counter whenever `system_key_hash`
+    (`issue_foundry_system_key` rotation), `is_active`,
+    `system_key_principal_user_id` (including the FK's own `ON DELETE SET
+    NULL`), or `world_id` changes.
+
+    `integration.bump_principal_credential_generations()` — a row-level
+    `AFTER UPDATE OF lifecycle_status_id` trigger on `security.users` that
+    bumps every external system bound to that user.
+
+    `core.lifecycle_statuses` itself (which `resolve_foundry_system_
+    principal` reads by `code`) gets no trigger, unlike revision 099's
+    shared security catalogs: it is a core catalog every lifecycle-bearing
+    table references, seeded by migrations and never written by
+    application commands, and the cache's own TTL already bounds how long
+    a change there could go unseen.
+
+Rollback:
+    Supported. Drops both triggers, their functions, and the column.
+    A downgraded schema must be paired with an application build that
+    predates the cache (or runs with
+    `DND_AI_FOUNDRY_PRINCIPAL_CACHE_MAX_ENTRIES=0`).
+
+Data implications:
+    Existing rows take the column default. Counters only ever increase;
+    only equality with a previously read value is meaningful.
+
+Locking considerations:
+    `ADD COLUMN ... DEFAULT 1` is metadata-only on PostgreSQL 11+; it and
+    each `CREATE TRIGGER` take a brief `ACCESS EXCLUSIVE`/`SHARE ROW
+    EXCLUSIVE` lock on a small table. At runtime a user lifecycle change
+    also updates that user's bound external systems (normally zero or
+    one row).
+
+See: database/migrations/versions/092_foundry_key_principal.py
+     (system_key_principal_user_id)
+     database/migrations/versions/099_security_generations.py (the
+     campaign-access counterpart of this counter)
+     src/dnd_ai/domain/access.py (resolve_foundry_system_principal,
+     read_foundry_credential_generation)
+     src/dnd_ai/api/foundry_principal_cache.py (the only consumer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "100_foundry_key_generation"
+down_revision = "099_security_generations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        ALTER TABLE integration.external_systems
+        ADD COLUMN credential_generation BIGINT NOT NULL DEFAULT 1;
+    """)
+    op.execute("""
+        COMMENT ON COLUMN integration.external_systems.credential_generation IS
+        'Incremented whenever this row''s system_key_hash, is_active, '
+        'system_key_principal_user_id, or world_id changes, or the bound user''s '
+        'lifecycle status changes. The invalidation key for the API layer''s '
+        'cached Foundry-adapter principals; only equality with a previously read '
+        'value is meaningful.';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION integration.bump_external_system_credential_generation()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF NEW.system_key_hash IS DISTINCT FROM OLD.system_key_hash
+               OR NEW.is_active IS DISTINCT FROM OLD.is_active
+               OR NEW.system_key_principal_user_id IS DISTINCT FROM OLD.system_key_principal_user_id
+               OR NEW.world_id IS DISTINCT FROM OLD.world_id
+            THEN
+                NEW.credential_generation := OLD.credential_generation + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION integration.bump_external_system_credential_generation() IS
+        'Row-level BEFORE UPDATE trigger on integration.external_systems: bumps '
+        'credential_generation when any column resolve_foundry_system_principal '
+        'reads from the row changes.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_external_systems_bump_credential_generation
+        BEFORE UPDATE ON integration.external_systems
+        FOR EACH ROW EXECUTE FUNCTION integration.bump_external_system_credential_generation();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION integration.bump_principal_credential_generations()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE integration.external_systems es
+            SET credential_generation = es.credential_generation + 1
+            WHERE es.system_key_principal_user_id = NEW.user_id;
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION integration.bump_principal_credential_generations() IS
+        'Row-level AFTER UPDATE trigger on security.users: bumps the credential '
+        'generation of every external system whose key is bound to a user whose '
+        'lifecycle status changed.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_users_bump_credential_generations
+        AFTER UPDATE OF lifecycle_status_id ON security.users
+        FOR EACH ROW
+        WHEN (OLD.lifecycle_status_id IS DISTINCT FROM NEW.lifecycle_status_id)
+        EXECUTE FUNCTION integration.bump_principal_credential_generations();
+    """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    op.execute("DROP TRIGGER IF EXISTS tr_users_bump_credential_generations ON security.users;")
+    op.execute("DROP FUNCTION IF EXISTS integration.bump_principal_credential_generations();")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_external_systems_bump_credential_generation "
+        "ON integration.external_systems;"
+    )
+    op.execute("DROP FUNCTION IF EXISTS integration.bump_external_system_credential_generation();")
+
+    op.execute(
+        "ALTER TABLE integration.external_systems DROP COLUMN IF EXISTS credential_generation;"
+    )
@@ -0,0 +1,94 @@
+"""Connect and first-byte timings for AI provider calls
+
+Revision ID: 101_ai_output_timings
+Revises: 100_foundry_key_generation
+Create Date: 2026-08-23 09:00:00.000000
+
+Purpose:
+    `ai.generated_outputs.latency_ms` records only a provider call's total
+    wall-clock time, which cannot tell a slow handshake from a slow model.
+    `dnd_ai.domain.ai_provider` now sends every call through a pooled,
+    keep-alive HTTP client and times each phase from the transport's own
+    trace events; this migration gives those figures somewhere to land.
+
+Forward migration:
+    `ai.generated_outputs.connect_ms INTEGER` — time until a usable
+    connection (0 when a pooled connection was reused).
+
+    `ai.generated_outputs.first_byte_ms INTEGER` — time until the
+    response headers arrived.
+
+    Both nullable, each with a non-negative CHECK matching
+    `ck_generated_outputs_latency_nonnegative`. `latency_ms` keeps its
+    meaning (the whole call) and gains a column comment saying so.
+
+Rollback:
+    Supported. Drops both columns and `latency_ms`'s comment.
+
+Data implications:
+    Existing rows read NULL for both new columns, as do rows from a call
+    whose transport reports no trace events or that failed before
+    connecting.
+
+Locking considerations:
+    `ADD COLUMN` without a default and `ADD CONSTRAINT ... CHECK` over an
+    all-NULL column are brief `ACCESS EXCLUSIVE` locks on
+    `ai.generated_outputs`; the CHECK validation scan is cheap because
+    every existing value is NULL.
+
+See: database/migrations/versions/093_ai_domain.py (ai.generated_outputs)
+     src/dnd_ai/domain/ai_provider.py (_CallTimer)
+     src/dnd_ai/commands/ai_npc.py, src/dnd_ai/commands/ai_synthesis.py
+     (the only writers)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "101_ai_output_timings"
+down_revision = "100_foundry_key_generation"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.generated_outputs
+            ADD COLUMN connect_ms INTEGER,
+            ADD COLUMN first_byte_ms INTEGER,
+            ADD CONSTRAINT ck_generated_outputs_connect_nonnegative
+                CHECK (connect_ms IS NULL OR connect_ms >= 0),
+            ADD CONSTRAINT ck_generated_outputs_first_byte_nonnegative
+                CHECK (first_byte_ms IS NULL OR first_byte_ms >= 0);
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.generated_outputs.latency_ms IS
+        'Total wall-clock time of the provider call, including connecting and '
+        'reading the whole response.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.generated_outputs.connect_ms IS
+        'Time until the provider call had a usable connection; 0 when a pooled '
+        'keep-alive connection was reused. NULL when the transport reported no '
+        'connection events.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.generated_outputs.first_byte_ms IS
+        'Time until the provider''s response headers arrived. NULL when the call '
+        'failed first or the transport reported no response events.';
+    """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    op.execute("COMMENT ON COLUMN ai.generated_outputs.latency_ms IS NULL;")
+    op.execute("""
+        ALTER TABLE ai.generated_outputs
+            DROP CONSTRAINT IF EXISTS ck_generated_outputs_first_byte_nonnegative,
+            DROP CONSTRAINT IF EXISTS ck_generated_outputs_connect_nonnegative,
+            DROP COLUMN IF EXISTS first_byte_ms,
+            DROP COLUMN IF EXISTS connect_ms;
+    """)
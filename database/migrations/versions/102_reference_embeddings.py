@@ -0,0 +1,181 @@
+"""Passage embeddings and hybrid-retrieval audit columns for the reference corpus
+
+Revision ID: 102_reference_embeddings
+Revises: 101_ai_output_timings
+Create Date: 2026-08-24 09:00:00.000000
+
+Purpose:
+    `dnd_ai.commands.reference_corpus` retrieval ranked only by
+    `ts_rank` over `content_tsv`, so a rules question worded differently
+    from the book ("can I attack twice" against "Extra Attack") could come
+    back empty. Retrieval gains an optional hybrid mode that fuses the
+    full-text ranking with a vector-similarity ranking (reciprocal-rank
+    fusion); this migration stores the passage vectors it needs and
+    widens the retrieval audit to record how each result was scored.
+
+Forward migration:
+    `ai.reference_passages.embedding REAL[]` and `.embedding_model TEXT` —
+    the passage's unit-length vector from a local embedder
+    (`dnd_ai.domain.embeddings`), computed at ingestion time, and the
+    identifier of the embedder that produced it. Both NULL or both set
+    (`ck_reference_passages_embedding_pair`), and the vector is always
+    one-dimensional (`ck_reference_passages_embedding_shape`).
+
+    `ai.reference_retrievals.retrieval_mode TEXT NOT NULL DEFAULT
+    'lexical'` ('lexical' | 'hybrid') and `.embedding_model TEXT` — set
+    iff the mode is 'hybrid' (`ck_reference_retrievals_mode_model`).
+
+    `ai.reference_retrieval_results.lexical_score REAL` and
+    `.vector_score REAL` — the two component scores behind a result's
+    `relevance_score`; either is NULL when the passage was not a candidate
+    on that side.
+
+    `ai.reference_passages`'s table comment drops "no embeddings".
+
+Rollback:
+    Supported. Drops every column and constraint added here and restores
+    the original table comment. Stored vectors and component scores are
+    lost; re-ingestion or a re-embed recomputes the vectors.
+
+Data implications:
+    Existing passages read NULL embeddings and are invisible to the vector
+    side of a hybrid query until re-embedded
+    (`dnd_ai.commands.reference_corpus.embed_reference_passages`); the
+    lexical side still finds them. Existing retrievals read
+    `retrieval_mode = 'lexical'`, and their results' `lexical_score` is
+    NULL (their `relevance_score` already is the lexical score).
+
+Locking considerations:
+    Each ALTER is a brief `ACCESS EXCLUSIVE` lock. No column has a
+    volatile default, so no table is rewritten; the new CHECKs validate
+    against columns that are all NULL (or all 'lexical'), which is a cheap
+    scan.
+
+Deliberate scoping decisions:
+    - A plain `REAL[]` column rather than pgvector's `vector` type: the
+      schema stays identical on every server whether or not the extension
+      is installed, and the similarity is computed in SQL over the
+      candidate sources only. pgvector (and an ANN index) can replace it
+      later without changing the commands' interface.
+    - No dimension CHECK: vectors of different embedders may differ in
+      length, and a query only ever compares vectors sharing its own
+      `embedding_model`.
+
+See: database/migrations/versions/094_reference_corpus.py (the tables)
+     src/dnd_ai/domain/embeddings.py
+     src/dnd_ai/commands/reference_corpus.py (_retrieve_cited_passages_impl)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "102_reference_embeddings"
+down_revision = "101_ai_output_timings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.reference_passages
+            ADD COLUMN embedding REAL[],
+            ADD COLUMN embedding_model TEXT,
+            ADD CONSTRAINT ck_reference_passages_embedding_pair
+                CHECK ((embedding IS NULL) = (embedding_model IS NULL)),
+            ADD CONSTRAINT ck_reference_passages_embedding_shape
+                CHECK (embedding IS NULL OR array_ndims(embedding) = 1);
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_passages.embedding IS
+        'Unit-length vector of content from a local embedder, computed at '
+        'ingestion; compared only against query vectors from the same '
+        'embedding_model. NULL when ingested without an embedder.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_passages.embedding_model IS
+        'Identifier of the embedder that produced embedding '
+        '(dnd_ai.domain.embeddings.PassageEmbedder.model_identifier).';
+    """)
+    op.execute("""
+        COMMENT ON TABLE ai.reference_passages IS
+        'One retrievable, citable chunk of a registered source document '
+        '(docs/PLAN.md §18.3): chapter/section/page_label carry citation '
+        'location, content_tsv is a generated, indexed tsvector column — '
+        'PostgreSQL-native full-text search — and embedding an optional '
+        'local-embedder vector for hybrid retrieval. passage_order is the '
+        'source''s own ordinal position, used for deterministic tie-breaking '
+        'and as a stable citation reference alongside chapter/section/page_label.';
+    """)
+
+    op.execute("""
+        ALTER TABLE ai.reference_retrievals
+            ADD COLUMN retrieval_mode TEXT NOT NULL DEFAULT 'lexical',
+            ADD COLUMN embedding_model TEXT,
+            ADD CONSTRAINT ck_reference_retrievals_mode
+                CHECK (retrieval_mode IN ('lexical', 'hybrid')),
+            ADD CONSTRAINT ck_reference_retrievals_mode_model
+                CHECK ((retrieval_mode = 'hybrid') = (embedding_model IS NOT NULL));
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_retrievals.retrieval_mode IS
+        '''lexical'' ranks by full-text relevance alone; ''hybrid'' fuses the '
+        'full-text and vector rankings by reciprocal-rank fusion.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_retrievals.embedding_model IS
+        'Embedder used for the query vector of a hybrid retrieval; NULL for '
+        'a lexical one.';
+    """)
+
+    op.execute("""
+        ALTER TABLE ai.reference_retrieval_results
+            ADD COLUMN lexical_score REAL,
+            ADD COLUMN vector_score REAL;
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_retrieval_results.lexical_score IS
+        'ts_rank of the passage against the query; NULL when the passage was '
+        'not a full-text candidate.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_retrieval_results.vector_score IS
+        'Cosine similarity of the passage and query vectors in a hybrid '
+        'retrieval; NULL for a lexical retrieval or a passage that was not a '
+        'vector candidate.';
+    """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.reference_retrieval_results
+            DROP COLUMN IF EXISTS vector_score,
+            DROP COLUMN IF EXISTS lexical_score;
+    """)
+    op.execute("""
+        ALTER TABLE ai.reference_retrievals
+            DROP CONSTRAINT IF EXISTS ck_reference_retrievals_mode_model,
+            DROP CONSTRAINT IF EXISTS ck_reference_retrievals_mode,
+            DROP COLUMN IF EXISTS embedding_model,
+            DROP COLUMN IF EXISTS retrieval_mode;
+    """)
+    op.execute("""
+        COMMENT ON TABLE ai.reference_passages IS
+        'One retrievable, citable chunk of a registered source document '
+        '(docs/PLAN.md §18.3): chapter/section/page_label carry citation '
+        'location, content_tsv is a generated, indexed tsvector column — '
+        'PostgreSQL-native full-text search, no embeddings or external '
+        'search service for this phase. passage_order is the source''s own '
+        'ordinal position, used for deterministic tie-breaking and as a '
+        'stable citation reference alongside chapter/section/page_label.';
+    """)
+    op.execute("""
+        ALTER TABLE ai.reference_passages
+            DROP CONSTRAINT IF EXISTS ck_reference_passages_embedding_shape,
+            DROP CONSTRAINT IF EXISTS ck_reference_passages_embedding_pair,
+            DROP COLUMN IF EXISTS embedding_model,
+            DROP COLUMN IF EXISTS embedding;
+    """)
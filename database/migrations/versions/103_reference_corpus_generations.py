@@ -0,0 +1,230 @@
+"""Per-ruleset-version reference-corpus generation for cached retrieval
+
+Revision ID: 103_corpus_generations
+Revises: 102_reference_embeddings
+Create Date: 2026-08-24 15:00:00.000000
+
+Purpose:
+    `dnd_ai.commands.reference_corpus.retrieve_cited_passages` re-runs the
+    full-text join across `ai.reference_passages`, `core.source_documents`
+    and `ai.reference_source_campaigns` on every call, while players and
+    the NPC agent keep asking the same rules questions. Its new result
+    cache (`ReferenceRetrievalCache`) needs an authoritative way to tell
+    that a cached ranking may have changed. This migration gives every
+    ruleset version a counter that any corpus write bumps in the *same
+    transaction* as the write, the same way 099_security_generations does
+    for access resolution. Every writer is covered this way, including a
+    support script or a data fix that bypasses the commands.
+
+Forward migration:
+    `ai.reference_corpus_generations` — one row per ruleset version with
+    corpus activity (`ruleset_version_id` PK, `ON DELETE CASCADE`),
+    `generation BIGINT NOT NULL DEFAULT 1`, `updated_at` (maintained by
+    `core.set_updated_at()`). Rows are created on first bump by an upsert
+    rather than backfilled for every ruleset version: a version with no
+    row reads as generation 0, and any write then moves it to 1 or more.
+
+    `ai.bump_reference_corpus_generations(UUID[])` — the upsert.
+
+    Trigger functions that call it, keyed by the ruleset version each
+    write touches:
+    - `core.source_documents`: row-level, OLD and NEW `ruleset_version_id`
+      (registration, status change, removal, edition move).
+    - `ai.reference_source_campaigns`: row-level, through the granted
+      source's version (grant, house-rule flag, revoke).
+    - `ai.reference_passages`: statement-level with transition tables, one
+      trigger per event. Bulk ingestion of a whole sourcebook then costs
+      one bump per statement, not one per passage.
+
+Rollback:
+    Supported. Drops the triggers, functions and table in reverse order.
+    The retrieval cache keys its validity off this table; a downgraded
+    schema must be paired with an application build that predates it (or
+    runs with `DND_AI_REFERENCE_RETRIEVAL_CACHE_MAX_ENTRIES=0`).
+
+Data implications:
+    Creates no rows; the first corpus write per ruleset version creates
+    its counter. Counters only ever increase, and only equality with a
+    previously read value is meaningful.
+
+Locking considerations:
+    `CREATE TABLE` of an empty table; `CREATE TRIGGER` briefly takes
+    `SHARE ROW EXCLUSIVE` on each of the three corpus tables.
+
+    At runtime every corpus write also upserts its ruleset version's
+    counter row, so concurrent corpus writes for the same edition
+    serialize on that row until the first commits. Corpus writes are
+    GM-driven administrative actions; retrieval only reads the row.
+
+See: database/migrations/versions/099_security_generations.py (the pattern)
+     database/migrations/versions/094_reference_corpus.py (the corpus tables)
+     src/dnd_ai/commands/reference_corpus.py (ReferenceRetrievalCache — the
+     only consumer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "103_corpus_generations"
+down_revision = "102_reference_embeddings"
+branch_labels = None
+depends_on = None
+
+# (event, transition table clause) — PostgreSQL allows transition tables
+# only on single-event triggers.
+_PASSAGE_EVENTS = (
+    ("INSERT", "REFERENCING NEW TABLE AS changed_rows"),
+    ("UPDATE", "REFERENCING NEW TABLE AS changed_rows"),
+    ("DELETE", "REFERENCING OLD TABLE AS changed_rows"),
+)
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        CREATE TABLE ai.reference_corpus_generations (
+            ruleset_version_id  UUID PRIMARY KEY
+                                   REFERENCES rules.ruleset_versions(ruleset_version_id)
+                                   ON DELETE CASCADE,
+            generation          BIGINT NOT NULL DEFAULT 1,
+            updated_at          TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+    """)
+    op.execute("""
+        COMMENT ON TABLE ai.reference_corpus_generations IS
+        'One monotonically increasing counter per ruleset version, bumped by '
+        'trigger in the same transaction as any write to that edition''s source '
+        'documents, passages, or campaign source grants. The invalidation key '
+        'for the reference-retrieval result cache — never an authorization input.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.reference_corpus_generations.generation IS
+        'Incremented on every corpus write for the ruleset version; a version '
+        'with no row reads as 0. Only equality with a previously read value is '
+        'meaningful.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_reference_corpus_generations_set_updated_at
+        BEFORE UPDATE ON ai.reference_corpus_generations
+        FOR EACH ROW EXECUTE FUNCTION core.set_updated_at();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.bump_reference_corpus_generations(
+            p_ruleset_version_ids UUID[]
+        )
+        RETURNS void
+        LANGUAGE sql
+        AS $$
+            INSERT INTO ai.reference_corpus_generations (ruleset_version_id)
+            SELECT DISTINCT id FROM unnest(p_ruleset_version_ids) AS id
+            WHERE id IS NOT NULL
+            ORDER BY id
+            ON CONFLICT (ruleset_version_id) DO UPDATE
+            SET generation = ai.reference_corpus_generations.generation + 1;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.bump_reference_corpus_generations(UUID[]) IS
+        'Creates or increments the ai.reference_corpus_generations row of each '
+        'given ruleset version, in id order so concurrent bumps cannot deadlock.';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.bump_reference_corpus_generation_for_source()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'source_documents' THEN
+                PERFORM ai.bump_reference_corpus_generations(ARRAY[
+                    CASE WHEN TG_OP <> 'DELETE' THEN NEW.ruleset_version_id END,
+                    CASE WHEN TG_OP <> 'INSERT' THEN OLD.ruleset_version_id END
+                ]);
+            ELSE
+                PERFORM ai.bump_reference_corpus_generations(ARRAY(
+                    SELECT sd.ruleset_version_id
+                    FROM core.source_documents sd
+                    WHERE sd.source_document_id IN (
+                        CASE WHEN TG_OP <> 'DELETE' THEN NEW.source_document_id END,
+                        CASE WHEN TG_OP <> 'INSERT' THEN OLD.source_document_id END
+                    )
+                ));
+            END IF;
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.bump_reference_corpus_generation_for_source() IS
+        'Row-level AFTER trigger for core.source_documents (its own '
+        'ruleset_version_id) and ai.reference_source_campaigns (the granted '
+        'source''s): bumps the corpus generation of OLD and NEW.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_source_documents_bump_corpus_generation
+        AFTER INSERT OR UPDATE OR DELETE ON core.source_documents
+        FOR EACH ROW EXECUTE FUNCTION ai.bump_reference_corpus_generation_for_source();
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_reference_source_campaigns_bump_corpus_generation
+        AFTER INSERT OR UPDATE OR DELETE ON ai.reference_source_campaigns
+        FOR EACH ROW EXECUTE FUNCTION ai.bump_reference_corpus_generation_for_source();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.bump_reference_corpus_generation_for_passages()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM ai.bump_reference_corpus_generations(ARRAY(
+                SELECT DISTINCT sd.ruleset_version_id
+                FROM changed_rows p
+                JOIN core.source_documents sd ON sd.source_document_id = p.source_document_id
+            ));
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.bump_reference_corpus_generation_for_passages() IS
+        'Statement-level AFTER trigger for ai.reference_passages: bumps the '
+        'corpus generation of every ruleset version the statement''s changed '
+        'rows (the changed_rows transition table) belong to, once.';
+    """)
+    for event, referencing in _PASSAGE_EVENTS:
+        op.execute(f"""
+            CREATE TRIGGER tr_reference_passages_{event.lower()}_bump_corpus_generation
+            AFTER {event} ON ai.reference_passages
+            {referencing}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION ai.bump_reference_corpus_generation_for_passages();
+        """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    for event, _referencing in reversed(_PASSAGE_EVENTS):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS tr_reference_passages_{event.lower()}_bump_corpus_generation "
+            "ON ai.reference_passages;"
+        )
+    op.execute("DROP FUNCTION IF EXISTS ai.bump_reference_corpus_generation_for_passages();")
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_reference_source_campaigns_bump_corpus_generation "
+        "ON ai.reference_source_campaigns;"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_source_documents_bump_corpus_generation "
+        "ON core.source_documents;"
+    )
+    op.execute("DROP FUNCTION IF EXISTS ai.bump_reference_corpus_generation_for_source();")
+    op.execute("DROP FUNCTION IF EXISTS ai.bump_reference_corpus_generations(UUID[]);")
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_reference_corpus_generations_set_updated_at "
+        "ON ai.reference_corpus_generations;"
+    )
+    op.execute("DROP TABLE IF EXISTS ai.reference_corpus_generations;")
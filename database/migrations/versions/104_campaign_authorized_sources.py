@@ -0,0 +1,312 @@
+"""Trigger-maintained per-campaign projection of retrievable reference sources
+
+Revision ID: 104_campaign_authorized_sources
+Revises: 103_corpus_generations
+Create Date: 2026-08-25 09:00:00.000000
+
+Purpose:
+    Every reference retrieval (`dnd_ai.commands.reference_corpus`)
+    decided which sources a campaign may see inline: a LEFT JOIN of
+    `ai.reference_source_campaigns`, the
+    `sd.visibility = 'general' OR <grant exists>` predicate, and a
+    `GROUP BY ... bool_or(is_house_rule)` over every matching passage, on
+    every call. That answer only changes when a source, a grant, or the
+    campaign's edition does, so this migration stores it:
+    `ai.campaign_authorized_sources` has one row per (campaign, source)
+    the campaign may retrieve, with the grant's house-rule flag. Retrieval
+    becomes an indexed join from the campaign's rows to
+    `ai.reference_passages`, with no aggregate.
+
+Forward migration:
+    `ai.campaign_authorized_sources` — `(campaign_id, source_document_id)`
+    primary key, both `ON DELETE CASCADE`, `is_house_rule BOOLEAN NOT
+    NULL`, `updated_at` (maintained by `core.set_updated_at()`), and an
+    index on `source_document_id` for the per-source refresh.
+
+    `ai.refresh_campaign_authorized_sources(campaign UUID, source UUID)` —
+    recomputes the rows in scope (either argument NULL means "all") from
+    the exact predicate retrieval used before, deletes rows no longer
+    authorized, and upserts the rest.
+
+    `ai.maintain_campaign_authorized_sources()` — a row-level AFTER trigger
+    function that calls it for each write that can change the answer:
+    - `core.source_documents` INSERT, DELETE, and UPDATE OF status,
+      visibility, ruleset_version_id: refresh that source for all campaigns;
+    - `ai.reference_source_campaigns` INSERT, UPDATE, DELETE: refresh the
+      OLD and NEW (campaign, source) pairs;
+    - `campaign.campaigns` INSERT, and an UPDATE that changes
+      ruleset_version_id: refresh that campaign for all sources. A deleted
+      campaign's rows go by FK cascade.
+
+    Before refreshing, the trigger function takes a transaction-scoped
+    advisory lock per ruleset version involved (OLD and NEW, sorted), keyed
+    `hashtextextended('ai.campaign_authorized_sources:' || id, 0)` — the
+    049_location_containment_locking pattern. Each refresh statement runs
+    after the lock is granted, so it sees every earlier maintainer of the
+    same edition as committed. Without the lock, two concurrent writes (a
+    grant and a source's visibility change, or a new general source and
+    a campaign moving onto its edition) could each compute their pair
+    without seeing the other's row and leave the projection wrong.
+
+    Backfills every existing campaign.
+
+Rollback:
+    Supported. Drops the triggers, functions and table in reverse order.
+    An application build that reads the projection must not run against
+    the downgraded schema.
+
+Data implications:
+    One row per (campaign, source it may retrieve). That is every active
+    general source of the campaign's edition, plus its granted restricted
+    ones: about 20,000 rows for 100 campaigns over 200 sources. No
+    existing data changes.
+
+Locking considerations:
+    `CREATE TABLE` plus a backfill that reads `campaign.campaigns`,
+    `core.source_documents` and `ai.reference_source_campaigns`.
+    `CREATE TRIGGER` briefly takes `SHARE ROW EXCLUSIVE` on each of those
+    three tables.
+
+    At runtime every corpus write, campaign creation and campaign edition
+    change holds its edition's advisory lock until commit, so such writes
+    for the same edition serialize. They are GM-driven and rare, and
+    retrieval takes no lock.
+
+Deliberate scoping decisions:
+    - A table maintained by trigger rather than a materialized view: a
+      `REFRESH MATERIALIZED VIEW` recomputes every campaign (and blocks
+      readers, or needs CONCURRENTLY's unique index and full diff) for
+      one grant, while the triggers recompute only the pairs a write can
+      affect, in the writing transaction, as 099/103 already do for their
+      counters.
+    - Passages are not projected per campaign — that would multiply the
+      largest table by the number of campaigns. The passage side stays
+      `ai.reference_passages` and its `content_tsv` GIN index.
+
+See: database/migrations/versions/094_reference_corpus.py (the corpus tables)
+     database/migrations/versions/049_location_containment_locking.py
+     (the advisory-lock pattern)
+     src/dnd_ai/commands/reference_corpus.py (the reader)
+     scripts/benchmark_reference_retrieval.py (EXPLAIN ANALYZE comparison)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "104_campaign_authorized_sources"
+down_revision = "103_corpus_generations"
+branch_labels = None
+depends_on = None
+
+# (trigger name, table, events)
+_TRIGGERS = (
+    (
+        "tr_source_documents_maintain_authorized_sources",
+        "core.source_documents",
+        "INSERT OR DELETE OR UPDATE OF status, visibility, ruleset_version_id",
+    ),
+    (
+        "tr_reference_source_campaigns_maintain_authorized_sources",
+        "ai.reference_source_campaigns",
+        "INSERT OR UPDATE OR DELETE",
+    ),
+    # Not `UPDATE OF ruleset_version_id`: a column list makes the trigger
+    # depend on the column, which 024_campaign_ruleset_version's downgrade
+    # (replayed by tests/database/test_seed_idempotency.py) must be able to
+    # drop. The function returns early when the edition did not change.
+    (
+        "tr_campaigns_maintain_authorized_sources",
+        "campaign.campaigns",
+        "INSERT OR UPDATE",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        CREATE TABLE ai.campaign_authorized_sources (
+            campaign_id         UUID NOT NULL
+                                   REFERENCES campaign.campaigns(campaign_id) ON DELETE CASCADE,
+            source_document_id  UUID NOT NULL
+                                   REFERENCES core.source_documents(source_document_id)
+                                   ON DELETE CASCADE,
+            is_house_rule       BOOLEAN NOT NULL,
+            updated_at          TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (campaign_id, source_document_id)
+        );
+    """)
+    op.execute("""
+        CREATE INDEX ix_campaign_authorized_sources_source_document_id
+            ON ai.campaign_authorized_sources (source_document_id);
+    """)
+    op.execute("""
+        COMMENT ON TABLE ai.campaign_authorized_sources IS
+        'Trigger-maintained projection: one row per (campaign, source document) '
+        'the campaign may retrieve from — an active source of the campaign''s own '
+        'ruleset version that is general or actively granted to it. Derived '
+        'entirely from core.source_documents, ai.reference_source_campaigns and '
+        'campaign.campaigns; never written directly.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.campaign_authorized_sources.is_house_rule IS
+        'The active grant''s is_house_rule; false for a general source without '
+        'a grant. House-rule passages rank first in retrieval.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_campaign_authorized_sources_set_updated_at
+        BEFORE UPDATE ON ai.campaign_authorized_sources
+        FOR EACH ROW EXECUTE FUNCTION core.set_updated_at();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.refresh_campaign_authorized_sources(
+            p_campaign_id UUID,
+            p_source_document_id UUID
+        )
+        RETURNS void
+        LANGUAGE sql
+        AS $$
+            WITH desired AS (
+                SELECT c.campaign_id, sd.source_document_id,
+                       COALESCE(bool_or(rsc.is_house_rule), false) AS is_house_rule
+                FROM campaign.campaigns c
+                JOIN core.source_documents sd ON sd.ruleset_version_id = c.ruleset_version_id
+                LEFT JOIN ai.reference_source_campaigns rsc
+                    ON rsc.source_document_id = sd.source_document_id
+                   AND rsc.campaign_id = c.campaign_id
+                   AND rsc.revoked_at IS NULL
+                WHERE (p_campaign_id IS NULL OR c.campaign_id = p_campaign_id)
+                  AND (p_source_document_id IS NULL
+                       OR sd.source_document_id = p_source_document_id)
+                  AND sd.status = 'active'
+                  AND (sd.visibility = 'general' OR rsc.reference_source_campaign_id IS NOT NULL)
+                GROUP BY c.campaign_id, sd.source_document_id
+            ),
+            removed AS (
+                DELETE FROM ai.campaign_authorized_sources cas
+                WHERE (p_campaign_id IS NULL OR cas.campaign_id = p_campaign_id)
+                  AND (p_source_document_id IS NULL
+                       OR cas.source_document_id = p_source_document_id)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM desired d
+                      WHERE d.campaign_id = cas.campaign_id
+                        AND d.source_document_id = cas.source_document_id
+                  )
+            )
+            INSERT INTO ai.campaign_authorized_sources
+                (campaign_id, source_document_id, is_house_rule)
+            SELECT campaign_id, source_document_id, is_house_rule FROM desired
+            ON CONFLICT (campaign_id, source_document_id) DO UPDATE
+            SET is_house_rule = EXCLUDED.is_house_rule
+            WHERE ai.campaign_authorized_sources.is_house_rule
+                  IS DISTINCT FROM EXCLUDED.is_house_rule;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.refresh_campaign_authorized_sources(UUID, UUID) IS
+        'Recomputes ai.campaign_authorized_sources for one campaign, one source, '
+        'or one (campaign, source) pair — a NULL argument means all. Callers '
+        'serialize per ruleset version first (see '
+        'ai.maintain_campaign_authorized_sources).';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.maintain_campaign_authorized_sources()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            v_ruleset_versions  UUID[];
+            v_scope             UUID;
+        BEGIN
+            -- Nested, not AND-ed: PL/pgSQL does not short-circuit, and the
+            -- other tables' records have no ruleset_version_id.
+            IF TG_TABLE_NAME = 'campaigns' AND TG_OP = 'UPDATE' THEN
+                IF OLD.ruleset_version_id IS NOT DISTINCT FROM NEW.ruleset_version_id THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+
+            IF TG_TABLE_NAME = 'reference_source_campaigns' THEN
+                SELECT array_agg(c.ruleset_version_id) INTO v_ruleset_versions
+                FROM campaign.campaigns c
+                WHERE c.campaign_id IN (
+                    CASE WHEN TG_OP <> 'DELETE' THEN NEW.campaign_id END,
+                    CASE WHEN TG_OP <> 'INSERT' THEN OLD.campaign_id END
+                );
+            ELSE
+                v_ruleset_versions := ARRAY[
+                    CASE WHEN TG_OP <> 'DELETE' THEN NEW.ruleset_version_id END,
+                    CASE WHEN TG_OP <> 'INSERT' THEN OLD.ruleset_version_id END
+                ];
+            END IF;
+
+            -- Serialize maintenance per ruleset version, sorted across every
+            -- version involved (revision 104's docstring explains why).
+            FOR v_scope IN
+                SELECT DISTINCT v FROM unnest(v_ruleset_versions) AS v
+                WHERE v IS NOT NULL
+                ORDER BY v
+            LOOP
+                PERFORM pg_advisory_xact_lock(
+                    hashtextextended('ai.campaign_authorized_sources:' || v_scope::text, 0)
+                );
+            END LOOP;
+
+            IF TG_TABLE_NAME = 'source_documents' THEN
+                PERFORM ai.refresh_campaign_authorized_sources(
+                    NULL, COALESCE(NEW.source_document_id, OLD.source_document_id)
+                );
+            ELSIF TG_TABLE_NAME = 'campaigns' THEN
+                PERFORM ai.refresh_campaign_authorized_sources(NEW.campaign_id, NULL);
+            ELSE
+                IF TG_OP <> 'DELETE' THEN
+                    PERFORM ai.refresh_campaign_authorized_sources(
+                        NEW.campaign_id, NEW.source_document_id
+                    );
+                END IF;
+                IF TG_OP <> 'INSERT' AND (
+                    TG_OP = 'DELETE'
+                    OR OLD.campaign_id IS DISTINCT FROM NEW.campaign_id
+                    OR OLD.source_document_id IS DISTINCT FROM NEW.source_document_id
+                ) THEN
+                    PERFORM ai.refresh_campaign_authorized_sources(
+                        OLD.campaign_id, OLD.source_document_id
+                    );
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.maintain_campaign_authorized_sources() IS
+        'Row-level AFTER trigger for core.source_documents, '
+        'ai.reference_source_campaigns and campaign.campaigns: takes the '
+        'affected ruleset versions'' advisory locks in order, then refreshes '
+        'the ai.campaign_authorized_sources rows the write can change.';
+    """)
+    for name, table, events in _TRIGGERS:
+        op.execute(f"""
+            CREATE TRIGGER {name}
+            AFTER {events} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION ai.maintain_campaign_authorized_sources();
+        """)
+
+    op.execute("SELECT ai.refresh_campaign_authorized_sources(NULL, NULL);")
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    for name, table, _events in reversed(_TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS ai.maintain_campaign_authorized_sources();")
+    op.execute("DROP FUNCTION IF EXISTS ai.refresh_campaign_authorized_sources(UUID, UUID);")
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_campaign_authorized_sources_set_updated_at "
+        "ON ai.campaign_authorized_sources;"
+    )
+    op.execute("DROP TABLE IF EXISTS ai.campaign_authorized_sources;")
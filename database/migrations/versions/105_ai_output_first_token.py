@@ -0,0 +1,69 @@
+"""Time to first dialogue token for streamed NPC turns
+
+Revision ID: 105_ai_output_first_token
+Revises: 104_campaign_authorized_sources
+Create Date: 2026-08-26 09:00:00.000000
+
+Purpose:
+    `POST /campaigns/{campaign_id}/ai/npc-conversation/stream`
+    (`dnd_ai.api.ai_npc`) forwards an NPC's dialogue to the player as the
+    provider streams it. What the player waits on is then the time to the
+    first piece of dialogue, not the whole call (`latency_ms`) or the
+    response headers (`first_byte_ms`). This migration records it next to
+    the existing timings.
+
+Forward migration:
+    `ai.generated_outputs.first_token_ms INTEGER` — nullable, with a
+    non-negative CHECK matching 101_ai_output_timings' columns.
+
+Rollback:
+    Supported. Drops the constraint and the column.
+
+Data implications:
+    Existing rows read NULL, as does every non-streamed call and a
+    streamed one that failed before any dialogue arrived.
+
+Locking considerations:
+    `ADD COLUMN` without a default and `ADD CONSTRAINT ... CHECK` over an
+    all-NULL column are brief `ACCESS EXCLUSIVE` locks on
+    `ai.generated_outputs`; the CHECK validation scan is cheap because
+    every existing value is NULL.
+
+See: database/migrations/versions/101_ai_output_timings.py (the sibling timings)
+     src/dnd_ai/domain/ai_provider.py (AsyncOpenAiCompatibleProvider.stream_npc_turn)
+     src/dnd_ai/commands/ai_npc.py (the only writer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "105_ai_output_first_token"
+down_revision = "104_campaign_authorized_sources"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.generated_outputs
+            ADD COLUMN first_token_ms INTEGER,
+            ADD CONSTRAINT ck_generated_outputs_first_token_nonnegative
+                CHECK (first_token_ms IS NULL OR first_token_ms >= 0);
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.generated_outputs.first_token_ms IS
+        'Time until the first piece of dialogue of a streamed NPC turn arrived. '
+        'NULL for a call that was not streamed or produced no dialogue.';
+    """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.generated_outputs
+            DROP CONSTRAINT IF EXISTS ck_generated_outputs_first_token_nonnegative,
+            DROP COLUMN IF EXISTS first_token_ms;
+    """)
@@ -0,0 +1,266 @@
+"""Per-timeline NPC-context generation for reusing assembled context
+
+Revision ID: 106_npc_context_generations
+Revises: 105_ai_output_first_token
+Create Date: 2026-08-26 10:00:00.000000
+
+Purpose:
+    `dnd_ai.domain.context_assembly.assemble_npc_conversation_context`
+    re-runs the character views, relationship, known-facts, revealable-
+    knowledge, related-quest and per-quest `get_quest_view` queries on
+    every NPC-conversation turn, although nothing canonical usually
+    changes between two lines of dialogue. `dnd_ai.commands.ai_npc.
+    NpcContextCache` now keeps the last assembled context per (assignment,
+    character, party, timeline); this migration gives it a counter to
+    invalidate against, bumped by trigger in the same transaction as any
+    write to a row that assembly reads, the same way
+    099_security_generations and 103_corpus_generations do for their
+    caches. Every writer is covered, including a support script or a data
+    fix that bypasses the commands.
+
+Forward migration:
+    `ai.npc_context_generations` — one row per timeline with relevant
+    writes (`timeline_id` PK, `ON DELETE CASCADE`), `generation BIGINT NOT
+    NULL DEFAULT 1`, `bumped_xact BIGINT` (the transaction that last
+    bumped it), `updated_at` (maintained by `core.set_updated_at()`). Rows
+    are created on first bump, as in 103: a timeline with no row reads as
+    generation 0.
+
+    `ai.bump_npc_context_generations(UUID[])` — the upsert, in id order,
+    and at most once per timeline per transaction (`bumped_xact`). Only
+    timelines that still exist are touched, so a bump queued for a
+    timeline that the same transaction deleted is a no-op rather than a
+    foreign-key error.
+
+    `ai.bump_npc_context_generation()` — a row-level trigger function
+    parameterized by `TG_ARGV[0]`, the firing row's key column, and
+    `TG_ARGV[1]`, how that key reaches a timeline:
+    - `timeline`: the row's own `timeline_id` (every `campaign.*` state
+      table assembly reads, and `narrative.encounters`).
+    - `encounter`: through `narrative.encounters`
+      (`narrative.encounter_participants`).
+    - `world`: every timeline of the row's `world_id` (`core.entities`).
+    - `entity`: every timeline of the world of the entity the key names
+      (`character.characters`, `knowledge.knowledge_items`,
+      `narrative.quests`, `narrative.quest_participants`,
+      `narrative.quest_stages`, `world.relationship_participants`).
+    - `quest_stage`: the same, through the stage's quest
+      (`narrative.quest_objectives`).
+    Both OLD and NEW are bumped on UPDATE.
+
+    Every trigger is a `DEFERRABLE INITIALLY DEFERRED` constraint trigger,
+    so the bump runs at commit, after the transaction has taken every row
+    lock it needs. An immediate bump would hold the counter row from the
+    first state write onward, and two transactions writing the same
+    timeline's rows in different orders would deadlock on it.
+
+Rollback:
+    Supported. Drops the triggers, functions and table in reverse order.
+    The NPC-context cache keys its validity off this table; a downgraded
+    schema must be paired with an application build that predates it (or
+    runs with `DND_AI_NPC_CONTEXT_CACHE_MAX_ENTRIES=0`).
+
+Data implications:
+    Creates no rows; the first relevant write per timeline creates its
+    counter. Counters only ever increase, and only equality with a
+    previously read value is meaningful.
+
+Locking considerations:
+    `CREATE TABLE` of an empty table; `CREATE TRIGGER` briefly takes
+    `SHARE ROW EXCLUSIVE` on each of the eighteen tables listed above.
+
+    At runtime a transaction that wrote any of those rows upserts its
+    timelines' counter rows at commit, so concurrent writers on the same
+    timeline serialize for the remainder of the commit only. An authored
+    world-level write (an entity, quest or knowledge item) bumps every
+    timeline of its world, usually one.
+
+Deliberate scoping decisions:
+    The `rules.*` and status lookup tables that assembly joins for codes
+    (species, conditions, resource definitions, relationship/quest/
+    objective statuses) carry no trigger: they are seeded, not written by
+    any command. The cache's TTL is the backstop for a hand edit to them.
+
+See: database/migrations/versions/103_reference_corpus_generations.py (the pattern)
+     src/dnd_ai/domain/context_assembly.py (the reads this counter summarizes)
+     src/dnd_ai/commands/ai_npc.py (NpcContextCache — the only consumer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "106_npc_context_generations"
+down_revision = "105_ai_output_first_token"
+branch_labels = None
+depends_on = None
+
+# (schema-qualified table, key column, how the key reaches a timeline) —
+# see the module docstring's "Forward migration" section.
+_BUMPING_TABLES = (
+    ("campaign.character_state", "timeline_id", "timeline"),
+    ("campaign.character_location_history", "timeline_id", "timeline"),
+    ("campaign.character_conditions", "timeline_id", "timeline"),
+    ("campaign.character_resources", "timeline_id", "timeline"),
+    ("campaign.party_knowledge", "timeline_id", "timeline"),
+    ("campaign.relationship_state", "timeline_id", "timeline"),
+    ("campaign.quest_state", "timeline_id", "timeline"),
+    ("campaign.objective_state", "timeline_id", "timeline"),
+    ("narrative.encounters", "timeline_id", "timeline"),
+    ("narrative.encounter_participants", "encounter_id", "encounter"),
+    ("core.entities", "world_id", "world"),
+    ("character.characters", "character_id", "entity"),
+    ("knowledge.knowledge_items", "knowledge_item_id", "entity"),
+    ("narrative.quests", "quest_id", "entity"),
+    ("narrative.quest_participants", "quest_id", "entity"),
+    ("narrative.quest_stages", "quest_id", "entity"),
+    ("narrative.quest_objectives", "quest_stage_id", "quest_stage"),
+    ("world.relationship_participants", "entity_id", "entity"),
+)
+
+
+def _trigger_name(table: str) -> str:
+    return f"tr_{table.split('.')[1]}_bump_npc_context_generation"
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        CREATE TABLE ai.npc_context_generations (
+            timeline_id  UUID PRIMARY KEY
+                            REFERENCES campaign.timelines(timeline_id) ON DELETE CASCADE,
+            generation   BIGINT NOT NULL DEFAULT 1,
+            bumped_xact  BIGINT,
+            updated_at   TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+    """)
+    op.execute("""
+        COMMENT ON TABLE ai.npc_context_generations IS
+        'One monotonically increasing counter per timeline, bumped by trigger at '
+        'the commit of any transaction that wrote a row NPC-conversation context '
+        'assembly reads for that timeline. The invalidation key for the '
+        'NPC-context cache — never an authorization input.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.npc_context_generations.generation IS
+        'Incremented once per committing transaction that wrote the timeline''s '
+        'state or its world''s authored content; a timeline with no row reads as '
+        '0. Only equality with a previously read value is meaningful.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.npc_context_generations.bumped_xact IS
+        'pg_current_xact_id() of the transaction that last incremented '
+        'generation, so one transaction bumps it at most once.';
+    """)
+    op.execute("""
+        CREATE TRIGGER tr_npc_context_generations_set_updated_at
+        BEFORE UPDATE ON ai.npc_context_generations
+        FOR EACH ROW EXECUTE FUNCTION core.set_updated_at();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.bump_npc_context_generations(p_timeline_ids UUID[])
+        RETURNS void
+        LANGUAGE sql
+        AS $$
+            INSERT INTO ai.npc_context_generations (timeline_id, bumped_xact)
+            SELECT t.timeline_id, pg_current_xact_id()::text::bigint
+            FROM campaign.timelines t
+            WHERE t.timeline_id = ANY (p_timeline_ids)
+            ORDER BY t.timeline_id
+            ON CONFLICT (timeline_id) DO UPDATE
+            SET generation = ai.npc_context_generations.generation + 1,
+                bumped_xact = EXCLUDED.bumped_xact
+            WHERE ai.npc_context_generations.bumped_xact IS DISTINCT FROM EXCLUDED.bumped_xact;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.bump_npc_context_generations(UUID[]) IS
+        'Creates or increments the ai.npc_context_generations row of each given '
+        'timeline that still exists, in id order so concurrent bumps cannot '
+        'deadlock, and at most once per transaction.';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ai.bump_npc_context_generation()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            v_key_column  TEXT := TG_ARGV[0];
+            v_scope       TEXT := TG_ARGV[1];
+            v_keys        UUID[] := ARRAY[]::UUID[];
+        BEGIN
+            IF TG_OP <> 'DELETE' THEN
+                v_keys := v_keys || (to_jsonb(NEW) ->> v_key_column)::UUID;
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                v_keys := v_keys || (to_jsonb(OLD) ->> v_key_column)::UUID;
+            END IF;
+
+            IF v_scope = 'timeline' THEN
+                PERFORM ai.bump_npc_context_generations(v_keys);
+            ELSIF v_scope = 'encounter' THEN
+                PERFORM ai.bump_npc_context_generations(ARRAY(
+                    SELECT e.timeline_id
+                    FROM narrative.encounters e
+                    WHERE e.encounter_id = ANY (v_keys)
+                ));
+            ELSIF v_scope = 'world' THEN
+                PERFORM ai.bump_npc_context_generations(ARRAY(
+                    SELECT t.timeline_id
+                    FROM campaign.timelines t
+                    WHERE t.world_id = ANY (v_keys)
+                ));
+            ELSIF v_scope = 'entity' THEN
+                PERFORM ai.bump_npc_context_generations(ARRAY(
+                    SELECT t.timeline_id
+                    FROM core.entities ce
+                    JOIN campaign.timelines t ON t.world_id = ce.world_id
+                    WHERE ce.entity_id = ANY (v_keys)
+                ));
+            ELSIF v_scope = 'quest_stage' THEN
+                PERFORM ai.bump_npc_context_generations(ARRAY(
+                    SELECT t.timeline_id
+                    FROM narrative.quest_stages qs
+                    JOIN core.entities ce ON ce.entity_id = qs.quest_id
+                    JOIN campaign.timelines t ON t.world_id = ce.world_id
+                    WHERE qs.quest_stage_id = ANY (v_keys)
+                ));
+            ELSE
+                RAISE EXCEPTION 'unknown NPC-context generation scope %', v_scope;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION ai.bump_npc_context_generation() IS
+        'Deferred row-level constraint trigger: bumps ai.npc_context_generations '
+        'for the timelines the firing row''s TG_ARGV[0] column reaches, as '
+        'TG_ARGV[1] says — timeline, encounter, world, entity, or quest_stage. '
+        'Bumps both OLD and NEW on UPDATE.';
+    """)
+    for table, key_column, scope in _BUMPING_TABLES:
+        op.execute(f"""
+            CREATE CONSTRAINT TRIGGER {_trigger_name(table)}
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW
+            EXECUTE FUNCTION ai.bump_npc_context_generation('{key_column}', '{scope}');
+        """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    for table, _key_column, _scope in reversed(_BUMPING_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS ai.bump_npc_context_generation();")
+    op.execute("DROP FUNCTION IF EXISTS ai.bump_npc_context_generations(UUID[]);")
+    op.execute(
+        "DROP TRIGGER IF EXISTS tr_npc_context_generations_set_updated_at "
+        "ON ai.npc_context_generations;"
+    )
+    op.execute("DROP TABLE IF EXISTS ai.npc_context_generations;")
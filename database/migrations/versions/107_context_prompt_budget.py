@@ -0,0 +1,84 @@
+"""Token accounting for recorded context snapshots
+
+Revision ID: 107_context_prompt_budget
+Revises: 106_npc_context_generations
+Create Date: 2026-08-27 09:00:00.000000
+
+Purpose:
+    NPC-conversation and campaign-synthesis contexts are now fitted to a
+    configurable token budget before they are recorded and sent
+    (`dnd_ai.domain.prompt_budget`, applied by
+    `dnd_ai.domain.context_assembly.budget_npc_conversation_context` and
+    `budget_campaign_synthesis_context`). A trimmed snapshot alone no
+    longer says what the model did not see, so this migration records,
+    next to each snapshot, how many tokens its payload was estimated at,
+    per section, and how many items each section lost to the budget.
+
+Forward migration:
+    `ai.context_snapshots.prompt_token_count INTEGER` — nullable, with a
+    non-negative CHECK, the estimated size of `assembled_context`.
+    `ai.context_snapshots.prompt_budget JSONB` — nullable: the tokenizer
+    identifier, the budget, the total and a per-section breakdown
+    (`PromptBudgetReport.as_record()`). JSONB for the same reason as
+    `assembled_context` itself: a debugging record written once and read
+    whole, never queried by field.
+
+Rollback:
+    Supported. Drops the constraint and both columns.
+
+Data implications:
+    Existing snapshots read NULL in both columns; they were recorded
+    untrimmed.
+
+Locking considerations:
+    `ADD COLUMN` without a default and `ADD CONSTRAINT ... CHECK` over an
+    all-NULL column are brief `ACCESS EXCLUSIVE` locks on
+    `ai.context_snapshots`; the CHECK validation scan is cheap because
+    every existing value is NULL.
+
+See: database/migrations/versions/105_ai_output_first_token.py (the same shape)
+     src/dnd_ai/domain/prompt_budget.py (what the columns record)
+     src/dnd_ai/commands/ai_npc.py, src/dnd_ai/commands/ai_synthesis.py (the writers)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "107_context_prompt_budget"
+down_revision = "106_npc_context_generations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.context_snapshots
+            ADD COLUMN prompt_token_count INTEGER,
+            ADD COLUMN prompt_budget JSONB,
+            ADD CONSTRAINT ck_context_snapshots_prompt_token_count_nonnegative
+                CHECK (prompt_token_count IS NULL OR prompt_token_count >= 0);
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.context_snapshots.prompt_token_count IS
+        'Estimated token count of assembled_context, by the tokenizer named in '
+        'prompt_budget. NULL for a snapshot recorded before token accounting.';
+    """)
+    op.execute("""
+        COMMENT ON COLUMN ai.context_snapshots.prompt_budget IS
+        'The tokenizer, token budget, total and per-section token and item '
+        'counts of assembled_context, and how many items each section lost to '
+        'the budget. NULL for a snapshot recorded before token accounting.';
+    """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    op.execute("""
+        ALTER TABLE ai.context_snapshots
+            DROP CONSTRAINT IF EXISTS ck_context_snapshots_prompt_token_count_nonnegative,
+            DROP COLUMN IF EXISTS prompt_budget,
+            DROP COLUMN IF EXISTS prompt_token_count;
+    """)
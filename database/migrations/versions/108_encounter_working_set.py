@@ -0,0 +1,157 @@
+"""Per-encounter working-set version for reusing what turn resolution reads
+
+Revision ID: 108_encounter_working_set
+Revises: 107_context_prompt_budget
+Create Date: 2026-09-02 09:00:00.000000
+
+Purpose:
+    `dnd_ai.commands.encounters._resolve_combat_turns_impl` re-reads the
+    encounter's participants, its rounds and its timeline's world on every
+    turn, although none of them usually changes between two turns of one
+    round. `dnd_ai.commands.encounters.EncounterWorkingSetCache` now keeps
+    them per encounter; this migration gives it a version to check against,
+    returned by the same `SELECT ... FOR UPDATE` that locks the encounter,
+    so a cached turn costs no extra round trip.
+
+Forward migration:
+    `narrative.encounter_working_set_version_seq` — the source of every
+    version. A sequence rather than `+ 1` because `nextval` is never rolled
+    back: a version written by a transaction that aborted is never handed
+    out again, so nothing cached from that transaction's uncommitted rows
+    can ever match a later committed version.
+
+    `narrative.encounters.working_set_version BIGINT NOT NULL` — added with
+    `DEFAULT 0` (no table rewrite), then defaulted to the sequence for new
+    encounters.
+
+    `narrative.bump_encounter_working_set_version()` — a row-level trigger
+    function that sets `working_set_version` to the next sequence value on
+    the firing row's encounter, OLD and NEW both on UPDATE. Fired `AFTER
+    INSERT OR UPDATE OR DELETE` on `narrative.encounter_participants` and
+    `narrative.encounter_rounds`, immediately rather than deferred (unlike
+    106): the version has to move within the writing transaction so that
+    transaction's own later reads are tagged with it, and every command
+    that writes those rows already holds the encounter's row lock, so the
+    bump adds no lock they do not take anyway.
+
+Rollback:
+    Supported. Drops the triggers, function, column and sequence. The
+    working-set cache reads this column; a downgraded schema must be
+    paired with an application build that predates it (or runs with
+    `DND_AI_ENCOUNTER_WORKING_SET_CACHE_MAX_ENTRIES=0`).
+
+Data implications:
+    Existing encounters read version 0 until their first participant or
+    round write. Only equality with a previously read value is meaningful.
+
+Locking considerations:
+    `ADD COLUMN ... DEFAULT 0` and `SET DEFAULT` are brief `ACCESS
+    EXCLUSIVE` locks on `narrative.encounters` without a rewrite; `CREATE
+    TRIGGER` briefly takes `SHARE ROW EXCLUSIVE` on the two child tables.
+
+    At runtime a participant or round write updates its encounter row, so
+    it waits behind an in-flight turn's `FOR UPDATE` on that encounter —
+    the serialization the cache relies on. The update also fires
+    `narrative.encounters`' own `set_updated_at`, same-world and (deferred)
+    106 NPC-context triggers, once per new round or participant change.
+
+Deliberate scoping decisions:
+    `narrative.encounters`' own columns are not versioned: the lock
+    re-reads `timeline_id`, `campaign_id` and `status` on every turn, and
+    the cache compares the `timeline_id` it was filled under.
+    `campaign.character_state` is not versioned either — it is written by
+    commands that never take the encounter lock, and the turn's `FOR
+    UPDATE` read of a target's hit points is also the row lock its
+    `UPDATE` needs.
+
+See: database/migrations/versions/106_npc_context_generations.py (the deferred variant)
+     src/dnd_ai/commands/encounters.py (EncounterWorkingSetCache — the only consumer)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "108_encounter_working_set"
+down_revision = "107_context_prompt_budget"
+branch_labels = None
+depends_on = None
+
+_BUMPING_TABLES = ("narrative.encounter_participants", "narrative.encounter_rounds")
+
+
+def _trigger_name(table: str) -> str:
+    return f"tr_{table.split('.')[1]}_bump_working_set_version"
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+
+    op.execute("CREATE SEQUENCE narrative.encounter_working_set_version_seq;")
+    op.execute("""
+        COMMENT ON SEQUENCE narrative.encounter_working_set_version_seq IS
+        'Source of narrative.encounters.working_set_version. Never rolled back, '
+        'so an aborted transaction''s version is never reused.';
+    """)
+    op.execute("""
+        ALTER TABLE narrative.encounters
+            ADD COLUMN working_set_version BIGINT NOT NULL DEFAULT 0;
+    """)
+    op.execute("""
+        ALTER TABLE narrative.encounters
+            ALTER COLUMN working_set_version
+            SET DEFAULT nextval('narrative.encounter_working_set_version_seq');
+    """)
+    op.execute("""
+        COMMENT ON COLUMN narrative.encounters.working_set_version IS
+        'Set from narrative.encounter_working_set_version_seq whenever one of '
+        'the encounter''s participants or rounds is written. The invalidation '
+        'key for the encounter working-set cache; only equality with a '
+        'previously read value is meaningful.';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION narrative.bump_encounter_working_set_version()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            v_encounter_ids  UUID[] := ARRAY[]::UUID[];
+        BEGIN
+            IF TG_OP <> 'DELETE' THEN
+                v_encounter_ids := v_encounter_ids || NEW.encounter_id;
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                v_encounter_ids := v_encounter_ids || OLD.encounter_id;
+            END IF;
+
+            UPDATE narrative.encounters
+            SET working_set_version = nextval('narrative.encounter_working_set_version_seq')
+            WHERE encounter_id = ANY (v_encounter_ids);
+
+            RETURN NULL;
+        END;
+        $$;
+    """)
+    op.execute("""
+        COMMENT ON FUNCTION narrative.bump_encounter_working_set_version() IS
+        'Row-level trigger: sets narrative.encounters.working_set_version to the '
+        'next sequence value for the firing row''s encounter, OLD and NEW both '
+        'on UPDATE.';
+    """)
+    for table in _BUMPING_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {_trigger_name(table)}
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW
+            EXECUTE FUNCTION narrative.bump_encounter_working_set_version();
+        """)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+
+    for table in reversed(_BUMPING_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS narrative.bump_encounter_working_set_version();")
+    op.execute("ALTER TABLE narrative.encounters DROP COLUMN IF EXISTS working_set_version;")
+    op.execute("DROP SEQUENCE IF EXISTS narrative.encounter_working_set_version_seq;")
@@ -74,7 +74,7 @@ from sqlalchemy import Connection, Engine, create_engine, text
 from dnd_ai.commands.ai_npc import request_npc_conversation_turn
 from dnd_ai.commands.ai_synthesis import request_campaign_synthesis
 from dnd_ai.config import settings
-from dnd_ai.domain.ai_provider import OpenAiCompatibleProvider
+from dnd_ai.domain.ai_provider import OpenAiCompatibleProvider, build_ai_http_client
 
 _DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 _RAW_RESPONSE_PREVIEW_CHARS = 200
@@ -356,7 +356,8 @@ def _generated_output_summary(engine: Engine, generated_output_id: uuid.UUID) ->
     with engine.connect() as connection:
         row = connection.execute(
             text("""
-                SELECT provider, model_identifier, finish_reason, latency_ms, error_message,
+                SELECT provider, model_identifier, finish_reason, latency_ms, connect_ms,
+                       first_byte_ms, error_message,
                        (structured_output IS NOT NULL) AS has_structured_output,
                        left(coalesce(raw_response, ''), :preview_chars) AS raw_preview
                 FROM ai.generated_outputs WHERE generated_output_id = :id
@@ -366,6 +367,7 @@ def _generated_output_summary(engine: Engine, generated_output_id: uuid.UUID) ->
     return (
         f"provider={row.provider} model={row.model_identifier} "
         f"finish_reason={row.finish_reason} latency_ms={row.latency_ms} "
+        f"connect_ms={row.connect_ms} first_byte_ms={row.first_byte_ms} "
         f"structured_output_present={row.has_structured_output} "
         f"error_message={row.error_message!r} "
         f"raw_response_preview={row.raw_preview!r}"
@@ -430,10 +432,17 @@ def main() -> int:
     _print_warning_banner(base_url=args.base_url, has_key=settings.ai_provider_api_key is not None)
 
     engine = create_engine(settings.database_url)
+    http_client = build_ai_http_client(
+        max_connections=settings.ai_provider_max_connections,
+        max_keepalive_connections=settings.ai_provider_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.ai_provider_keepalive_expiry_seconds,
+        http2=settings.ai_provider_http2,
+    )
     provider = OpenAiCompatibleProvider(
         api_key=settings.ai_provider_api_key,
         model_identifier=args.model,
         base_url=args.base_url,
+        client=http_client,
     )
 
     with engine.begin() as connection:
@@ -498,6 +507,7 @@ def main() -> int:
     finally:
         _cleanup_fixture(engine, fixture)
         engine.dispose()
+        http_client.close()
         print("\nDisposable smoke-test fixture cleaned up.")
 
 
@@ -0,0 +1,506 @@
+"""Opt-in latency benchmark for `dnd_ai.domain.access.resolve_access_context`:
+the single-statement resolver against the sequential five-query path it
+replaced, on one campaign member carrying hundreds of resource grants spread
+across hundreds of access groups.
+
+Kept out of pytest collection for the same reason as
+`scripts/ai_provider_smoke_test.py` — it measures wall-clock latency, which
+is meaningful only against a quiet database and never a pass/fail gate.
+`tests/database/test_benchmark_access_resolution.py` imports this module's
+fixture builder and `legacy_resolve_access_context` to prove both paths
+still resolve the identical `AccessContext`; that parity check is the only
+part that runs in CI.
+
+What it does, against `DND_AI_DATABASE_URL`/`DATABASE_URL`:
+
+1. Opens ONE transaction and builds a disposable fixture inside it (a
+   throwaway world/timeline/ruleset, a pending campaign, one member with
+   one multi-capability role, `--groups` access groups the member belongs
+   to, and `--grants` resource grants over quest targets — a mix of direct
+   and group grants, with some explicit denies and some expiring rows).
+2. Checks both resolvers return the same `AccessContext` (including
+   `valid_until`), then runs each `--iterations` times after a short
+   warm-up, interleaved so drift affects both paths equally.
+3. Prints p50/p99/mean milliseconds per path.
+4. Rolls the transaction back — nothing is ever committed, so there is no
+   cleanup step and no disposable data is left behind even on failure.
+
+Usage:
+    uv run python scripts/benchmark_access_resolution.py [--grants 600] \
+        [--groups 300] [--iterations 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Connection, create_engine, text
+
+from dnd_ai.config import settings
+from dnd_ai.domain.access import (
+    _TARGET_COLUMNS,
+    AccessContext,
+    UnauthorizedTimelineError,
+    _as_str,
+    _as_uuid,
+    _GrantKey,
+    resolve_access_context,
+)
+
+_CAPABILITY_COUNT = 12
+_WARMUP_ITERATIONS = 20
+
+
+@dataclass
+class BenchmarkFixture:
+    campaign_id: uuid.UUID
+    user_id: uuid.UUID
+
+
+def _scalar_uuid(connection: Connection, sql: str, params: dict[str, object]) -> uuid.UUID:
+    value = connection.execute(text(sql), params).scalar()
+    assert isinstance(value, uuid.UUID)
+    return value
+
+
+def build_fixture(connection: Connection, *, grants: int, groups: int) -> BenchmarkFixture:
+    """Builds the benchmark fixture inside the caller's transaction, set-based
+    (`generate_series`) so hundreds of rows cost a handful of statements.
+    Mirrors tests/factories.py's tested shapes — this script cannot import
+    that test-only module. Grants come in pairs sharing one quest and
+    capability under different grantees (every fourth grant targets the
+    member directly, the rest one of the access groups); every seventh is a
+    `deny` and every eleventh expires in a day, so the deny-over-allow fold
+    and `valid_until` both have real work to do."""
+    suffix = uuid.uuid4().hex[:8]
+    active = _scalar_uuid(
+        connection,
+        "SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active'",
+        {},
+    )
+    world_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.worlds (name, slug, lifecycle_status_id)
+        VALUES ('Access Benchmark World', :slug, :status)
+        RETURNING world_id
+        """,
+        {"slug": f"access-benchmark-{suffix}", "status": active},
+    )
+    timeline_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO campaign.timelines (world_id, name, is_primary, lifecycle_status_id)
+        VALUES (:world, 'Benchmark Timeline', true, :status)
+        RETURNING timeline_id
+        """,
+        {"world": world_id, "status": active},
+    )
+    ruleset_id = _scalar_uuid(
+        connection,
+        "INSERT INTO rules.rulesets (code, display_name) VALUES (:c, :c) RETURNING ruleset_id",
+        {"c": f"access_benchmark_{suffix}"},
+    )
+    ruleset_version_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO rules.ruleset_versions (ruleset_id, version_label, is_current)
+        VALUES (:r, 'v1', true)
+        RETURNING ruleset_version_id
+        """,
+        {"r": ruleset_id},
+    )
+    connection.execute(
+        text("INSERT INTO rules.world_rulesets (world_id, ruleset_id) VALUES (:w, :r)"),
+        {"w": world_id, "r": ruleset_id},
+    )
+    # Pending, not active: an active campaign must retain an access-manager
+    # membership at commit, which a benchmark has no reason to set up.
+    campaign_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO campaign.campaigns (timeline_id, name, lifecycle_status_id, ruleset_version_id)
+        VALUES (
+            :timeline, 'Access Benchmark Campaign',
+            (SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'pending'),
+            :ruleset_version
+        )
+        RETURNING campaign_id
+        """,
+        {"timeline": timeline_id, "ruleset_version": ruleset_version_id},
+    )
+    user_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO security.users (display_name, lifecycle_status_id)
+        VALUES ('Access Benchmark User', :status)
+        RETURNING user_id
+        """,
+        {"status": active},
+    )
+    membership_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO security.campaign_memberships
+            (campaign_id, user_id, membership_status_id, joined_at)
+        VALUES (
+            :campaign, :user,
+            (SELECT membership_status_id FROM security.membership_statuses WHERE code = 'active'),
+            now()
+        )
+        RETURNING campaign_membership_id
+        """,
+        {"campaign": campaign_id, "user": user_id},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO security.capabilities (code, display_name)
+            SELECT 'benchmark.run_' || :suffix || '.cap_' || n,
+                   'benchmark.run_' || :suffix || '.cap_' || n
+            FROM generate_series(1, :count) AS n
+        """),
+        {"suffix": suffix, "count": _CAPABILITY_COUNT},
+    )
+    role_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO security.roles (campaign_id, code, display_name)
+        VALUES (:campaign, :code, :code)
+        RETURNING role_id
+        """,
+        {"campaign": campaign_id, "code": f"benchmark_role_{suffix}"},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO security.role_capabilities (role_id, capability_id)
+            SELECT :role, capability_id FROM security.capabilities
+            WHERE code LIKE 'benchmark.run_' || :suffix || '.%'
+        """),
+        {"role": role_id, "suffix": suffix},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO security.membership_roles (campaign_membership_id, role_id)
+            VALUES (:membership, :role)
+        """),
+        {"membership": membership_id, "role": role_id},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO security.access_groups (campaign_id, name)
+            SELECT :campaign, 'Benchmark Group ' || n FROM generate_series(1, :count) AS n
+        """),
+        {"campaign": campaign_id, "count": groups},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO security.access_group_memberships (access_group_id, campaign_membership_id)
+            SELECT access_group_id, :membership FROM security.access_groups
+            WHERE campaign_id = :campaign
+        """),
+        {"campaign": campaign_id, "membership": membership_id},
+    )
+    connection.execute(
+        text("""
+            WITH new_entities AS (
+                INSERT INTO core.entities
+                    (world_id, entity_type_id, canonical_name, canon_status_id,
+                     lifecycle_status_id)
+                SELECT :world,
+                       (SELECT entity_type_id FROM core.entity_types WHERE code = 'quest'),
+                       'Benchmark Quest ' || n,
+                       (SELECT canon_status_id FROM core.canon_statuses WHERE code = 'draft'),
+                       :status
+                FROM generate_series(1, :count) AS n
+                RETURNING entity_id
+            )
+            INSERT INTO narrative.quests (quest_id) SELECT entity_id FROM new_entities
+        """),
+        {"world": world_id, "status": active, "count": (grants + 1) // 2},
+    )
+    connection.execute(
+        text("""
+            WITH quests AS (
+                SELECT q.quest_id, row_number() OVER (ORDER BY q.quest_id) AS rn
+                FROM narrative.quests q
+                JOIN core.entities e ON e.entity_id = q.quest_id
+                WHERE e.world_id = :world
+            ),
+            capabilities AS (
+                SELECT capability_id, row_number() OVER (ORDER BY code) AS rn
+                FROM security.capabilities
+                WHERE code LIKE 'benchmark.run_' || :suffix || '.%'
+            ),
+            access_groups AS (
+                SELECT access_group_id, row_number() OVER (ORDER BY access_group_id) AS rn
+                FROM security.access_groups
+                WHERE campaign_id = :campaign
+            )
+            INSERT INTO security.resource_grants
+                (campaign_id, grantee_campaign_membership_id, grantee_access_group_id,
+                 capability_id, effect, quest_id, grant_source, expires_at)
+            SELECT :campaign,
+                   CASE WHEN n % 4 = 0 THEN :membership END,
+                   CASE WHEN n % 4 <> 0 THEN g.access_group_id END,
+                   c.capability_id,
+                   CASE WHEN n % 7 = 0 THEN 'deny' ELSE 'allow' END,
+                   q.quest_id,
+                   'benchmark',
+                   CASE WHEN n % 11 = 0 THEN now() + interval '1 day' END
+            FROM generate_series(0, :grants - 1) AS n
+            JOIN quests q ON q.rn = 1 + n / 2
+            JOIN capabilities c ON c.rn = 1 + (n / 2) % (SELECT count(*) FROM capabilities)
+            JOIN access_groups g ON g.rn = 1 + n % (SELECT count(*) FROM access_groups)
+        """),
+        {
+            "campaign": campaign_id,
+            "membership": membership_id,
+            "world": world_id,
+            "suffix": suffix,
+            "grants": grants,
+        },
+    )
+    return BenchmarkFixture(campaign_id=campaign_id, user_id=user_id)
+
+
+def legacy_resolve_access_context(
+    connection: Connection,
+    *,
+    user_id: uuid.UUID,
+    campaign_id: uuid.UUID,
+    timeline_id: uuid.UUID | None = None,
+) -> AccessContext | None:
+    """The sequential five-query resolver `resolve_access_context` replaced,
+    kept verbatim as this benchmark's baseline and as the reference
+    implementation the parity test compares against."""
+    membership_id = connection.execute(
+        text("""
+            SELECT cm.campaign_membership_id
+            FROM security.campaign_memberships cm
+            JOIN security.membership_statuses ms
+              ON ms.membership_status_id = cm.membership_status_id
+            WHERE cm.campaign_id = :campaign_id
+              AND cm.user_id = :user_id
+              AND cm.ended_at IS NULL
+              AND ms.code = 'active'
+              AND ms.is_active
+        """),
+        {"campaign_id": campaign_id, "user_id": user_id},
+    ).scalar()
+    if membership_id is None:
+        return None
+    membership_id = _as_uuid(membership_id)
+
+    campaign_timeline = connection.execute(
+        text("SELECT timeline_id FROM campaign.campaigns WHERE campaign_id = :campaign_id"),
+        {"campaign_id": campaign_id},
+    ).scalar()
+    if campaign_timeline is None:
+        raise ValueError(f"campaign {campaign_id} does not exist")
+    campaign_timeline_id = _as_uuid(campaign_timeline)
+
+    if timeline_id is not None and timeline_id != campaign_timeline_id:
+        raise UnauthorizedTimelineError(
+            f"timeline {timeline_id} is not campaign {campaign_id}'s own timeline "
+            f"({campaign_timeline_id}) — resolve_access_context only resolves access "
+            "for a campaign's own pinned timeline; see its docstring for the rule."
+        )
+
+    expirations: list[datetime] = []
+    role_capability_codes: set[str] = set()
+    for row in connection.execute(
+        text("""
+            SELECT cap.code, mr.expires_at
+            FROM security.membership_roles mr
+            JOIN security.roles r ON r.role_id = mr.role_id
+            JOIN security.role_capabilities rc ON rc.role_id = r.role_id
+            JOIN security.capabilities cap ON cap.capability_id = rc.capability_id
+            WHERE mr.campaign_membership_id = :membership_id
+              AND mr.revoked_at IS NULL
+              AND (mr.expires_at IS NULL OR mr.expires_at > now())
+              AND r.is_active
+              AND cap.is_active
+        """),
+        {"membership_id": membership_id},
+    ).mappings():
+        role_capability_codes.add(_as_str(row["code"]))
+        if row["expires_at"] is not None:
+            expirations.append(row["expires_at"])
+    role_capabilities = frozenset(role_capability_codes)
+
+    character_capabilities: dict[uuid.UUID, set[str]] = {}
+    for row in connection.execute(
+        text("""
+            SELECT mcr.character_id, cap.code, mcr.expires_at
+            FROM security.membership_character_relationships mcr
+            JOIN security.character_relationship_type_capabilities rtc
+              ON rtc.character_relationship_type_id = mcr.character_relationship_type_id
+            JOIN security.capabilities cap ON cap.capability_id = rtc.capability_id
+            WHERE mcr.campaign_membership_id = :membership_id
+              AND mcr.revoked_at IS NULL
+              AND (mcr.expires_at IS NULL OR mcr.expires_at > now())
+              AND (mcr.timeline_id IS NULL OR mcr.timeline_id = :timeline_id)
+              AND cap.is_active
+        """),
+        {"membership_id": membership_id, "timeline_id": campaign_timeline_id},
+    ).mappings():
+        character_id = _as_uuid(row["character_id"])
+        character_capabilities.setdefault(character_id, set()).add(_as_str(row["code"]))
+        if row["expires_at"] is not None:
+            expirations.append(row["expires_at"])
+
+    grant_effects: dict[_GrantKey, dict[str, str]] = {}
+    target_column_list = ", ".join(f"rg.{column}" for column in _TARGET_COLUMNS)
+    for row in connection.execute(
+        text(f"""
+            SELECT {target_column_list}, cap.code AS capability_code, rg.effect, rg.expires_at
+            FROM security.resource_grants rg
+            JOIN security.capabilities cap ON cap.capability_id = rg.capability_id
+            WHERE rg.campaign_id = :campaign_id
+              AND rg.revoked_at IS NULL
+              AND (rg.expires_at IS NULL OR rg.expires_at > now())
+              AND (rg.timeline_id IS NULL OR rg.timeline_id = :timeline_id)
+              AND cap.is_active
+              AND (
+                    rg.grantee_campaign_membership_id = :membership_id
+                    OR rg.grantee_access_group_id IN (
+                        SELECT agm.access_group_id
+                        FROM security.access_group_memberships agm
+                        WHERE agm.campaign_membership_id = :membership_id
+                          AND agm.removed_at IS NULL
+                    )
+                  )
+        """),
+        {
+            "campaign_id": campaign_id,
+            "timeline_id": campaign_timeline_id,
+            "membership_id": membership_id,
+        },
+    ).mappings():
+        if row["expires_at"] is not None:
+            expirations.append(row["expires_at"])
+        target_field = next(column for column in _TARGET_COLUMNS if row[column] is not None)
+        key = (target_field, _as_uuid(row[target_field]))
+        capability_code = _as_str(row["capability_code"])
+        bucket = grant_effects.setdefault(key, {})
+        if bucket.get(capability_code) == "deny":
+            continue
+        bucket[capability_code] = _as_str(row["effect"])
+
+    return AccessContext(
+        user_id=user_id,
+        campaign_id=campaign_id,
+        campaign_membership_id=membership_id,
+        timeline_id=campaign_timeline_id,
+        role_capabilities=role_capabilities,
+        character_capabilities={
+            character_id: frozenset(codes) for character_id, codes in character_capabilities.items()
+        },
+        grant_effects=grant_effects,
+        valid_until=min(expirations, default=None),
+    )
+
+
+@dataclass(frozen=True)
+class PathTiming:
+    name: str
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+
+
+def _summarize(name: str, samples: list[float]) -> PathTiming:
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+    return PathTiming(
+        name=name,
+        p50_ms=percentiles[49] * 1000,
+        p99_ms=percentiles[98] * 1000,
+        mean_ms=statistics.fmean(samples) * 1000,
+    )
+
+
+def assert_paths_agree(connection: Connection, fixture: BenchmarkFixture) -> None:
+    """Raises AssertionError unless both resolvers return the same context.
+    `valid_until` is compared explicitly since `AccessContext` excludes it
+    from equality."""
+    legacy = legacy_resolve_access_context(
+        connection, user_id=fixture.user_id, campaign_id=fixture.campaign_id
+    )
+    current = resolve_access_context(
+        connection, user_id=fixture.user_id, campaign_id=fixture.campaign_id
+    )
+    assert legacy is not None and current is not None
+    assert current == legacy, "single-statement resolver disagrees with the legacy path"
+    assert current.valid_until == legacy.valid_until, "valid_until disagrees"
+
+
+def run_benchmark(
+    connection: Connection, fixture: BenchmarkFixture, *, iterations: int
+) -> list[PathTiming]:
+    paths: dict[str, Callable[..., AccessContext | None]] = {
+        "legacy (5 queries)": legacy_resolve_access_context,
+        "single statement": resolve_access_context,
+    }
+    samples: dict[str, list[float]] = {name: [] for name in paths}
+    for iteration in range(_WARMUP_ITERATIONS + iterations):
+        for name, resolve in paths.items():
+            started = time.perf_counter()
+            resolve(connection, user_id=fixture.user_id, campaign_id=fixture.campaign_id)
+            elapsed = time.perf_counter() - started
+            if iteration >= _WARMUP_ITERATIONS:
+                samples[name].append(elapsed)
+    return [_summarize(name, values) for name, values in samples.items()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare p50/p99 latency of the legacy and single-statement "
+            "resolve_access_context paths. Never commits anything."
+        )
+    )
+    parser.add_argument("--grants", type=int, default=600, help="Resource grants (default 600).")
+    parser.add_argument("--groups", type=int, default=300, help="Access groups (default 300).")
+    parser.add_argument(
+        "--iterations", type=int, default=500, help="Timed runs per path (default 500)."
+    )
+    args = parser.parse_args()
+    if args.grants < 1 or args.groups < 2 or args.iterations < 2:
+        parser.error("--grants must be >= 1, --groups >= 2, and --iterations >= 2")
+
+    assert settings.database_url is not None
+    engine = create_engine(settings.database_url)
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                fixture = build_fixture(connection, grants=args.grants, groups=args.groups)
+                connection.execute(text("ANALYZE security.resource_grants"))
+                assert_paths_agree(connection, fixture)
+                timings = run_benchmark(connection, fixture, iterations=args.iterations)
+            finally:
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    print(
+        f"resolve_access_context: {args.grants} grants, {args.groups} access groups, "
+        f"{args.iterations} iterations per path"
+    )
+    print(f"{'path':<20} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10}")
+    for timing in timings:
+        print(
+            f"{timing.name:<20} {timing.p50_ms:>10.3f} {timing.p99_ms:>10.3f} "
+            f"{timing.mean_ms:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,488 @@
+"""Opt-in benchmark of `dnd_ai.commands.integration.apply_foundry_combat_sync`
+under an at-least-once adapter's redelivery load: mostly replays of
+operations that already completed, with and without the lock-free replay
+pre-check (`_replay_completed_sync_jobs`).
+
+Kept out of pytest collection for the same reason as
+`scripts/benchmark_access_resolution.py` — wall-clock latency is meaningful
+only against a quiet database and never a pass/fail gate.
+`tests/database/test_benchmark_foundry_sync_replay.py` imports this
+module's functions to prove the fixture and both paths do what they claim
+and that only the baseline checks out a lock connection per replay; that
+is the only part that runs in CI.
+
+What it does, against `DND_AI_DATABASE_URL`/`DATABASE_URL`:
+
+1. Commits a disposable fixture — unlike the other benchmarks, which roll
+   one transaction back, because the command under test commits its own
+   claim/work transactions on its own connections. A throwaway world,
+   timeline and ruleset, two characters, an active encounter, a
+   registered Foundry system, and `--completed` operations delivered once.
+2. For each path — `apply_foundry_combat_sync` without a
+   `replay_connection` (the locked path, every call's path before the
+   pre-check) and with one (what the API passes) — runs `--calls`
+   deliveries across `--threads` workers, `--replay-percent` of them
+   redeliveries of completed operations and the rest new operations
+   (misses, so hit points never change). Advisory locks are taken on a
+   dedicated engine of `--lock-pool-size` connections, the shape
+   `DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE` gives the API; the pre-check
+   reads on a connection each delivery holds from a separate request
+   engine throughout, as an API request holds its own. Deliveries arrive open-loop at
+   `--rate` per second, served by `--threads` workers, and each one's
+   latency counts from its scheduled arrival — a closed loop would let
+   fast replays push every worker onto the serialized new-operation path
+   and report that queue instead of what an adapter sees.
+3. Prints, per path, how many lock-engine connections were checked out,
+   the p50/p99/mean milliseconds per delivery, and the p99 of replays and
+   of new operations separately.
+4. Deletes the fixture, in a `finally`: its integration and ruleset rows,
+   then its entities and world under `session_replication_role =
+   replica`, the same cleanup tests/scenario/test_foundry_sync_commands.py
+   uses — which, like those tests, leaves the encounter's own narrative
+   rows behind, so point it at a disposable database.
+
+Usage:
+    uv run python scripts/benchmark_foundry_sync_replay.py [--completed 200] \
+        [--calls 2000] [--replay-percent 90] [--rate 400] [--threads 32] \
+        [--lock-pool-size 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import random
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, create_engine, event, text
+
+from dnd_ai.commands.encounters import CombatTurn, start_encounter
+from dnd_ai.commands.integration import (
+    ApplyFoundryCombatSyncResult,
+    FoundryCombatSyncOperation,
+    apply_foundry_combat_sync,
+    register_external_system,
+)
+from dnd_ai.config import settings
+
+
+@dataclass
+class BenchmarkFixture:
+    world_id: uuid.UUID
+    timeline_id: uuid.UUID
+    ruleset_id: uuid.UUID
+    world_time_id: uuid.UUID
+    attacker_id: uuid.UUID
+    defender_id: uuid.UUID
+    external_system_id: uuid.UUID
+    encounter_id: uuid.UUID
+    completed: list[FoundryCombatSyncOperation]
+    # The next unused round; every new operation takes one.
+    rounds: itertools.count[int]
+
+
+@dataclass(frozen=True)
+class PathResult:
+    name: str
+    calls: int
+    replays: int
+    lock_checkouts: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    replay_p99_ms: float
+    new_p99_ms: float
+
+
+def _p99(samples: list[float]) -> float:
+    """Nearest-rank p99 in milliseconds; nan with no samples, since a
+    --replay-percent of 0 or 100 leaves one kind empty."""
+    if not samples:
+        return math.nan
+    ordered = sorted(samples)
+    return ordered[math.ceil(0.99 * len(ordered)) - 1] * 1000
+
+
+def _scalar_uuid(connection: Connection, sql: str, params: dict[str, object]) -> uuid.UUID:
+    value = connection.execute(text(sql), params).scalar()
+    assert isinstance(value, uuid.UUID)
+    return value
+
+
+def _character(
+    connection: Connection, world_id: uuid.UUID, species_id: uuid.UUID, name: str
+) -> uuid.UUID:
+    character_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.entities
+            (world_id, entity_type_id, canonical_name, canon_status_id, lifecycle_status_id)
+        VALUES (
+            :world,
+            (SELECT entity_type_id FROM core.entity_types WHERE code = 'character'),
+            :name,
+            (SELECT canon_status_id FROM core.canon_statuses WHERE code = 'draft'),
+            (SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active')
+        )
+        RETURNING entity_id
+        """,
+        {"world": world_id, "name": name},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO character.characters (character_id, species_id, size_category)
+            VALUES (:character, :species, 'medium')
+        """),
+        {"character": character_id, "species": species_id},
+    )
+    return character_id
+
+
+def _miss(fixture: BenchmarkFixture, operation_id: str) -> FoundryCombatSyncOperation:
+    return FoundryCombatSyncOperation(
+        external_operation_id=operation_id,
+        turn=CombatTurn(
+            round_number=next(fixture.rounds),
+            turn_order=0,
+            actor_entity_id=fixture.attacker_id,
+            world_time_id=fixture.world_time_id,
+            target_entity_id=fixture.defender_id,
+            hit=False,
+        ),
+    )
+
+
+def deliver(
+    fixture: BenchmarkFixture,
+    operation: FoundryCombatSyncOperation,
+    *,
+    lock_engine: Engine,
+    request_engine: Engine | None,
+) -> ApplyFoundryCombatSyncResult:
+    """One delivery of operation, with the lock-free replay pre-check on a
+    connection held from request_engine for the whole delivery unless it
+    is None."""
+    if request_engine is None:
+        return _apply(fixture, operation, lock_engine=lock_engine, replay_connection=None)
+    with request_engine.connect() as connection:
+        return _apply(fixture, operation, lock_engine=lock_engine, replay_connection=connection)
+
+
+def _apply(
+    fixture: BenchmarkFixture,
+    operation: FoundryCombatSyncOperation,
+    *,
+    lock_engine: Engine,
+    replay_connection: Connection | None,
+) -> ApplyFoundryCombatSyncResult:
+    turn = operation.turn
+    return apply_foundry_combat_sync(
+        lock_engine,
+        external_system_id=fixture.external_system_id,
+        external_operation_id=operation.external_operation_id,
+        encounter_id=fixture.encounter_id,
+        round_number=turn.round_number,
+        turn_order=turn.turn_order,
+        actor_entity_id=turn.actor_entity_id,
+        world_time_id=turn.world_time_id,
+        target_entity_id=turn.target_entity_id,
+        hit=turn.hit,
+        replay_connection=replay_connection,
+    )
+
+
+def build_fixture(engine: Engine, *, completed: int) -> BenchmarkFixture:
+    """See this module's docstring, step 1."""
+    suffix = uuid.uuid4().hex[:8]
+    with engine.begin() as connection:
+        active = _scalar_uuid(
+            connection,
+            "SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active'",
+            {},
+        )
+        world_id = _scalar_uuid(
+            connection,
+            """
+            INSERT INTO core.worlds (name, slug, lifecycle_status_id)
+            VALUES ('Foundry Replay Benchmark World', :slug, :status)
+            RETURNING world_id
+            """,
+            {"slug": f"foundry-replay-benchmark-{suffix}", "status": active},
+        )
+        timeline_id = _scalar_uuid(
+            connection,
+            """
+            INSERT INTO campaign.timelines (world_id, name, is_primary, lifecycle_status_id)
+            VALUES (:world, 'Benchmark Timeline', true, :status)
+            RETURNING timeline_id
+            """,
+            {"world": world_id, "status": active},
+        )
+        world_time_id = _scalar_uuid(
+            connection,
+            """
+            INSERT INTO core.world_times (world_id, world_time_precision_id, year, sort_key)
+            VALUES (
+                :world,
+                (SELECT world_time_precision_id FROM core.world_time_precisions
+                 WHERE code = 'exact'),
+                1100, 100
+            )
+            RETURNING world_time_id
+            """,
+            {"world": world_id},
+        )
+        ruleset_id = _scalar_uuid(
+            connection,
+            "INSERT INTO rules.rulesets (code, display_name) VALUES (:c, :c) RETURNING ruleset_id",
+            {"c": f"foundry_replay_benchmark_{suffix}"},
+        )
+        ruleset_version_id = _scalar_uuid(
+            connection,
+            """
+            INSERT INTO rules.ruleset_versions (ruleset_id, version_label, is_current)
+            VALUES (:r, 'v1', true)
+            RETURNING ruleset_version_id
+            """,
+            {"r": ruleset_id},
+        )
+        connection.execute(
+            text("INSERT INTO rules.world_rulesets (world_id, ruleset_id) VALUES (:w, :r)"),
+            {"w": world_id, "r": ruleset_id},
+        )
+        species_id = _scalar_uuid(
+            connection,
+            """
+            INSERT INTO rules.species (ruleset_version_id, code, display_name)
+            VALUES (:v, 'human', 'Human')
+            RETURNING species_id
+            """,
+            {"v": ruleset_version_id},
+        )
+        attacker_id = _character(connection, world_id, species_id, "Benchmark Attacker")
+        defender_id = _character(connection, world_id, species_id, "Benchmark Defender")
+        connection.execute(
+            text("""
+                INSERT INTO campaign.character_state
+                    (timeline_id, character_id, current_hit_points, maximum_hit_points)
+                SELECT :timeline, character_id, 20, 20
+                FROM unnest(CAST(:characters AS uuid[])) AS character_id
+            """),
+            {"timeline": timeline_id, "characters": [attacker_id, defender_id]},
+        )
+
+    system = register_external_system(
+        engine, world_id=world_id, system_type="foundry", display_name="Benchmark Foundry"
+    )
+    encounter = start_encounter(
+        engine,
+        timeline_id=timeline_id,
+        world_time_id=world_time_id,
+        participant_entity_ids=(attacker_id, defender_id),
+    )
+    fixture = BenchmarkFixture(
+        world_id=world_id,
+        timeline_id=timeline_id,
+        ruleset_id=ruleset_id,
+        world_time_id=world_time_id,
+        attacker_id=attacker_id,
+        defender_id=defender_id,
+        external_system_id=system.external_system_id,
+        encounter_id=encounter.encounter_id,
+        completed=[],
+        rounds=itertools.count(1),
+    )
+    for index in range(completed):
+        operation = _miss(fixture, f"benchmark-completed-{index}")
+        deliver(fixture, operation, lock_engine=engine, request_engine=engine)
+        fixture.completed.append(operation)
+    return fixture
+
+
+def drop_fixture(engine: Engine, fixture: BenchmarkFixture) -> None:
+    """See this module's docstring, step 4."""
+    with engine.begin() as connection:
+        connection.execute(text("SET LOCAL session_replication_role = replica"))
+        params = {
+            "world": fixture.world_id,
+            "system": fixture.external_system_id,
+            "ruleset": fixture.ruleset_id,
+        }
+        for statement in (
+            """
+            DELETE FROM integration.delivery_attempts WHERE sync_job_id IN (
+                SELECT sync_job_id FROM integration.sync_jobs WHERE external_system_id = :system
+            )
+            """,
+            "DELETE FROM integration.sync_state WHERE external_system_id = :system",
+            "DELETE FROM integration.sync_jobs WHERE external_system_id = :system",
+            "DELETE FROM integration.external_systems WHERE external_system_id = :system",
+            "DELETE FROM core.entities WHERE world_id = :world",
+            "DELETE FROM core.worlds WHERE world_id = :world",
+            "DELETE FROM rules.world_rulesets WHERE ruleset_id = :ruleset",
+            """
+            DELETE FROM rules.species WHERE ruleset_version_id IN (
+                SELECT ruleset_version_id FROM rules.ruleset_versions WHERE ruleset_id = :ruleset
+            )
+            """,
+            "DELETE FROM rules.ruleset_versions WHERE ruleset_id = :ruleset",
+            "DELETE FROM rules.rulesets WHERE ruleset_id = :ruleset",
+        ):
+            connection.execute(text(statement), params)
+
+
+def run_path(
+    fixture: BenchmarkFixture,
+    *,
+    name: str,
+    lock_engine: Engine,
+    request_engine: Engine | None,
+    calls: int,
+    replay_percent: int,
+    rate: float,
+    threads: int,
+    seed: int = 0,
+) -> PathResult:
+    """See this module's docstring, step 2. request_engine=None runs the
+    locked baseline."""
+    chooser = random.Random(seed)
+    workload = [
+        chooser.choice(fixture.completed)
+        if chooser.randrange(100) < replay_percent
+        else _miss(fixture, f"benchmark-{name}-{index}")
+        for index in range(calls)
+    ]
+
+    checkouts = 0
+    checkouts_lock = threading.Lock()
+
+    def _count_checkout(*_args: object) -> None:
+        nonlocal checkouts
+        with checkouts_lock:
+            checkouts += 1
+
+    def _timed(operation: FoundryCombatSyncOperation, arrival: float) -> float:
+        deliver(fixture, operation, lock_engine=lock_engine, request_engine=request_engine)
+        return time.perf_counter() - arrival
+
+    event.listen(lock_engine, "checkout", _count_checkout)
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            started = time.perf_counter()
+            futures = []
+            for index, operation in enumerate(workload):
+                arrival = started + index / rate
+                time.sleep(max(0.0, arrival - time.perf_counter()))
+                futures.append(pool.submit(_timed, operation, arrival))
+            samples = [future.result() for future in futures]
+    finally:
+        event.remove(lock_engine, "checkout", _count_checkout)
+
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+    is_replay = [operation in fixture.completed for operation in workload]
+    return PathResult(
+        name=name,
+        calls=calls,
+        replays=sum(is_replay),
+        lock_checkouts=checkouts,
+        p50_ms=percentiles[49] * 1000,
+        p99_ms=percentiles[98] * 1000,
+        mean_ms=statistics.fmean(samples) * 1000,
+        replay_p99_ms=_p99([s for s, replay in zip(samples, is_replay, strict=True) if replay]),
+        new_p99_ms=_p99([s for s, replay in zip(samples, is_replay, strict=True) if not replay]),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare lock-connection checkouts and p50/p99 latency of Foundry "
+            "combat-sync delivery with and without the lock-free replay pre-check. "
+            "Commits a disposable fixture and deletes it afterwards."
+        )
+    )
+    parser.add_argument(
+        "--completed", type=int, default=200, help="Operations already delivered (default 200)."
+    )
+    parser.add_argument(
+        "--calls", type=int, default=2_000, help="Deliveries per path (default 2000)."
+    )
+    parser.add_argument(
+        "--replay-percent",
+        type=int,
+        default=90,
+        help="Share of deliveries that redeliver a completed operation (default 90).",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=400.0, help="Deliveries arriving per second (default 400)."
+    )
+    parser.add_argument(
+        "--threads", type=int, default=32, help="Workers serving arrivals (default 32)."
+    )
+    parser.add_argument(
+        "--lock-pool-size",
+        type=int,
+        default=2,
+        help="Connections in the dedicated advisory-lock pool (default 2).",
+    )
+    args = parser.parse_args()
+    if min(args.completed, args.threads, args.lock_pool_size) < 1 or args.calls < 2:
+        parser.error("--completed, --threads and --lock-pool-size must be >= 1, --calls >= 2")
+    if args.rate <= 0:
+        parser.error("--rate must be > 0")
+    if not 0 <= args.replay_percent <= 100:
+        parser.error("--replay-percent must be between 0 and 100")
+
+    assert settings.database_url is not None
+    request_engine = create_engine(settings.database_url, pool_size=args.threads)
+    lock_engine = create_engine(
+        settings.database_url, pool_size=args.lock_pool_size, max_overflow=0
+    )
+    try:
+        fixture = build_fixture(request_engine, completed=args.completed)
+        try:
+            results = [
+                run_path(
+                    fixture,
+                    name=name,
+                    lock_engine=lock_engine,
+                    request_engine=replay_engine,
+                    calls=args.calls,
+                    replay_percent=args.replay_percent,
+                    rate=args.rate,
+                    threads=args.threads,
+                )
+                for name, replay_engine in (("locked", None), ("lock-free replay", request_engine))
+            ]
+        finally:
+            drop_fixture(request_engine, fixture)
+    finally:
+        lock_engine.dispose()
+        request_engine.dispose()
+
+    print(
+        f"apply_foundry_combat_sync: {args.calls} deliveries per path, "
+        f"{args.replay_percent}% replays, {args.rate:g}/s on {args.threads} threads, "
+        f"{args.lock_pool_size} lock connections"
+    )
+    print(
+        f"{'path':<18} {'replays':>8} {'lock conns':>11} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'mean ms':>9} {'replay p99':>11} {'new p99':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<18} {result.replays:>8} {result.lock_checkouts:>11} "
+            f"{result.p50_ms:>9.3f} {result.p99_ms:>9.3f} {result.mean_ms:>9.3f} "
+            f"{result.replay_p99_ms:>11.3f} {result.new_p99_ms:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
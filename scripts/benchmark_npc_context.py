@@ -0,0 +1,398 @@
+"""Opt-in benchmark of NPC-conversation context size and assembly time on a
+long-running campaign (`dnd_ai.domain.context_assembly.
+assemble_npc_conversation_context` and `budget_npc_conversation_context`).
+
+Kept out of pytest collection for the same reason as
+`scripts/benchmark_reference_retrieval.py` — its numbers are meaningful
+only against a quiet database and never a pass/fail gate.
+`tests/database/test_benchmark_npc_context.py` imports this module's
+fixture builder to prove it seeds what it claims and that the budgeted
+payload fits its budget; those checks are the only part that runs in CI.
+
+What it does, against `DND_AI_DATABASE_URL`/`DATABASE_URL`:
+
+1. Opens ONE transaction and builds a disposable long campaign inside
+   it: a throwaway world, one NPC and one player character, a party,
+   `--facts` knowledge items about the NPC (the party already knows every
+   other one) and `--quests` quests the NPC takes part in, each with two
+   stages of three objectives and the party's own quest state. Then
+   `ANALYZE`s the tables assembly reads.
+2. For each of `--runs` rounds, assembles the NPC's context for the
+   player character and fits it to `--max-tokens`.
+3. Prints median/p95 assembly and budgeting milliseconds, and the
+   payload's size in bytes and estimated tokens before and after the
+   budget, with how many items each section lost.
+4. Rolls the transaction back — nothing is ever committed, so there is no
+   cleanup step and no disposable data is left behind even on failure.
+
+Usage:
+    uv run python scripts/benchmark_npc_context.py [--facts 400] \
+        [--quests 60] [--max-tokens 6000] [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, create_engine, text
+
+from dnd_ai.config import settings
+from dnd_ai.domain.context_assembly import (
+    NpcConversationContext,
+    assemble_npc_conversation_context,
+    budget_npc_conversation_context,
+)
+from dnd_ai.domain.prompt_budget import PromptBudget, PromptBudgetReport
+
+_STAGES_PER_QUEST = 2
+_OBJECTIVES_PER_STAGE = 3
+# Roughly the length of an authored knowledge statement.
+_FACT_TEXT = "the innkeeper once told a traveller about the old road north of the river"
+
+
+@dataclass
+class BenchmarkFixture:
+    world_id: uuid.UUID
+    timeline_id: uuid.UUID
+    npc_id: uuid.UUID
+    pc_id: uuid.UUID
+    party_id: uuid.UUID
+
+
+def _scalar_uuid(connection: Connection, sql: str, params: dict[str, object]) -> uuid.UUID:
+    value = connection.execute(text(sql), params).scalar()
+    assert isinstance(value, uuid.UUID)
+    return value
+
+
+def _character(
+    connection: Connection, world_id: uuid.UUID, species_id: uuid.UUID, name: str
+) -> uuid.UUID:
+    character_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.entities
+            (world_id, entity_type_id, canonical_name, canon_status_id, lifecycle_status_id)
+        VALUES (
+            :world,
+            (SELECT entity_type_id FROM core.entity_types WHERE code = 'character'),
+            :name,
+            (SELECT canon_status_id FROM core.canon_statuses WHERE code = 'draft'),
+            (SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active')
+        )
+        RETURNING entity_id
+        """,
+        {"world": world_id, "name": name},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO character.characters (character_id, species_id, size_category)
+            VALUES (:character, :species, 'medium')
+        """),
+        {"character": character_id, "species": species_id},
+    )
+    return character_id
+
+
+def build_fixture(connection: Connection, *, facts: int, quests: int) -> BenchmarkFixture:
+    """See this module's docstring, step 1."""
+    suffix = uuid.uuid4().hex[:8]
+    active = _scalar_uuid(
+        connection,
+        "SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active'",
+        {},
+    )
+    world_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.worlds (name, slug, lifecycle_status_id)
+        VALUES ('NPC Context Benchmark World', :slug, :status)
+        RETURNING world_id
+        """,
+        {"slug": f"npc-context-benchmark-{suffix}", "status": active},
+    )
+    timeline_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO campaign.timelines (world_id, name, is_primary, lifecycle_status_id)
+        VALUES (:world, 'Benchmark Timeline', true, :status)
+        RETURNING timeline_id
+        """,
+        {"world": world_id, "status": active},
+    )
+    ruleset_id = _scalar_uuid(
+        connection,
+        "INSERT INTO rules.rulesets (code, display_name) VALUES (:c, :c) RETURNING ruleset_id",
+        {"c": f"npc_context_benchmark_{suffix}"},
+    )
+    ruleset_version_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO rules.ruleset_versions (ruleset_id, version_label, is_current)
+        VALUES (:r, 'v1', true)
+        RETURNING ruleset_version_id
+        """,
+        {"r": ruleset_id},
+    )
+    connection.execute(
+        text("INSERT INTO rules.world_rulesets (world_id, ruleset_id) VALUES (:w, :r)"),
+        {"w": world_id, "r": ruleset_id},
+    )
+    species_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO rules.species (ruleset_version_id, code, display_name)
+        VALUES (:v, 'human', 'Human')
+        RETURNING species_id
+        """,
+        {"v": ruleset_version_id},
+    )
+    npc_id = _character(connection, world_id, species_id, "Benchmark Innkeeper")
+    pc_id = _character(connection, world_id, species_id, "Benchmark Hero")
+    party_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO campaign.parties (world_id, name)
+        VALUES (:world, 'Benchmark Party')
+        RETURNING party_id
+        """,
+        {"world": world_id},
+    )
+
+    params = {
+        "world": world_id,
+        "timeline": timeline_id,
+        "party": party_id,
+        "npc": npc_id,
+        "status": active,
+    }
+    connection.execute(
+        text("""
+            WITH new_entities AS (
+                INSERT INTO core.entities
+                    (world_id, entity_type_id, canonical_name, canon_status_id,
+                     lifecycle_status_id)
+                SELECT :world,
+                       (SELECT entity_type_id FROM core.entity_types WHERE code = 'knowledge_item'),
+                       format('Fact %s: %s', lpad(n::text, 6, '0'), CAST(:fact_text AS text)),
+                       (SELECT canon_status_id FROM core.canon_statuses WHERE code = 'draft'),
+                       :status
+                FROM generate_series(1, :count) AS n
+                RETURNING entity_id, canonical_name
+            )
+            INSERT INTO knowledge.knowledge_items
+                (knowledge_item_id, knowledge_type_id, truth_status_id, canonical_statement,
+                 subject_entity_id)
+            SELECT entity_id,
+                   (SELECT knowledge_type_id FROM knowledge.knowledge_types WHERE code = 'secret'),
+                   (SELECT truth_status_id FROM knowledge.truth_statuses WHERE code = 'true'),
+                   canonical_name, :npc
+            FROM new_entities
+        """),
+        {**params, "count": facts, "fact_text": _FACT_TEXT},
+    )
+    connection.execute(
+        text("""
+            INSERT INTO campaign.party_knowledge
+                (timeline_id, party_id, knowledge_item_id, awareness_level)
+            SELECT :timeline, :party, knowledge_item_id, 'aware'
+            FROM (
+                SELECT knowledge_item_id,
+                       row_number() OVER (ORDER BY canonical_statement) AS rn
+                FROM knowledge.knowledge_items
+                WHERE subject_entity_id = :npc
+            ) numbered
+            WHERE rn % 2 = 0
+        """),
+        params,
+    )
+    connection.execute(
+        text("""
+            WITH new_entities AS (
+                INSERT INTO core.entities
+                    (world_id, entity_type_id, canonical_name, canon_status_id,
+                     lifecycle_status_id)
+                SELECT :world,
+                       (SELECT entity_type_id FROM core.entity_types WHERE code = 'quest'),
+                       'Benchmark Quest ' || lpad(n::text, 4, '0'),
+                       (SELECT canon_status_id FROM core.canon_statuses WHERE code = 'draft'),
+                       :status
+                FROM generate_series(1, :count) AS n
+                RETURNING entity_id
+            ),
+            new_quests AS (
+                INSERT INTO narrative.quests (quest_id)
+                SELECT entity_id FROM new_entities
+                RETURNING quest_id
+            ),
+            participants AS (
+                INSERT INTO narrative.quest_participants
+                    (quest_id, participant_entity_id, participant_role)
+                SELECT quest_id, :npc, 'quest_giver' FROM new_quests
+            )
+            INSERT INTO campaign.quest_state (timeline_id, quest_id, party_id, quest_status_id)
+            SELECT :timeline, quest_id, :party,
+                   (SELECT quest_status_id FROM campaign.quest_statuses WHERE code = 'active')
+            FROM new_quests
+        """),
+        {**params, "count": quests},
+    )
+    connection.execute(
+        text("""
+            WITH new_stages AS (
+                INSERT INTO narrative.quest_stages (quest_id, name, sequence_number, stage_type)
+                SELECT q.quest_id, 'Stage ' || s, s, 'sequential'
+                FROM narrative.quests q
+                JOIN core.entities e ON e.entity_id = q.quest_id
+                CROSS JOIN generate_series(0, :stages - 1) AS s
+                WHERE e.world_id = :world
+                RETURNING quest_stage_id
+            )
+            INSERT INTO narrative.quest_objectives
+                (quest_stage_id, objective_type_id, name, requirement_level, completion_mode,
+                 visibility_policy)
+            SELECT quest_stage_id,
+                   (SELECT objective_type_id FROM narrative.objective_types WHERE code = 'other'),
+                   'Objective ' || o, 'required', 'automatic', 'visible'
+            FROM new_stages
+            CROSS JOIN generate_series(1, :objectives) AS o
+        """),
+        {**params, "stages": _STAGES_PER_QUEST, "objectives": _OBJECTIVES_PER_STAGE},
+    )
+    for table in (
+        "knowledge.knowledge_items",
+        "campaign.party_knowledge",
+        "narrative.quest_participants",
+        "campaign.quest_state",
+        "narrative.quest_stages",
+        "narrative.quest_objectives",
+    ):
+        connection.execute(text(f"ANALYZE {table}"))
+    return BenchmarkFixture(
+        world_id=world_id,
+        timeline_id=timeline_id,
+        npc_id=npc_id,
+        pc_id=pc_id,
+        party_id=party_id,
+    )
+
+
+def assemble(connection: Connection, fixture: BenchmarkFixture) -> NpcConversationContext:
+    return assemble_npc_conversation_context(
+        connection,
+        npc_entity_id=fixture.npc_id,
+        timeline_id=fixture.timeline_id,
+        expected_world_id=fixture.world_id,
+        requesting_character_id=fixture.pc_id,
+        requesting_party_id=fixture.party_id,
+    )
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    median_assembly_ms: float
+    p95_assembly_ms: float
+    median_budgeting_ms: float
+    unbudgeted_bytes: int
+    budgeted_bytes: int
+    unbudgeted: PromptBudgetReport
+    budgeted: PromptBudgetReport
+
+
+def _p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20)[-1] if len(values) > 1 else values[0]
+
+
+def run_benchmark(
+    connection: Connection, fixture: BenchmarkFixture, *, max_tokens: int, runs: int
+) -> BenchmarkResult:
+    budget = PromptBudget(max_tokens=max_tokens)
+    assembly_ms: list[float] = []
+    budgeting_ms: list[float] = []
+    for _run in range(runs):
+        started = time.perf_counter()
+        context = assemble(connection, fixture)
+        assembled = time.perf_counter()
+        budgeted_context, budgeted = budget_npc_conversation_context(context, budget=budget)
+        assembly_ms.append((assembled - started) * 1000)
+        budgeting_ms.append((time.perf_counter() - assembled) * 1000)
+    _context, unbudgeted = budget_npc_conversation_context(context, budget=PromptBudget())
+    return BenchmarkResult(
+        median_assembly_ms=statistics.median(assembly_ms),
+        p95_assembly_ms=_p95(assembly_ms),
+        median_budgeting_ms=statistics.median(budgeting_ms),
+        unbudgeted_bytes=len(json.dumps(context.as_prompt_payload()).encode()),
+        budgeted_bytes=len(json.dumps(budgeted_context.as_prompt_payload()).encode()),
+        unbudgeted=unbudgeted,
+        budgeted=budgeted,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure NPC-conversation context assembly time and payload size, "
+            "before and after the prompt budget, on a seeded long campaign. "
+            "Never commits anything."
+        )
+    )
+    parser.add_argument(
+        "--facts", type=int, default=400, help="Knowledge items about the NPC (default 400)."
+    )
+    parser.add_argument(
+        "--quests", type=int, default=60, help="Quests the NPC takes part in (default 60)."
+    )
+    parser.add_argument(
+        "--max-tokens", type=int, default=6_000, help="Prompt budget to apply (default 6000)."
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Assemblies to time (default 20).")
+    args = parser.parse_args()
+    if min(args.facts, args.quests, args.max_tokens, args.runs) < 1:
+        parser.error("--facts, --quests, --max-tokens and --runs must be >= 1")
+
+    assert settings.database_url is not None
+    engine = create_engine(settings.database_url)
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                fixture = build_fixture(connection, facts=args.facts, quests=args.quests)
+                result = run_benchmark(
+                    connection, fixture, max_tokens=args.max_tokens, runs=args.runs
+                )
+            finally:
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    print(
+        f"npc context: {args.facts} facts, {args.quests} quests, "
+        f"budget {args.max_tokens} tokens ({result.budgeted.tokenizer_identifier}), "
+        f"{args.runs} runs"
+    )
+    print(
+        f"assembly p50 {result.median_assembly_ms:.3f} ms, "
+        f"p95 {result.p95_assembly_ms:.3f} ms; "
+        f"budgeting p50 {result.median_budgeting_ms:.3f} ms"
+    )
+    print(
+        f"payload {result.unbudgeted_bytes} -> {result.budgeted_bytes} bytes, "
+        f"{result.unbudgeted.total_tokens} -> {result.budgeted.total_tokens} tokens"
+    )
+    print(f"{'section':<24} {'tokens':>8} {'budgeted':>9} {'items':>6} {'trimmed':>8}")
+    for before, after in zip(result.unbudgeted.sections, result.budgeted.sections, strict=True):
+        items = "" if before.items is None else str(before.items)
+        print(
+            f"{before.name:<24} {before.tokens:>8} {after.tokens:>9} "
+            f"{items:>6} {after.trimmed_items:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
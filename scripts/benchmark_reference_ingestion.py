@@ -0,0 +1,282 @@
+"""Opt-in throughput benchmark for reference-corpus passage ingestion
+(`dnd_ai.commands.reference_corpus._ingest_reference_passage_stream_impl`):
+the batched `INSERT ... SELECT FROM unnest(...)` path against the
+row-at-a-time loop it replaced, on one synthetic sourcebook of tens of
+thousands of passages.
+
+Kept out of pytest collection for the same reason as
+`scripts/benchmark_access_resolution.py` — it measures wall-clock time,
+which is meaningful only against a quiet database and never a pass/fail
+gate. `tests/database/test_benchmark_reference_ingestion.py` imports this
+module's fixture builder and `legacy_ingest_reference_passages` to prove
+both paths store identical rows; that parity check is the only part that
+runs in CI.
+
+What it does, against `DND_AI_DATABASE_URL`/`DATABASE_URL`:
+
+1. Opens ONE transaction and builds a disposable ruleset/ruleset version
+   inside it.
+2. For each of `--runs` rounds, registers two fresh indexable source
+   documents and ingests the same `--passages` synthetic passages (a
+   generator, in shuffled `passage_order`) into one per path, so every
+   round inserts into an empty source and neither path sees the other's
+   rows. The paths alternate which goes first each round so drift
+   affects both equally.
+3. Prints median/mean seconds and passages per second per path.
+4. Rolls the transaction back — nothing is ever committed, so there is no
+   cleanup step and no disposable data is left behind even on failure.
+
+Usage:
+    uv run python scripts/benchmark_reference_ingestion.py [--passages 50000] [--runs 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, create_engine, text
+
+from dnd_ai.commands.reference_corpus import (
+    PassageInput,
+    _ingest_reference_passage_stream_impl,
+)
+from dnd_ai.config import settings
+
+# Roughly one paragraph of sourcebook prose per passage.
+_PASSAGE_WORDS = 80
+_WORDS = (
+    "the", "spell", "creature", "target", "saving", "throw", "damage", "radius",
+    "feet", "action", "bonus", "reaction", "hit", "points", "armor", "class",
+    "advantage", "disadvantage", "concentration", "duration", "range",
+    "component", "material", "somatic", "verbal", "level", "slot", "cantrip",
+)  # fmt: skip
+
+
+@dataclass
+class BenchmarkFixture:
+    ruleset_version_id: uuid.UUID
+
+
+def _scalar_uuid(connection: Connection, sql: str, params: dict[str, object]) -> uuid.UUID:
+    value = connection.execute(text(sql), params).scalar()
+    assert isinstance(value, uuid.UUID)
+    return value
+
+
+def build_fixture(connection: Connection) -> BenchmarkFixture:
+    """Builds the ruleset version every benchmark source document hangs off,
+    inside the caller's transaction. Mirrors tests/factories.py's tested
+    shapes — this script cannot import that test-only module."""
+    suffix = uuid.uuid4().hex[:8]
+    ruleset_id = _scalar_uuid(
+        connection,
+        "INSERT INTO rules.rulesets (code, display_name) VALUES (:c, :c) RETURNING ruleset_id",
+        {"c": f"ingestion_benchmark_{suffix}"},
+    )
+    ruleset_version_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO rules.ruleset_versions (ruleset_id, version_label, is_current)
+        VALUES (:r, 'v1', true)
+        RETURNING ruleset_version_id
+        """,
+        {"r": ruleset_id},
+    )
+    return BenchmarkFixture(ruleset_version_id=ruleset_version_id)
+
+
+def register_source(connection: Connection, fixture: BenchmarkFixture) -> uuid.UUID:
+    """One fresh, indexable source document with verified usage rights."""
+    return _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.source_documents
+            (source_type_id, ruleset_version_id, title, classification, file_hash,
+             source_version_label, visibility, status, usage_rights_status)
+        VALUES (
+            (SELECT source_type_id FROM core.source_types WHERE code = 'rulebook'),
+            :ruleset_version, 'Ingestion Benchmark Sourcebook', 'srd', :hash, 'v1',
+            'general', 'active', 'verified_srd_license'
+        )
+        RETURNING source_document_id
+        """,
+        {"ruleset_version": fixture.ruleset_version_id, "hash": uuid.uuid4().hex},
+    )
+
+
+def synthetic_passages(count: int, *, seed: int = 0) -> Iterator[PassageInput]:
+    """`count` passages in a seeded shuffle of `passage_order` 0..count-1,
+    yielded lazily — the way the NDJSON route feeds the stream path — with
+    every tenth passage carrying no page label and every hundredth a
+    chapter break."""
+    rng = random.Random(seed)
+    orders = list(range(count))
+    rng.shuffle(orders)
+    for order in orders:
+        yield PassageInput(
+            passage_order=order,
+            content=" ".join(rng.choices(_WORDS, k=_PASSAGE_WORDS)),
+            chapter=f"Chapter {order // 100 + 1}",
+            section=f"Section {order // 10 + 1}",
+            page_label=None if order % 10 == 0 else str(order // 4 + 1),
+            heading="Chapter opening" if order % 100 == 0 else None,
+        )
+
+
+def legacy_ingest_reference_passages(
+    connection: Connection, *, source_document_id: uuid.UUID, passages: Iterable[PassageInput]
+) -> tuple[uuid.UUID, ...]:
+    """The one-INSERT-per-passage loop the batched path replaced, kept
+    verbatim as this benchmark's baseline (minus its source-document
+    check, which both paths pay once). Returns ids in input order."""
+    passage_ids: list[uuid.UUID] = []
+    for passage in passages:
+        passage_id = connection.execute(
+            text("""
+                INSERT INTO ai.reference_passages
+                    (source_document_id, passage_order, chapter, section, page_label,
+                     heading, content)
+                VALUES (:source, :order, :chapter, :section, :page, :heading, :content)
+                RETURNING reference_passage_id
+            """),
+            {
+                "source": source_document_id,
+                "order": passage.passage_order,
+                "chapter": passage.chapter,
+                "section": passage.section,
+                "page": passage.page_label,
+                "heading": passage.heading,
+                "content": passage.content,
+            },
+        ).scalar()
+        assert isinstance(passage_id, uuid.UUID)
+        passage_ids.append(passage_id)
+    return tuple(passage_ids)
+
+
+def _stored_passages(connection: Connection, source_document_id: uuid.UUID) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in connection.execute(
+            text("""
+                SELECT passage_order, chapter, section, page_label, heading, content
+                FROM ai.reference_passages
+                WHERE source_document_id = :source
+                ORDER BY passage_order
+            """),
+            {"source": source_document_id},
+        )
+    ]
+
+
+def assert_paths_agree(connection: Connection, fixture: BenchmarkFixture, *, passages: int) -> None:
+    """Raises AssertionError unless both paths store the same rows for the
+    same input, and the batched path returns its ids in `passage_order`."""
+    legacy_source = register_source(connection, fixture)
+    batched_source = register_source(connection, fixture)
+    legacy_ingest_reference_passages(
+        connection, source_document_id=legacy_source, passages=synthetic_passages(passages)
+    )
+    batched_ids = _ingest_reference_passage_stream_impl(
+        connection, source_document_id=batched_source, passages=synthetic_passages(passages)
+    )
+    stored = _stored_passages(connection, batched_source)
+    assert stored == _stored_passages(connection, legacy_source), "batched rows disagree"
+    assert len(stored) == passages
+    ordered_ids = connection.execute(
+        text("""
+            SELECT reference_passage_id FROM ai.reference_passages
+            WHERE source_document_id = :source ORDER BY passage_order
+        """),
+        {"source": batched_source},
+    ).scalars()
+    assert list(batched_ids) == list(ordered_ids), "batched ids are not in passage_order"
+
+
+@dataclass(frozen=True)
+class PathTiming:
+    name: str
+    median_seconds: float
+    mean_seconds: float
+    passages_per_second: float
+
+
+def run_benchmark(
+    connection: Connection, fixture: BenchmarkFixture, *, passages: int, runs: int
+) -> list[PathTiming]:
+    paths: dict[str, Callable[..., tuple[uuid.UUID, ...]]] = {
+        "legacy (row at a time)": legacy_ingest_reference_passages,
+        "batched unnest": _ingest_reference_passage_stream_impl,
+    }
+    samples: dict[str, list[float]] = {name: [] for name in paths}
+    for run in range(runs):
+        order = list(paths.items())
+        if run % 2:
+            order.reverse()
+        for name, ingest in order:
+            source_document_id = register_source(connection, fixture)
+            started = time.perf_counter()
+            ingest(
+                connection,
+                source_document_id=source_document_id,
+                passages=synthetic_passages(passages, seed=run),
+            )
+            samples[name].append(time.perf_counter() - started)
+    return [
+        PathTiming(
+            name=name,
+            median_seconds=statistics.median(values),
+            mean_seconds=statistics.fmean(values),
+            passages_per_second=passages / statistics.median(values),
+        )
+        for name, values in samples.items()
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare wall-clock time of the legacy row-at-a-time and batched "
+            "reference passage ingestion paths. Never commits anything."
+        )
+    )
+    parser.add_argument(
+        "--passages", type=int, default=50_000, help="Passages per ingestion (default 50000)."
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per path (default 3).")
+    args = parser.parse_args()
+    if args.passages < 1 or args.runs < 1:
+        parser.error("--passages and --runs must be >= 1")
+
+    assert settings.database_url is not None
+    engine = create_engine(settings.database_url)
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                fixture = build_fixture(connection)
+                assert_paths_agree(connection, fixture, passages=min(args.passages, 2_000))
+                timings = run_benchmark(connection, fixture, passages=args.passages, runs=args.runs)
+            finally:
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    print(f"reference passage ingestion: {args.passages} passages, {args.runs} runs per path")
+    print(f"{'path':<24} {'median s':>10} {'mean s':>10} {'passages/s':>12}")
+    for timing in timings:
+        print(
+            f"{timing.name:<24} {timing.median_seconds:>10.3f} {timing.mean_seconds:>10.3f} "
+            f"{timing.passages_per_second:>12.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,493 @@
+"""Opt-in query-plan benchmark for reference retrieval's authorization
+filter (`dnd_ai.commands.reference_corpus._lexical_candidates`): the join
+from `ai.campaign_authorized_sources` (migration 104) against the
+per-query `LEFT JOIN ai.reference_source_campaigns ... GROUP BY ...
+bool_or(is_house_rule)` it replaced, across many campaigns sharing one
+edition's corpus.
+
+Kept out of pytest collection for the same reason as
+`scripts/benchmark_reference_ingestion.py` — its numbers are meaningful
+only against a quiet database and never a pass/fail gate.
+`tests/database/test_benchmark_reference_retrieval.py` imports this
+module's fixture builder and `legacy_lexical_candidates` to prove both
+paths return the same passages with the same house-rule flags, and that
+the projection holds exactly the rows the legacy filter computes; those
+checks are the only part that runs in CI.
+
+What it does, against `DND_AI_DATABASE_URL`/`DATABASE_URL`:
+
+1. Opens ONE transaction and builds a disposable fixture inside it: a
+   throwaway world and ruleset version, `--campaigns` pending campaigns
+   on it, `--sources` source documents with `--passages` synthetic
+   passages each, and a second edition's sources the edition guard must
+   exclude. Every fourth source is campaign-restricted and every
+   twenty-fifth removed. Restricted sources are granted to about a third
+   of the campaigns, and some general sources carry a house-rule grant.
+   Then `ANALYZE`s the tables involved so both plans see real statistics.
+2. Checks both paths agree for every campaign and query.
+3. For each of `--runs` rounds, runs every query for every campaign under
+   `EXPLAIN (ANALYZE, FORMAT JSON)` through each path, alternating which
+   goes first. The projection path is the production function itself; an
+   event hook prefixes its statement with the `EXPLAIN`.
+4. Prints median/p95 execution and median planning milliseconds per path,
+   and whether its plan contains an aggregate node.
+5. Rolls the transaction back — nothing is ever committed, so there is no
+   cleanup step and no disposable data is left behind even on failure.
+
+Usage:
+    uv run python scripts/benchmark_reference_retrieval.py [--campaigns 100] \
+        [--sources 200] [--passages 20] [--runs 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, Row, create_engine, event, text
+
+from dnd_ai.commands.reference_corpus import _lexical_candidates
+from dnd_ai.config import settings
+
+_PASSAGE_WORDS = 40
+_WORDS = (
+    "the", "spell", "creature", "target", "saving", "throw", "damage", "radius",
+    "feet", "action", "bonus", "reaction", "hit", "points", "armor", "class",
+    "advantage", "disadvantage", "concentration", "duration", "range",
+    "goblin", "dragon", "wizard", "fireball", "poison", "grapple", "stealth",
+)  # fmt: skip
+QUERIES = ("fireball damage", "goblin stealth", '"saving throw" -poison')
+# The route's default `limit`.
+_LIMIT = 5
+
+
+@dataclass
+class BenchmarkFixture:
+    ruleset_version_id: uuid.UUID
+    campaign_ids: list[uuid.UUID]
+
+
+def _scalar_uuid(connection: Connection, sql: str, params: dict[str, object]) -> uuid.UUID:
+    value = connection.execute(text(sql), params).scalar()
+    assert isinstance(value, uuid.UUID)
+    return value
+
+
+def _ruleset_version(connection: Connection, world_id: uuid.UUID, code: str) -> uuid.UUID:
+    ruleset_id = _scalar_uuid(
+        connection,
+        "INSERT INTO rules.rulesets (code, display_name) VALUES (:c, :c) RETURNING ruleset_id",
+        {"c": code},
+    )
+    connection.execute(
+        text("INSERT INTO rules.world_rulesets (world_id, ruleset_id) VALUES (:w, :r)"),
+        {"w": world_id, "r": ruleset_id},
+    )
+    return _scalar_uuid(
+        connection,
+        """
+        INSERT INTO rules.ruleset_versions (ruleset_id, version_label, is_current)
+        VALUES (:r, 'v1', true)
+        RETURNING ruleset_version_id
+        """,
+        {"r": ruleset_id},
+    )
+
+
+def _insert_sources(
+    connection: Connection, ruleset_version_id: uuid.UUID, *, count: int
+) -> list[uuid.UUID]:
+    """`count` sources in source order: every fourth restricted, every
+    twenty-fifth removed, the rest general and active."""
+    return list(
+        connection.execute(
+            text("""
+                INSERT INTO core.source_documents
+                    (source_type_id, ruleset_version_id, title, classification, file_hash,
+                     source_version_label, visibility, status, removed_at, usage_rights_status)
+                SELECT
+                    (SELECT source_type_id FROM core.source_types WHERE code = 'rulebook'),
+                    :ruleset_version, 'Retrieval Benchmark Source ' || i, 'srd',
+                    md5(:salt || i::text), 'v1',
+                    CASE WHEN i % 4 = 0 THEN 'campaign_restricted' ELSE 'general' END,
+                    CASE WHEN i % 25 = 0 THEN 'removed' ELSE 'active' END,
+                    CASE WHEN i % 25 = 0 THEN now() END,
+                    'verified_srd_license'
+                FROM generate_series(1, :count) AS i
+                ORDER BY i
+                RETURNING source_document_id
+            """),
+            {"ruleset_version": ruleset_version_id, "salt": uuid.uuid4().hex, "count": count},
+        ).scalars()
+    )
+
+
+def _insert_passages(
+    connection: Connection, source_ids: Sequence[uuid.UUID], *, passages: int, seed: int
+) -> None:
+    rng = random.Random(seed)
+    rows = [
+        (source_id, order, " ".join(rng.choices(_WORDS, k=_PASSAGE_WORDS)))
+        for source_id in source_ids
+        for order in range(passages)
+    ]
+    connection.execute(
+        text("""
+            INSERT INTO ai.reference_passages (source_document_id, passage_order, content)
+            SELECT * FROM unnest(
+                CAST(:sources AS uuid[]), CAST(:orders AS integer[]), CAST(:contents AS text[])
+            )
+        """),
+        {
+            "sources": [row[0] for row in rows],
+            "orders": [row[1] for row in rows],
+            "contents": [row[2] for row in rows],
+        },
+    )
+
+
+def build_fixture(
+    connection: Connection, *, campaigns: int, sources: int, passages: int
+) -> BenchmarkFixture:
+    """Builds the benchmark fixture inside the caller's transaction (see
+    this module's docstring). Mirrors tests/factories.py's tested shapes —
+    this script cannot import that test-only module."""
+    suffix = uuid.uuid4().hex[:8]
+    active = _scalar_uuid(
+        connection,
+        "SELECT lifecycle_status_id FROM core.lifecycle_statuses WHERE code = 'active'",
+        {},
+    )
+    world_id = _scalar_uuid(
+        connection,
+        """
+        INSERT INTO core.worlds (name, slug, lifecycle_status_id)
+        VALUES ('Retrieval Benchmark World', :slug, :status)
+        RETURNING world_id
+        """,
+        {"slug": f"retrieval-benchmark-{suffix}", "status": active},
+    )
+    ruleset_version_id = _ruleset_version(connection, world_id, f"retrieval_benchmark_{suffix}")
+    other_version_id = _ruleset_version(connection, world_id, f"retrieval_benchmark_{suffix}_b")
+    # Pending, not active: an active campaign must retain an access-manager
+    # membership at commit, which a benchmark has no reason to set up.
+    campaign_ids = list(
+        connection.execute(
+            text("""
+                WITH timelines AS (
+                    INSERT INTO campaign.timelines (world_id, name, is_primary, lifecycle_status_id)
+                    SELECT :world, 'Benchmark Timeline ' || i, false, :status
+                    FROM generate_series(1, :count) AS i
+                    RETURNING timeline_id
+                )
+                INSERT INTO campaign.campaigns
+                    (timeline_id, name, lifecycle_status_id, ruleset_version_id)
+                SELECT timeline_id, 'Retrieval Benchmark Campaign',
+                       (SELECT lifecycle_status_id FROM core.lifecycle_statuses
+                        WHERE code = 'pending'),
+                       :ruleset_version
+                FROM timelines
+                RETURNING campaign_id
+            """),
+            {
+                "world": world_id,
+                "status": active,
+                "count": campaigns,
+                "ruleset_version": ruleset_version_id,
+            },
+        ).scalars()
+    )
+    source_ids = _insert_sources(connection, ruleset_version_id, count=sources)
+    other_source_ids = _insert_sources(connection, other_version_id, count=max(sources // 10, 1))
+    _insert_passages(connection, source_ids, passages=passages, seed=0)
+    _insert_passages(connection, other_source_ids, passages=passages, seed=1)
+
+    grants: list[tuple[uuid.UUID, uuid.UUID, bool]] = []
+    for c, campaign_id in enumerate(campaign_ids):
+        for s, source_id in enumerate(source_ids, start=1):
+            if s % 4 == 0 and (c + s) % 3 == 0:
+                grants.append((source_id, campaign_id, (c + s) % 2 == 0))
+            elif s % 4 != 0 and (c * 7 + s) % 50 == 0:
+                grants.append((source_id, campaign_id, True))
+    connection.execute(
+        text("""
+            INSERT INTO ai.reference_source_campaigns
+                (source_document_id, campaign_id, is_house_rule)
+            SELECT * FROM unnest(
+                CAST(:sources AS uuid[]), CAST(:campaigns AS uuid[]),
+                CAST(:house_rules AS boolean[])
+            )
+        """),
+        {
+            "sources": [grant[0] for grant in grants],
+            "campaigns": [grant[1] for grant in grants],
+            "house_rules": [grant[2] for grant in grants],
+        },
+    )
+    for table in (
+        "campaign.campaigns",
+        "core.source_documents",
+        "ai.reference_passages",
+        "ai.reference_source_campaigns",
+        "ai.campaign_authorized_sources",
+    ):
+        connection.execute(text(f"ANALYZE {table}"))
+    return BenchmarkFixture(ruleset_version_id=ruleset_version_id, campaign_ids=campaign_ids)
+
+
+def legacy_lexical_candidates(
+    connection: Connection,
+    *,
+    campaign_id: uuid.UUID,
+    ruleset_version_id: uuid.UUID,
+    query_text: str,
+    limit: int,
+) -> Sequence[Row[Any]]:
+    """The per-query grant join and aggregate `_lexical_candidates` ran
+    before migration 104, kept verbatim as this benchmark's baseline."""
+    return connection.execute(
+        text("""
+            SELECT
+                p.reference_passage_id, p.source_document_id, sd.title, p.chapter, p.section,
+                p.page_label, p.heading, p.content,
+                COALESCE(bool_or(rsc.is_house_rule), false) AS is_house_rule,
+                ts_rank(p.content_tsv, websearch_to_tsquery('english', :query)) AS relevance_score,
+                ts_rank(p.content_tsv, websearch_to_tsquery('english', :query)) AS lexical_score,
+                CAST(NULL AS real) AS vector_score
+            FROM ai.reference_passages p
+            JOIN core.source_documents sd ON sd.source_document_id = p.source_document_id
+            LEFT JOIN ai.reference_source_campaigns rsc
+                ON rsc.source_document_id = sd.source_document_id
+               AND rsc.campaign_id = :campaign
+               AND rsc.revoked_at IS NULL
+            WHERE sd.status = 'active'
+              AND sd.ruleset_version_id = :ruleset_version
+              AND (sd.visibility = 'general' OR rsc.reference_source_campaign_id IS NOT NULL)
+              AND p.content_tsv @@ websearch_to_tsquery('english', :query)
+            GROUP BY p.reference_passage_id, p.source_document_id, sd.title, p.chapter,
+                     p.section, p.page_label, p.heading, p.content
+            ORDER BY is_house_rule DESC, relevance_score DESC, p.passage_order ASC
+            LIMIT :limit
+        """),
+        {
+            "campaign": campaign_id,
+            "ruleset_version": ruleset_version_id,
+            "query": query_text,
+            "limit": limit,
+        },
+    ).all()
+
+
+def legacy_authorized_sources(
+    connection: Connection, campaign_id: uuid.UUID
+) -> dict[uuid.UUID, bool]:
+    """The legacy filter's (source, house rule) set for one campaign."""
+    rows = connection.execute(
+        text("""
+            SELECT sd.source_document_id,
+                   COALESCE(bool_or(rsc.is_house_rule), false) AS is_house_rule
+            FROM campaign.campaigns c
+            JOIN core.source_documents sd ON sd.ruleset_version_id = c.ruleset_version_id
+            LEFT JOIN ai.reference_source_campaigns rsc
+                ON rsc.source_document_id = sd.source_document_id
+               AND rsc.campaign_id = c.campaign_id
+               AND rsc.revoked_at IS NULL
+            WHERE c.campaign_id = :campaign
+              AND sd.status = 'active'
+              AND (sd.visibility = 'general' OR rsc.reference_source_campaign_id IS NOT NULL)
+            GROUP BY sd.source_document_id
+        """),
+        {"campaign": campaign_id},
+    ).all()
+    return {row.source_document_id: row.is_house_rule for row in rows}
+
+
+def _projected_sources(connection: Connection, campaign_id: uuid.UUID) -> dict[uuid.UUID, bool]:
+    rows = connection.execute(
+        text("""
+            SELECT source_document_id, is_house_rule FROM ai.campaign_authorized_sources
+            WHERE campaign_id = :campaign
+        """),
+        {"campaign": campaign_id},
+    ).all()
+    return {row.source_document_id: row.is_house_rule for row in rows}
+
+
+def _comparable(rows: Sequence[Row[Any]]) -> list[tuple[Any, ...]]:
+    """Passage, house-rule flag and score, sorted by passage id: passages
+    tied on (house rule, score, passage_order) across sources may come back
+    in either order from either path."""
+    return sorted(
+        (row.reference_passage_id, row.is_house_rule, round(float(row.relevance_score), 6))
+        for row in rows
+    )
+
+
+def assert_paths_agree(connection: Connection, fixture: BenchmarkFixture) -> None:
+    """Raises AssertionError unless, for every campaign, the projection
+    holds exactly the legacy filter's sources and flags, and both paths
+    return the same passages for every query."""
+    for campaign_id in fixture.campaign_ids:
+        assert _projected_sources(connection, campaign_id) == legacy_authorized_sources(
+            connection, campaign_id
+        ), f"projection disagrees for campaign {campaign_id}"
+        for query in QUERIES:
+            kwargs: dict[str, Any] = {
+                "campaign_id": campaign_id,
+                "ruleset_version_id": fixture.ruleset_version_id,
+                "query_text": query,
+                "limit": 1_000_000,
+            }
+            assert _comparable(_lexical_candidates(connection, **kwargs)) == _comparable(
+                legacy_lexical_candidates(connection, **kwargs)
+            ), f"passages disagree for campaign {campaign_id}, query {query!r}"
+
+
+@contextmanager
+def _explain_analyze(connection: Connection) -> Iterator[None]:
+    """Runs every statement `connection` executes inside the block as
+    `EXPLAIN (ANALYZE, FORMAT JSON)`, so the caller's own function returns
+    its plan instead of its rows."""
+
+    def prefix(
+        _conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> tuple[str, Any]:
+        return f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters
+
+    event.listen(connection, "before_cursor_execute", prefix, retval=True)
+    try:
+        yield
+    finally:
+        event.remove(connection, "before_cursor_execute", prefix)
+
+
+def _node_types(plan: dict[str, Any]) -> Iterator[str]:
+    yield plan["Node Type"]
+    for child in plan.get("Plans", ()):
+        yield from _node_types(child)
+
+
+@dataclass(frozen=True)
+class PathTiming:
+    name: str
+    median_execution_ms: float
+    p95_execution_ms: float
+    median_planning_ms: float
+    aggregates: bool
+
+
+def run_benchmark(
+    connection: Connection, fixture: BenchmarkFixture, *, runs: int
+) -> list[PathTiming]:
+    paths: dict[str, Callable[..., Sequence[Row[Any]]]] = {
+        "legacy (group by)": legacy_lexical_candidates,
+        "authorized sources": _lexical_candidates,
+    }
+    execution: dict[str, list[float]] = {name: [] for name in paths}
+    planning: dict[str, list[float]] = {name: [] for name in paths}
+    aggregates = dict.fromkeys(paths, False)
+    for run in range(runs):
+        order = list(paths.items())
+        if run % 2:
+            order.reverse()
+        for name, candidates in order:
+            for campaign_id in fixture.campaign_ids:
+                for query in QUERIES:
+                    with _explain_analyze(connection):
+                        rows = candidates(
+                            connection,
+                            campaign_id=campaign_id,
+                            ruleset_version_id=fixture.ruleset_version_id,
+                            query_text=query,
+                            limit=_LIMIT,
+                        )
+                    explained = rows[0][0][0]
+                    execution[name].append(explained["Execution Time"])
+                    planning[name].append(explained["Planning Time"])
+                    aggregates[name] = aggregates[name] or any(
+                        "Aggregate" in node for node in _node_types(explained["Plan"])
+                    )
+    return [
+        PathTiming(
+            name=name,
+            median_execution_ms=statistics.median(execution[name]),
+            p95_execution_ms=statistics.quantiles(execution[name], n=20)[-1]
+            if len(execution[name]) > 1
+            else execution[name][0],
+            median_planning_ms=statistics.median(planning[name]),
+            aggregates=aggregates[name],
+        )
+        for name in paths
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare EXPLAIN ANALYZE timings of reference retrieval's legacy "
+            "grant-join filter and the per-campaign authorized-source "
+            "projection. Never commits anything."
+        )
+    )
+    parser.add_argument(
+        "--campaigns", type=int, default=100, help="Campaigns sharing the corpus (default 100)."
+    )
+    parser.add_argument(
+        "--sources", type=int, default=200, help="Source documents in the edition (default 200)."
+    )
+    parser.add_argument(
+        "--passages", type=int, default=20, help="Passages per source document (default 20)."
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Rounds per path (default 3).")
+    args = parser.parse_args()
+    if min(args.campaigns, args.sources, args.passages, args.runs) < 1:
+        parser.error("--campaigns, --sources, --passages and --runs must be >= 1")
+
+    assert settings.database_url is not None
+    engine = create_engine(settings.database_url)
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                fixture = build_fixture(
+                    connection,
+                    campaigns=args.campaigns,
+                    sources=args.sources,
+                    passages=args.passages,
+                )
+                assert_paths_agree(connection, fixture)
+                timings = run_benchmark(connection, fixture, runs=args.runs)
+            finally:
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    print(
+        f"reference retrieval: {args.campaigns} campaigns x {args.sources} sources x "
+        f"{args.passages} passages, {len(QUERIES)} queries, {args.runs} runs per path"
+    )
+    print(
+        f"{'path':<20} {'exec p50 ms':>12} {'exec p95 ms':>12} {'plan p50 ms':>12} {'aggregate':>10}"
+    )
+    for timing in timings:
+        print(
+            f"{timing.name:<20} {timing.median_execution_ms:>12.3f} "
+            f"{timing.p95_execution_ms:>12.3f} {timing.median_planning_ms:>12.3f} "
+            f"{'yes' if timing.aggregates else 'no':>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -45,6 +45,11 @@ resolved `AccessContext.principal` in hand — that is a per-request check
 this module cannot perform generically, since which request field carries
 `external_system_id` varies by route.
 
+`require_campaign_capability_released` is the same dependency for the
+async AI routes (`dnd_ai.api.ai_npc`, `.ai_synthesis`): it resolves on a
+short-lived connection of its own rather than holding the request's
+`get_connection` through a provider call.
+
 `resolve_party_perspective()` and `resolve_character_view_tier()` below
 are this module's resource-scoped resolvers: not "does this caller have a
 campaign-wide capability" but "is this caller authorized to view fictional
@@ -68,26 +73,26 @@ from collections.abc import Callable
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import Connection, text
+from sqlalchemy import Connection, Engine, text
 
 from dnd_ai.commands._shared import validate_campaign_party
 from dnd_ai.domain.access import (
     FOUNDRY_SYSTEM_AUTH_METHOD,
     AccessContext,
     AuthenticatedPrincipal,
-    resolve_access_context,
 )
 from dnd_ai.domain.errors import DomainAuthorizationError
 
 from ._shared import timeline_world_id
+from .access_cache import AccessContextCache, get_access_context_cache
 from .auth import get_authenticated_user_id
-from .deps import get_connection
+from .deps import get_connection, get_engine, open_transaction
 from .errors import ForbiddenError, NotFoundError
 
 
 def require_campaign_capability(
     capability_code: str, *, allow_foundry_system: bool = False
-) -> Callable[[uuid.UUID, AuthenticatedPrincipal, Connection], AccessContext]:
+) -> Callable[[uuid.UUID, AuthenticatedPrincipal, Connection, AccessContextCache], AccessContext]:
     """Returns a FastAPI dependency requiring `capability_code` (role- or
     character-relationship-derived, per `AccessContext.has_capability`) in
     the campaign named by the route's own `campaign_id` path parameter.
@@ -105,40 +110,94 @@ def require_campaign_capability(
     and the defect it closes. The returned `AccessContext` always carries
     the resolved `principal` (`dataclasses.replace`, since `resolve_access_
     context` itself only ever takes a bare `user_id`) so route code can
-    still recover how the caller authenticated afterward."""
+    still recover how the caller authenticated afterward.
+
+    The context itself comes from `dnd_ai.api.access_cache.
+    AccessContextCache` — the same `resolve_access_context` result, reused
+    across requests only while the campaign's security generation and
+    every contributing row's `expires_at` say it is still current (see
+    that module's docstring). Every check below still runs per request."""
 
     def _dependency(
         campaign_id: uuid.UUID,
         principal: Annotated[AuthenticatedPrincipal, Depends(get_authenticated_user_id)],
         connection: Annotated[Connection, Depends(get_connection)],
+        access_cache: Annotated[AccessContextCache, Depends(get_access_context_cache)],
     ) -> AccessContext:
-        is_foundry = principal.auth_method == FOUNDRY_SYSTEM_AUTH_METHOD
-        if is_foundry and not allow_foundry_system:
-            raise ForbiddenError()
-
-        access = resolve_access_context(
-            connection, user_id=principal.user_id, campaign_id=campaign_id
+        return _authorize_campaign_capability(
+            connection,
+            campaign_id=campaign_id,
+            principal=principal,
+            access_cache=access_cache,
+            capability_code=capability_code,
+            allow_foundry_system=allow_foundry_system,
         )
-        if access is None:
-            raise NotFoundError()
 
-        if is_foundry:
-            campaign_world_id = timeline_world_id(connection, access.timeline_id)
-            if campaign_world_id != principal.foundry_world_id:
-                # Indistinguishable from "no active membership" — a
-                # FoundrySystem credential for a different world must not be
-                # able to learn that this campaign exists at all, any more
-                # than a non-member OIDC caller can. See this module's
-                # docstring for the full reasoning.
-                raise NotFoundError()
+    return _dependency
+
 
-        if not access.has_capability(capability_code):
-            raise ForbiddenError()
-        return dataclasses.replace(access, principal=principal)
+def require_campaign_capability_released(
+    capability_code: str, *, allow_foundry_system: bool = False
+) -> Callable[[uuid.UUID, AuthenticatedPrincipal, Engine, AccessContextCache], AccessContext]:
+    """`require_campaign_capability` for an `async def` route that awaits
+    an AI provider: the same checks, on a connection of this dependency's
+    own (`dnd_ai.api.deps.open_transaction`) that is back in the pool
+    before the handler runs. On the request's `get_connection` the
+    connection would stay checked out for the whole provider wait, so
+    enough slow turns at once would exhaust the pool. The handler reads
+    on its own short-lived connections too, never `get_connection`."""
+
+    def _dependency(
+        campaign_id: uuid.UUID,
+        principal: Annotated[AuthenticatedPrincipal, Depends(get_authenticated_user_id)],
+        engine: Annotated[Engine, Depends(get_engine)],
+        access_cache: Annotated[AccessContextCache, Depends(get_access_context_cache)],
+    ) -> AccessContext:
+        with open_transaction(engine) as connection:
+            return _authorize_campaign_capability(
+                connection,
+                campaign_id=campaign_id,
+                principal=principal,
+                access_cache=access_cache,
+                capability_code=capability_code,
+                allow_foundry_system=allow_foundry_system,
+            )
 
     return _dependency
 
 
+def _authorize_campaign_capability(
+    connection: Connection,
+    *,
+    campaign_id: uuid.UUID,
+    principal: AuthenticatedPrincipal,
+    access_cache: AccessContextCache,
+    capability_code: str,
+    allow_foundry_system: bool,
+) -> AccessContext:
+    is_foundry = principal.auth_method == FOUNDRY_SYSTEM_AUTH_METHOD
+    if is_foundry and not allow_foundry_system:
+        raise ForbiddenError()
+
+    access = access_cache.resolve(connection, user_id=principal.user_id, campaign_id=campaign_id)
+    if access is None:
+        raise NotFoundError()
+
+    if is_foundry:
+        campaign_world_id = timeline_world_id(connection, access.timeline_id)
+        if campaign_world_id != principal.foundry_world_id:
+            # Indistinguishable from "no active membership" — a
+            # FoundrySystem credential for a different world must not be
+            # able to learn that this campaign exists at all, any more
+            # than a non-member OIDC caller can. See this module's
+            # docstring for the full reasoning.
+            raise NotFoundError()
+
+    if not access.has_capability(capability_code):
+        raise ForbiddenError()
+    return dataclasses.replace(access, principal=principal)
+
+
 class PartyPerspectiveNotAuthorizedError(DomainAuthorizationError):
     """Raised by `resolve_party_perspective()` for any combination that
     does not prove the authenticated caller is entitled to view fictional
@@ -0,0 +1,117 @@
+"""Cross-request cache of resolved `AccessContext`s for
+`dnd_ai.api.access.require_campaign_capability`.
+
+`resolve_access_context` joins across six `security.*` tables, and
+`require_campaign_capability` runs it on every campaign-scoped request —
+while the answer itself changes only when someone edits that campaign's
+memberships, roles, relationships, or grants, or when one of those rows
+reaches its own `expires_at`. This module keeps the last resolved context
+per (user, campaign) and reuses it only while all three of these still
+hold:
+
+1. the campaign's security generation (`dnd_ai.domain.access.
+   read_campaign_security_generation` — one primary-key read, replacing
+   those joins) is the one the entry was resolved at. Migration 099's
+   triggers bump it inside the writing transaction itself, so a grant
+   revocation, role removal, suspension, or invitation acceptance is
+   visible to the very next request once it commits, from every process,
+   with nothing application-side to remember to call;
+2. the database's own `now()` from that same read is still before the
+   entry's `AccessContext.valid_until` — the one change no row write
+   announces is a row simply reaching its `expires_at`;
+3. the entry is younger than `ttl_seconds` (process monotonic clock) — a
+   backstop bounding how long any single entry lives regardless, not the
+   invalidation mechanism itself.
+
+Fail-closed is unchanged: a miss, a missing generation row, or a `None`
+resolution all fall through to `resolve_access_context` exactly as before,
+and only a positive resolution is ever stored (a non-member's next request
+re-resolves, which is also what makes a brand-new membership usable
+immediately). Nothing here decides authorization — `require_campaign_
+capability` still performs every capability, Foundry-gate, and world check
+on whatever context this returns.
+
+Process-local and bounded (`max_entries`, least-recently-used eviction);
+`max_entries=0` disables caching entirely and makes `resolve` a plain
+pass-through, which is also the safe setting for a schema downgraded below
+migration 099. Built once per process by `get_access_context_cache` from
+`DND_AI_ACCESS_CONTEXT_CACHE_MAX_ENTRIES`/`_TTL_SECONDS`, and discarded by
+`dispose_access_context_cache` from the app's lifespan shutdown, mirroring
+`dnd_ai.api.auth.get_jwks_client`/`dispose_jwks_client`.
+"""
+
+import threading
+import uuid
+
+from sqlalchemy import Connection
+
+from dnd_ai.caching import GenerationCache
+from dnd_ai.config import settings
+from dnd_ai.domain.access import (
+    AccessContext,
+    read_campaign_security_generation,
+    resolve_access_context,
+)
+
+_CacheKey = tuple[uuid.UUID, uuid.UUID]
+
+
+class AccessContextCache(GenerationCache[_CacheKey, AccessContext]):
+    """See this module's docstring: a `dnd_ai.caching.GenerationCache` at
+    the campaign's security generation, with the database clock checked
+    against `valid_until` on every hit and `ttl_seconds` as the
+    backstop."""
+
+    def resolve(
+        self, connection: Connection, *, user_id: uuid.UUID, campaign_id: uuid.UUID
+    ) -> AccessContext | None:
+        """`resolve_access_context(connection, user_id=..., campaign_id=...)`,
+        served from the cache when the entry for (user_id, campaign_id) is
+        still current by all three of this module's rules."""
+        if not self.enabled:
+            return resolve_access_context(connection, user_id=user_id, campaign_id=campaign_id)
+
+        current = read_campaign_security_generation(connection, campaign_id=campaign_id)
+        if current is None:
+            return resolve_access_context(connection, user_id=user_id, campaign_id=campaign_id)
+
+        key = (user_id, campaign_id)
+        cached = self.lookup(
+            key,
+            generation=current.generation,
+            is_current=lambda access: (
+                access.valid_until is None or current.observed_at < access.valid_until
+            ),
+        )
+        if cached is not None:
+            return cached
+
+        access = resolve_access_context(connection, user_id=user_id, campaign_id=campaign_id)
+        if access is not None:
+            self.store(key, access, generation=current.generation)
+        return access
+
+
+_access_context_cache: AccessContextCache | None = None
+_access_context_cache_init_lock = threading.Lock()
+
+
+def get_access_context_cache() -> AccessContextCache:
+    global _access_context_cache
+    if _access_context_cache is not None:
+        return _access_context_cache
+    with _access_context_cache_init_lock:
+        if _access_context_cache is None:
+            _access_context_cache = AccessContextCache(
+                max_entries=settings.access_context_cache_max_entries,
+                ttl_seconds=settings.access_context_cache_ttl_seconds,
+            )
+        return _access_context_cache
+
+
+def dispose_access_context_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.auth.dispose_jwks_client`."""
+    global _access_context_cache
+    with _access_context_cache_init_lock:
+        _access_context_cache = None
@@ -32,23 +32,82 @@ unavailable (503) rather than silently falling back to a fake provider in
 production. Tests override this via `app.dependency_overrides` (the same
 mechanism `dnd_ai.api.deps.get_engine` already uses), never a
 monkeypatched module global.
+
+Both AI routes are `async def`: the provider call is awaited on one
+process-wide, pooled keep-alive `httpx.AsyncClient` (`get_ai_http_client()`,
+sized by `DND_AI_AI_PROVIDER_MAX_CONNECTIONS` and friends, closed by
+`dnd_ai.api.app`'s lifespan), so a slow model server holds neither a
+worker thread nor a pooled database connection while it answers.
+Authorization runs on `dnd_ai.api.access.require_campaign_capability_
+released`'s own short-lived connection, not the request-scoped
+`get_connection`, which would otherwise stay checked out until the
+response is sent. Each command transaction still runs synchronously, off
+the event loop (`dnd_ai.commands.ai_npc.request_npc_conversation_turn_
+async`), as does every other blocking database call in these handlers
+(`run_in_threadpool`), each on a connection of its own released before the
+next await.
+
+`.../ai/npc-conversation/stream` is the same turn, with the same
+authorization, answered as `application/x-ndjson`. One
+`{"type": "dialogue", "text": ...}` line is sent per piece of dialogue as
+the provider streams it, then one `{"type": "result", ...}` line with
+exactly the non-streamed response's fields, once the turn and any
+proposal are recorded. Every error the non-streamed route can answer
+with before the provider is called (403, 404, 503) is still an ordinary
+error response, because the stream only starts once
+`open_npc_conversation_turn_stream` has committed the request. A
+provider failure mid-stream ends in a `result` line carrying
+`error_message`, as it would in the non-streamed body.
+
+Both conversation routes share one process-wide `NpcContextCache`
+(`get_npc_context_cache`, sized by `DND_AI_NPC_CONTEXT_CACHE_*`, discarded
+by `dispose_npc_context_cache` at lifespan shutdown), so consecutive turns
+against unchanged canonical state reuse the assembled context — see
+`dnd_ai.commands.ai_npc`'s docstring. Each turn's context is then fitted
+to `DND_AI_NPC_PROMPT_MAX_TOKENS` as counted by `DND_AI_PROMPT_TOKENIZER`
+(`_resolve_prompt_budget`).
+
+Both also share one process-wide `NpcTurnGate` (`get_npc_turn_gate`), so
+concurrent turns for one NPC run one after another, with at most
+`DND_AI_NPC_TURN_MAX_QUEUED` waiting; a turn beyond that is answered 429
+`npc_busy` before anything is recorded, on the streamed route as an
+ordinary error response. `DND_AI_NPC_TURN_SINGLE_FLIGHT=false` turns the
+gate off.
 """
 
+import threading
 import uuid
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Literal
 
+import httpx
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import Engine
 
-from dnd_ai.commands.ai_npc import request_npc_conversation_turn
+from dnd_ai.commands.ai_npc import (
+    NpcContextCache,
+    NpcConversationTurnResult,
+    NpcTurnGate,
+    open_npc_conversation_turn_stream,
+    request_npc_conversation_turn_async,
+)
 from dnd_ai.commands.ai_proposals import review_proposed_change
 from dnd_ai.config import settings
 from dnd_ai.domain.access import AccessContext
-from dnd_ai.domain.ai_provider import AiProvider, OpenAiCompatibleProvider
+from dnd_ai.domain.ai_provider import (
+    AsyncAiProvider,
+    AsyncOpenAiCompatibleProvider,
+    DialogueDelta,
+    StreamingAiProvider,
+    build_async_ai_http_client,
+)
+from dnd_ai.domain.prompt_budget import PromptBudget, build_prompt_tokenizer
 
 from ._shared import timeline_world_id
-from .access import require_campaign_capability
+from .access import require_campaign_capability, require_campaign_capability_released
 from .deps import get_engine
 from .errors import ApiError, ForbiddenError
 
@@ -78,19 +137,123 @@ class AiProviderUnavailableError(ApiError):
     safe_message = "No AI provider is currently configured."
 
 
-def _resolve_provider() -> AiProvider:
+_ai_http_client: httpx.AsyncClient | None = None
+
+# Guards lazy construction of _ai_http_client, for the same reason
+# dnd_ai.api.auth._jwks_client_init_lock guards its singleton: two racing
+# first callers would otherwise each build (and one would leak) a client
+# with its own connection pool.
+_ai_http_client_init_lock = threading.Lock()
+
+
+def get_ai_http_client() -> httpx.AsyncClient:
+    global _ai_http_client
+    if _ai_http_client is not None:
+        return _ai_http_client
+    with _ai_http_client_init_lock:
+        if _ai_http_client is None:
+            _ai_http_client = build_async_ai_http_client(
+                max_connections=settings.ai_provider_max_connections,
+                max_keepalive_connections=settings.ai_provider_max_keepalive_connections,
+                keepalive_expiry_seconds=settings.ai_provider_keepalive_expiry_seconds,
+                http2=settings.ai_provider_http2,
+            )
+        return _ai_http_client
+
+
+async def dispose_ai_http_client() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.deps.dispose_engine`."""
+    global _ai_http_client
+    with _ai_http_client_init_lock:
+        client, _ai_http_client = _ai_http_client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _resolve_provider() -> StreamingAiProvider:
     if (
         settings.ai_provider_base_url == _DEFAULT_OPENAI_BASE_URL
         and settings.ai_provider_api_key is None
     ):
         raise AiProviderUnavailableError()
-    return OpenAiCompatibleProvider(
+    return AsyncOpenAiCompatibleProvider(
+        client=get_ai_http_client(),
         api_key=settings.ai_provider_api_key,
         model_identifier=settings.ai_provider_model,
         base_url=settings.ai_provider_base_url,
     )
 
 
+def _resolve_prompt_budget() -> PromptBudget:
+    return PromptBudget(
+        tokenizer=build_prompt_tokenizer(settings.prompt_tokenizer),
+        max_tokens=settings.npc_prompt_max_tokens,
+    )
+
+
+_npc_context_cache: NpcContextCache | None = None
+_npc_context_cache_init_lock = threading.Lock()
+
+
+def get_npc_context_cache() -> NpcContextCache:
+    global _npc_context_cache
+    if _npc_context_cache is not None:
+        return _npc_context_cache
+    with _npc_context_cache_init_lock:
+        if _npc_context_cache is None:
+            _npc_context_cache = NpcContextCache(
+                max_entries=settings.npc_context_cache_max_entries,
+                ttl_seconds=settings.npc_context_cache_ttl_seconds,
+            )
+        return _npc_context_cache
+
+
+def peek_npc_context_cache() -> NpcContextCache | None:
+    """The NPC-context cache if one has been built, without building it —
+    for `/metricsz`."""
+    return _npc_context_cache
+
+
+def dispose_npc_context_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.reference_corpus.dispose_reference_retrieval_cache`."""
+    global _npc_context_cache
+    with _npc_context_cache_init_lock:
+        _npc_context_cache = None
+
+
+_npc_turn_gate: NpcTurnGate | None = None
+_npc_turn_gate_init_lock = threading.Lock()
+
+
+def get_npc_turn_gate() -> NpcTurnGate | None:
+    """`None` when `DND_AI_NPC_TURN_SINGLE_FLIGHT` is off."""
+    global _npc_turn_gate
+    if not settings.npc_turn_single_flight:
+        return None
+    if _npc_turn_gate is not None:
+        return _npc_turn_gate
+    with _npc_turn_gate_init_lock:
+        if _npc_turn_gate is None:
+            _npc_turn_gate = NpcTurnGate(max_queued=settings.npc_turn_max_queued)
+        return _npc_turn_gate
+
+
+def peek_npc_turn_gate() -> NpcTurnGate | None:
+    """The NPC-turn gate if one has been built, without building it — for
+    `/metricsz`."""
+    return _npc_turn_gate
+
+
+def dispose_npc_turn_gate() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dispose_npc_context_cache`."""
+    global _npc_turn_gate
+    with _npc_turn_gate_init_lock:
+        _npc_turn_gate = None
+
+
 class NpcConversationTurnRequest(BaseModel):
     agent_assignment_id: uuid.UUID
     requesting_character_id: uuid.UUID
@@ -108,6 +271,15 @@ class NpcConversationTurnResponse(BaseModel):
     error_message: str | None
 
 
+class NpcConversationDialogueLine(BaseModel):
+    type: Literal["dialogue"] = "dialogue"
+    text: str
+
+
+class NpcConversationResultLine(NpcConversationTurnResponse):
+    type: Literal["result"] = "result"
+
+
 class ReviewProposedChangeRequest(BaseModel):
     decision: str
     comments: str | None = None
@@ -124,17 +296,23 @@ class ReviewProposedChangeResponse(BaseModel):
     response_model=NpcConversationTurnResponse,
     status_code=200,
 )
-def request_npc_conversation_turn_endpoint(
+async def request_npc_conversation_turn_endpoint(
     campaign_id: uuid.UUID,  # noqa: ARG001
     body: NpcConversationTurnRequest,
-    access: Annotated[AccessContext, Depends(require_campaign_capability(_INTERACT_CAPABILITY))],
+    access: Annotated[
+        AccessContext, Depends(require_campaign_capability_released(_INTERACT_CAPABILITY))
+    ],
     engine: Annotated[Engine, Depends(get_engine)],
-    provider: Annotated[AiProvider, Depends(_resolve_provider)],
+    provider: Annotated[AsyncAiProvider, Depends(_resolve_provider)],
+    context_cache: Annotated[NpcContextCache, Depends(get_npc_context_cache)],
+    prompt_budget: Annotated[PromptBudget, Depends(_resolve_prompt_budget)],
+    turn_gate: Annotated[NpcTurnGate | None, Depends(get_npc_turn_gate)],
 ) -> NpcConversationTurnResponse:
     if not access.has_capability(_INTERACT_CAPABILITY, character_id=body.requesting_character_id):
         raise ForbiddenError()
 
-    result = request_npc_conversation_turn(
+    expected_world_id = await run_in_threadpool(_world_id, engine, access.timeline_id)
+    result = await request_npc_conversation_turn_async(
         engine,
         agent_assignment_id=body.agent_assignment_id,
         requesting_user_id=access.user_id,
@@ -143,8 +321,11 @@ def request_npc_conversation_turn_endpoint(
         player_message=body.player_message,
         provider=provider,
         timeline_id=access.timeline_id,
-        expected_world_id=_world_id(engine, access.timeline_id),
+        expected_world_id=expected_world_id,
         world_time_id=body.world_time_id,
+        context_cache=context_cache,
+        prompt_budget=prompt_budget,
+        turn_gate=turn_gate,
     )
     return NpcConversationTurnResponse(
         context_request_id=result.context_request_id,
@@ -156,6 +337,64 @@ def request_npc_conversation_turn_endpoint(
     )
 
 
+@router.post(
+    "/campaigns/{campaign_id}/ai/npc-conversation/stream",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def stream_npc_conversation_turn_endpoint(
+    campaign_id: uuid.UUID,  # noqa: ARG001
+    body: NpcConversationTurnRequest,
+    access: Annotated[
+        AccessContext, Depends(require_campaign_capability_released(_INTERACT_CAPABILITY))
+    ],
+    engine: Annotated[Engine, Depends(get_engine)],
+    provider: Annotated[StreamingAiProvider, Depends(_resolve_provider)],
+    context_cache: Annotated[NpcContextCache, Depends(get_npc_context_cache)],
+    prompt_budget: Annotated[PromptBudget, Depends(_resolve_prompt_budget)],
+    turn_gate: Annotated[NpcTurnGate | None, Depends(get_npc_turn_gate)],
+) -> StreamingResponse:
+    if not access.has_capability(_INTERACT_CAPABILITY, character_id=body.requesting_character_id):
+        raise ForbiddenError()
+
+    expected_world_id = await run_in_threadpool(_world_id, engine, access.timeline_id)
+    events = await open_npc_conversation_turn_stream(
+        engine,
+        agent_assignment_id=body.agent_assignment_id,
+        requesting_user_id=access.user_id,
+        requesting_character_id=body.requesting_character_id,
+        requesting_party_id=body.requesting_party_id,
+        player_message=body.player_message,
+        provider=provider,
+        timeline_id=access.timeline_id,
+        expected_world_id=expected_world_id,
+        world_time_id=body.world_time_id,
+        context_cache=context_cache,
+        prompt_budget=prompt_budget,
+        turn_gate=turn_gate,
+    )
+    return StreamingResponse(_ndjson_lines(events), media_type="application/x-ndjson")
+
+
+async def _ndjson_lines(
+    events: AsyncIterator[DialogueDelta | NpcConversationTurnResult],
+) -> AsyncIterator[str]:
+    async for event in events:
+        if isinstance(event, DialogueDelta):
+            line: BaseModel = NpcConversationDialogueLine(text=event.text)
+        else:
+            line = NpcConversationResultLine(
+                context_request_id=event.context_request_id,
+                generated_output_id=event.generated_output_id,
+                dialogue=event.dialogue,
+                ai_proposed_change_id=event.ai_proposed_change_id,
+                proposal_status=event.proposal_status,
+                error_message=event.error_message,
+            )
+        yield line.model_dump_json() + "\n"
+
+
 def _world_id(engine: Engine, timeline_id: uuid.UUID) -> uuid.UUID:
     with engine.connect() as connection:
         return timeline_world_id(connection, timeline_id)
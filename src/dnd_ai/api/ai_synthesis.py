@@ -23,23 +23,33 @@ assembled-then-withheld.
   request is accepted but never used (`dnd_ai.domain.context_assembly.
   assemble_campaign_synthesis_context`'s own docstring), so this route
   simply never resolves or authorizes one for that tier.
+
+Async for the same reason as `dnd_ai.api.ai_npc`'s NPC route (see that
+module's docstring): the provider call is awaited, the perspective check
+and both command transactions run in the threadpool. Like that route it
+holds no request-scoped connection: authorization and the perspective
+check each run on a short-lived connection released before the provider
+is called.
 """
 
 import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from sqlalchemy import Connection, Engine
+from sqlalchemy import Engine
 
-from dnd_ai.commands.ai_synthesis import request_campaign_synthesis
+from dnd_ai.commands.ai_synthesis import request_campaign_synthesis_async
+from dnd_ai.config import settings
 from dnd_ai.domain.access import AccessContext
-from dnd_ai.domain.ai_provider import AiProvider
+from dnd_ai.domain.ai_provider import AsyncAiProvider
 from dnd_ai.domain.context_assembly import GM_BRIEF, OBSERVER_SUMMARY, PLAYER_SUMMARY
+from dnd_ai.domain.prompt_budget import PromptBudget, build_prompt_tokenizer
 
-from .access import require_campaign_capability, resolve_party_perspective
+from .access import require_campaign_capability_released, resolve_party_perspective
 from .ai_npc import _resolve_provider
-from .deps import get_connection, get_engine
+from .deps import get_engine, open_transaction
 from .errors import ApiError, ForbiddenError
 
 router = APIRouter(tags=["ai-synthesis"])
@@ -52,6 +62,13 @@ _BASELINE_CAPABILITY = "campaign.view"
 _GM_BRIEF_CAPABILITY = "canon.edit"
 
 
+def _resolve_prompt_budget() -> PromptBudget:
+    return PromptBudget(
+        tokenizer=build_prompt_tokenizer(settings.prompt_tokenizer),
+        max_tokens=settings.synthesis_prompt_max_tokens,
+    )
+
+
 class InvalidAudienceTierError(ApiError):
     status_code = 400
     error_code = "invalid_audience_tier"
@@ -78,13 +95,15 @@ class CampaignSynthesisResponse(BaseModel):
     response_model=CampaignSynthesisResponse,
     status_code=200,
 )
-def request_campaign_synthesis_endpoint(
+async def request_campaign_synthesis_endpoint(
     campaign_id: uuid.UUID,
     body: CampaignSynthesisRequest,
-    access: Annotated[AccessContext, Depends(require_campaign_capability(_BASELINE_CAPABILITY))],
-    connection: Annotated[Connection, Depends(get_connection)],
+    access: Annotated[
+        AccessContext, Depends(require_campaign_capability_released(_BASELINE_CAPABILITY))
+    ],
     engine: Annotated[Engine, Depends(get_engine)],
-    provider: Annotated[AiProvider, Depends(_resolve_provider)],
+    provider: Annotated[AsyncAiProvider, Depends(_resolve_provider)],
+    prompt_budget: Annotated[PromptBudget, Depends(_resolve_prompt_budget)],
 ) -> CampaignSynthesisResponse:
     if body.audience_tier not in (GM_BRIEF, PLAYER_SUMMARY, OBSERVER_SUMMARY):
         raise InvalidAudienceTierError()
@@ -96,8 +115,9 @@ def request_campaign_synthesis_endpoint(
         if not access.has_capability(_GM_BRIEF_CAPABILITY):
             raise ForbiddenError()
     elif body.audience_tier == PLAYER_SUMMARY:
-        authorized_party_id = resolve_party_perspective(
-            connection,
+        authorized_party_id = await run_in_threadpool(
+            _resolve_party_perspective,
+            engine,
             access=access,
             campaign_id=campaign_id,
             character_id=body.requesting_character_id,
@@ -110,7 +130,7 @@ def request_campaign_synthesis_endpoint(
     # authorization, and the request's own character_id/party_id are never
     # forwarded — see this module's own docstring.
 
-    result = request_campaign_synthesis(
+    result = await request_campaign_synthesis_async(
         engine,
         agent_assignment_id=body.agent_assignment_id,
         campaign_id=campaign_id,
@@ -121,6 +141,7 @@ def request_campaign_synthesis_endpoint(
         timeline_id=access.timeline_id,
         requesting_character_id=authorized_character_id,
         requesting_party_id=authorized_party_id,
+        prompt_budget=prompt_budget,
     )
     return CampaignSynthesisResponse(
         context_request_id=result.context_request_id,
@@ -128,3 +149,21 @@ def request_campaign_synthesis_endpoint(
         answer=result.answer,
         error_message=result.error_message,
     )
+
+
+def _resolve_party_perspective(
+    engine: Engine,
+    *,
+    access: AccessContext,
+    campaign_id: uuid.UUID,
+    character_id: uuid.UUID | None,
+    party_id: uuid.UUID | None,
+) -> uuid.UUID | None:
+    with open_transaction(engine) as connection:
+        return resolve_party_perspective(
+            connection,
+            access=access,
+            campaign_id=campaign_id,
+            character_id=character_id,
+            party_id=party_id,
+        )
@@ -38,7 +38,8 @@ origin.
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Annotated
+from dataclasses import asdict
+from typing import Annotated, Any
 
 from fastapi import Depends, FastAPI
 from sqlalchemy import Engine, text
@@ -47,29 +48,55 @@ from starlette.responses import JSONResponse
 
 from dnd_ai.config import PRODUCTION_REQUIRED_DATABASE_ROLE, foundry_allowed_origins_tuple, settings
 
+from .access_cache import dispose_access_context_cache
 from .access_grants import router as access_grants_router
+from .ai_npc import (
+    dispose_ai_http_client,
+    dispose_npc_context_cache,
+    dispose_npc_turn_gate,
+    peek_npc_context_cache,
+    peek_npc_turn_gate,
+)
 from .ai_npc import router as ai_npc_router
 from .ai_synthesis import router as ai_synthesis_router
-from .auth import dispose_jwks_client
+from .auth import dispose_jwks_client, dispose_verified_token_cache
 from .campaign_invitations import router as campaign_invitations_router
 from .campaigns import router as campaigns_router
 from .character_state import router as character_state_router
 from .characters import router as characters_router
 from .correlation import CorrelationIdMiddleware
-from .deps import dispose_engine, get_engine, verify_database_identity
+from .deps import (
+    dispose_engine,
+    get_engine,
+    peek_advisory_lock_engine,
+    peek_read_replica,
+    verify_database_identity,
+)
 from .dungeon import router as dungeon_router
+from .encounters import (
+    dispose_encounter_working_set_cache,
+    peek_encounter_working_set_cache,
+)
 from .encounters import router as encounters_router
 from .errors import install_error_handlers
 from .events import router as events_router
+from .foundry_principal_cache import dispose_foundry_principal_cache
+from .identity_cache import dispose_external_identity_cache
 from .integration import router as integration_router
 from .interactions import router as interactions_router
 from .items import router as items_router
 from .knowledge import router as knowledge_router
 from .memberships import router as memberships_router
 from .movement import router as movement_router
+from .pool_metrics import read_pool_gauges
 from .quests import router as quests_router
+from .reference_corpus import (
+    dispose_reference_retrieval_cache,
+    peek_reference_retrieval_cache,
+)
 from .reference_corpus import router as reference_corpus_router
 from .relationships import router as relationships_router
+from .retrieval_audit import dispose_retrieval_audit_writer, peek_retrieval_audit_writer
 from .sessions import router as sessions_router
 from .summary import router as summary_router
 
@@ -103,8 +130,20 @@ async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        # Before dispose_engine(): it flushes queued audit rows through
+        # the request engine.
+        dispose_retrieval_audit_writer()
         dispose_engine()
         dispose_jwks_client()
+        dispose_access_context_cache()
+        dispose_verified_token_cache()
+        dispose_external_identity_cache()
+        dispose_foundry_principal_cache()
+        dispose_reference_retrieval_cache()
+        dispose_npc_context_cache()
+        dispose_npc_turn_gate()
+        dispose_encounter_working_set_cache()
+        await dispose_ai_http_client()
 
 
 def create_app() -> FastAPI:
@@ -191,6 +230,50 @@ def create_app() -> FastAPI:
             return JSONResponse(status_code=503, content={"status": "not_ready"})
         return JSONResponse(status_code=200, content={"status": "ready"})
 
+    @app.get("/metricsz")
+    def metricsz(engine: Annotated[Engine, Depends(get_engine)]) -> dict[str, Any]:
+        """Connection-pool gauges (`dnd_ai.api.pool_metrics`) for the
+        request engine and, once each exists, the dedicated advisory-lock
+        and read-replica engines — the latter with its last measured lag
+        and how many reads fell back to the primary — plus the reference
+        retrieval cache's and the NPC-context cache's hit ratios and
+        estimated latency saved, the encounter working-set cache's hit
+        ratio, the NPC-turn gate's busy NPCs, queued turns and refusals,
+        and the asynchronous retrieval-audit writer's
+        counters. Numbers only — no DSN, host, or role — and no database
+        round trip, so it stays answerable while the pool is exhausted,
+        which is exactly when it is needed. Meant for the same private
+        network `/readyz` is."""
+        pools = {"primary": asdict(read_pool_gauges(engine))}
+        advisory_lock_engine = peek_advisory_lock_engine()
+        if advisory_lock_engine is not None:
+            pools["advisory_lock"] = asdict(read_pool_gauges(advisory_lock_engine))
+        metrics: dict[str, Any] = {"pools": pools}
+        read_replica = peek_read_replica()
+        if read_replica is not None:
+            replica_engine, lag_monitor = read_replica
+            pools["read_replica"] = asdict(read_pool_gauges(replica_engine))
+            metrics["read_replica"] = {
+                "last_lag_seconds": lag_monitor.last_lag_seconds,
+                "fallback_count": lag_monitor.fallback_count,
+            }
+        reference_retrieval_cache = peek_reference_retrieval_cache()
+        if reference_retrieval_cache is not None:
+            metrics["reference_retrieval_cache"] = asdict(reference_retrieval_cache.stats())
+        npc_context_cache = peek_npc_context_cache()
+        if npc_context_cache is not None:
+            metrics["npc_context_cache"] = asdict(npc_context_cache.stats())
+        encounter_working_set_cache = peek_encounter_working_set_cache()
+        if encounter_working_set_cache is not None:
+            metrics["encounter_working_set_cache"] = asdict(encounter_working_set_cache.stats())
+        npc_turn_gate = peek_npc_turn_gate()
+        if npc_turn_gate is not None:
+            metrics["npc_turn_gate"] = asdict(npc_turn_gate.stats())
+        retrieval_audit_writer = peek_retrieval_audit_writer()
+        if retrieval_audit_writer is not None:
+            metrics["reference_retrieval_audit"] = asdict(retrieval_audit_writer.stats())
+        return metrics
+
     return app
 
 
@@ -7,7 +7,9 @@ it, first used by `dnd_ai.api.items`).
 caller's own connection, so it commits atomically with the command and
 event it describes — never a separate post-commit write, which could
 observe a committed state change with no corresponding audit row if the
-process died in between.
+process died in between. `record_change_logs()` is the same for a batch
+route (`dnd_ai.api.events`' `events:batch`): one row per record, one
+statement.
 
 `actor_user_id` always comes from the resolved, authenticated
 `dnd_ai.domain.access.AccessContext.user_id` — never a command's own
@@ -57,6 +59,8 @@ docstring for why this is untrusted metadata, never an authorization
 input."""
 
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from sqlalchemy import Connection, text
 
@@ -124,3 +128,65 @@ def record_change_log(
             "ai_proposal": ai_proposal_id,
         },
     )
+
+
+@dataclass(frozen=True)
+class ChangeLogRecord:
+    """The per-row columns of one `record_change_logs` row."""
+
+    record_id: uuid.UUID | None
+    entity_id: uuid.UUID | None
+    event_id: uuid.UUID | None
+
+
+def record_change_logs(
+    connection: Connection,
+    *,
+    change_action_code: str,
+    schema_name: str,
+    table_name: str,
+    records: Sequence[ChangeLogRecord],
+    world_id: uuid.UUID | None,
+    actor_user_id: uuid.UUID,
+    correlation_id: str | None,
+    command_name: str,
+    acting_external_system_id: uuid.UUID | None = None,
+    acting_foundry_actor_id: str | None = None,
+) -> None:
+    """`record_change_log` for a batch: one `audit.change_log` row per
+    entry of `records`, every other column shared, in one statement."""
+    if not records:
+        return
+    change_action_id = lookup_id(
+        connection, "audit", "change_actions", "change_action_id", change_action_code
+    )
+    connection.execute(
+        text("""
+            INSERT INTO audit.change_log
+                (change_action_id, schema_name, table_name, record_id, entity_id, world_id,
+                 actor_user_id, correlation_id, command_name, event_id,
+                 acting_external_system_id, acting_foundry_actor_id)
+            SELECT CAST(:action AS uuid), CAST(:schema AS text), CAST(:table AS text),
+                   r.record_id, r.entity_id, CAST(:world AS uuid), CAST(:actor AS uuid),
+                   CAST(:correlation AS uuid), CAST(:command AS text), r.event_id,
+                   CAST(:acting_external_system AS uuid), CAST(:acting_foundry_actor AS text)
+            FROM unnest(
+                CAST(:records AS uuid[]), CAST(:entities AS uuid[]), CAST(:events AS uuid[])
+            ) WITH ORDINALITY AS r(record_id, entity_id, event_id, n)
+            ORDER BY r.n
+        """),
+        {
+            "action": change_action_id,
+            "schema": schema_name,
+            "table": table_name,
+            "records": [record.record_id for record in records],
+            "entities": [record.entity_id for record in records],
+            "events": [record.event_id for record in records],
+            "world": world_id,
+            "actor": actor_user_id,
+            "correlation": uuid.UUID(correlation_id) if correlation_id is not None else None,
+            "command": command_name,
+            "acting_external_system": acting_external_system_id,
+            "acting_foundry_actor": acting_foundry_actor_id,
+        },
+    )
@@ -70,7 +70,11 @@ token, or under ordinary concurrent request traffic:
    client): every lookup resolves against the Tier-1 JWKS-*set* cache,
    which does expire on `lifespan`, so key material for any `kid` can
    never outlive that TTL (or this module's own forced-refresh cooldown)
-   without a real refetch.
+   without a real refetch. The one thing kept beyond the Tier-1 entry
+   itself is that entry's *parsed* form — a kid→key map built once per
+   fetched set (`_ParsedSigningKeys`) and reused only while the Tier-1
+   cache still returns that exact same set object, so it expires, is
+   evicted, and is replaced precisely when the set it was parsed from is.
 5. `PyJWKClient.fetch_data()` calls `urllib.request.urlopen(request,
    timeout=self.timeout, context=self.ssl_context)` directly, with no
    constructor hook to supply a custom opener or redirect handler
@@ -185,7 +189,8 @@ import urllib.error
 import urllib.request
 import uuid
 from collections.abc import Callable
-from typing import Annotated, cast
+from dataclasses import dataclass
+from typing import Annotated, Any, cast
 from urllib.parse import urlsplit
 
 import jwt
@@ -194,16 +199,13 @@ from fastapi import Depends, Header, Request
 from sqlalchemy import Connection
 
 from dnd_ai.config import OIDC_LOCAL_URL_SCHEMES, OIDC_PRODUCTION_URL_SCHEMES, settings
-from dnd_ai.domain.access import (
-    OIDC_AUTH_METHOD,
-    AuthenticatedPrincipal,
-    resolve_foundry_system_principal,
-    resolve_user_by_external_identity,
-)
-from dnd_ai.domain.tokens import VerifiedTokenClaims, verify_bearer_token
+from dnd_ai.domain.access import OIDC_AUTH_METHOD, AuthenticatedPrincipal
+from dnd_ai.domain.tokens import VerifiedTokenCache, VerifiedTokenClaims, verify_bearer_token
 
 from .deps import get_connection
 from .errors import ForbiddenError, UnauthorizedError
+from .foundry_principal_cache import get_foundry_principal_cache
+from .identity_cache import get_external_identity_cache
 
 # The Authorization scheme keyword that selects the Foundry-adapter
 # credential path below instead of the OIDC/JWT one — see this module's
@@ -339,6 +341,17 @@ def _build_validating_fetch_data(
     return fetch_data
 
 
+@dataclass(frozen=True)
+class _ParsedSigningKeys:
+    """The signing keys of one fetched JWKS set, parsed once. `source` is
+    the raw set object the Tier-1 cache holds — compared by identity, and
+    held here so that identity can never be reused by a different set
+    while this snapshot is alive."""
+
+    source: object
+    keys_by_kid: dict[str, Any]
+
+
 class _JWKSClient:
     """Wraps `jwt.PyJWKClient` to close the gaps described in this
     module's docstring. Never raises anything but what the underlying
@@ -380,13 +393,16 @@ class _JWKSClient:
         self._lock = threading.Lock()
         self._last_forced_refresh: float | None = None
         self._last_failed_fetch: float | None = None
+        # Replaced wholesale (one reference assignment) whenever the Tier-1
+        # cache hands back a different set, so a lock-free reader sees
+        # either the old snapshot or the new one, never a half-built map.
+        self._parsed: _ParsedSigningKeys | None = None
 
     def get_signing_key(self, kid: str) -> RSAPublicKey:
         signing_keys = self._peek_signing_keys()
-        matched = jwt.PyJWKClient.match_kid(signing_keys, kid) if signing_keys is not None else None
-        if matched is None:
-            matched = self._resolve_under_lock(kid)
-        key = matched.key
+        key = signing_keys.get(kid) if signing_keys is not None else None
+        if key is None:
+            key = self._resolve_under_lock(kid)
         # verify_bearer_token has already rejected any token whose header
         # `alg` isn't RS256 before this is ever called, but a misconfigured
         # JWKS (e.g. an EC or HMAC key under the matching kid) is still
@@ -396,7 +412,7 @@ class _JWKSClient:
             raise TypeError(f"JWKS key for kid={kid!r} is not an RSA public key")
         return key
 
-    def _peek_signing_keys(self) -> list[jwt.PyJWK] | None:
+    def _peek_signing_keys(self) -> dict[str, Any] | None:
         """Read-only: the currently cached, unexpired signing keys, or
         `None` if the Tier-1 JWKS-set cache is empty or expired. Never
         performs network I/O under any circumstance — safe to call
@@ -413,9 +429,13 @@ class _JWKSClient:
         against the installed `jwt.jwks_client`/`jwt.jwk_set_cache`
         source — despite `PyJWTSetWithTimestamp`'s own type hint saying
         `PyJWKSet`), which still needs `jwt.PyJWKSet.from_dict()` to
-        become `PyJWK` objects; `PyJWKClient` itself re-parses on every
-        call, cache hit or not, so doing the same here costs nothing
-        extra relative to the codepath this replaces."""
+        become `PyJWK` objects. `PyJWKClient` itself re-parses on every
+        call, cache hit or not — rebuilding every RSA public key from its
+        JWK JSON per bearer-authenticated request. This parses each cached
+        set once instead: the result is kept as `self._parsed` and reused
+        for as long as the Tier-1 cache keeps returning the identical set
+        object, which is exactly as long as that set is unexpired and
+        unreplaced."""
         cache = self._client.jwk_set_cache
         if cache is None:
             return None
@@ -429,33 +449,43 @@ class _JWKSClient:
         data = cast(object, cache.get())
         if data is None or not isinstance(data, dict):
             return None
+        parsed = self._parsed
+        if parsed is not None and parsed.source is data:
+            return parsed.keys_by_kid
         try:
             jwk_set = jwt.PyJWKSet.from_dict(data)
         except jwt.PyJWKSetError:
             return None
-        signing_keys = [
-            key for key in jwk_set.keys if key.public_key_use in ("sig", None) and key.key_id
-        ]
+        keys_by_kid: dict[str, Any] = {}
+        for key in jwk_set.keys:
+            if key.public_key_use in ("sig", None) and key.key_id:
+                # First match wins, as in jwt.PyJWKClient.match_kid.
+                keys_by_kid.setdefault(key.key_id, key.key)
         # An empty result (every cached key filtered out — no signing-use
         # key, or none with a kid) is exactly as unusable as an unparseable
         # response; treat it identically as "no cache" rather than a
         # distinct empty-but-cached state, so it's gated by the same
         # failure-retry cooldown instead of the unknown-kid one.
-        return signing_keys or None
+        if not keys_by_kid:
+            return None
+        self._parsed = _ParsedSigningKeys(source=data, keys_by_kid=keys_by_kid)
+        return keys_by_kid
 
-    def _resolve_under_lock(self, kid: str) -> jwt.PyJWK:
+    def _resolve_under_lock(self, kid: str) -> Any:
         """Reached only on a cache-read miss (cold, TTL-expired, or
         genuinely missing `kid`) — every path that might need to perform
-        network I/O funnels through here, all under `self._lock`."""
+        network I/O funnels through here, all under `self._lock`. Returns
+        the matched `PyJWK`'s key object, exactly what the lock-free path
+        returns from `_peek_signing_keys`."""
         with self._lock:
             # Double-checked locking: recheck now that we hold the lock —
             # a peer thread may have already fetched or refreshed while
             # this thread was waiting for it.
             signing_keys = self._peek_signing_keys()
             if signing_keys is not None:
-                matched = jwt.PyJWKClient.match_kid(signing_keys, kid)
-                if matched is not None:
-                    return matched
+                key = signing_keys.get(kid)
+                if key is not None:
+                    return key
                 # Cache is warm but doesn't contain kid — gate behind the
                 # forced-refresh cooldown (finding 1's DoS bound).
                 return self._forced_refresh_and_match_locked(kid)
@@ -469,13 +499,13 @@ class _JWKSClient:
             # capable of being hammered by request volume as the unknown-
             # kid path below — `_fetch_signing_keys_locked` applies the
             # same failure-retry cooldown to both.
-            signing_keys = self._fetch_signing_keys_locked(refresh=False)
-            matched = jwt.PyJWKClient.match_kid(signing_keys, kid)
+            fetched = self._fetch_signing_keys_locked(refresh=False)
+            matched = jwt.PyJWKClient.match_kid(fetched, kid)
             if matched is not None:
-                return matched
+                return matched.key
             return self._forced_refresh_and_match_locked(kid)
 
-    def _forced_refresh_and_match_locked(self, kid: str) -> jwt.PyJWK:
+    def _forced_refresh_and_match_locked(self, kid: str) -> Any:
         """Caller must already hold `self._lock`. Reached either straight
         from `_resolve_under_lock` (cache warm, kid missing) or after a
         cold/expired-cache fetch that still didn't contain `kid`."""
@@ -507,7 +537,7 @@ class _JWKSClient:
         matched = jwt.PyJWKClient.match_kid(signing_keys, kid)
         if matched is None:
             raise jwt.PyJWKClientError(f"Unable to find a signing key that matches: {kid!r}")
-        return matched
+        return matched.key
 
     def _fetch_signing_keys_locked(self, *, refresh: bool) -> list[jwt.PyJWK]:
         """Caller must already hold `self._lock`. The single choke point
@@ -616,6 +646,35 @@ def dispose_jwks_client() -> None:
         _jwks_client = None
 
 
+_verified_token_cache: VerifiedTokenCache | None = None
+_verified_token_cache_init_lock = threading.Lock()
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """The process-wide `dnd_ai.domain.tokens.VerifiedTokenCache`
+    `get_verified_token_claims` verifies through, built from
+    `DND_AI_OIDC_TOKEN_CACHE_MAX_ENTRIES`/`_MAX_TTL_SECONDS` with the same
+    double-checked lazy init as `get_jwks_client`."""
+    global _verified_token_cache
+    if _verified_token_cache is not None:
+        return _verified_token_cache
+    with _verified_token_cache_init_lock:
+        if _verified_token_cache is None:
+            _verified_token_cache = VerifiedTokenCache(
+                max_entries=settings.oidc_token_cache_max_entries,
+                max_ttl_seconds=settings.oidc_token_cache_max_ttl_seconds,
+            )
+        return _verified_token_cache
+
+
+def dispose_verified_token_cache() -> None:
+    """Called from the app's lifespan shutdown, alongside
+    `dispose_jwks_client`."""
+    global _verified_token_cache
+    with _verified_token_cache_init_lock:
+        _verified_token_cache = None
+
+
 def get_verified_token_claims(
     jwks_client: Annotated[_JWKSClient, Depends(get_jwks_client)],
     authorization: Annotated[str | None, Header()] = None,
@@ -630,7 +689,9 @@ def get_verified_token_claims(
     AuthenticationError` from `verify_bearer_token` itself, which
     `dnd_ai.api.errors`' generic `SafeMessageError` handler already maps
     to the identical 401 response — no per-route wiring needed for that
-    case."""
+    case. A token already verified under the configured issuer and
+    audience is answered from `get_verified_token_cache()` until shortly
+    before its own `exp`."""
     if authorization is None:
         raise UnauthorizedError()
     scheme, _, token = authorization.partition(" ")
@@ -645,6 +706,7 @@ def get_verified_token_claims(
         issuer=settings.oidc_issuer,
         audience=settings.oidc_audience,
         get_signing_key=jwks_client.get_signing_key,
+        cache=get_verified_token_cache(),
     )
 
 
@@ -676,7 +738,10 @@ def _resolve_foundry_system_principal(
     `UnauthorizedError` — deliberately non-disclosing, the same fail-closed
     contract the OIDC path already has via `resolve_user_by_external_
     identity`. A missing/absent `claimed_foundry_actor_id` is not a failure
-    at all — see `resolve_foundry_system_principal`'s own docstring."""
+    at all — see `resolve_foundry_system_principal`'s own docstring.
+    Resolved through `dnd_ai.api.foundry_principal_cache`, which reuses a
+    principal only while migration 100's credential generation for the
+    system is unchanged."""
     external_system_id_text, separator, raw_key = credential.partition(".")
     if not separator or not raw_key:
         raise UnauthorizedError()
@@ -685,7 +750,7 @@ def _resolve_foundry_system_principal(
     except ValueError as exc:
         raise UnauthorizedError() from exc
 
-    principal = resolve_foundry_system_principal(
+    principal = get_foundry_principal_cache().resolve(
         connection,
         external_system_id=external_system_id,
         raw_key=raw_key,
@@ -729,7 +794,8 @@ def get_authenticated_user_id(
     is not itself a route, just another dependency function, safely
     callable outside FastAPI's own resolution) with that client and this
     function's own `authorization`, resolved via `dnd_ai.domain.access.
-    resolve_user_by_external_identity` exactly as before. Raises
+    resolve_user_by_external_identity` through the short-TTL
+    `dnd_ai.api.identity_cache.ExternalIdentityCache`. Raises
     `UnauthorizedError` for an unknown or revoked identity, or one linked
     to a user without an active lifecycle status — this dependency only
     establishes *who is making the request*; provisioning a new user on
@@ -743,7 +809,7 @@ def get_authenticated_user_id(
 
     jwks_client = request.app.dependency_overrides.get(get_jwks_client, get_jwks_client)()
     claims = get_verified_token_claims(jwks_client, authorization)
-    user_id = resolve_user_by_external_identity(
+    user_id = get_external_identity_cache().resolve(
         connection, issuer=claims.issuer, subject=claims.subject
     )
     if user_id is None:
@@ -35,7 +35,8 @@ nonexistent character or one in a different world.
 This is a read: no idempotency key, no `audit.change_log` row (a routine,
 already-authorized character read is not "sensitive" in that table's
 documented sense — see `dnd_ai.api.dungeon`'s identical reasoning) and no
-mutation of any kind.
+mutation of any kind, so both routes read on `dnd_ai.api.deps.
+get_read_connection` the way `dnd_ai.api.dungeon`'s does.
 
 Phase 10 workstream 16 added a sub-resource:
 `GET /campaigns/{campaign_id}/characters/{character_id}/inventory`
@@ -75,7 +76,7 @@ from .access import (
     require_campaign_capability,
     resolve_character_view_tier,
 )
-from .deps import get_connection
+from .deps import get_read_connection
 
 router = APIRouter(tags=["characters"])
 
@@ -172,7 +173,7 @@ def get_character_endpoint(
         AccessContext,
         Depends(require_campaign_capability(_CHARACTER_VIEW_CAPABILITY, allow_foundry_system=True)),
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> CharacterResponse:
     include_full = resolve_character_view_tier(access, character_id=character_id)
 
@@ -232,7 +233,7 @@ def get_character_inventory_endpoint(
     access: Annotated[
         AccessContext, Depends(require_campaign_capability(_CHARACTER_VIEW_CAPABILITY))
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> list[InventoryItemResponse]:
     if not resolve_character_view_tier(access, character_id=character_id):
         # The summary tier alone is not enough to see inventory contents —
@@ -8,17 +8,49 @@ back around the handler, matching the one-transaction-per-world-change rule
 every command already follows on its own when called directly; going
 through the API just means the API layer, not the command, now owns that
 boundary.
+
+Both engines here are built by `_create_pooled_engine` from the
+`DND_AI_DATABASE_POOL_*`/`_TIMEOUT_MS` settings: pool size, overflow,
+checkout timeout, recycle, pre-ping, and PostgreSQL's own
+`statement_timeout`/`lock_timeout` sent as connection startup options.
+`get_advisory_lock_engine` is the engine `dnd_ai.commands.integration.
+apply_foundry_combat_sync` holds its session-level advisory lock on — the
+request engine itself unless `DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE` asks
+for a dedicated small pool, so a burst of long-held lock connections can
+never exhaust the pool every other request checks out from.
+`get_connection` records how long each checkout waited
+(`dnd_ai.api.pool_metrics`), which `/metricsz` reports alongside each
+pool's in-use and overflow counts.
+
+`get_read_connection` is the opt-in counterpart for routes whose body is a
+side-effect-free `dnd_ai.queries.*` read: a `READ ONLY` transaction on
+`get_read_replica_engine` — the `DND_AI_DATABASE_READ_REPLICA_URL` engine
+while `dnd_ai.api.read_replica.ReplicaLagMonitor` finds it fresh enough.
+Otherwise (and always when no replica is configured, which is also how
+every test overriding `get_engine` sees it) it is the request's own
+`get_connection` connection, never a second checkout from the same pool:
+a request holding one connection while waiting for another could starve
+the pool once every slot was held that way. Authentication and
+`require_campaign_capability` keep resolving on `get_connection`, so a
+just-revoked grant is never read from a lagging replica; a replica-routed
+request holds one primary and one replica connection.
 """
 
 import re
+import threading
+import time
 from collections.abc import Iterator
-from typing import Annotated
+from contextlib import contextmanager
+from typing import Annotated, Any
 
 from fastapi import Depends, Header
 from sqlalchemy import Connection, Engine, create_engine, text
 
 from dnd_ai.config import settings
 
+from .pool_metrics import record_checkout_wait
+from .read_replica import ReplicaLagMonitor
+
 # Mirrors dnd_ai.api.correlation's own reasoning for X-Correlation-Id:
 # bound length and character set before a client-supplied header value
 # ever reaches a database column, a log line, or an error response.
@@ -30,14 +62,45 @@ _IDEMPOTENCY_KEY_PATTERN = re.compile(r"[A-Za-z0-9._~-]{1,255}")
 _engine: Engine | None = None
 
 
+def _server_timeout_options() -> str | None:
+    """libpq `options` for the configured server-side timeouts, or None
+    when neither is set (PostgreSQL's own default of no timeout)."""
+    options = []
+    if settings.database_statement_timeout_ms:
+        options.append(f"-c statement_timeout={settings.database_statement_timeout_ms}")
+    if settings.database_lock_timeout_ms:
+        options.append(f"-c lock_timeout={settings.database_lock_timeout_ms}")
+    return " ".join(options) or None
+
+
+def _create_pooled_engine(*, pool_size: int, max_overflow: int, url: str | None = None) -> Engine:
+    """`url` defaults to `settings.database_url`, the primary."""
+    # Settings._require_explicit_database_url_outside_local_dev guarantees this
+    # is populated by the time Settings() finishes constructing (either an
+    # explicit value or the local-dev default) — never None here at runtime.
+    assert settings.database_url is not None
+    connect_args: dict[str, Any] = {}
+    options = _server_timeout_options()
+    if options is not None:
+        connect_args["options"] = options
+    return create_engine(
+        url if url is not None else settings.database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.database_pool_timeout_seconds,
+        pool_recycle=settings.database_pool_recycle_seconds,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
 def get_engine() -> Engine:
     global _engine
     if _engine is None:
-        # Settings._require_explicit_database_url_outside_local_dev guarantees this
-        # is populated by the time Settings() finishes constructing (either an
-        # explicit value or the local-dev default) — never None here at runtime.
-        assert settings.database_url is not None
-        _engine = create_engine(settings.database_url)
+        _engine = _create_pooled_engine(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+        )
     return _engine
 
 
@@ -48,6 +111,98 @@ def dispose_engine() -> None:
     if _engine is not None:
         _engine.dispose()
         _engine = None
+    dispose_advisory_lock_engine()
+    dispose_read_replica_engine()
+
+
+_advisory_lock_engine: Engine | None = None
+_advisory_lock_engine_init_lock = threading.Lock()
+
+
+def get_advisory_lock_engine(engine: Annotated[Engine, Depends(get_engine)]) -> Engine:
+    """`engine` itself (the request engine, or a test's override of it)
+    unless `DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE` is set, in which case a
+    process-wide dedicated engine with exactly that many connections and
+    no overflow — a caller past that bound waits up to the pool timeout
+    rather than borrowing from the request pool."""
+    global _advisory_lock_engine
+    if settings.database_advisory_lock_pool_size <= 0:
+        return engine
+    if _advisory_lock_engine is not None:
+        return _advisory_lock_engine
+    with _advisory_lock_engine_init_lock:
+        if _advisory_lock_engine is None:
+            _advisory_lock_engine = _create_pooled_engine(
+                pool_size=settings.database_advisory_lock_pool_size, max_overflow=0
+            )
+        return _advisory_lock_engine
+
+
+def peek_advisory_lock_engine() -> Engine | None:
+    """The dedicated advisory-lock engine if one has been built, without
+    building it — for `/metricsz`."""
+    return _advisory_lock_engine
+
+
+def dispose_advisory_lock_engine() -> None:
+    global _advisory_lock_engine
+    with _advisory_lock_engine_init_lock:
+        if _advisory_lock_engine is not None:
+            _advisory_lock_engine.dispose()
+            _advisory_lock_engine = None
+
+
+_read_replica_engine: Engine | None = None
+_read_replica_lag_monitor: ReplicaLagMonitor | None = None
+_read_replica_init_lock = threading.Lock()
+
+
+def _get_read_replica() -> tuple[Engine, ReplicaLagMonitor] | None:
+    global _read_replica_engine, _read_replica_lag_monitor
+    if settings.database_read_replica_url is None:
+        return None
+    if _read_replica_engine is not None and _read_replica_lag_monitor is not None:
+        return _read_replica_engine, _read_replica_lag_monitor
+    with _read_replica_init_lock:
+        if _read_replica_engine is None or _read_replica_lag_monitor is None:
+            _read_replica_engine = _create_pooled_engine(
+                pool_size=settings.database_pool_size,
+                max_overflow=settings.database_max_overflow,
+                url=settings.database_read_replica_url,
+            )
+            _read_replica_lag_monitor = ReplicaLagMonitor(
+                max_lag_seconds=settings.database_read_replica_max_lag_seconds,
+                check_interval_seconds=settings.database_read_replica_lag_check_interval_seconds,
+            )
+        return _read_replica_engine, _read_replica_lag_monitor
+
+
+def get_read_replica_engine() -> Engine | None:
+    """The read replica while its lag is within
+    `DND_AI_DATABASE_READ_REPLICA_MAX_LAG_SECONDS`; None when none is
+    configured or it is too far behind, and reads stay on the primary."""
+    replica = _get_read_replica()
+    if replica is None:
+        return None
+    replica_engine, lag_monitor = replica
+    return replica_engine if lag_monitor.is_fresh(replica_engine) else None
+
+
+def peek_read_replica() -> tuple[Engine, ReplicaLagMonitor] | None:
+    """The read-replica engine and its lag monitor if they have been
+    built, without building them — for `/metricsz`."""
+    if _read_replica_engine is None or _read_replica_lag_monitor is None:
+        return None
+    return _read_replica_engine, _read_replica_lag_monitor
+
+
+def dispose_read_replica_engine() -> None:
+    global _read_replica_engine, _read_replica_lag_monitor
+    with _read_replica_init_lock:
+        if _read_replica_engine is not None:
+            _read_replica_engine.dispose()
+        _read_replica_engine = None
+        _read_replica_lag_monitor = None
 
 
 class DatabaseIdentityError(RuntimeError):
@@ -95,14 +250,46 @@ def verify_database_identity(engine: Engine, *, expected_role: str) -> None:
         _check_database_identity(connection, expected_role=expected_role)
 
 
+@contextmanager
+def open_transaction(engine: Engine) -> Iterator[Connection]:
+    """One connection and one transaction on `engine`, its checkout wait
+    recorded: `get_connection`'s own body, for a block shorter than a
+    request — what an `async def` route reads on before it awaits
+    something slow, so the connection is back in the pool meanwhile."""
+    started = time.perf_counter()
+    with engine.connect() as connection:
+        record_checkout_wait(engine, time.perf_counter() - started)
+        with connection.begin():
+            yield connection
+
+
 def get_connection(engine: Annotated[Engine, Depends(get_engine)]) -> Iterator[Connection]:
     """One connection, one transaction, for the lifetime of a single
     request. Commits when the handler returns normally; rolls back if it
     raises — including a `dnd_ai.api.errors.ApiError` or a domain
     `ValueError`, so a validation failure never leaves a partial write
     (docs/architecture/SYSTEM_ARCHITECTURE.md §20)."""
-    with engine.connect() as connection, connection.begin():
+    with open_transaction(engine) as connection:
+        yield connection
+
+
+def get_read_connection(
+    connection: Annotated[Connection, Depends(get_connection)],
+    replica_engine: Annotated[Engine | None, Depends(get_read_replica_engine)],
+) -> Iterator[Connection]:
+    """`get_connection` for a route whose body only reads: one `READ ONLY`
+    transaction on the replica while `get_read_replica_engine` offers it,
+    otherwise the request's own `connection` — which is not read-only, and
+    does see that transaction's own writes."""
+    if replica_engine is None:
         yield connection
+        return
+    started = time.perf_counter()
+    with replica_engine.connect() as read_connection:
+        record_checkout_wait(replica_engine, time.perf_counter() - started)
+        with read_connection.begin():
+            read_connection.execute(text("SET TRANSACTION READ ONLY"))
+            yield read_connection
 
 
 def get_idempotency_key(
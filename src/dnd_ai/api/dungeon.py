@@ -73,7 +73,11 @@ This is a read: no idempotency key, no `audit.change_log` row (that table's
 own documented scope is login-linked identity changes, role/access changes,
 sensitive reads, and writes — a routine dungeon-area read for an already
 campaign-scoped, `campaign.view`-authorized member is not "sensitive" in
-that sense) and no mutation of any kind.
+that sense) and no mutation of any kind. The view itself is therefore
+read on `dnd_ai.api.deps.get_read_connection` (a `READ ONLY` transaction
+on the read replica when one is configured and fresh enough);
+`resolve_party_perspective` stays on the request's primary connection
+alongside the rest of authorization.
 """
 
 import uuid
@@ -88,7 +92,7 @@ from dnd_ai.queries.dungeon import get_dungeon_area_view
 
 from ._shared import timeline_world_id
 from .access import require_campaign_capability, resolve_party_perspective
-from .deps import get_connection
+from .deps import get_connection, get_read_connection
 
 router = APIRouter(tags=["dungeon"])
 
@@ -177,6 +181,7 @@ def get_dungeon_area_endpoint(
         AccessContext, Depends(require_campaign_capability(_DUNGEON_VIEW_CAPABILITY))
     ],
     connection: Annotated[Connection, Depends(get_connection)],
+    read_connection: Annotated[Connection, Depends(get_read_connection)],
     character_id: uuid.UUID | None = None,
     party_id: uuid.UUID | None = None,
 ) -> DungeonAreaResponse:
@@ -202,10 +207,10 @@ def get_dungeon_area_endpoint(
     )
 
     view = get_dungeon_area_view(
-        connection,
+        read_connection,
         dungeon_area_id=dungeon_area_id,
         timeline_id=access.timeline_id,
-        expected_world_id=timeline_world_id(connection, access.timeline_id),
+        expected_world_id=timeline_world_id(read_connection, access.timeline_id),
         party_id=authorized_party_id,
         include_hidden=include_hidden,
     )
@@ -19,10 +19,17 @@ access `resolve_combat_turn` could in principle support (a player submitting
 their own character's turn) — extending that is future scope once a caller
 actually needs it, not invented speculatively here.
 
+`POST .../turns:batch` resolves an ordered list of up to
+`_MAX_BATCH_TURNS` turns — typically a whole round — through
+`_resolve_combat_turns_impl`: one encounter lock, one transaction, one
+request's authentication and access resolution, and the same rows and
+events per turn as the single-turn route. All of them or none; the
+response lists each turn's result in request order.
+
 Idempotency: `narrative.encounter_turns` carries
 `ux_encounter_turns_round_participant UNIQUE (encounter_round_id,
 participant_id)` (revision 078), so a naive client retry of the same
-round/participant turn is rejected as a 409 conflict by the existing
+round/participant turn (or of a batch containing one) is rejected as a 409 conflict by the existing
 `IntegrityError` handler rather than silently applying damage twice — no
 bespoke idempotency-key store is needed for this endpoint yet, consistent
 with `dnd_ai.api.deps.get_idempotency_key`'s own "most commands already
@@ -96,9 +103,18 @@ the same `campaign_id`-column check every command route above performs,
 via the same `EncounterNotFoundError` (re-exported by `dnd_ai.queries.
 encounter`, not duplicated). This route is a read: no idempotency key, no
 `audit.change_log` row, for the same reasons `dnd_ai.api.dungeon`'s read
-endpoint has neither.
+endpoint has neither, and it reads on `dnd_ai.api.deps.get_read_connection`.
+
+Every command route shares one process-wide `EncounterWorkingSetCache`
+(`get_encounter_working_set_cache`, sized by
+`DND_AI_ENCOUNTER_WORKING_SET_CACHE_MAX_ENTRIES`, discarded by
+`dispose_encounter_working_set_cache` at lifespan shutdown): `start` fills
+an encounter's entry, `turns` and `turns:batch` resolve from it while its
+version is current, and `end` discards it. `dnd_ai.api.integration`'s
+combat-sync routes use the same one.
 """
 
+import threading
 import uuid
 from typing import Annotated
 
@@ -107,15 +123,19 @@ from pydantic import BaseModel, Field
 from sqlalchemy import Connection
 
 from dnd_ai.commands.encounters import (
+    CombatTurn,
+    EncounterWorkingSetCache,
     _end_encounter_impl,
     _resolve_combat_turn_impl,
+    _resolve_combat_turns_impl,
     _start_encounter_impl,
 )
+from dnd_ai.config import settings
 from dnd_ai.domain.access import AccessContext
 from dnd_ai.queries.encounter import get_encounter_view
 
 from .access import require_campaign_capability
-from .deps import get_connection
+from .deps import get_connection, get_read_connection
 
 router = APIRouter(tags=["encounters"])
 
@@ -130,6 +150,41 @@ _ENCOUNTER_MANAGE_CAPABILITY = "canon.edit"
 _ENCOUNTER_VIEW_CAPABILITY = "campaign.view"
 
 
+_encounter_working_set_cache: EncounterWorkingSetCache | None = None
+_encounter_working_set_cache_init_lock = threading.Lock()
+
+
+def get_encounter_working_set_cache() -> EncounterWorkingSetCache:
+    global _encounter_working_set_cache
+    if _encounter_working_set_cache is not None:
+        return _encounter_working_set_cache
+    with _encounter_working_set_cache_init_lock:
+        if _encounter_working_set_cache is None:
+            _encounter_working_set_cache = EncounterWorkingSetCache(
+                max_entries=settings.encounter_working_set_cache_max_entries
+            )
+        return _encounter_working_set_cache
+
+
+def peek_encounter_working_set_cache() -> EncounterWorkingSetCache | None:
+    """The encounter working-set cache if one has been built, without
+    building it — for `/metricsz`."""
+    return _encounter_working_set_cache
+
+
+def dispose_encounter_working_set_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.ai_npc.dispose_npc_context_cache`."""
+    global _encounter_working_set_cache
+    with _encounter_working_set_cache_init_lock:
+        _encounter_working_set_cache = None
+
+
+# Bounds one request's encounter lock; a crowded battle's round fits well
+# within it.
+_MAX_BATCH_TURNS = 100
+
+
 # ---------------------------------------------------------------------------
 # Request/response contracts
 # ---------------------------------------------------------------------------
@@ -173,6 +228,14 @@ class ResolveCombatTurnResponse(BaseModel):
     new_hit_points: int | None
 
 
+class ResolveCombatTurnBatchRequest(BaseModel):
+    turns: list[ResolveCombatTurnRequest] = Field(min_length=1, max_length=_MAX_BATCH_TURNS)
+
+
+class ResolveCombatTurnBatchResponse(BaseModel):
+    turns: list[ResolveCombatTurnResponse]
+
+
 class EncounterOutcome(BaseModel):
     participant_entity_id: uuid.UUID
     outcome: str
@@ -250,6 +313,9 @@ def start_encounter_endpoint(
         AccessContext, Depends(require_campaign_capability(_ENCOUNTER_MANAGE_CAPABILITY))
     ],
     connection: Annotated[Connection, Depends(get_connection)],
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
 ) -> EncounterResponse:
     result = _start_encounter_impl(
         connection,
@@ -260,6 +326,7 @@ def start_encounter_endpoint(
         session_id=body.session_id,
         location_id=body.location_id,
         summary=body.summary,
+        working_set_cache=working_set_cache,
     )
     return EncounterResponse(encounter_id=result.encounter_id)
 
@@ -280,6 +347,9 @@ def resolve_combat_turn_endpoint(
         AccessContext, Depends(require_campaign_capability(_ENCOUNTER_MANAGE_CAPABILITY))
     ],
     connection: Annotated[Connection, Depends(get_connection)],
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
 ) -> ResolveCombatTurnResponse:
     result = _resolve_combat_turn_impl(
         connection,
@@ -300,6 +370,7 @@ def resolve_combat_turn_endpoint(
         campaign_id=campaign_id,
         session_id=body.session_id,
         event_details=body.event_details,
+        working_set_cache=working_set_cache,
     )
     return ResolveCombatTurnResponse(
         encounter_turn_id=result.encounter_turn_id,
@@ -310,6 +381,64 @@ def resolve_combat_turn_endpoint(
     )
 
 
+@router.post(
+    "/campaigns/{campaign_id}/encounters/{encounter_id}/turns:batch",
+    response_model=ResolveCombatTurnBatchResponse,
+    status_code=201,
+)
+def resolve_combat_turn_batch_endpoint(
+    campaign_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    body: ResolveCombatTurnBatchRequest,
+    # Enforces canon.edit — see resolve_combat_turn_endpoint.
+    _access: Annotated[
+        AccessContext, Depends(require_campaign_capability(_ENCOUNTER_MANAGE_CAPABILITY))
+    ],
+    connection: Annotated[Connection, Depends(get_connection)],
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
+) -> ResolveCombatTurnBatchResponse:
+    results = _resolve_combat_turns_impl(
+        connection,
+        encounter_id=encounter_id,
+        turns=[
+            CombatTurn(
+                round_number=turn.round_number,
+                turn_order=turn.turn_order,
+                actor_entity_id=turn.actor_entity_id,
+                world_time_id=turn.world_time_id,
+                action_kind=turn.action_kind,
+                target_entity_id=turn.target_entity_id,
+                item_instance_id=turn.item_instance_id,
+                spell_id=turn.spell_id,
+                hit=turn.hit,
+                damage_amount=turn.damage_amount,
+                damage_type_id=turn.damage_type_id,
+                resulting_condition_id=turn.resulting_condition_id,
+                interaction_type_code=turn.interaction_type_code,
+                session_id=turn.session_id,
+                event_details=turn.event_details,
+            )
+            for turn in body.turns
+        ],
+        campaign_id=campaign_id,
+        working_set_cache=working_set_cache,
+    )
+    return ResolveCombatTurnBatchResponse(
+        turns=[
+            ResolveCombatTurnResponse(
+                encounter_turn_id=result.encounter_turn_id,
+                combat_action_id=result.combat_action_id,
+                event_id=result.event_id,
+                previous_hit_points=result.previous_hit_points,
+                new_hit_points=result.new_hit_points,
+            )
+            for result in results
+        ]
+    )
+
+
 @router.post(
     "/campaigns/{campaign_id}/encounters/{encounter_id}/end",
     response_model=EndEncounterResponse,
@@ -325,6 +454,9 @@ def end_encounter_endpoint(
         AccessContext, Depends(require_campaign_capability(_ENCOUNTER_MANAGE_CAPABILITY))
     ],
     connection: Annotated[Connection, Depends(get_connection)],
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
 ) -> EndEncounterResponse:
     result = _end_encounter_impl(
         connection,
@@ -334,6 +466,7 @@ def end_encounter_endpoint(
         summary=body.summary,
         campaign_id=campaign_id,
         session_id=body.session_id,
+        working_set_cache=working_set_cache,
     )
     return EndEncounterResponse(event_id=result.event_id)
 
@@ -353,7 +486,7 @@ def get_encounter_endpoint(
     _access: Annotated[
         AccessContext, Depends(require_campaign_capability(_ENCOUNTER_VIEW_CAPABILITY))
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> EncounterDetailResponse:
     view = get_encounter_view(connection, encounter_id=encounter_id, campaign_id=campaign_id)
 
@@ -1,7 +1,8 @@
 """Standalone event-recording endpoint.
 
 Exposes the standalone `RecordEvent` command (docs/ENTITY_LIFECYCLE.md
-§21) over HTTP as `POST /campaigns/{campaign_id}/events`, on the same
+§21) over HTTP as `POST /campaigns/{campaign_id}/events`, and a batch of them
+as `POST /campaigns/{campaign_id}/events:batch`, on the same
 already-delivered OIDC authentication (`dnd_ai.api.auth`), transaction
 management (`dnd_ai.api.deps`), and access resolution (`dnd_ai.api.access`,
 `dnd_ai.domain.access`) every other command router uses.
@@ -39,6 +40,13 @@ inheritance, CLAUDE.md rule 4 — `event_id` *is* the entity_id), so
 `record_event_endpoint` records `entity_id=result.event_id` directly,
 unlike the quest/relationship routes' owning-entity indirection.
 
+Batches: `events:batch` takes up to `_MAX_BATCH_EVENTS` events — a GM
+importing a session log — and records them all or none on the request's
+one transaction, through `_record_events_impl`'s set-based inserts and one
+`record_change_logs` statement for the audit rows. Each event gets the
+same checks, triggers and audit row as if it had been posted alone; the
+response lists the new event ids in request order.
+
 Idempotency: durable, PostgreSQL-backed, via `dnd_ai.api.idempotency` and
 `security.idempotent_requests` (migration 082) — identical mechanism to
 every other command router; see `dnd_ai.api.items`'s module docstring for
@@ -52,12 +60,17 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from sqlalchemy import Connection
 
-from dnd_ai.commands.events import EventParticipant, _record_event_impl
+from dnd_ai.commands.events import (
+    EventParticipant,
+    EventSpec,
+    _record_event_impl,
+    _record_events_impl,
+)
 from dnd_ai.domain.access import AccessContext
 
 from ._shared import timeline_world_id
 from .access import require_campaign_capability
-from .audit import record_change_log
+from .audit import ChangeLogRecord, record_change_log, record_change_logs
 from .correlation import get_request_correlation_id
 from .deps import get_connection, get_idempotency_key
 from .idempotency import IdempotentReplay, begin_idempotent_request, complete_idempotent_request
@@ -73,6 +86,10 @@ _EVENT_MANAGE_CAPABILITY = "canon.edit"
 # audit.change_log.command_name / the idempotency store's fingerprinted
 # command_name — one literal per route, never derived from request data.
 _RECORD_EVENT_COMMAND_NAME = "record_event"
+_RECORD_EVENT_BATCH_COMMAND_NAME = "record_event_batch"
+
+# Bounds one request's transaction; a longer log is several requests.
+_MAX_BATCH_EVENTS = 1_000
 
 # audit.change_actions.code (revision 007 seed): each call always creates a
 # new narrative.events row — there is no "insert vs. update" ambiguity the
@@ -108,6 +125,14 @@ class RecordEventResponse(BaseModel):
     event_id: uuid.UUID
 
 
+class RecordEventBatchRequest(BaseModel):
+    events: list[RecordEventRequest] = Field(min_length=1, max_length=_MAX_BATCH_EVENTS)
+
+
+class RecordEventBatchResponse(BaseModel):
+    event_ids: list[uuid.UUID]
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -193,3 +218,91 @@ def record_event_endpoint(
         )
 
     return response
+
+
+@router.post(
+    "/campaigns/{campaign_id}/events:batch",
+    response_model=RecordEventBatchResponse,
+    status_code=201,
+)
+def record_event_batch_endpoint(
+    campaign_id: uuid.UUID,
+    body: RecordEventBatchRequest,
+    access: Annotated[
+        AccessContext, Depends(require_campaign_capability(_EVENT_MANAGE_CAPABILITY))
+    ],
+    connection: Annotated[Connection, Depends(get_connection)],
+    idempotency_key: Annotated[str | None, Depends(get_idempotency_key)],
+    correlation_id: Annotated[str | None, Depends(get_request_correlation_id)],
+) -> RecordEventBatchResponse:
+    reservation_id: uuid.UUID | None = None
+    if idempotency_key is not None:
+        fingerprint_payload: dict[str, Any] = body.model_dump(mode="json")
+        outcome = begin_idempotent_request(
+            connection,
+            actor_user_id=access.user_id,
+            campaign_id=campaign_id,
+            idempotency_key=idempotency_key,
+            command_name=_RECORD_EVENT_BATCH_COMMAND_NAME,
+            payload=fingerprint_payload,
+            correlation_id=correlation_id,
+        )
+        if isinstance(outcome, IdempotentReplay):
+            return RecordEventBatchResponse.model_validate(outcome.response_body)
+        reservation_id = outcome.idempotent_request_id
+
+    world_id = timeline_world_id(connection, access.timeline_id)
+
+    results = _record_events_impl(
+        connection,
+        world_id=world_id,
+        timeline_id=access.timeline_id,
+        events=[
+            EventSpec(
+                world_time_id=event.world_time_id,
+                event_type_code=event.event_type_code,
+                name=event.name,
+                event_status_code=event.event_status_code,
+                details=event.details,
+                campaign_id=campaign_id,
+                session_id=event.session_id,
+                participants=tuple(
+                    EventParticipant(entity_id=p.entity_id, role_code=p.role_code, notes=p.notes)
+                    for p in event.participants
+                ),
+                cause_event_id=event.cause_event_id,
+                cause_interaction_id=event.cause_interaction_id,
+                cause_description=event.cause_description,
+            )
+            for event in body.events
+        ],
+    )
+
+    record_change_logs(
+        connection,
+        change_action_code=_CREATED_CHANGE_ACTION,
+        schema_name="narrative",
+        table_name="events",
+        records=[
+            ChangeLogRecord(
+                record_id=result.event_id, entity_id=result.event_id, event_id=result.event_id
+            )
+            for result in results
+        ],
+        world_id=world_id,
+        actor_user_id=access.user_id,
+        correlation_id=correlation_id,
+        command_name=_RECORD_EVENT_BATCH_COMMAND_NAME,
+    )
+
+    response = RecordEventBatchResponse(event_ids=[result.event_id for result in results])
+
+    if reservation_id is not None:
+        complete_idempotent_request(
+            connection,
+            idempotent_request_id=reservation_id,
+            response_status_code=201,
+            response_body=response.model_dump(mode="json"),
+        )
+
+    return response
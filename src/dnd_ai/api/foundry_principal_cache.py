@@ -0,0 +1,126 @@
+"""Cross-request cache of Foundry-adapter principals for
+`dnd_ai.api.auth.get_authenticated_user_id`'s `FoundrySystem` path.
+
+`resolve_foundry_system_principal` joins `integration.external_systems`,
+`security.users`, and `core.lifecycle_statuses` on every Foundry-adapter
+request — the highest-volume client during combat — while its answer
+changes only when a key is rotated, a system is deactivated or rebound,
+or the bound user's lifecycle status changes. This module keeps the last
+resolved principal per (external system, presented key's hash) and reuses
+it only while both of these still hold:
+
+1. the system's `credential_generation` (`dnd_ai.domain.access.
+   read_foundry_credential_generation` — one primary-key read, replacing
+   the join) is the one the entry was resolved at. Migration 100's
+   triggers bump it inside the writing transaction itself —
+   `issue_foundry_system_key`'s rotation, an `is_active` flip, a rebind,
+   or a lifecycle change on the bound user — so the very next request
+   after that commit re-resolves, from every process;
+2. the entry is younger than `ttl_seconds` (process monotonic clock) — the
+   configurable upper bound on how long any cached credential is accepted
+   regardless, covering anything the counter cannot see (a schema
+   downgraded below migration 100 with the cache left on, or triggers
+   disabled for a bulk fix).
+
+Keyed on the hash, never the raw key: a rotated-out key simply stops
+matching any entry's key, and a wrong key can never hit another key's
+entry. Only a positive resolution is stored, so a failed attempt
+re-resolves every time. `foundry_claimed_actor_id` is descriptive audit
+metadata, never part of the key — a hit returns the cached principal with
+the current request's own claim substituted in.
+
+Process-local and bounded (`max_entries`, least-recently-used eviction);
+`max_entries=0` disables caching entirely and makes `resolve` a plain
+pass-through. Built once per process by `get_foundry_principal_cache`
+from `DND_AI_FOUNDRY_PRINCIPAL_CACHE_MAX_ENTRIES`/`_TTL_SECONDS` and
+discarded by `dispose_foundry_principal_cache` from the app's lifespan
+shutdown, mirroring `dnd_ai.api.access_cache`.
+"""
+
+import dataclasses
+import threading
+import uuid
+
+from sqlalchemy import Connection
+
+from dnd_ai.caching import GenerationCache
+from dnd_ai.config import settings
+from dnd_ai.domain.access import (
+    AuthenticatedPrincipal,
+    hash_foundry_system_key,
+    read_foundry_credential_generation,
+    resolve_foundry_system_principal,
+)
+
+_CacheKey = tuple[uuid.UUID, str]
+
+
+class FoundryPrincipalCache(GenerationCache[_CacheKey, AuthenticatedPrincipal]):
+    """See this module's docstring: a `dnd_ai.caching.GenerationCache` at
+    the system's `credential_generation`, with `ttl_seconds` as the age
+    bound."""
+
+    def resolve(
+        self,
+        connection: Connection,
+        *,
+        external_system_id: uuid.UUID,
+        raw_key: str,
+        claimed_foundry_actor_id: str | None,
+    ) -> AuthenticatedPrincipal | None:
+        """`resolve_foundry_system_principal(connection, ...)`, served from
+        the cache while the entry for (external_system_id, hash of raw_key)
+        is still current by both of this module's rules."""
+        if not self.enabled:
+            return resolve_foundry_system_principal(
+                connection,
+                external_system_id=external_system_id,
+                raw_key=raw_key,
+                claimed_foundry_actor_id=claimed_foundry_actor_id,
+            )
+
+        current = read_foundry_credential_generation(
+            connection, external_system_id=external_system_id
+        )
+        if current is None:
+            return None
+
+        key = (external_system_id, hash_foundry_system_key(raw_key))
+        cached = self.lookup(key, generation=current)
+        if cached is not None:
+            return dataclasses.replace(cached, foundry_claimed_actor_id=claimed_foundry_actor_id)
+
+        principal = resolve_foundry_system_principal(
+            connection,
+            external_system_id=external_system_id,
+            raw_key=raw_key,
+            claimed_foundry_actor_id=claimed_foundry_actor_id,
+        )
+        if principal is not None:
+            self.store(key, principal, generation=current)
+        return principal
+
+
+_foundry_principal_cache: FoundryPrincipalCache | None = None
+_foundry_principal_cache_init_lock = threading.Lock()
+
+
+def get_foundry_principal_cache() -> FoundryPrincipalCache:
+    global _foundry_principal_cache
+    if _foundry_principal_cache is not None:
+        return _foundry_principal_cache
+    with _foundry_principal_cache_init_lock:
+        if _foundry_principal_cache is None:
+            _foundry_principal_cache = FoundryPrincipalCache(
+                max_entries=settings.foundry_principal_cache_max_entries,
+                ttl_seconds=settings.foundry_principal_cache_ttl_seconds,
+            )
+        return _foundry_principal_cache
+
+
+def dispose_foundry_principal_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.access_cache.dispose_access_context_cache`."""
+    global _foundry_principal_cache
+    with _foundry_principal_cache_init_lock:
+        _foundry_principal_cache = None
@@ -0,0 +1,86 @@
+"""Short-TTL cache of `(issuer, subject) -> user_id` for
+`dnd_ai.api.auth.get_authenticated_user_id`'s OIDC path.
+
+Every OIDC-authenticated request resolves its verified token's
+`(issuer, subject)` pair through `dnd_ai.domain.access.
+resolve_user_by_external_identity` — a join of `security.
+external_identities`, `security.users`, and their lifecycle statuses that
+answers the same thing for every request a given user makes. This module
+keeps the last positive answer per pair for `ttl_seconds` (process
+monotonic clock).
+
+Unlike `dnd_ai.api.access_cache`, nothing in the schema announces a change
+here: an identity revocation, relinking, or user deactivation is noticed
+only once the entry's TTL has elapsed, so the TTL is the whole staleness
+bound and is meant to stay short (`DND_AI_EXTERNAL_IDENTITY_CACHE_TTL_
+SECONDS`, 30 seconds by default). Only a positive resolution is ever
+stored — an unknown, revoked, or inactive identity re-resolves on every
+request, which is also what makes a freshly linked identity usable
+immediately. Nothing here authorizes anything; `dnd_ai.api.access.
+require_campaign_capability` still resolves campaign access separately.
+
+Process-local and bounded (`max_entries`, least-recently-used eviction);
+`max_entries=0` disables caching entirely and makes `resolve` a plain
+pass-through. Built once per process by `get_external_identity_cache` and
+discarded by `dispose_external_identity_cache` from the app's lifespan
+shutdown, mirroring `dnd_ai.api.access_cache`.
+"""
+
+import threading
+import uuid
+
+from sqlalchemy import Connection
+
+from dnd_ai.caching import GenerationCache
+from dnd_ai.config import settings
+from dnd_ai.domain.access import resolve_user_by_external_identity
+
+_CacheKey = tuple[str, str]
+
+
+class ExternalIdentityCache(GenerationCache[_CacheKey, uuid.UUID]):
+    """See this module's docstring: a `dnd_ai.caching.GenerationCache`
+    with no generation to compare, so `ttl_seconds` alone bounds an
+    entry."""
+
+    def resolve(self, connection: Connection, *, issuer: str, subject: str) -> uuid.UUID | None:
+        """`resolve_user_by_external_identity(connection, issuer=...,
+        subject=...)`, served from the cache while the pair's entry is
+        younger than `ttl_seconds`."""
+        if not self.enabled:
+            return resolve_user_by_external_identity(connection, issuer=issuer, subject=subject)
+
+        key = (issuer, subject)
+        cached = self.lookup(key, generation=None)
+        if cached is not None:
+            return cached
+
+        user_id = resolve_user_by_external_identity(connection, issuer=issuer, subject=subject)
+        if user_id is not None:
+            self.store(key, user_id, generation=None)
+        return user_id
+
+
+_external_identity_cache: ExternalIdentityCache | None = None
+_external_identity_cache_init_lock = threading.Lock()
+
+
+def get_external_identity_cache() -> ExternalIdentityCache:
+    global _external_identity_cache
+    if _external_identity_cache is not None:
+        return _external_identity_cache
+    with _external_identity_cache_init_lock:
+        if _external_identity_cache is None:
+            _external_identity_cache = ExternalIdentityCache(
+                max_entries=settings.external_identity_cache_max_entries,
+                ttl_seconds=settings.external_identity_cache_ttl_seconds,
+            )
+        return _external_identity_cache
+
+
+def dispose_external_identity_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.access_cache.dispose_access_context_cache`."""
+    global _external_identity_cache
+    with _external_identity_cache_init_lock:
+        _external_identity_cache = None
@@ -13,13 +13,14 @@ management (`dnd_ai.api.deps`), and access resolution
 (`dnd_ai.api.access`, `dnd_ai.domain.access`) every other command router
 uses.
 
-The first four routes (all writes) and `sync_state_endpoint` (a read) run
-on the request's own `get_connection` transaction and call the
-connection-taking `_..._impl` form of their command, or a plain query
-function for the read, on that same connection — never the public
+The first four routes (all writes) run on the request's own
+`get_connection` transaction and call the connection-taking `_..._impl`
+form of their command on that same connection — never the public
 engine-based command wrapper, which would open a second, nested
 transaction — identical to every route in `dnd_ai.api.encounters`/
 `.items`/`.quests`/`.relationships`/`.events`/`.interactions`.
+`sync_state_endpoint` (a read) runs its plain query function on
+`get_read_connection` instead.
 `apply_foundry_combat_sync_endpoint` is the one deliberate exception — see
 its own section below and `dnd_ai.commands.integration`'s own module
 docstring ("HTTP exposure") for why.
@@ -130,8 +131,10 @@ one — so `link_foundry_identity_endpoint` also records `entity_id=None`,
 the same as `register_external_system_endpoint`.
 
 `apply_foundry_combat_sync_endpoint` (Phase 11 workstream 3): unlike the
-four routes above, this one takes `Depends(get_engine)`, not
-`Depends(get_connection)` — see `dnd_ai.commands.integration`'s own module
+four routes above, this one takes an engine, not
+`Depends(get_connection)` — `Depends(get_advisory_lock_engine)`, the
+request engine unless a dedicated advisory-lock pool is configured (see
+`dnd_ai.api.deps`) — see `dnd_ai.commands.integration`'s own module
 docstring for why `apply_foundry_combat_sync`'s three-transaction,
 advisory-lock design cannot run inside a caller-supplied connection/
 transaction the way every other command here does. `require_campaign_
@@ -155,6 +158,21 @@ integration`'s own docstring for why a combat turn's durable record is
 not `audit.change_log`, mirroring `resolve_combat_turn_endpoint`'s
 identical omission.
 
+`POST .../integration/foundry/combat-sync:batch` is the same route for an
+ordered backlog of up to `_MAX_BATCH_SYNC_OPERATIONS` operations on one
+encounter — what a reconnecting adapter replays — through
+`apply_foundry_combat_sync_batch`, with one result per operation in
+request order and the same per-operation replay/conflict rules. A batch
+that fails part way has completed the operations before the failing one;
+redelivering the whole batch replays those and retries the rest.
+
+Both combat-sync routes also take `Depends(get_connection)` — the same
+connection `require_campaign_capability` already holds, never a second
+checkout from the request pool — as `replay_connection`: an
+already-completed operation is replayed there and never checks out an
+advisory-lock connection at all (`dnd_ai.commands.integration`'s module
+docstring, "Lock-free replay").
+
 `sync_state_endpoint` (Phase 11 workstream 4, "restore synchronized state
 after reopening or reconnecting"): `GET /campaigns/{campaign_id}/
 integration/external-systems/{external_system_id}/sync-state`, taking
@@ -189,13 +207,16 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from sqlalchemy import Connection, Engine, text
 
+from dnd_ai.commands.encounters import CombatTurn, EncounterWorkingSetCache
 from dnd_ai.commands.integration import (
     ApplyFoundryCombatSyncResult,
+    FoundryCombatSyncOperation,
     _issue_foundry_system_key_impl,
     _link_foundry_identity_impl,
     _map_external_identifier_impl,
     _register_external_system_impl,
     apply_foundry_combat_sync,
+    apply_foundry_combat_sync_batch,
 )
 from dnd_ai.domain.access import AccessContext, assert_foundry_system_matches
 from dnd_ai.queries.integration import InvalidSyncStateTargetError, get_sync_state_view
@@ -204,7 +225,13 @@ from ._shared import timeline_world_id
 from .access import require_campaign_capability
 from .audit import record_change_log
 from .correlation import get_request_correlation_id
-from .deps import get_connection, get_engine, get_idempotency_key
+from .deps import (
+    get_advisory_lock_engine,
+    get_connection,
+    get_idempotency_key,
+    get_read_connection,
+)
+from .encounters import get_encounter_working_set_cache
 from .errors import NotFoundError
 from .idempotency import IdempotentReplay, begin_idempotent_request, complete_idempotent_request
 
@@ -245,6 +272,12 @@ _ISSUE_FOUNDRY_SYSTEM_KEY_COMMAND_NAME = "issue_foundry_system_key"
 # often as they create one, the same "insert vs. update is an
 # implementation detail of one logical operation" reasoning
 # dnd_ai.api.items already applies to its own upserts.
+# Each operation holds its own advisory lock until the batch finishes, and
+# session-level advisory locks share PostgreSQL's lock table with every
+# other connection — the bound keeps one backlog from crowding it out.
+# Larger backlogs are delivered in several batches.
+_MAX_BATCH_SYNC_OPERATIONS = 250
+
 _CREATED_CHANGE_ACTION = "created"
 _UPDATED_CHANGE_ACTION = "updated"
 
@@ -365,6 +398,62 @@ class ApplyFoundryCombatSyncResponse(BaseModel):
         )
 
 
+class FoundryCombatSyncOperationRequest(BaseModel):
+    # Same bounds as ApplyFoundryCombatSyncRequest's own fields.
+    external_operation_id: str = Field(min_length=1, max_length=255)
+    round_number: int = Field(ge=1)
+    turn_order: int = Field(ge=0)
+    actor_entity_id: uuid.UUID
+    world_time_id: uuid.UUID
+    action_kind: str = "attack"
+    target_entity_id: uuid.UUID | None = None
+    item_instance_id: uuid.UUID | None = None
+    spell_id: uuid.UUID | None = None
+    hit: bool | None = None
+    damage_amount: int | None = Field(default=None, ge=0)
+    damage_type_id: uuid.UUID | None = None
+    resulting_condition_id: uuid.UUID | None = None
+    interaction_type_code: str = "attack"
+    session_id: uuid.UUID | None = None
+    event_details: str | None = None
+    raw_payload: dict[str, Any] | None = None
+
+    def to_operation(self) -> FoundryCombatSyncOperation:
+        return FoundryCombatSyncOperation(
+            external_operation_id=self.external_operation_id,
+            turn=CombatTurn(
+                round_number=self.round_number,
+                turn_order=self.turn_order,
+                actor_entity_id=self.actor_entity_id,
+                world_time_id=self.world_time_id,
+                action_kind=self.action_kind,
+                target_entity_id=self.target_entity_id,
+                item_instance_id=self.item_instance_id,
+                spell_id=self.spell_id,
+                hit=self.hit,
+                damage_amount=self.damage_amount,
+                damage_type_id=self.damage_type_id,
+                resulting_condition_id=self.resulting_condition_id,
+                interaction_type_code=self.interaction_type_code,
+                session_id=self.session_id,
+                event_details=self.event_details,
+            ),
+            raw_payload=self.raw_payload,
+        )
+
+
+class ApplyFoundryCombatSyncBatchRequest(BaseModel):
+    external_system_id: uuid.UUID
+    encounter_id: uuid.UUID
+    operations: list[FoundryCombatSyncOperationRequest] = Field(
+        min_length=1, max_length=_MAX_BATCH_SYNC_OPERATIONS
+    )
+
+
+class ApplyFoundryCombatSyncBatchResponse(BaseModel):
+    operations: list[ApplyFoundryCombatSyncResponse]
+
+
 class SyncStateResponse(BaseModel):
     sync_state_id: uuid.UUID
     external_system_id: uuid.UUID
@@ -662,16 +751,23 @@ def apply_foundry_combat_sync_endpoint(
     # the principal assert_foundry_system_matches checks body.
     # external_system_id against below — this route otherwise still does
     # not use the resolved AccessContext for anything else, and
-    # deliberately does not depend on get_connection for its own work. See
-    # this module's docstring ("apply_foundry_combat_sync_endpoint") for
-    # why.
+    # deliberately does not run its own work on get_connection. See this
+    # module's docstring ("apply_foundry_combat_sync_endpoint") for why.
     access: Annotated[
         AccessContext,
         Depends(
             require_campaign_capability(_INTEGRATION_MANAGE_CAPABILITY, allow_foundry_system=True)
         ),
     ],
-    engine: Annotated[Engine, Depends(get_engine)],
+    engine: Annotated[Engine, Depends(get_advisory_lock_engine)],
+    # The lock-free replay pre-check reads on the connection the access
+    # check above already holds, so a redelivered, already-completed
+    # operation never waits for (or holds) a second one.
+    connection: Annotated[Connection, Depends(get_connection)],
+    # Shared with dnd_ai.api.encounters' turn routes.
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
 ) -> ApplyFoundryCombatSyncResponse:
     assert access.principal is not None
     assert_foundry_system_matches(access.principal, body.external_system_id)
@@ -698,10 +794,50 @@ def apply_foundry_combat_sync_endpoint(
         event_details=body.event_details,
         raw_payload=body.raw_payload,
         campaign_id=campaign_id,
+        replay_connection=connection,
+        working_set_cache=working_set_cache,
     )
     return ApplyFoundryCombatSyncResponse.from_result(result)
 
 
+@router.post(
+    "/campaigns/{campaign_id}/integration/foundry/combat-sync:batch",
+    response_model=ApplyFoundryCombatSyncBatchResponse,
+    status_code=201,
+)
+def apply_foundry_combat_sync_batch_endpoint(
+    campaign_id: uuid.UUID,
+    body: ApplyFoundryCombatSyncBatchRequest,
+    # See apply_foundry_combat_sync_endpoint.
+    access: Annotated[
+        AccessContext,
+        Depends(
+            require_campaign_capability(_INTEGRATION_MANAGE_CAPABILITY, allow_foundry_system=True)
+        ),
+    ],
+    engine: Annotated[Engine, Depends(get_advisory_lock_engine)],
+    connection: Annotated[Connection, Depends(get_connection)],
+    working_set_cache: Annotated[
+        EncounterWorkingSetCache, Depends(get_encounter_working_set_cache)
+    ],
+) -> ApplyFoundryCombatSyncBatchResponse:
+    assert access.principal is not None
+    assert_foundry_system_matches(access.principal, body.external_system_id)
+
+    results = apply_foundry_combat_sync_batch(
+        engine,
+        external_system_id=body.external_system_id,
+        encounter_id=body.encounter_id,
+        operations=[operation.to_operation() for operation in body.operations],
+        campaign_id=campaign_id,
+        replay_connection=connection,
+        working_set_cache=working_set_cache,
+    )
+    return ApplyFoundryCombatSyncBatchResponse(
+        operations=[ApplyFoundryCombatSyncResponse.from_result(result) for result in results]
+    )
+
+
 def _assert_sync_state_target_owned_by_campaign(
     connection: Connection,
     *,
@@ -760,7 +896,7 @@ def sync_state_endpoint(
             require_campaign_capability(_INTEGRATION_VIEW_CAPABILITY, allow_foundry_system=True)
         ),
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
     target_entity_id: uuid.UUID | None = None,
     target_encounter_id: uuid.UUID | None = None,
 ) -> SyncStateResponse:
@@ -27,7 +27,9 @@ item" resolve to the identical fixed, non-disclosing 404
 item would, since a knowledge item's own existence can be sensitive.
 
 This is a read: no idempotency key, no `audit.change_log` row, for the
-same reasons `dnd_ai.api.dungeon`'s read endpoint has neither.
+same reasons `dnd_ai.api.dungeon`'s read endpoint has neither, and it
+splits its connections the same way: the view on `dnd_ai.api.deps.
+get_read_connection`, the party perspective on the primary.
 """
 
 import uuid
@@ -42,7 +44,7 @@ from dnd_ai.queries.knowledge import get_knowledge_view
 
 from ._shared import timeline_world_id
 from .access import require_campaign_capability, resolve_party_perspective
-from .deps import get_connection
+from .deps import get_connection, get_read_connection
 
 router = APIRouter(tags=["knowledge"])
 
@@ -83,6 +85,7 @@ def get_knowledge_endpoint(
         AccessContext, Depends(require_campaign_capability(_KNOWLEDGE_VIEW_CAPABILITY))
     ],
     connection: Annotated[Connection, Depends(get_connection)],
+    read_connection: Annotated[Connection, Depends(get_read_connection)],
     character_id: uuid.UUID | None = None,
     party_id: uuid.UUID | None = None,
 ) -> KnowledgeResponse:
@@ -103,10 +106,10 @@ def get_knowledge_endpoint(
     )
 
     view = get_knowledge_view(
-        connection,
+        read_connection,
         knowledge_item_id=knowledge_item_id,
         timeline_id=access.timeline_id,
-        expected_world_id=timeline_world_id(connection, access.timeline_id),
+        expected_world_id=timeline_world_id(read_connection, access.timeline_id),
         party_id=authorized_party_id,
         include_ground_truth=include_ground_truth,
     )
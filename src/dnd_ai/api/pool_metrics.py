@@ -0,0 +1,80 @@
+"""Connection-pool gauges for `/metricsz`.
+
+In-use, idle, and overflow counts are read straight off each engine's
+`QueuePool` at scrape time. Checkout wait has no pool-level hook before
+the wait begins, so `dnd_ai.api.deps.get_connection` times its own
+`engine.connect()` and reports it here through `record_checkout_wait`;
+the wait figures therefore cover request-scoped checkouts only, which is
+where pool exhaustion shows up as user-visible latency. Kept per engine in
+a `WeakKeyDictionary`, so a disposed or test-local engine takes its
+figures with it.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+
+
+@dataclass
+class _CheckoutWaits:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+_checkout_waits: "weakref.WeakKeyDictionary[Engine, _CheckoutWaits]" = weakref.WeakKeyDictionary()
+_checkout_waits_lock = threading.Lock()
+
+
+def record_checkout_wait(engine: Engine, seconds: float) -> None:
+    with _checkout_waits_lock:
+        waits = _checkout_waits.setdefault(engine, _CheckoutWaits())
+        waits.count += 1
+        waits.total_seconds += seconds
+        waits.max_seconds = max(waits.max_seconds, seconds)
+
+
+@dataclass(frozen=True)
+class PoolGauges:
+    """One engine's pool state at the moment it was read. `size`,
+    `checked_out`, `checked_in`, and `overflow` are None for a pool class
+    that does not report them (anything but `QueuePool`). `overflow` is
+    `QueuePool`'s own figure, which runs negative while the pool has not
+    yet opened all `size` connections."""
+
+    size: int | None
+    checked_out: int | None
+    checked_in: int | None
+    overflow: int | None
+    checkout_wait_count: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+
+
+def read_pool_gauges(engine: Engine) -> PoolGauges:
+    pool = engine.pool
+    with _checkout_waits_lock:
+        waits = _checkout_waits.get(engine, _CheckoutWaits())
+        count, total, longest = waits.count, waits.total_seconds, waits.max_seconds
+    if isinstance(pool, QueuePool):
+        return PoolGauges(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            checkout_wait_count=count,
+            checkout_wait_seconds_total=total,
+            checkout_wait_seconds_max=longest,
+        )
+    return PoolGauges(
+        size=None,
+        checked_out=None,
+        checked_in=None,
+        overflow=None,
+        checkout_wait_count=count,
+        checkout_wait_seconds_total=total,
+        checkout_wait_seconds_max=longest,
+    )
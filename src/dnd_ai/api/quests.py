@@ -75,7 +75,8 @@ regardless of `visibility_policy` — and party-perspective authorization
 exactly — see `dnd_ai.queries.quest`'s own docstring for how
 `narrative.quest_objectives.visibility_policy` drives it. This route is a
 read: no idempotency key, no `audit.change_log` row, for the same reasons
-`dnd_ai.api.dungeon`'s read endpoint has neither.
+`dnd_ai.api.dungeon`'s read endpoint has neither, and it splits its
+connections the same way that endpoint does.
 """
 
 import uuid
@@ -93,7 +94,7 @@ from ._shared import timeline_world_id
 from .access import require_campaign_capability, resolve_party_perspective
 from .audit import record_change_log
 from .correlation import get_request_correlation_id
-from .deps import get_connection, get_idempotency_key
+from .deps import get_connection, get_idempotency_key, get_read_connection
 from .idempotency import IdempotentReplay, begin_idempotent_request, complete_idempotent_request
 
 router = APIRouter(tags=["quests"])
@@ -267,6 +268,7 @@ def get_quest_endpoint(
     quest_id: uuid.UUID,
     access: Annotated[AccessContext, Depends(require_campaign_capability(_QUEST_VIEW_CAPABILITY))],
     connection: Annotated[Connection, Depends(get_connection)],
+    read_connection: Annotated[Connection, Depends(get_read_connection)],
     character_id: uuid.UUID | None = None,
     party_id: uuid.UUID | None = None,
 ) -> QuestResponse:
@@ -284,10 +286,10 @@ def get_quest_endpoint(
     )
 
     view = get_quest_view(
-        connection,
+        read_connection,
         quest_id=quest_id,
         timeline_id=access.timeline_id,
-        expected_world_id=timeline_world_id(connection, access.timeline_id),
+        expected_world_id=timeline_world_id(read_connection, access.timeline_id),
         party_id=authorized_party_id,
         include_hidden=include_hidden,
     )
@@ -0,0 +1,110 @@
+"""Replay-lag gate for `dnd_ai.api.deps.get_read_replica_engine`.
+
+A read routed to the replica is only as fresh as the replica's last
+replayed transaction, so `ReplicaLagMonitor` decides, per request, whether
+the replica is close enough behind the primary to serve it. The answer is
+measured on the replica itself (`measure_replica_lag_seconds`) and reused
+for `check_interval_seconds` (process monotonic clock), so the probe costs
+one round trip per interval rather than one per request.
+
+The replica is considered fresh only when a measurement succeeded and came
+in at or under `max_lag_seconds`. An unreachable replica, a failed probe, or
+a standby that has not replayed anything yet all count as stale, and the
+caller falls back to the primary — a read is never refused because the
+replica is unavailable. A probe failure is logged by exception class name
+only, following `dnd_ai.api.app.readyz`'s rule that a driver error's
+message can carry the DSN.
+
+Replay lag measures time since the last replayed commit, so an idle
+primary makes a healthy standby look increasingly stale; the effect is
+only that reads go to the primary until the next write replicates, which
+is the safe direction. A database that is not in recovery at all (the
+local test suite's stand-in replica, or a promoted standby) reports zero.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy import Connection, Engine, text
+
+logger = logging.getLogger(__name__)
+
+
+def measure_replica_lag_seconds(connection: Connection) -> float | None:
+    """Seconds since the last transaction `connection`'s server replayed,
+    0.0 when the server is not a standby, or None when it is a standby
+    that has not replayed anything yet."""
+    lag = connection.execute(
+        text(
+            "SELECT CASE WHEN pg_is_in_recovery() "
+            "THEN EXTRACT(EPOCH FROM clock_timestamp() - pg_last_xact_replay_timestamp()) "
+            "ELSE 0 END"
+        )
+    ).scalar()
+    return None if lag is None else float(lag)
+
+
+class ReplicaLagMonitor:
+    """See this module's docstring. `monotonic` and `measure` are
+    injectable so tests can step the interval and dictate the lag without
+    a real standby."""
+
+    def __init__(
+        self,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        monotonic: Callable[[], float] = time.monotonic,
+        measure: Callable[[Connection], float | None] = measure_replica_lag_seconds,
+    ) -> None:
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._monotonic = monotonic
+        self._measure = measure
+        self._lock = threading.Lock()
+        self._checked_at: float | None = None
+        self._fresh = False
+        self._last_lag_seconds: float | None = None
+        self._fallback_count = 0
+
+    def is_fresh(self, replica: Engine) -> bool:
+        """Whether `replica` may serve a read right now. Counts every
+        False answer as one fallback to the primary."""
+        with self._lock:
+            checked_at = self._checked_at
+            if checked_at is not None and (
+                self._monotonic() - checked_at < self._check_interval_seconds
+            ):
+                fresh = self._fresh
+                if not fresh:
+                    self._fallback_count += 1
+                return fresh
+
+        lag: float | None
+        try:
+            with replica.connect() as connection:
+                lag = self._measure(connection)
+        except Exception as exc:
+            logger.warning("read replica lag probe failed: %s", type(exc).__name__)
+            lag = None
+        fresh = lag is not None and lag <= self._max_lag_seconds
+
+        with self._lock:
+            self._checked_at = self._monotonic()
+            self._fresh = fresh
+            self._last_lag_seconds = lag
+            if not fresh:
+                self._fallback_count += 1
+        return fresh
+
+    @property
+    def last_lag_seconds(self) -> float | None:
+        with self._lock:
+            return self._last_lag_seconds
+
+    @property
+    def fallback_count(self) -> int:
+        with self._lock:
+            return self._fallback_count
@@ -27,31 +27,67 @@ remove) are administrative, GM-only, low-frequency actions with no exit
 criterion requiring durable retry-safety, unlike the player-facing,
 high-frequency command routes (`dnd_ai.api.items`/`.encounters`) that do
 implement it.
+
+Passages arrive either as one JSON body (`.../passages`) or, for a whole
+sourcebook, as an NDJSON stream (`.../passages/ndjson`, one
+`PassageRequest` object per line). The stream is parsed line by line as
+the body arrives and handed to `dnd_ai.commands.reference_corpus.
+ingest_reference_passage_stream` in a worker thread, which pulls each next
+body chunk back from the event loop (`anyio.from_thread`) — so the book is
+never held in memory whole, and a malformed line aborts the one ingestion
+transaction before anything commits.
+
+Embedding for hybrid retrieval is deployment configuration, not a
+request choice: `_resolve_embedder()` builds the embedder
+`DND_AI_REFERENCE_EMBEDDER` names (or None), both ingestion routes store
+vectors whenever one is configured, and a query asks for `"mode":
+"hybrid"` explicitly — refused with a 503 when no embedder is configured,
+rather than quietly answered lexically. Tests override `_resolve_embedder`
+through `app.dependency_overrides`, as `dnd_ai.api.ai_npc`'s tests do its
+provider.
+
+The query route passes the process's one `ReferenceRetrievalCache`, built by
+`get_reference_retrieval_cache` from `DND_AI_REFERENCE_RETRIEVAL_CACHE_*` and
+discarded by `dispose_reference_retrieval_cache` at lifespan shutdown, the
+same lifecycle `dnd_ai.api.access_cache` gives its cache. `/metricsz`
+reports its hit ratio and estimated latency saved once it exists. It also
+passes the asynchronous audit writer (`dnd_ai.api.retrieval_audit`) when
+`DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE=async`.
 """
 
+import threading
 import uuid
-from typing import Annotated
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+import anyio.from_thread
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy import Connection, Engine
 
 from dnd_ai.commands.reference_corpus import (
     CitedPassage,
     PassageInput,
+    ReferenceRetrievalCache,
     _register_source_document_impl,
     _remove_source_document_impl,
     grant_source_to_campaign,
+    ingest_reference_passage_stream,
     ingest_reference_passages,
     retrieve_cited_passages,
     revoke_source_campaign_grant,
 )
+from dnd_ai.config import settings
 from dnd_ai.domain.access import AccessContext
+from dnd_ai.domain.embeddings import PassageEmbedder, build_passage_embedder
+from dnd_ai.domain.errors import SafeMessageError
 
 from .access import require_campaign_capability
 from .audit import record_change_log
 from .correlation import get_request_correlation_id
 from .deps import get_connection, get_engine
+from .retrieval_audit import RetrievalAuditWriter, get_retrieval_audit_writer
 
 router = APIRouter(tags=["reference-corpus"])
 
@@ -61,6 +97,75 @@ _VIEW_CAPABILITY = "campaign.view"
 _REGISTER_COMMAND_NAME = "register_source_document"
 _REMOVE_COMMAND_NAME = "remove_source_document"
 
+_NDJSON_MEDIA_TYPES = frozenset({"application/x-ndjson", "application/jsonl"})
+
+# Generous for one passage (content is capped at 20,000 characters); a
+# longer line is rejected rather than buffered without bound.
+_MAX_NDJSON_LINE_BYTES = 128 * 1024
+
+
+class UnsupportedPassageStreamMediaTypeError(SafeMessageError):
+    safe_status_code = 415
+    safe_error_code = "unsupported_media_type"
+    safe_message = "The passage stream must be sent as application/x-ndjson."
+
+
+class InvalidPassageStreamError(SafeMessageError):
+    """A passage-stream line that is not one valid passage object, or is
+    longer than `_MAX_NDJSON_LINE_BYTES`. Never says which line or why —
+    the same no-echo rule `dnd_ai.api.errors` applies to request-body
+    validation."""
+
+    safe_error_code = "invalid_passage_stream"
+    safe_message = "Each line of the passage stream must be one valid passage object."
+
+
+class HybridRetrievalUnavailableError(SafeMessageError):
+    """A hybrid query against a deployment with no passage embedder
+    configured. 503, like `dnd_ai.api.ai_npc`'s missing provider: the
+    request is valid, this deployment just cannot serve it."""
+
+    safe_status_code = 503
+    safe_error_code = "hybrid_retrieval_unavailable"
+    safe_message = "Hybrid retrieval is not enabled on this server."
+
+
+def _resolve_embedder() -> PassageEmbedder | None:
+    return build_passage_embedder(
+        settings.reference_embedder, dimensions=settings.reference_embedding_dimensions
+    )
+
+
+_reference_retrieval_cache: ReferenceRetrievalCache | None = None
+_reference_retrieval_cache_init_lock = threading.Lock()
+
+
+def get_reference_retrieval_cache() -> ReferenceRetrievalCache:
+    global _reference_retrieval_cache
+    if _reference_retrieval_cache is not None:
+        return _reference_retrieval_cache
+    with _reference_retrieval_cache_init_lock:
+        if _reference_retrieval_cache is None:
+            _reference_retrieval_cache = ReferenceRetrievalCache(
+                max_entries=settings.reference_retrieval_cache_max_entries,
+                ttl_seconds=settings.reference_retrieval_cache_ttl_seconds,
+            )
+        return _reference_retrieval_cache
+
+
+def peek_reference_retrieval_cache() -> ReferenceRetrievalCache | None:
+    """The retrieval cache if one has been built, without building it —
+    for `/metricsz`."""
+    return _reference_retrieval_cache
+
+
+def dispose_reference_retrieval_cache() -> None:
+    """Called from the app's lifespan shutdown, mirroring
+    `dnd_ai.api.access_cache.dispose_access_context_cache`."""
+    global _reference_retrieval_cache
+    with _reference_retrieval_cache_init_lock:
+        _reference_retrieval_cache = None
+
 
 class RegisterSourceDocumentRequest(BaseModel):
     source_type_code: str
@@ -114,6 +219,7 @@ class GrantSourceToCampaignResponse(BaseModel):
 class RetrieveCitedPassagesRequest(BaseModel):
     query_text: str = Field(min_length=1, max_length=2000)
     limit: int = Field(default=5, ge=1, le=20)
+    mode: Literal["lexical", "hybrid"] = "lexical"
 
 
 class CitedPassageResponse(BaseModel):
@@ -128,6 +234,8 @@ class CitedPassageResponse(BaseModel):
     is_house_rule: bool
     rank: int
     relevance_score: float
+    lexical_score: float | None
+    vector_score: float | None
 
     @classmethod
     def from_domain(cls, passage: CitedPassage) -> "CitedPassageResponse":
@@ -143,6 +251,8 @@ class CitedPassageResponse(BaseModel):
             is_house_rule=passage.is_house_rule,
             rank=passage.rank,
             relevance_score=passage.relevance_score,
+            lexical_score=passage.lexical_score,
+            vector_score=passage.vector_score,
         )
 
 
@@ -210,6 +320,7 @@ def ingest_reference_passages_endpoint(
     body: IngestReferencePassagesRequest,
     access: Annotated[AccessContext, Depends(require_campaign_capability(_MANAGE_CAPABILITY))],  # noqa: ARG001
     engine: Annotated[Engine, Depends(get_engine)],
+    embedder: Annotated[PassageEmbedder | None, Depends(_resolve_embedder)],
 ) -> IngestReferencePassagesResponse:
     passage_ids = ingest_reference_passages(
         engine,
@@ -225,10 +336,79 @@ def ingest_reference_passages_endpoint(
             )
             for p in body.passages
         ),
+        embedder=embedder,
+    )
+    return IngestReferencePassagesResponse(reference_passage_ids=list(passage_ids))
+
+
+@router.post(
+    "/campaigns/{campaign_id}/reference-corpus/sources/{source_document_id}/passages/ndjson",
+    response_model=IngestReferencePassagesResponse,
+    status_code=201,
+)
+async def ingest_reference_passage_stream_endpoint(
+    campaign_id: uuid.UUID,  # noqa: ARG001
+    source_document_id: uuid.UUID,
+    request: Request,
+    access: Annotated[AccessContext, Depends(require_campaign_capability(_MANAGE_CAPABILITY))],  # noqa: ARG001
+    engine: Annotated[Engine, Depends(get_engine)],
+    embedder: Annotated[PassageEmbedder | None, Depends(_resolve_embedder)],
+) -> IngestReferencePassagesResponse:
+    """Returns the new ids in ascending `passage_order`."""
+    media_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    if media_type not in _NDJSON_MEDIA_TYPES:
+        raise UnsupportedPassageStreamMediaTypeError()
+
+    body = request.stream()
+    passage_ids = await run_in_threadpool(
+        ingest_reference_passage_stream,
+        engine,
+        source_document_id=source_document_id,
+        passages=_ndjson_passages(lambda: anyio.from_thread.run(_next_chunk, body)),
+        embedder=embedder,
     )
     return IngestReferencePassagesResponse(reference_passage_ids=list(passage_ids))
 
 
+async def _next_chunk(body: AsyncIterator[bytes]) -> bytes | None:
+    return await anext(body, None)
+
+
+def _ndjson_passages(next_chunk: Callable[[], bytes | None]) -> Iterator[PassageInput]:
+    """Splits the body into lines as chunks arrive and validates each
+    non-blank line as a `PassageRequest`. Runs in the worker thread;
+    `next_chunk` blocks on the event loop for the next chunk (None at
+    the end of the body)."""
+    pending = b""
+    while (chunk := next_chunk()) is not None:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        if len(pending) > _MAX_NDJSON_LINE_BYTES:
+            raise InvalidPassageStreamError()
+        for line in lines:
+            if line.strip():
+                yield _parse_passage_line(line)
+    if pending.strip():
+        yield _parse_passage_line(pending)
+
+
+def _parse_passage_line(line: bytes) -> PassageInput:
+    if len(line) > _MAX_NDJSON_LINE_BYTES:
+        raise InvalidPassageStreamError()
+    try:
+        passage = PassageRequest.model_validate_json(line)
+    except ValidationError:
+        raise InvalidPassageStreamError() from None
+    return PassageInput(
+        passage_order=passage.passage_order,
+        content=passage.content,
+        chapter=passage.chapter,
+        section=passage.section,
+        page_label=passage.page_label,
+        heading=passage.heading,
+    )
+
+
 @router.post(
     "/campaigns/{campaign_id}/reference-corpus/sources/{source_document_id}/grant",
     response_model=GrantSourceToCampaignResponse,
@@ -302,13 +482,21 @@ def retrieve_cited_passages_endpoint(
     body: RetrieveCitedPassagesRequest,
     access: Annotated[AccessContext, Depends(require_campaign_capability(_VIEW_CAPABILITY))],
     engine: Annotated[Engine, Depends(get_engine)],
+    embedder: Annotated[PassageEmbedder | None, Depends(_resolve_embedder)],
+    cache: Annotated[ReferenceRetrievalCache, Depends(get_reference_retrieval_cache)],
+    audit_writer: Annotated[RetrievalAuditWriter | None, Depends(get_retrieval_audit_writer)],
 ) -> RetrieveCitedPassagesResponse:
+    if body.mode == "hybrid" and embedder is None:
+        raise HybridRetrievalUnavailableError()
     passages = retrieve_cited_passages(
         engine,
         campaign_id=campaign_id,
         query_text=body.query_text,
         requested_by_user_id=access.user_id,
         limit=body.limit,
+        embedder=embedder if body.mode == "hybrid" else None,
+        cache=cache,
+        audit_queue=audit_writer,
     )
     return RetrieveCitedPassagesResponse(
         passages=[CitedPassageResponse.from_domain(p) for p in passages]
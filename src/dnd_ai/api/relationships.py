@@ -75,7 +75,8 @@ standing with no single entity identity of its own — the same reason
 and this remains a genuinely campaign-wide capability check, unlike the
 `entity_id`-scoped organization check below. This route is a read: no
 idempotency key, no `audit.change_log` row, for the same reasons
-`dnd_ai.api.dungeon`'s read endpoint has neither.
+`dnd_ai.api.dungeon`'s read endpoint has neither; it and the organization
+read below run on `dnd_ai.api.deps.get_read_connection`.
 
 The organization read side is a sibling to the relationship read over the other half of this module's
 own command domain: `GET /campaigns/{campaign_id}/organizations/
@@ -112,7 +113,7 @@ from ._shared import timeline_world_id
 from .access import require_campaign_capability
 from .audit import record_change_log
 from .correlation import get_request_correlation_id
-from .deps import get_connection, get_idempotency_key
+from .deps import get_connection, get_idempotency_key, get_read_connection
 from .idempotency import IdempotentReplay, begin_idempotent_request, complete_idempotent_request
 
 router = APIRouter(tags=["relationships"])
@@ -342,7 +343,7 @@ def get_relationship_endpoint(
     access: Annotated[
         AccessContext, Depends(require_campaign_capability(_RELATIONSHIP_VIEW_CAPABILITY))
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> RelationshipResponse:
     include_subjective = access.has_capability(_RELATIONSHIP_MANAGE_CAPABILITY)
 
@@ -491,7 +492,7 @@ def get_organization_endpoint(
     access: Annotated[
         AccessContext, Depends(require_campaign_capability(_RELATIONSHIP_VIEW_CAPABILITY))
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> OrganizationResponse:
     include_internal_description = access.has_capability(
         _RELATIONSHIP_MANAGE_CAPABILITY, entity_id=organization_id
@@ -0,0 +1,229 @@
+"""Background, batched writer for reference-retrieval audit rows — the
+optional asynchronous mode of `dnd_ai.commands.reference_corpus`'s audit.
+
+By default (`DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE=sync`) every retrieval
+writes its own audit rows inside its own transaction, and a retrieval that
+returned is a retrieval that is audited. With `async`, the query route
+hands each `RetrievalAuditRecord` to the process's one
+`RetrievalAuditWriter` instead. The writer's thread collects records for up
+to `flush_interval_seconds` after the first one arrives, or until
+`batch_size` have arrived, and writes the whole batch with one
+`_insert_retrieval_audits` statement in one transaction.
+
+The durability trade is explicit and bounded:
+- a record is lost only if the process dies before its batch commits.
+  While the database keeps up that is about `flush_interval_seconds` of
+  retrievals, but a slow database lets the queue fill, so the bound is
+  `max_queued` queued records plus the `batch_size` batch being written
+  (10,500 with the defaults);
+- shutdown (`dispose_retrieval_audit_writer`, from the app's lifespan)
+  flushes everything still queued before returning;
+- the queue holds at most `max_queued` records. A full queue refuses the
+  next record and that retrieval writes its own rows synchronously, so
+  back pressure slows retrievals down rather than dropping audit rows;
+- a batch that fails is retried one record per transaction, so one bad
+  record (say, a campaign deleted in the meantime) costs only itself.
+  A record that still fails is counted and logged by exception class
+  name only, following `dnd_ai.api.app.readyz`'s rule that a driver
+  error's message can carry the DSN.
+
+`/metricsz` reports the writer's counters once it exists.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import Engine
+
+from dnd_ai.commands.reference_corpus import RetrievalAuditRecord, _insert_retrieval_audits
+from dnd_ai.config import settings
+
+from .deps import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetrievalAuditWriterStats:
+    queued: int
+    written: int
+    failed: int
+    refused: int
+
+
+class RetrievalAuditWriter:
+    """See this module's docstring. Starts its daemon thread on
+    construction; `close()` flushes and stops it."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        batch_size: int,
+        flush_interval_seconds: float,
+        max_queued: int,
+    ) -> None:
+        self._engine = engine
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._queue: queue.Queue[RetrievalAuditRecord | None] = queue.Queue(maxsize=max_queued)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._failed = 0
+        self._refused = 0
+        self._thread = threading.Thread(
+            target=self._run, name="reference-retrieval-audit", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record: RetrievalAuditRecord) -> bool:
+        with self._lock:
+            if not self._closed:
+                try:
+                    self._queue.put_nowait(record)
+                    return True
+                except queue.Full:
+                    pass
+            self._refused += 1
+            return False
+
+    def flush(self) -> None:
+        """Block until every record submitted so far is written (or has
+        failed)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Refuse new records, write everything queued, stop the thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def stats(self) -> RetrievalAuditWriterStats:
+        with self._lock:
+            return RetrievalAuditWriterStats(
+                queued=self._queue.qsize(),
+                written=self._written,
+                failed=self._failed,
+                refused=self._refused,
+            )
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._flush_interval_seconds
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is None:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(record)
+            if stopping:
+                batch.extend(self._drain())
+            for start in range(0, len(batch), self._batch_size):
+                chunk = batch[start : start + self._batch_size]
+                self._write(chunk)
+                for _ in chunk:
+                    self._queue.task_done()
+
+    def _drain(self) -> list[RetrievalAuditRecord]:
+        """Everything still queued at shutdown; `close()` refuses new
+        records first, so nothing arrives after this."""
+        records: list[RetrievalAuditRecord] = []
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return records
+            if record is None:
+                self._queue.task_done()
+            else:
+                records.append(record)
+
+    def _write(self, batch: list[RetrievalAuditRecord]) -> None:
+        try:
+            with self._engine.begin() as connection:
+                _insert_retrieval_audits(connection, batch)
+        except Exception as exc:
+            logger.warning(
+                "retrieval audit batch of %d failed (%s); retrying one record at a time",
+                len(batch),
+                type(exc).__name__,
+            )
+        else:
+            with self._lock:
+                self._written += len(batch)
+            return
+        for record in batch:
+            try:
+                with self._engine.begin() as connection:
+                    _insert_retrieval_audits(connection, (record,))
+            except Exception as exc:
+                logger.warning("retrieval audit record dropped (%s)", type(exc).__name__)
+                with self._lock:
+                    self._failed += 1
+            else:
+                with self._lock:
+                    self._written += 1
+
+
+_retrieval_audit_writer: RetrievalAuditWriter | None = None
+_retrieval_audit_writer_init_lock = threading.Lock()
+
+
+def get_retrieval_audit_writer(
+    engine: Annotated[Engine, Depends(get_engine)],
+) -> RetrievalAuditWriter | None:
+    """The process's writer when `DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE` is
+    `async`, built on first use against the request engine; None (write
+    synchronously) otherwise."""
+    global _retrieval_audit_writer
+    if settings.reference_retrieval_audit_mode != "async":
+        return None
+    if _retrieval_audit_writer is not None:
+        return _retrieval_audit_writer
+    with _retrieval_audit_writer_init_lock:
+        if _retrieval_audit_writer is None:
+            _retrieval_audit_writer = RetrievalAuditWriter(
+                engine,
+                batch_size=settings.reference_retrieval_audit_batch_size,
+                flush_interval_seconds=settings.reference_retrieval_audit_flush_interval_seconds,
+                max_queued=settings.reference_retrieval_audit_max_queued,
+            )
+        return _retrieval_audit_writer
+
+
+def peek_retrieval_audit_writer() -> RetrievalAuditWriter | None:
+    """The writer if one has been built, without building it — for
+    `/metricsz`."""
+    return _retrieval_audit_writer
+
+
+def dispose_retrieval_audit_writer() -> None:
+    """Called from the app's lifespan shutdown: flushes every queued
+    record before the engine it writes through is disposed."""
+    global _retrieval_audit_writer
+    with _retrieval_audit_writer_init_lock:
+        if _retrieval_audit_writer is not None:
+            _retrieval_audit_writer.close()
+        _retrieval_audit_writer = None
@@ -34,7 +34,8 @@ both per row, inside its own query, before the response's
 filtering after the cap would be wrong (a denied draft would consume a
 slot and push an older, genuinely visible event out of the response).
 This route is a read: no idempotency key, no `audit.change_log` row, for
-the same reasons every other Phase 10 read endpoint has neither.
+the same reasons every other Phase 10 read endpoint has neither, and like
+them it reads on `dnd_ai.api.deps.get_read_connection`.
 """
 
 import uuid
@@ -49,7 +50,7 @@ from dnd_ai.domain.access import AccessContext
 from dnd_ai.queries.summary import get_campaign_summary_view
 
 from .access import require_campaign_capability
-from .deps import get_connection
+from .deps import get_read_connection
 
 router = APIRouter(tags=["summary"])
 
@@ -102,7 +103,7 @@ def get_campaign_summary_endpoint(
     access: Annotated[
         AccessContext, Depends(require_campaign_capability(_SUMMARY_VIEW_CAPABILITY))
     ],
-    connection: Annotated[Connection, Depends(get_connection)],
+    connection: Annotated[Connection, Depends(get_read_connection)],
 ) -> CampaignSummaryResponse:
     denied_draft_event_ids, allowed_draft_event_ids = access.resource_grant_targets(
         _DRAFT_EVENTS_CAPABILITY, field_name="event_id"
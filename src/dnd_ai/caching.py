@@ -0,0 +1,131 @@
+"""The process-local, bounded cache every cross-request cache in this
+codebase is built on — the command-layer caches (`dnd_ai.commands.
+reference_corpus`, `dnd_ai.commands.ai_npc`, `dnd_ai.commands.encounters`),
+the API-layer ones (`dnd_ai.api.access_cache`, `dnd_ai.api.identity_cache`,
+`dnd_ai.api.foundry_principal_cache`), and `dnd_ai.domain.tokens.
+VerifiedTokenCache`. Each of those decides what its key and generation
+are and when an entry is still current; this module owns only the
+storage, locking, eviction, and hit/miss accounting they share.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class _GenerationCacheEntry[V]:
+    generation: object
+    value: V
+    stored_at: float
+    compute_seconds: float
+
+
+@dataclass(frozen=True)
+class GenerationCacheStats:
+    entries: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    latency_saved_seconds: float
+
+
+class GenerationCache[K: Hashable, V]:
+    """A process-local cache whose entries are only served at the
+    generation they were stored at: `lookup` compares the generation the
+    caller just read (a database-maintained counter, compared by equality
+    only) with the stored one and drops the entry on a mismatch. A cache
+    with nothing to compare passes the same constant generation, typically
+    `None`, to both calls. `lookup`'s `is_current`, when given, is one more
+    condition the stored value must meet, checked the same way. Bounded
+    (`max_entries`, least-recently-used eviction); `max_entries=0` disables
+    it. `ttl_seconds`, when given, caps any single entry's age. `monotonic`
+    is injectable so tests can step it without sleeping.
+
+    `latency_saved_seconds` adds up, over every hit, the `compute_seconds`
+    the entry was stored with, so it is an estimate."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float | None = None,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._monotonic = monotonic
+        self._entries: OrderedDict[K, _GenerationCacheEntry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._latency_saved_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def lookup(
+        self,
+        key: K,
+        *,
+        generation: object,
+        is_current: Callable[[V], bool] | None = None,
+    ) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if (
+                    entry.generation == generation
+                    and (
+                        self._ttl_seconds is None
+                        or self._monotonic() - entry.stored_at < self._ttl_seconds
+                    )
+                    and (is_current is None or is_current(entry.value))
+                ):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    self._latency_saved_seconds += entry.compute_seconds
+                    return entry.value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def store(self, key: K, value: V, *, generation: object, compute_seconds: float = 0.0) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = _GenerationCacheEntry(
+                generation=generation,
+                value=value,
+                stored_at=self._monotonic(),
+                compute_seconds=compute_seconds,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> GenerationCacheStats:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return GenerationCacheStats(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                hit_ratio=self._hits / lookups if lookups else 0.0,
+                latency_saved_seconds=self._latency_saved_seconds,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,8 +1,11 @@
 """Helpers shared across command handlers."""
 
+import threading
 import uuid
+import weakref
 
-from sqlalchemy import Connection, text
+from sqlalchemy import Connection, Engine, create_engine, text
+from sqlalchemy.pool import NullPool
 
 from dnd_ai.domain.errors import DomainAuthorizationError
 
@@ -11,6 +14,125 @@ class LookupCodeNotFoundError(ValueError):
     """Raised when a command references a lookup-table code that doesn't exist."""
 
 
+_LookupKey = tuple[str, str, str]
+
+# Every table shaped like docs/DATABASE_CONVENTIONS.md §11's lookup tables:
+# a single-column UUID primary key plus a plain (non-partial, non-
+# expression) unique index on `code` alone. Campaign- or ruleset-scoped
+# codes (`security.roles`, `rules.*`) are unique only together with their
+# scope column and are deliberately not matched. Tables the connecting role
+# cannot read are skipped rather than failing the whole preload.
+_LOOKUP_TABLES_SQL = text("""
+    SELECT n.nspname AS schema_name, c.relname AS table_name, pk_att.attname AS pk_column
+    FROM pg_index ux
+    JOIN pg_class c ON c.oid = ux.indrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute code_att
+      ON code_att.attrelid = c.oid AND code_att.attnum = ux.indkey[0]
+    JOIN pg_index pk ON pk.indrelid = c.oid AND pk.indisprimary AND pk.indnatts = 1
+    JOIN pg_attribute pk_att ON pk_att.attrelid = c.oid AND pk_att.attnum = pk.indkey[0]
+    WHERE ux.indisunique
+      AND ux.indnatts = 1
+      AND ux.indpred IS NULL
+      AND ux.indexprs IS NULL
+      AND code_att.attname = 'code'
+      AND pk_att.atttypid = 'uuid'::regtype
+      AND c.relkind IN ('r', 'p')
+      AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+      AND has_table_privilege(c.oid, 'SELECT')
+    ORDER BY 1, 2
+""")
+
+
+class LookupCodeRegistry:
+    """Every lookup table's code→id mapping for one engine, read once.
+
+    Lookup tables are seeded by Alembic revisions
+    (`dnd_ai.persistence.seeds`, database/seeds/) and never written by the
+    application, so `lookup_id` can serve them from memory.
+    """
+
+    def __init__(self, codes: dict[_LookupKey, dict[str, uuid.UUID]]) -> None:
+        self._codes = codes
+
+    @classmethod
+    def load(cls, connection: Connection) -> "LookupCodeRegistry":
+        """Read every lookup table on `connection`, which should hold no
+        uncommitted writes of its own — `get_lookup_code_registry` always
+        passes a fresh one, so no row a command inserted, and might yet roll
+        back, can ever be cached."""
+        tables = connection.execute(_LOOKUP_TABLES_SQL).all()
+        codes: dict[_LookupKey, dict[str, uuid.UUID]] = {}
+        if tables:
+            # Identifiers come from the catalog query above, never from a
+            # caller, and are quoted regardless.
+            union = " UNION ALL ".join(
+                f"SELECT :s{index} AS schema_name, :t{index} AS table_name, "
+                f":p{index} AS pk_column, code, {_quote(row.pk_column)} AS id "
+                f"FROM {_quote(row.schema_name)}.{_quote(row.table_name)}"
+                for index, row in enumerate(tables)
+            )
+            params: dict[str, str] = {}
+            for index, row in enumerate(tables):
+                params[f"s{index}"] = row.schema_name
+                params[f"t{index}"] = row.table_name
+                params[f"p{index}"] = row.pk_column
+            for row in connection.execute(text(union), params):
+                key = (row.schema_name, row.table_name, row.pk_column)
+                codes.setdefault(key, {})[row.code] = row.id
+        return cls(codes)
+
+    def get(self, schema: str, table: str, pk_column: str, code: str) -> uuid.UUID | None:
+        return self._codes.get((schema, table, pk_column), {}).get(code)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+_lookup_code_registries: "weakref.WeakKeyDictionary[Engine, LookupCodeRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+_lookup_code_registries_lock = threading.Lock()
+
+
+def get_lookup_code_registry(engine: Engine) -> LookupCodeRegistry:
+    """`engine`'s registry, loading it on first use. One registry per engine
+    rather than per process: two engines may point at different databases
+    (the test suite's migration-round-trip databases, for one), whose
+    surrogate ids for the same code differ.
+
+    The load runs once, on a short-lived connection of its own opened
+    outside `engine`'s pool (`NullPool`): the first caller is usually a
+    command already holding one of that pool's connections, and waiting on
+    a second one from it is the hold-and-wait a full pool deadlocks on. The
+    lock is never held across the load's queries; two threads racing the
+    first load both read, and the first to finish wins."""
+    registry = _lookup_code_registries.get(engine)
+    if registry is not None:
+        return registry
+    loader = create_engine(engine.url, poolclass=NullPool)
+    try:
+        with loader.connect() as connection:
+            loaded = LookupCodeRegistry.load(connection)
+    finally:
+        loader.dispose()
+    with _lookup_code_registries_lock:
+        return _lookup_code_registries.setdefault(engine, loaded)
+
+
+def reload_lookup_codes(engine: Engine | None = None) -> None:
+    """Discard the cached registry for `engine` (every engine's, if None) so
+    the next `lookup_id` reloads it. Call after running migrations against a
+    database a live engine already served lookups from — a migration that
+    reseeds or adds lookup rows is the only way their ids change."""
+    with _lookup_code_registries_lock:
+        if engine is None:
+            _lookup_code_registries.clear()
+        else:
+            _lookup_code_registries.pop(engine, None)
+
+
 def lookup_id(
     connection: Connection, schema: str, table: str, pk_column: str, code: str
 ) -> uuid.UUID:
@@ -22,7 +144,16 @@ def lookup_id(
     environments) rather than hardcoding ids. schema/table/pk_column are
     always internal literals supplied by other command code, never
     user-controlled, so the interpolated SQL identifiers are safe.
+
+    Served from the connection's engine's `LookupCodeRegistry` without a
+    round trip. A miss falls back to querying the table on `connection`
+    itself — a row committed after the registry loaded, or one the
+    caller's own transaction just inserted — and is not added to the
+    registry, since that transaction may still roll back.
     """
+    cached = get_lookup_code_registry(connection.engine).get(schema, table, pk_column, code)
+    if cached is not None:
+        return cached
     value = connection.execute(
         text(f"SELECT {pk_column} FROM {schema}.{table} WHERE code = :code"),
         {"code": code},
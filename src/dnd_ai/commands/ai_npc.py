@@ -15,6 +15,52 @@ phase's auto-approve path). A provider failure between (1) and (3) leaves a
 `context_requests`/`context_snapshots` pair with no `generated_outputs`
 row — a legitimate, auditable "the request was made but never got a
 response" state, not a partial write of anything canonical.
+`request_npc_conversation_turn_async` is the same three steps for the HTTP
+route — (1) and (3) on a worker thread, (2) awaited on an
+`AsyncAiProvider` — so the split, and everything it guarantees, is shared
+code rather than a parallel copy. `open_npc_conversation_turn_stream` is
+the same again with step (2) streamed: it runs (1) before returning, so a
+missing assignment still fails before anything is streamed, and the
+iterator it returns forwards each `DialogueDelta` as the provider yields
+it, then runs (3) and yields the `NpcConversationTurnResult` last. The
+proposal is judged on the provider's final, validated output exactly as in
+the non-streamed path, never on the forwarded dialogue. A caller that stops
+iterating early (a player who disconnects) leaves the same
+request-without-response state as a provider failure.
+
+Step (1) can reuse the context an earlier turn assembled, through an
+`NpcContextCache` (one per process, `dnd_ai.api.ai_npc`). An entry is
+keyed by (assignment, NPC, requesting character, party, timeline, world)
+and only reused while the timeline's NPC-context generation
+(`ai.npc_context_generations`, migration 106) is the one it was assembled
+at. Triggers bump that generation when a transaction that wrote any row
+assembly reads commits, so a state change, a newly known fact or an
+applied proposal is seen by the next turn in every process. The
+generation is read before assembling, so a write that commits in
+between leaves the new entry stale on arrival rather than wrong. A hit
+still writes the turn's own `context_requests`/`context_snapshots` rows,
+so the audit trail is the same with or without the cache.
+
+The cache holds contexts as assembled. Each turn then fits its context to
+`prompt_budget` (`dnd_ai.domain.context_assembly.
+budget_npc_conversation_context`) and records the token accounting in
+the snapshot; the trimmed context is the one the provider sees and the
+one proposals are validated against.
+
+The async entry points can also take an `NpcTurnGate` (again one per
+process), which runs an assignment's turns one at a time. Step (1)'s
+assignment row lock lasts only for that transaction, so without it two
+players messaging one NPC at once both assemble context and both call the
+provider concurrently. Behind the gate, the second turn starts once the
+first has recorded its response, usually hits the context cache, and sees
+what the first turn proposed or applied. At most `max_queued` turns wait
+per assignment; the next is refused with `NpcTurnQueueFullError` (429)
+before it records anything, so a crowded table gets explicit backpressure
+instead of an unbounded pile of provider calls. Turns are not merged into
+one multi-speaker provider call: each one's context, audit rows and
+proposal belong to its own requesting character and party. The lane is
+held from step (1) to the end of step (3), and for a stream until it is
+exhausted or closed.
 
 `reveal_knowledge_item_id`/`advance_quest_objective_id` from the model are
 each validated against the context's own `revealable_knowledge`/
@@ -37,20 +83,39 @@ changes" rule) — via `dnd_ai.commands.ai_proposals._apply_proposal`'s
 explicit, closed dispatch table; see that module's own docstring.
 """
 
+import asyncio
 import json
+import threading
+import time
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 from dataclasses import dataclass
+from typing import cast
 
 from sqlalchemy import Connection, Engine, text
 
+from dnd_ai.caching import GenerationCache
 from dnd_ai.domain.ai_policy import (
     RISK_TIER_AUTO_APPROVE,
     classify_advance_quest_objective_risk,
     classify_reveal_knowledge_risk,
 )
-from dnd_ai.domain.ai_provider import AiProvider, NpcTurnOutput
-from dnd_ai.domain.context_assembly import NpcConversationContext, assemble_npc_conversation_context
-from dnd_ai.domain.errors import DomainAuthorizationError
+from dnd_ai.domain.ai_provider import (
+    AiProvider,
+    AsyncAiProvider,
+    DialogueDelta,
+    NpcTurnOutput,
+    ProviderResult,
+    StreamingAiProvider,
+)
+from dnd_ai.domain.context_assembly import (
+    NpcConversationContext,
+    assemble_npc_conversation_context,
+    budget_npc_conversation_context,
+)
+from dnd_ai.domain.errors import DomainAuthorizationError, SafeMessageError
+from dnd_ai.domain.prompt_budget import PromptBudget
 
 from .ai_proposals import _apply_proposal
 
@@ -72,6 +137,115 @@ class NpcConversationTurnResult:
     error_message: str | None
 
 
+_NpcContextCacheKey = tuple[uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID, uuid.UUID]
+
+
+class NpcContextCache(GenerationCache[_NpcContextCacheKey, NpcConversationContext]):
+    """See this module's docstring: a `GenerationCache` at the timeline's
+    NPC-context generation, so every turn assembles afresh when disabled.
+    `latency_saved_seconds` counts how long assembly took."""
+
+
+class NpcTurnQueueFullError(SafeMessageError):
+    """Raised by `NpcTurnGate` when an NPC already has as many turns
+    waiting as the gate allows. Nothing has been recorded for the turn, so
+    the player can simply send it again. 429, not 503: the server is fine,
+    this one NPC is busy."""
+
+    safe_status_code = 429
+    safe_error_code = "npc_busy"
+    safe_message = "This NPC is answering other players. Try again shortly."
+
+
+@dataclass
+class _NpcTurnLane:
+    lock: asyncio.Lock
+    # The running turn plus every turn waiting behind it.
+    holders: int = 0
+
+
+@dataclass(frozen=True)
+class NpcTurnGateStats:
+    busy_assignments: int
+    queued_turns: int
+    admitted: int
+    rejected: int
+
+
+class NpcTurnGate:
+    """See this module's docstring. Process-local: one lane per agent
+    assignment with a turn in progress, created on first use and dropped
+    once its last turn finishes, so idle NPCs cost nothing. `max_queued`
+    is how many turns may wait behind the running one; the next is
+    refused with `NpcTurnQueueFullError` before it records anything."""
+
+    def __init__(self, *, max_queued: int) -> None:
+        if max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+        self._max_queued = max_queued
+        self._lanes: dict[uuid.UUID, _NpcTurnLane] = {}
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._rejected = 0
+
+    @asynccontextmanager
+    async def turn(self, agent_assignment_id: uuid.UUID) -> AsyncIterator[None]:
+        """Holds `agent_assignment_id`'s lane for the body, waiting for any
+        earlier turn first."""
+        with self._lock:
+            lane = self._lanes.get(agent_assignment_id)
+            if lane is None:
+                lane = self._lanes[agent_assignment_id] = _NpcTurnLane(lock=asyncio.Lock())
+            if lane.holders > self._max_queued:
+                self._rejected += 1
+                raise NpcTurnQueueFullError(
+                    f"agent assignment {agent_assignment_id} already has "
+                    f"{lane.holders - 1} turns queued"
+                )
+            lane.holders += 1
+            self._admitted += 1
+        try:
+            async with lane.lock:
+                yield
+        finally:
+            with self._lock:
+                lane.holders -= 1
+                if lane.holders == 0:
+                    del self._lanes[agent_assignment_id]
+
+    def stats(self) -> NpcTurnGateStats:
+        with self._lock:
+            return NpcTurnGateStats(
+                busy_assignments=len(self._lanes),
+                queued_turns=sum(lane.holders - 1 for lane in self._lanes.values()),
+                admitted=self._admitted,
+                rejected=self._rejected,
+            )
+
+
+def _single_flight(
+    turn_gate: NpcTurnGate | None, agent_assignment_id: uuid.UUID
+) -> AbstractAsyncContextManager[None]:
+    if turn_gate is None:
+        return nullcontext()
+    return turn_gate.turn(agent_assignment_id)
+
+
+def _read_npc_context_generation(connection: Connection, *, timeline_id: uuid.UUID) -> int:
+    """The timeline's NPC-context generation; 0 before any write that
+    bumps it."""
+    generation = connection.execute(
+        text("""
+            SELECT COALESCE(
+                (SELECT generation FROM ai.npc_context_generations WHERE timeline_id = :timeline),
+                0
+            )
+        """),
+        {"timeline": timeline_id},
+    ).scalar_one()
+    return int(generation)
+
+
 @dataclass(frozen=True)
 class _AssignmentContext:
     agent_id: uuid.UUID
@@ -110,14 +284,44 @@ def _record_request_and_context(
     player_message: str,
     timeline_id: uuid.UUID,
     expected_world_id: uuid.UUID,
+    context_cache: NpcContextCache | None = None,
+    prompt_budget: PromptBudget | None = None,
 ) -> tuple[uuid.UUID, NpcConversationContext]:
-    context = assemble_npc_conversation_context(
-        connection,
-        npc_entity_id=assignment.npc_entity_id,
-        timeline_id=timeline_id,
-        expected_world_id=expected_world_id,
-        requesting_character_id=requesting_character_id,
-        requesting_party_id=requesting_party_id,
+    context: NpcConversationContext | None = None
+    generation: int | None = None
+    cache_key: _NpcContextCacheKey | None = None
+    if context_cache is not None and context_cache.enabled:
+        generation = _read_npc_context_generation(connection, timeline_id=timeline_id)
+        cache_key = (
+            agent_assignment_id,
+            assignment.npc_entity_id,
+            requesting_character_id,
+            requesting_party_id,
+            timeline_id,
+            expected_world_id,
+        )
+        context = context_cache.lookup(cache_key, generation=generation)
+
+    if context is None:
+        started = time.perf_counter()
+        context = assemble_npc_conversation_context(
+            connection,
+            npc_entity_id=assignment.npc_entity_id,
+            timeline_id=timeline_id,
+            expected_world_id=expected_world_id,
+            requesting_character_id=requesting_character_id,
+            requesting_party_id=requesting_party_id,
+        )
+        if context_cache is not None and generation is not None and cache_key is not None:
+            context_cache.store(
+                cache_key,
+                context,
+                generation=generation,
+                compute_seconds=time.perf_counter() - started,
+            )
+
+    context, budget_report = budget_npc_conversation_context(
+        context, budget=prompt_budget if prompt_budget is not None else PromptBudget()
     )
 
     context_request_id = connection.execute(
@@ -139,10 +343,16 @@ def _record_request_and_context(
 
     connection.execute(
         text("""
-            INSERT INTO ai.context_snapshots (context_request_id, assembled_context)
-            VALUES (:request, :context)
+            INSERT INTO ai.context_snapshots
+                (context_request_id, assembled_context, prompt_token_count, prompt_budget)
+            VALUES (:request, :context, :token_count, :budget)
         """),
-        {"request": context_request_id, "context": json.dumps(context.as_prompt_payload())},
+        {
+            "request": context_request_id,
+            "context": json.dumps(context.as_prompt_payload()),
+            "token_count": budget_report.total_tokens,
+            "budget": json.dumps(budget_report.as_record()),
+        },
     )
     return context_request_id, context
 
@@ -190,7 +400,17 @@ def _validated_advance_target(
     return None
 
 
-def request_npc_conversation_turn(
+@dataclass(frozen=True)
+class _PendingNpcTurn:
+    """Everything transaction (1) hands to transaction (3) across the
+    provider call."""
+
+    assignment: _AssignmentContext
+    context_request_id: uuid.UUID
+    context: NpcConversationContext
+
+
+def _begin_npc_turn(
     engine: Engine,
     *,
     agent_assignment_id: uuid.UUID,
@@ -198,11 +418,12 @@ def request_npc_conversation_turn(
     requesting_character_id: uuid.UUID,
     requesting_party_id: uuid.UUID,
     player_message: str,
-    provider: AiProvider,
     timeline_id: uuid.UUID,
     expected_world_id: uuid.UUID,
-    world_time_id: uuid.UUID,
-) -> NpcConversationTurnResult:
+    context_cache: NpcContextCache | None = None,
+    prompt_budget: PromptBudget | None = None,
+) -> _PendingNpcTurn:
+    """Transaction (1) — see this module's docstring."""
     with engine.begin() as connection:
         assignment = _lock_active_assignment(connection, agent_assignment_id)
         context_request_id, context = _record_request_and_context(
@@ -215,10 +436,27 @@ def request_npc_conversation_turn(
             player_message=player_message,
             timeline_id=timeline_id,
             expected_world_id=expected_world_id,
+            context_cache=context_cache,
+            prompt_budget=prompt_budget,
         )
+    return _PendingNpcTurn(
+        assignment=assignment, context_request_id=context_request_id, context=context
+    )
 
-    provider_result = provider.generate_npc_turn(context=context, player_message=player_message)
 
+def _finish_npc_turn(
+    engine: Engine,
+    *,
+    pending: _PendingNpcTurn,
+    provider_result: ProviderResult,
+    requesting_party_id: uuid.UUID,
+    timeline_id: uuid.UUID,
+    world_time_id: uuid.UUID,
+) -> NpcConversationTurnResult:
+    """Transaction (3) — see this module's docstring."""
+    assignment = pending.assignment
+    context_request_id = pending.context_request_id
+    context = pending.context
     with engine.begin() as connection:
         agent_row = connection.execute(
             text("SELECT provider, model_identifier FROM ai.agents WHERE agent_id = :id"),
@@ -229,9 +467,10 @@ def request_npc_conversation_turn(
             text("""
                 INSERT INTO ai.generated_outputs
                     (context_request_id, provider, model_identifier, raw_response,
-                     structured_output, finish_reason, latency_ms, error_message)
+                     structured_output, finish_reason, latency_ms, connect_ms, first_byte_ms,
+                     first_token_ms, error_message)
                 VALUES (:request, :provider, :model, :raw, :structured, :finish_reason, :latency,
-                        :error)
+                        :connect, :first_byte, :first_token, :error)
                 RETURNING generated_output_id
             """),
             {
@@ -246,6 +485,9 @@ def request_npc_conversation_turn(
                 ),
                 "finish_reason": provider_result.finish_reason,
                 "latency": provider_result.latency_ms,
+                "connect": provider_result.connect_ms,
+                "first_byte": provider_result.first_byte_ms,
+                "first_token": provider_result.first_token_ms,
                 "error": provider_result.error_message,
             },
         ).scalar()
@@ -346,3 +588,193 @@ def request_npc_conversation_turn(
             applied_event_id=applied_event_id,
             error_message=provider_result.error_message,
         )
+
+
+def request_npc_conversation_turn(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    requesting_user_id: uuid.UUID | None,
+    requesting_character_id: uuid.UUID,
+    requesting_party_id: uuid.UUID,
+    player_message: str,
+    provider: AiProvider,
+    timeline_id: uuid.UUID,
+    expected_world_id: uuid.UUID,
+    world_time_id: uuid.UUID,
+    context_cache: NpcContextCache | None = None,
+    prompt_budget: PromptBudget | None = None,
+) -> NpcConversationTurnResult:
+    pending = _begin_npc_turn(
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        requesting_user_id=requesting_user_id,
+        requesting_character_id=requesting_character_id,
+        requesting_party_id=requesting_party_id,
+        player_message=player_message,
+        timeline_id=timeline_id,
+        expected_world_id=expected_world_id,
+        context_cache=context_cache,
+        prompt_budget=prompt_budget,
+    )
+
+    provider_result = provider.generate_npc_turn(
+        context=pending.context, player_message=player_message
+    )
+
+    return _finish_npc_turn(
+        engine,
+        pending=pending,
+        provider_result=provider_result,
+        requesting_party_id=requesting_party_id,
+        timeline_id=timeline_id,
+        world_time_id=world_time_id,
+    )
+
+
+async def request_npc_conversation_turn_async(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    requesting_user_id: uuid.UUID | None,
+    requesting_character_id: uuid.UUID,
+    requesting_party_id: uuid.UUID,
+    player_message: str,
+    provider: AsyncAiProvider,
+    timeline_id: uuid.UUID,
+    expected_world_id: uuid.UUID,
+    world_time_id: uuid.UUID,
+    context_cache: NpcContextCache | None = None,
+    prompt_budget: PromptBudget | None = None,
+    turn_gate: NpcTurnGate | None = None,
+) -> NpcConversationTurnResult:
+    """`request_npc_conversation_turn` for an async caller: the same two
+    transactions, each run on a worker thread (`asyncio.to_thread` —
+    SQLAlchemy here is synchronous), with the provider call between them
+    awaited on the event loop, so no thread is held while the provider
+    thinks. With a `turn_gate`, the whole turn holds its assignment's lane
+    (raising `NpcTurnQueueFullError` if the queue for it is full)."""
+    async with _single_flight(turn_gate, agent_assignment_id):
+        pending = await asyncio.to_thread(
+            _begin_npc_turn,
+            engine,
+            agent_assignment_id=agent_assignment_id,
+            requesting_user_id=requesting_user_id,
+            requesting_character_id=requesting_character_id,
+            requesting_party_id=requesting_party_id,
+            player_message=player_message,
+            timeline_id=timeline_id,
+            expected_world_id=expected_world_id,
+            context_cache=context_cache,
+            prompt_budget=prompt_budget,
+        )
+
+        provider_result = await provider.generate_npc_turn(
+            context=pending.context, player_message=player_message
+        )
+
+        return await asyncio.to_thread(
+            _finish_npc_turn,
+            engine,
+            pending=pending,
+            provider_result=provider_result,
+            requesting_party_id=requesting_party_id,
+            timeline_id=timeline_id,
+            world_time_id=world_time_id,
+        )
+
+
+async def open_npc_conversation_turn_stream(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    requesting_user_id: uuid.UUID | None,
+    requesting_character_id: uuid.UUID,
+    requesting_party_id: uuid.UUID,
+    player_message: str,
+    provider: StreamingAiProvider,
+    timeline_id: uuid.UUID,
+    expected_world_id: uuid.UUID,
+    world_time_id: uuid.UUID,
+    context_cache: NpcContextCache | None = None,
+    prompt_budget: PromptBudget | None = None,
+    turn_gate: NpcTurnGate | None = None,
+) -> AsyncIterator[DialogueDelta | NpcConversationTurnResult]:
+    """`request_npc_conversation_turn_async` with the provider call
+    streamed — see this module's docstring. The assignment's lane has been
+    taken and transaction (1) has committed (or either raised) by the time
+    this returns; the lane is released when the stream finishes or is
+    closed."""
+    stream = _stream_npc_turn(
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        requesting_user_id=requesting_user_id,
+        requesting_character_id=requesting_character_id,
+        requesting_party_id=requesting_party_id,
+        player_message=player_message,
+        provider=provider,
+        timeline_id=timeline_id,
+        expected_world_id=expected_world_id,
+        world_time_id=world_time_id,
+        context_cache=context_cache,
+        prompt_budget=prompt_budget,
+        turn_gate=turn_gate,
+    )
+    # Run the generator up to its priming `None`, so a refused, unknown or
+    # unauthorized turn raises here rather than inside the response body.
+    await anext(stream)
+    return cast(AsyncIterator[DialogueDelta | NpcConversationTurnResult], stream)
+
+
+async def _stream_npc_turn(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    requesting_user_id: uuid.UUID | None,
+    requesting_character_id: uuid.UUID,
+    requesting_party_id: uuid.UUID,
+    player_message: str,
+    provider: StreamingAiProvider,
+    timeline_id: uuid.UUID,
+    expected_world_id: uuid.UUID,
+    world_time_id: uuid.UUID,
+    context_cache: NpcContextCache | None,
+    prompt_budget: PromptBudget | None,
+    turn_gate: NpcTurnGate | None,
+) -> AsyncIterator[DialogueDelta | NpcConversationTurnResult | None]:
+    async with _single_flight(turn_gate, agent_assignment_id):
+        pending = await asyncio.to_thread(
+            _begin_npc_turn,
+            engine,
+            agent_assignment_id=agent_assignment_id,
+            requesting_user_id=requesting_user_id,
+            requesting_character_id=requesting_character_id,
+            requesting_party_id=requesting_party_id,
+            player_message=player_message,
+            timeline_id=timeline_id,
+            expected_world_id=expected_world_id,
+            context_cache=context_cache,
+            prompt_budget=prompt_budget,
+        )
+        yield None
+
+        provider_result: ProviderResult | None = None
+        async for event in provider.stream_npc_turn(
+            context=pending.context, player_message=player_message
+        ):
+            if isinstance(event, ProviderResult):
+                provider_result = event
+            else:
+                yield event
+        if provider_result is None:
+            raise RuntimeError("provider stream ended without a ProviderResult")
+
+        yield await asyncio.to_thread(
+            _finish_npc_turn,
+            engine,
+            pending=pending,
+            provider_result=provider_result,
+            requesting_party_id=requesting_party_id,
+            timeline_id=timeline_id,
+            world_time_id=world_time_id,
+        )
@@ -4,7 +4,8 @@ synthesis over the deterministic summary/detail query services").
 
 Same three-transaction shape as `dnd_ai.commands.ai_npc.request_npc_
 conversation_turn` — see that module's own docstring for why a network call
-never happens while a transaction is open. Purely informational: unlike
+never happens while a transaction is open — and the same async twin,
+`request_campaign_synthesis_async`. Purely informational: unlike
 `reveal_knowledge`, a synthesis answer never proposes a canonical mutation,
 so this module writes only `ai.context_requests`/`.context_snapshots`/
 `.generated_outputs` — no `ai.proposed_changes` row, ever.
@@ -18,20 +19,27 @@ already-authorized arguments. The one thing this module does enforce
 itself, structurally: `dnd_ai.domain.context_assembly.assemble_campaign_
 synthesis_context` only ever consults `requesting_party_id` for
 `PLAYER_SUMMARY` — see that function's own docstring.
+
+The assembled context is fitted to `prompt_budget` before it is recorded
+and sent, exactly as `dnd_ai.commands.ai_npc` does for an NPC turn, and
+the snapshot carries the same token accounting.
 """
 
+import asyncio
 import json
 import uuid
 from dataclasses import dataclass
 
 from sqlalchemy import Connection, Engine, text
 
-from dnd_ai.domain.ai_provider import AiProvider
+from dnd_ai.domain.ai_provider import AiProvider, AsyncAiProvider, SynthesisProviderResult
 from dnd_ai.domain.context_assembly import (
     CampaignSynthesisContext,
     assemble_campaign_synthesis_context,
+    budget_campaign_synthesis_context,
 )
 from dnd_ai.domain.errors import DomainAuthorizationError
+from dnd_ai.domain.prompt_budget import PromptBudget
 
 
 class SynthesisAgentAssignmentNotFoundError(DomainAuthorizationError):
@@ -74,13 +82,17 @@ def _record_synthesis_request(
     campaign_id: uuid.UUID,
     timeline_id: uuid.UUID | None,
     requesting_party_id: uuid.UUID | None,
+    prompt_budget: PromptBudget | None = None,
 ) -> tuple[uuid.UUID, CampaignSynthesisContext]:
-    context = assemble_campaign_synthesis_context(
-        connection,
-        campaign_id=campaign_id,
-        audience_tier=audience_tier,
-        timeline_id=timeline_id,
-        requesting_party_id=requesting_party_id,
+    context, budget_report = budget_campaign_synthesis_context(
+        assemble_campaign_synthesis_context(
+            connection,
+            campaign_id=campaign_id,
+            audience_tier=audience_tier,
+            timeline_id=timeline_id,
+            requesting_party_id=requesting_party_id,
+        ),
+        budget=prompt_budget if prompt_budget is not None else PromptBudget(),
     )
 
     context_request_id = connection.execute(
@@ -103,15 +115,21 @@ def _record_synthesis_request(
 
     connection.execute(
         text("""
-            INSERT INTO ai.context_snapshots (context_request_id, assembled_context)
-            VALUES (:request, :context)
+            INSERT INTO ai.context_snapshots
+                (context_request_id, assembled_context, prompt_token_count, prompt_budget)
+            VALUES (:request, :context, :token_count, :budget)
         """),
-        {"request": context_request_id, "context": json.dumps(context.as_prompt_payload())},
+        {
+            "request": context_request_id,
+            "context": json.dumps(context.as_prompt_payload()),
+            "token_count": budget_report.total_tokens,
+            "budget": json.dumps(budget_report.as_record()),
+        },
     )
     return context_request_id, context
 
 
-def request_campaign_synthesis(
+def _begin_synthesis(
     engine: Engine,
     *,
     agent_assignment_id: uuid.UUID,
@@ -119,16 +137,16 @@ def request_campaign_synthesis(
     audience_tier: str,
     requesting_user_id: uuid.UUID | None,
     question_text: str,
-    provider: AiProvider,
-    timeline_id: uuid.UUID | None = None,
-    requesting_character_id: uuid.UUID | None = None,
-    requesting_party_id: uuid.UUID | None = None,
-) -> CampaignSynthesisResult:
+    timeline_id: uuid.UUID | None,
+    requesting_character_id: uuid.UUID | None,
+    requesting_party_id: uuid.UUID | None,
+    prompt_budget: PromptBudget | None = None,
+) -> tuple[uuid.UUID, CampaignSynthesisContext]:
     with engine.begin() as connection:
         _lock_campaign_agent_assignment(
             connection, agent_assignment_id=agent_assignment_id, campaign_id=campaign_id
         )
-        context_request_id, context = _record_synthesis_request(
+        return _record_synthesis_request(
             connection,
             agent_assignment_id=agent_assignment_id,
             requesting_user_id=requesting_user_id,
@@ -138,14 +156,17 @@ def request_campaign_synthesis(
             campaign_id=campaign_id,
             timeline_id=timeline_id,
             requesting_party_id=requesting_party_id,
+            prompt_budget=prompt_budget,
         )
 
-    provider_result = provider.generate_synthesis(
-        context=context.as_prompt_payload(),
-        audience_tier=audience_tier,
-        question_text=question_text,
-    )
 
+def _finish_synthesis(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    context_request_id: uuid.UUID,
+    provider_result: SynthesisProviderResult,
+) -> CampaignSynthesisResult:
     with engine.begin() as connection:
         agent_row = connection.execute(
             text("""
@@ -161,9 +182,10 @@ def request_campaign_synthesis(
             text("""
                 INSERT INTO ai.generated_outputs
                     (context_request_id, provider, model_identifier, raw_response,
-                     structured_output, finish_reason, latency_ms, error_message)
+                     structured_output, finish_reason, latency_ms, connect_ms, first_byte_ms,
+                     error_message)
                 VALUES (:request, :provider, :model, :raw, :structured, :finish_reason, :latency,
-                        :error)
+                        :connect, :first_byte, :error)
                 RETURNING generated_output_id
             """),
             {
@@ -178,6 +200,8 @@ def request_campaign_synthesis(
                 ),
                 "finish_reason": provider_result.finish_reason,
                 "latency": provider_result.latency_ms,
+                "connect": provider_result.connect_ms,
+                "first_byte": provider_result.first_byte_ms,
                 "error": provider_result.error_message,
             },
         ).scalar()
@@ -193,3 +217,89 @@ def request_campaign_synthesis(
             ),
             error_message=provider_result.error_message,
         )
+
+
+def request_campaign_synthesis(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    campaign_id: uuid.UUID,
+    audience_tier: str,
+    requesting_user_id: uuid.UUID | None,
+    question_text: str,
+    provider: AiProvider,
+    timeline_id: uuid.UUID | None = None,
+    requesting_character_id: uuid.UUID | None = None,
+    requesting_party_id: uuid.UUID | None = None,
+    prompt_budget: PromptBudget | None = None,
+) -> CampaignSynthesisResult:
+    context_request_id, context = _begin_synthesis(
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        campaign_id=campaign_id,
+        audience_tier=audience_tier,
+        requesting_user_id=requesting_user_id,
+        question_text=question_text,
+        timeline_id=timeline_id,
+        requesting_character_id=requesting_character_id,
+        requesting_party_id=requesting_party_id,
+        prompt_budget=prompt_budget,
+    )
+
+    provider_result = provider.generate_synthesis(
+        context=context.as_prompt_payload(),
+        audience_tier=audience_tier,
+        question_text=question_text,
+    )
+
+    return _finish_synthesis(
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        context_request_id=context_request_id,
+        provider_result=provider_result,
+    )
+
+
+async def request_campaign_synthesis_async(
+    engine: Engine,
+    *,
+    agent_assignment_id: uuid.UUID,
+    campaign_id: uuid.UUID,
+    audience_tier: str,
+    requesting_user_id: uuid.UUID | None,
+    question_text: str,
+    provider: AsyncAiProvider,
+    timeline_id: uuid.UUID | None = None,
+    requesting_character_id: uuid.UUID | None = None,
+    requesting_party_id: uuid.UUID | None = None,
+    prompt_budget: PromptBudget | None = None,
+) -> CampaignSynthesisResult:
+    """`request_campaign_synthesis` for an async caller — the same split
+    `dnd_ai.commands.ai_npc.request_npc_conversation_turn_async` uses."""
+    context_request_id, context = await asyncio.to_thread(
+        _begin_synthesis,
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        campaign_id=campaign_id,
+        audience_tier=audience_tier,
+        requesting_user_id=requesting_user_id,
+        question_text=question_text,
+        timeline_id=timeline_id,
+        requesting_character_id=requesting_character_id,
+        requesting_party_id=requesting_party_id,
+        prompt_budget=prompt_budget,
+    )
+
+    provider_result = await provider.generate_synthesis(
+        context=context.as_prompt_payload(),
+        audience_tier=audience_tier,
+        question_text=question_text,
+    )
+
+    return await asyncio.to_thread(
+        _finish_synthesis,
+        engine,
+        agent_assignment_id=agent_assignment_id,
+        context_request_id=context_request_id,
+        provider_result=provider_result,
+    )
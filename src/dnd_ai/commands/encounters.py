@@ -15,6 +15,27 @@ attach to, left at the default 'initiated' status: no check_requests are
 created here, so the interaction-lifecycle locking revisions 067/070-072
 added never engages, and there is no exit criterion requiring this
 command to also close out the interaction's own lifecycle.
+resolve_combat_turns records an ordered list of such turns — a whole
+round — under one encounter lock, resolving what the turns share once;
+resolve_combat_turn is a batch of one.
+
+Working set: everything a turn reads about its encounter besides the
+encounter row and its targets' hit points — the encounter's participants,
+the rounds the turn lands in, and its timeline's world — changes only when
+a participant or round is written. An EncounterWorkingSetCache (one per
+process, dnd_ai.api.encounters) keeps them per encounter, tagged with
+narrative.encounters.working_set_version (migration 108), which triggers
+advance from a sequence on every such write and which _lock_encounter
+reads in the same FOR UPDATE statement that takes the lock. A turn whose
+locked version matches its cached entry therefore runs only the lock, the
+hit-point reads and its INSERTs. start_encounter fills the entry,
+end_encounter discards it, and a version that moved — any participant or
+round write, by any process — is a miss that re-reads and refills it.
+Because the sequence never rolls back, an entry filled from a transaction
+that later aborts can never match again. Hit points are never cached:
+campaign.character_state is written by commands that never take the
+encounter lock, and the FOR UPDATE read is also the row lock the turn's
+UPDATE needs.
 
 start_encounter validates session_id/campaign_id agreement in application
 code (_validate_session_campaign) before inserting anything, closing out
@@ -50,12 +71,15 @@ docstring for the full account.
 """
 
 import json
+import time
 import uuid
 from collections import Counter
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
 from sqlalchemy import Connection, Engine, text
 
+from dnd_ai.caching import GenerationCache
 from dnd_ai.domain.errors import DomainAuthorizationError, SafeMessageError
 
 from ._shared import SessionNotInCampaignError as SessionNotInCampaignError
@@ -141,6 +165,32 @@ class LockedEncounter:
 
     timeline_id: uuid.UUID
     campaign_id: uuid.UUID | None
+    working_set_version: int
+
+
+@dataclass(frozen=True)
+class EncounterWorkingSet:
+    """What `_resolve_combat_turns_impl` reads about an encounter beyond
+    its locked row, as of `working_set_version`. `participant_ids` is the
+    encounter's complete entity → `encounter_participant_id` map, so an
+    entity missing from it is not a participant; `round_ids` holds only the
+    rounds seen so far."""
+
+    working_set_version: int
+    timeline_id: uuid.UUID
+    world_id: uuid.UUID
+    participant_ids: Mapping[uuid.UUID, uuid.UUID]
+    round_ids: Mapping[int, uuid.UUID]
+
+
+class EncounterWorkingSetCache(GenerationCache[uuid.UUID, EncounterWorkingSet]):
+    """See this module's docstring: a `GenerationCache` keyed on
+    `encounter_id` at the locked row's `(working_set_version,
+    timeline_id)`, so every turn reads its working set afresh when
+    disabled. It has no TTL: every write that could make an entry wrong
+    moves the version it is checked against. `latency_saved_seconds`
+    counts how long a turn's re-read took; entries stored by
+    `start_encounter` count nothing."""
 
 
 @dataclass(frozen=True)
@@ -157,6 +207,28 @@ class ResolveCombatTurnResult:
     new_hit_points: int | None
 
 
+@dataclass(frozen=True)
+class CombatTurn:
+    """One turn of a `_resolve_combat_turns_impl` batch —
+    `_resolve_combat_turn_impl`'s per-turn arguments."""
+
+    round_number: int
+    turn_order: int
+    actor_entity_id: uuid.UUID
+    world_time_id: uuid.UUID
+    action_kind: str = "attack"
+    target_entity_id: uuid.UUID | None = None
+    item_instance_id: uuid.UUID | None = None
+    spell_id: uuid.UUID | None = None
+    hit: bool | None = None
+    damage_amount: int | None = None
+    damage_type_id: uuid.UUID | None = None
+    resulting_condition_id: uuid.UUID | None = None
+    interaction_type_code: str = "attack"
+    session_id: uuid.UUID | None = None
+    event_details: str | None = None
+
+
 @dataclass(frozen=True)
 class EndEncounterResult:
     event_id: uuid.UUID
@@ -172,6 +244,7 @@ def _start_encounter_impl(
     session_id: uuid.UUID | None = None,
     location_id: uuid.UUID | None = None,
     summary: str | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> StartEncounterResult:
     """The actual work of start_encounter(), on a connection the caller
     already has open — see _resolve_combat_turn_impl's docstring for why
@@ -181,7 +254,11 @@ def _start_encounter_impl(
     layer's per-request connection) calls this directly.
 
     Validates session_id/campaign_id agreement (_validate_session_campaign)
-    before inserting anything — see that function's own docstring."""
+    before inserting anything — see that function's own docstring.
+
+    With working_set_cache, fills the new encounter's entry, so its first
+    turn is already a hit; if this transaction rolls back the entry names
+    an encounter that never existed and is simply never looked up."""
     _validate_session_campaign(connection, campaign_id=campaign_id, session_id=session_id)
 
     encounter_id = connection.execute(
@@ -203,14 +280,42 @@ def _start_encounter_impl(
     ).scalar()
     assert isinstance(encounter_id, uuid.UUID)
 
+    participant_ids: dict[uuid.UUID, uuid.UUID] = {}
     for participant_entity_id in participant_entity_ids:
-        connection.execute(
+        participant_id = connection.execute(
             text("""
                 INSERT INTO narrative.encounter_participants
                     (encounter_id, participant_entity_id)
                 VALUES (:encounter, :participant)
+                RETURNING encounter_participant_id
             """),
             {"encounter": encounter_id, "participant": participant_entity_id},
+        ).scalar()
+        assert isinstance(participant_id, uuid.UUID)
+        participant_ids[participant_entity_id] = participant_id
+
+    if working_set_cache is not None and working_set_cache.enabled:
+        # Read back after the participant INSERTs, whose triggers have
+        # already moved the version.
+        row = connection.execute(
+            text("""
+                SELECT e.working_set_version, t.world_id
+                FROM narrative.encounters e
+                JOIN campaign.timelines t ON t.timeline_id = e.timeline_id
+                WHERE e.encounter_id = :encounter
+            """),
+            {"encounter": encounter_id},
+        ).one()
+        working_set_cache.store(
+            encounter_id,
+            EncounterWorkingSet(
+                working_set_version=row.working_set_version,
+                timeline_id=timeline_id,
+                world_id=row.world_id,
+                participant_ids=participant_ids,
+                round_ids={},
+            ),
+            generation=(row.working_set_version, timeline_id),
         )
 
     return StartEncounterResult(encounter_id=encounter_id)
@@ -226,6 +331,7 @@ def start_encounter(
     session_id: uuid.UUID | None = None,
     location_id: uuid.UUID | None = None,
     summary: str | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> StartEncounterResult:
     """Create an encounter and its initial participants, atomically. Public
     convenience API: opens and commits its own transaction. See
@@ -241,6 +347,7 @@ def start_encounter(
             session_id=session_id,
             location_id=location_id,
             summary=summary,
+            working_set_cache=working_set_cache,
         )
 
 
@@ -317,11 +424,15 @@ def _lock_encounter(
     first caller's already-`'completed'` (or otherwise non-`'active'`)
     status and is rejected here, before touching any other row, rather
     than racing to insert a second completion event or overwrite
-    `resulting_event_id`."""
+    `resulting_event_id`.
+
+    The same statement returns the row's `working_set_version` — the
+    locked row's latest committed value, which a statement run after the
+    lock would otherwise have to read — for `EncounterWorkingSetCache`."""
     row = connection.execute(
         text(
-            "SELECT timeline_id, status, campaign_id FROM narrative.encounters "
-            "WHERE encounter_id = :e FOR UPDATE"
+            "SELECT timeline_id, status, campaign_id, working_set_version "
+            "FROM narrative.encounters WHERE encounter_id = :e FOR UPDATE"
         ),
         {"e": encounter_id},
     ).first()
@@ -338,12 +449,17 @@ def _lock_encounter(
         )
     assert isinstance(row.timeline_id, uuid.UUID)
     assert row.campaign_id is None or isinstance(row.campaign_id, uuid.UUID)
-    return LockedEncounter(timeline_id=row.timeline_id, campaign_id=row.campaign_id)
+    return LockedEncounter(
+        timeline_id=row.timeline_id,
+        campaign_id=row.campaign_id,
+        working_set_version=row.working_set_version,
+    )
 
 
 def _get_or_create_round(
     connection: Connection, *, encounter_id: uuid.UUID, round_number: int
-) -> uuid.UUID:
+) -> tuple[uuid.UUID, bool]:
+    """The round's id, and whether this call created it."""
     round_id = connection.execute(
         text("""
             SELECT encounter_round_id FROM narrative.encounter_rounds
@@ -354,7 +470,7 @@ def _get_or_create_round(
     ).scalar()
     if round_id is not None:
         assert isinstance(round_id, uuid.UUID)
-        return round_id
+        return round_id, False
 
     round_id = connection.execute(
         text("""
@@ -365,25 +481,102 @@ def _get_or_create_round(
         {"encounter": encounter_id, "round": round_number},
     ).scalar()
     assert isinstance(round_id, uuid.UUID)
-    return round_id
+    return round_id, True
 
 
-def _participant_id(
-    connection: Connection, *, encounter_id: uuid.UUID, participant_entity_id: uuid.UUID
-) -> uuid.UUID:
-    value = connection.execute(
+def _participant_ids(
+    connection: Connection, *, encounter_id: uuid.UUID
+) -> dict[uuid.UUID, uuid.UUID]:
+    """Every participant's encounter_participant_id, by entity, in one read."""
+    rows = connection.execute(
         text("""
-            SELECT encounter_participant_id FROM narrative.encounter_participants
-            WHERE encounter_id = :encounter AND participant_entity_id = :entity
+            SELECT participant_entity_id, encounter_participant_id
+            FROM narrative.encounter_participants
+            WHERE encounter_id = :encounter
         """),
-        {"encounter": encounter_id, "entity": participant_entity_id},
-    ).scalar()
-    if value is None:
-        raise ValueError(
-            f"entity {participant_entity_id} is not a participant in encounter {encounter_id}"
+        {"encounter": encounter_id},
+    ).all()
+    return {row.participant_entity_id: row.encounter_participant_id for row in rows}
+
+
+def _require_participants(
+    participant_ids: Mapping[uuid.UUID, uuid.UUID],
+    *,
+    encounter_id: uuid.UUID,
+    participant_entity_ids: Sequence[uuid.UUID],
+) -> None:
+    """Raises for the first entity (in `participant_entity_ids` order) that
+    is not in the encounter's complete participant map."""
+    for participant_entity_id in participant_entity_ids:
+        if participant_entity_id not in participant_ids:
+            raise ValueError(
+                f"entity {participant_entity_id} is not a participant in encounter {encounter_id}"
+            )
+
+
+def _encounter_working_set(
+    connection: Connection,
+    *,
+    encounter_id: uuid.UUID,
+    locked: LockedEncounter,
+    round_numbers: Sequence[int],
+    working_set_cache: EncounterWorkingSetCache | None,
+) -> EncounterWorkingSet:
+    """The encounter's working set with every round in `round_numbers`
+    resolved (created if need be), from `working_set_cache` when its entry
+    is at the locked version — see this module's docstring. A miss re-reads
+    participants and the world; either way the result is stored back,
+    unless this call created a round: that INSERT has just moved the
+    version, so the next turn re-reads once at the new one."""
+    cached = None
+    if working_set_cache is not None and working_set_cache.enabled:
+        cached = working_set_cache.lookup(
+            encounter_id, generation=(locked.working_set_version, locked.timeline_id)
         )
-    assert isinstance(value, uuid.UUID)
-    return value
+
+    round_ids = dict(cached.round_ids) if cached is not None else {}
+    created_round = False
+    for round_number in round_numbers:
+        if round_number not in round_ids:
+            round_ids[round_number], created = _get_or_create_round(
+                connection, encounter_id=encounter_id, round_number=round_number
+            )
+            created_round = created_round or created
+
+    compute_seconds = 0.0
+    if cached is not None:
+        participant_ids = cached.participant_ids
+        world_id = cached.world_id
+    else:
+        started = time.perf_counter()
+        participant_ids = _participant_ids(connection, encounter_id=encounter_id)
+        read_world_id = connection.execute(
+            text("SELECT world_id FROM campaign.timelines WHERE timeline_id = :t"),
+            {"t": locked.timeline_id},
+        ).scalar()
+        assert isinstance(read_world_id, uuid.UUID)
+        world_id = read_world_id
+        compute_seconds = time.perf_counter() - started
+
+    working_set = EncounterWorkingSet(
+        working_set_version=locked.working_set_version,
+        timeline_id=locked.timeline_id,
+        world_id=world_id,
+        participant_ids=participant_ids,
+        round_ids=round_ids,
+    )
+    if (
+        working_set_cache is not None
+        and not created_round
+        and (cached is None or len(round_ids) > len(cached.round_ids))
+    ):
+        working_set_cache.store(
+            encounter_id,
+            working_set,
+            generation=(locked.working_set_version, locked.timeline_id),
+            compute_seconds=compute_seconds,
+        )
+    return working_set
 
 
 def _character_hit_points(
@@ -420,6 +613,7 @@ def _resolve_combat_turn_impl(
     campaign_id: uuid.UUID | None = None,
     session_id: uuid.UUID | None = None,
     event_details: str | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> ResolveCombatTurnResult:
     """The actual work of resolve_combat_turn(), on a connection the caller
     already has open — without opening or closing a transaction of its own,
@@ -469,28 +663,108 @@ def _resolve_combat_turn_impl(
     session_id parameter behaves identically). A caller that wants a
     turn's session recorded must supply it explicitly.
     """
+    (result,) = _resolve_combat_turns_impl(
+        connection,
+        encounter_id=encounter_id,
+        turns=(
+            CombatTurn(
+                round_number=round_number,
+                turn_order=turn_order,
+                actor_entity_id=actor_entity_id,
+                world_time_id=world_time_id,
+                action_kind=action_kind,
+                target_entity_id=target_entity_id,
+                item_instance_id=item_instance_id,
+                spell_id=spell_id,
+                hit=hit,
+                damage_amount=damage_amount,
+                damage_type_id=damage_type_id,
+                resulting_condition_id=resulting_condition_id,
+                interaction_type_code=interaction_type_code,
+                session_id=session_id,
+                event_details=event_details,
+            ),
+        ),
+        campaign_id=campaign_id,
+        working_set_cache=working_set_cache,
+    )
+    return result
+
+
+def _resolve_combat_turns_impl(
+    connection: Connection,
+    *,
+    encounter_id: uuid.UUID,
+    turns: Sequence[CombatTurn],
+    campaign_id: uuid.UUID | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> tuple[ResolveCombatTurnResult, ...]:
+    """`_resolve_combat_turn_impl` for an ordered list of turns — a whole
+    round, or several — on one encounter, under one `_lock_encounter` and
+    in the caller's one transaction: all of them or none. Each turn
+    creates exactly the rows, event and HP change it would have created
+    alone, in `turns` order, so two hits on the same target apply one
+    after the other. What does not change from turn to turn is done once:
+    the lock and ownership/lifecycle check, each distinct session's
+    validation, the encounter's working set (each distinct round's
+    get-or-create, one read of the participants, the world id — from
+    `working_set_cache` when its entry is current), and each target's HP
+    read (later turns continue from the value the previous one wrote)."""
     locked = _lock_encounter(connection, encounter_id, expected_campaign_id=campaign_id)
-    timeline_id = locked.timeline_id
-    _validate_session_campaign(connection, campaign_id=locked.campaign_id, session_id=session_id)
-    encounter_round_id = _get_or_create_round(
-        connection, encounter_id=encounter_id, round_number=round_number
+    for session_id in dict.fromkeys(turn.session_id for turn in turns):
+        _validate_session_campaign(
+            connection, campaign_id=locked.campaign_id, session_id=session_id
+        )
+    working_set = _encounter_working_set(
+        connection,
+        encounter_id=encounter_id,
+        locked=locked,
+        round_numbers=list(dict.fromkeys(turn.round_number for turn in turns)),
+        working_set_cache=working_set_cache,
     )
-    participant_id = _participant_id(
-        connection, encounter_id=encounter_id, participant_entity_id=actor_entity_id
+    _require_participants(
+        working_set.participant_ids,
+        encounter_id=encounter_id,
+        participant_entity_ids=list(dict.fromkeys(turn.actor_entity_id for turn in turns)),
+    )
+
+    hit_points: dict[uuid.UUID, int | None] = {}
+    return tuple(
+        _record_combat_turn(
+            connection,
+            encounter_id=encounter_id,
+            locked=locked,
+            world_id=working_set.world_id,
+            encounter_round_id=working_set.round_ids[turn.round_number],
+            participant_id=working_set.participant_ids[turn.actor_entity_id],
+            turn=turn,
+            hit_points=hit_points,
+        )
+        for turn in turns
     )
 
-    world_id = connection.execute(
-        text("SELECT world_id FROM campaign.timelines WHERE timeline_id = :t"),
-        {"t": timeline_id},
-    ).scalar()
-    assert isinstance(world_id, uuid.UUID)
 
+def _record_combat_turn(
+    connection: Connection,
+    *,
+    encounter_id: uuid.UUID,
+    locked: LockedEncounter,
+    world_id: uuid.UUID,
+    encounter_round_id: uuid.UUID,
+    participant_id: uuid.UUID,
+    turn: CombatTurn,
+    hit_points: dict[uuid.UUID, int | None],
+) -> ResolveCombatTurnResult:
+    """One turn's writes, once `_resolve_combat_turns_impl` has locked and
+    resolved everything the turn shares with its batch. `hit_points` is
+    the batch's running HP per target, read (`FOR UPDATE`) on first use."""
+    timeline_id = locked.timeline_id
     interaction_type_id = lookup_id(
         connection,
         "interaction",
         "interaction_types",
         "interaction_type_id",
-        interaction_type_code,
+        turn.interaction_type_code,
     )
     interaction_id = connection.execute(
         text("""
@@ -502,9 +776,9 @@ def _resolve_combat_turn_impl(
         {
             "timeline": timeline_id,
             "campaign": locked.campaign_id,
-            "session": session_id,
+            "session": turn.session_id,
             "itype": interaction_type_id,
-            "world_time": world_time_id,
+            "world_time": turn.world_time_id,
         },
     ).scalar()
     assert isinstance(interaction_id, uuid.UUID)
@@ -515,19 +789,19 @@ def _resolve_combat_turn_impl(
             VALUES (:interaction, :actor)
             RETURNING action_id
         """),
-        {"interaction": interaction_id, "actor": actor_entity_id},
+        {"interaction": interaction_id, "actor": turn.actor_entity_id},
     ).scalar()
     assert isinstance(action_id, uuid.UUID)
 
     target_id = None
-    if target_entity_id is not None:
+    if turn.target_entity_id is not None:
         target_id = connection.execute(
             text("""
                 INSERT INTO interaction.targets (action_id, target_entity_id)
                 VALUES (:action, :entity)
                 RETURNING target_id
             """),
-            {"action": action_id, "entity": target_entity_id},
+            {"action": action_id, "entity": turn.target_entity_id},
         ).scalar()
         assert isinstance(target_id, uuid.UUID)
 
@@ -543,13 +817,13 @@ def _resolve_combat_turn_impl(
         {
             "action": action_id,
             "target": target_id,
-            "kind": action_kind,
-            "item": item_instance_id,
-            "spell": spell_id,
-            "hit": hit,
-            "damage": damage_amount,
-            "damage_type": damage_type_id,
-            "condition": resulting_condition_id,
+            "kind": turn.action_kind,
+            "item": turn.item_instance_id,
+            "spell": turn.spell_id,
+            "hit": turn.hit,
+            "damage": turn.damage_amount,
+            "damage_type": turn.damage_type_id,
+            "condition": turn.resulting_condition_id,
         },
     ).scalar()
     assert isinstance(combat_action_id, uuid.UUID)
@@ -564,7 +838,7 @@ def _resolve_combat_turn_impl(
         {
             "round": encounter_round_id,
             "participant": participant_id,
-            "order": turn_order,
+            "order": turn.turn_order,
             "combat_action": combat_action_id,
         },
     ).scalar()
@@ -594,33 +868,36 @@ def _resolve_combat_turn_impl(
     new_hit_points: int | None = None
 
     if (
-        hit is not False
-        and damage_amount is not None
-        and damage_amount > 0
-        and target_entity_id is not None
+        turn.hit is not False
+        and turn.damage_amount is not None
+        and turn.damage_amount > 0
+        and turn.target_entity_id is not None
     ):
-        previous_hit_points = _character_hit_points(
-            connection, timeline_id=timeline_id, character_id=target_entity_id
-        )
+        if turn.target_entity_id not in hit_points:
+            hit_points[turn.target_entity_id] = _character_hit_points(
+                connection, timeline_id=timeline_id, character_id=turn.target_entity_id
+            )
+        previous_hit_points = hit_points[turn.target_entity_id]
 
     if previous_hit_points is not None:
-        assert target_entity_id is not None
-        assert damage_amount is not None
-        new_hit_points = previous_hit_points - damage_amount
+        assert turn.target_entity_id is not None
+        assert turn.damage_amount is not None
+        new_hit_points = previous_hit_points - turn.damage_amount
+        hit_points[turn.target_entity_id] = new_hit_points
 
         event_id = _insert_event_row(
             connection,
             world_id=world_id,
             timeline_id=timeline_id,
-            world_time_id=world_time_id,
+            world_time_id=turn.world_time_id,
             event_type_code="combat_damage_dealt",
             name="Combat damage dealt",
-            details=event_details,
+            details=turn.event_details,
             campaign_id=locked.campaign_id,
-            session_id=session_id,
+            session_id=turn.session_id,
             participants=(
-                EventParticipant(entity_id=actor_entity_id, role_code="actor"),
-                EventParticipant(entity_id=target_entity_id, role_code="victim"),
+                EventParticipant(entity_id=turn.actor_entity_id, role_code="actor"),
+                EventParticipant(entity_id=turn.target_entity_id, role_code="victim"),
             ),
             cause_description=None,
         )
@@ -637,7 +914,7 @@ def _resolve_combat_turn_impl(
                 SET current_hit_points = :hp, updated_at = now()
                 WHERE timeline_id = :timeline AND character_id = :character
             """),
-            {"hp": new_hit_points, "timeline": timeline_id, "character": target_entity_id},
+            {"hp": new_hit_points, "timeline": timeline_id, "character": turn.target_entity_id},
         )
         connection.execute(
             text("""
@@ -649,10 +926,10 @@ def _resolve_combat_turn_impl(
             """),
             {
                 "event": event_id,
-                "character": target_entity_id,
+                "character": turn.target_entity_id,
                 "previous": json.dumps(previous_hit_points),
                 "new": json.dumps(new_hit_points),
-                "world_time": world_time_id,
+                "world_time": turn.world_time_id,
             },
         )
 
@@ -685,6 +962,7 @@ def resolve_combat_turn(
     campaign_id: uuid.UUID | None = None,
     session_id: uuid.UUID | None = None,
     event_details: str | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> ResolveCombatTurnResult:
     """Record one participant's turn — the interaction/action/combat_action
     it resolved via, and (when it dealt damage to a character with existing
@@ -714,6 +992,28 @@ def resolve_combat_turn(
             campaign_id=campaign_id,
             session_id=session_id,
             event_details=event_details,
+            working_set_cache=working_set_cache,
+        )
+
+
+def resolve_combat_turns(
+    engine: Engine,
+    *,
+    encounter_id: uuid.UUID,
+    turns: Sequence[CombatTurn],
+    campaign_id: uuid.UUID | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> tuple[ResolveCombatTurnResult, ...]:
+    """Record an ordered list of turns on one encounter — see
+    _resolve_combat_turns_impl() — atomically. Public convenience API:
+    opens and commits its own transaction."""
+    with engine.begin() as connection:
+        return _resolve_combat_turns_impl(
+            connection,
+            encounter_id=encounter_id,
+            turns=turns,
+            campaign_id=campaign_id,
+            working_set_cache=working_set_cache,
         )
 
 
@@ -777,6 +1077,7 @@ def _end_encounter_impl(
     summary: str | None = None,
     campaign_id: uuid.UUID | None = None,
     session_id: uuid.UUID | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> EndEncounterResult:
     """The actual work of end_encounter(), on a connection the caller
     already has open — see _resolve_combat_turn_impl's docstring for the
@@ -798,6 +1099,9 @@ def _end_encounter_impl(
     (an encounter can outlive the session it was started in, so the
     session an encounter actually *ended* in is a fact about the
     completion event, not something to infer from the encounter's start).
+
+    Discards the encounter's working_set_cache entry: no turn can be
+    resolved against it once it is no longer active.
     """
     locked = _lock_encounter(connection, encounter_id, expected_campaign_id=campaign_id)
     timeline_id = locked.timeline_id
@@ -849,6 +1153,8 @@ def _end_encounter_impl(
             {"outcome": outcome, "encounter": encounter_id, "entity": participant_entity_id},
         )
 
+    if working_set_cache is not None:
+        working_set_cache.discard(encounter_id)
     return EndEncounterResult(event_id=event_id)
 
 
@@ -861,6 +1167,7 @@ def end_encounter(
     summary: str | None = None,
     campaign_id: uuid.UUID | None = None,
     session_id: uuid.UUID | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> EndEncounterResult:
     """Mark an encounter completed, record each participant's outcome
     (defeated/escaped/surrendered/captured), and link the resulting event —
@@ -876,4 +1183,5 @@ def end_encounter(
             summary=summary,
             campaign_id=campaign_id,
             session_id=session_id,
+            working_set_cache=working_set_cache,
         )
@@ -4,9 +4,16 @@ Events created through gameplay (as opposed to AI proposals, which stay at
 canon_status = proposed until approved per docs/ENTITY_LIFECYCLE.md §10) are
 recorded directly at canon_status = canon, lifecycle_status = active: they
 are the record of something that has already, authoritatively, happened.
+
+Every command that records an event writes it through `_insert_event_row`,
+which is `_insert_event_rows` — the set-based batch form — for one event.
+`record_events`/`_record_events_impl` expose the batch directly, so a
+session log of hundreds of events costs a handful of statements rather
+than several per event.
 """
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from sqlalchemy import Connection, Engine, text
@@ -26,6 +33,32 @@ class RecordEventResult:
     event_id: uuid.UUID
 
 
+@dataclass(frozen=True)
+class EventSpec:
+    """One event of a `_insert_event_rows`/`_record_events_impl` batch —
+    `_insert_event_row`'s per-event arguments."""
+
+    world_time_id: uuid.UUID
+    event_type_code: str
+    name: str
+    event_status_code: str = "recorded"
+    details: str | None = None
+    campaign_id: uuid.UUID | None = None
+    session_id: uuid.UUID | None = None
+    participants: tuple[EventParticipant, ...] = ()
+    cause_event_id: uuid.UUID | None = None
+    cause_interaction_id: uuid.UUID | None = None
+    cause_description: str | None = None
+
+    @property
+    def has_cause(self) -> bool:
+        return (
+            self.cause_event_id is not None
+            or self.cause_interaction_id is not None
+            or self.cause_description is not None
+        )
+
+
 def _insert_event_row(
     connection: Connection,
     *,
@@ -49,7 +82,56 @@ def _insert_event_row(
     interactions.py) call this directly inside their own transaction; the
     standalone record_event() command below is a thin wrapper that owns its
     own transaction for a caller with no other work to combine it with.
+
+    A batch of one for `_insert_event_rows`.
     """
+    (event_id,) = _insert_event_rows(
+        connection,
+        world_id=world_id,
+        timeline_id=timeline_id,
+        events=(
+            EventSpec(
+                world_time_id=world_time_id,
+                event_type_code=event_type_code,
+                name=name,
+                event_status_code=event_status_code,
+                details=details,
+                campaign_id=campaign_id,
+                session_id=session_id,
+                participants=participants,
+                cause_event_id=cause_event_id,
+                cause_interaction_id=cause_interaction_id,
+                cause_description=cause_description,
+            ),
+        ),
+    )
+    return event_id
+
+
+def _insert_event_rows(
+    connection: Connection,
+    *,
+    world_id: uuid.UUID,
+    timeline_id: uuid.UUID,
+    events: Sequence[EventSpec],
+) -> tuple[uuid.UUID, ...]:
+    """`_insert_event_row` for many events on one timeline at once, with
+    the same transaction contract: the event ids, in `events` order.
+
+    At most four statements however many events, participants and causes
+    there are — one multi-row `INSERT ... SELECT FROM unnest(...)` each
+    into core.entities, narrative.events, narrative.event_participants and
+    narrative.event_causes (the last two only when some event has one),
+    the same shape as `dnd_ai.commands.reference_corpus`'s passage
+    batches. Every row still fires its own row-level triggers and
+    constraints, so a batch is held to exactly what the same events
+    recorded one at a time would be. The entity ids are drawn inside the
+    first statement and returned in input order, since `RETURNING` makes
+    no promise about row order.
+    """
+    if not events:
+        return ()
+
     # Resolve every lookup code before writing anything, so an unknown code
     # fails clean rather than after a partial insert (still rolled back
     # either way, but this avoids relying on that for the common typo case).
@@ -58,93 +140,138 @@ def _insert_event_row(
     lifecycle_status_id = lookup_id(
         connection, "core", "lifecycle_statuses", "lifecycle_status_id", "active"
     )
-    event_type_id = lookup_id(
-        connection, "narrative", "event_types", "event_type_id", event_type_code
-    )
-    event_status_id = lookup_id(
-        connection, "narrative", "event_statuses", "event_status_id", event_status_code
-    )
+    event_type_ids = {
+        code: lookup_id(connection, "narrative", "event_types", "event_type_id", code)
+        for code in dict.fromkeys(event.event_type_code for event in events)
+    }
+    event_status_ids = {
+        code: lookup_id(connection, "narrative", "event_statuses", "event_status_id", code)
+        for code in dict.fromkeys(event.event_status_code for event in events)
+    }
+    role_ids = {
+        code: lookup_id(
+            connection,
+            "narrative",
+            "event_participant_roles",
+            "event_participant_role_id",
+            code,
+        )
+        for code in dict.fromkeys(
+            participant.role_code for event in events for participant in event.participants
+        )
+    }
 
-    event_id = connection.execute(
-        text("""
-            INSERT INTO core.entities
-                (world_id, entity_type_id, canonical_name, canon_status_id, lifecycle_status_id)
-            VALUES (:world, :etype, :name, :canon, :lifecycle)
-            RETURNING entity_id
-        """),
-        {
-            "world": world_id,
-            "etype": event_entity_type_id,
-            "name": name,
-            "canon": canon_status_id,
-            "lifecycle": lifecycle_status_id,
-        },
-    ).scalar()
-    assert isinstance(event_id, uuid.UUID)
+    event_ids = tuple(
+        connection.execute(
+            text("""
+                WITH spec AS MATERIALIZED (
+                    SELECT gen_random_uuid() AS entity_id, s.canonical_name, s.n
+                    FROM unnest(CAST(:names AS text[])) WITH ORDINALITY AS s(canonical_name, n)
+                ),
+                inserted AS (
+                    INSERT INTO core.entities
+                        (entity_id, world_id, entity_type_id, canonical_name, canon_status_id,
+                         lifecycle_status_id)
+                    SELECT entity_id, :world, :etype, canonical_name, :canon, :lifecycle
+                    FROM spec
+                    RETURNING entity_id
+                )
+                SELECT spec.entity_id
+                FROM spec
+                JOIN inserted ON inserted.entity_id = spec.entity_id
+                ORDER BY spec.n
+            """),
+            {
+                "names": [event.name for event in events],
+                "world": world_id,
+                "etype": event_entity_type_id,
+                "canon": canon_status_id,
+                "lifecycle": lifecycle_status_id,
+            },
+        ).scalars()
+    )
+    assert len(event_ids) == len(events)
 
     connection.execute(
         text("""
             INSERT INTO narrative.events
                 (event_id, timeline_id, campaign_id, session_id, event_type_id,
                  event_status_id, world_time_id, details)
-            VALUES (:id, :timeline, :campaign, :session, :event_type, :event_status,
-                    :world_time, :details)
+            SELECT e.event_id, :timeline, e.campaign_id, e.session_id, e.event_type_id,
+                   e.event_status_id, e.world_time_id, e.details
+            FROM unnest(
+                CAST(:ids AS uuid[]), CAST(:campaigns AS uuid[]), CAST(:sessions AS uuid[]),
+                CAST(:event_types AS uuid[]), CAST(:event_statuses AS uuid[]),
+                CAST(:world_times AS uuid[]), CAST(:details AS text[])
+            ) WITH ORDINALITY AS e(event_id, campaign_id, session_id, event_type_id,
+                                   event_status_id, world_time_id, details, n)
+            ORDER BY e.n
         """),
         {
-            "id": event_id,
+            "ids": list(event_ids),
             "timeline": timeline_id,
-            "campaign": campaign_id,
-            "session": session_id,
-            "event_type": event_type_id,
-            "event_status": event_status_id,
-            "world_time": world_time_id,
-            "details": details,
+            "campaigns": [event.campaign_id for event in events],
+            "sessions": [event.session_id for event in events],
+            "event_types": [event_type_ids[event.event_type_code] for event in events],
+            "event_statuses": [event_status_ids[event.event_status_code] for event in events],
+            "world_times": [event.world_time_id for event in events],
+            "details": [event.details for event in events],
         },
     )
 
-    for participant in participants:
-        role_id = lookup_id(
-            connection,
-            "narrative",
-            "event_participant_roles",
-            "event_participant_role_id",
-            participant.role_code,
-        )
+    participants = [
+        (event_id, participant)
+        for event_id, event in zip(event_ids, events, strict=True)
+        for participant in event.participants
+    ]
+    if participants:
         connection.execute(
             text("""
                 INSERT INTO narrative.event_participants
                     (event_id, participant_entity_id, participant_role_id, notes)
-                VALUES (:event, :entity, :role, :notes)
+                SELECT p.event_id, p.participant_entity_id, p.participant_role_id, p.notes
+                FROM unnest(
+                    CAST(:events AS uuid[]), CAST(:entities AS uuid[]),
+                    CAST(:roles AS uuid[]), CAST(:notes AS text[])
+                ) WITH ORDINALITY AS p(event_id, participant_entity_id, participant_role_id,
+                                       notes, n)
+                ORDER BY p.n
             """),
             {
-                "event": event_id,
-                "entity": participant.entity_id,
-                "role": role_id,
-                "notes": participant.notes,
+                "events": [event_id for event_id, _ in participants],
+                "entities": [participant.entity_id for _, participant in participants],
+                "roles": [role_ids[participant.role_code] for _, participant in participants],
+                "notes": [participant.notes for _, participant in participants],
             },
         )
 
-    has_cause = (
-        cause_event_id is not None
-        or cause_interaction_id is not None
-        or cause_description is not None
-    )
-    if has_cause:
+    causes = [
+        (event_id, event)
+        for event_id, event in zip(event_ids, events, strict=True)
+        if event.has_cause
+    ]
+    if causes:
         connection.execute(
             text("""
                 INSERT INTO narrative.event_causes
                     (event_id, cause_event_id, cause_interaction_id, cause_description)
-                VALUES (:event, :cause_event, :cause_interaction, :cause_description)
+                SELECT c.event_id, c.cause_event_id, c.cause_interaction_id, c.cause_description
+                FROM unnest(
+                    CAST(:events AS uuid[]), CAST(:cause_events AS uuid[]),
+                    CAST(:cause_interactions AS uuid[]), CAST(:cause_descriptions AS text[])
+                ) WITH ORDINALITY AS c(event_id, cause_event_id, cause_interaction_id,
+                                       cause_description, n)
+                ORDER BY c.n
             """),
             {
-                "event": event_id,
-                "cause_event": cause_event_id,
-                "cause_interaction": cause_interaction_id,
-                "cause_description": cause_description,
+                "events": [event_id for event_id, _ in causes],
+                "cause_events": [event.cause_event_id for _, event in causes],
+                "cause_interactions": [event.cause_interaction_id for _, event in causes],
+                "cause_descriptions": [event.cause_description for _, event in causes],
             },
         )
 
-    return event_id
+    return event_ids
 
 
 def _record_event_impl(
@@ -234,3 +361,39 @@ def record_event(
             cause_interaction_id=cause_interaction_id,
             cause_description=cause_description,
         )
+
+
+def _record_events_impl(
+    connection: Connection,
+    *,
+    world_id: uuid.UUID,
+    timeline_id: uuid.UUID,
+    events: Sequence[EventSpec],
+) -> tuple[RecordEventResult, ...]:
+    """`_record_event_impl` for a batch (`_insert_event_rows`), on a
+    connection the caller already has open. Every distinct caller-supplied
+    (campaign_id, session_id) pair is validated once, before anything is
+    written; one bad event fails the whole batch."""
+    for campaign_id, session_id in dict.fromkeys(
+        (event.campaign_id, event.session_id) for event in events
+    ):
+        validate_session_campaign(connection, campaign_id=campaign_id, session_id=session_id)
+    event_ids = _insert_event_rows(
+        connection, world_id=world_id, timeline_id=timeline_id, events=events
+    )
+    return tuple(RecordEventResult(event_id=event_id) for event_id in event_ids)
+
+
+def record_events(
+    engine: Engine,
+    *,
+    world_id: uuid.UUID,
+    timeline_id: uuid.UUID,
+    events: Sequence[EventSpec],
+) -> tuple[RecordEventResult, ...]:
+    """Record a batch of standalone narrative events in one transaction —
+    `record_event` for, say, an imported session log. All or nothing."""
+    with engine.begin() as connection:
+        return _record_events_impl(
+            connection, world_id=world_id, timeline_id=timeline_id, events=events
+        )
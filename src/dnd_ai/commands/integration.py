@@ -101,6 +101,29 @@ session dying before it releases) retries under the same sync_jobs row,
 logging an additional integration.delivery_attempts row rather than a new
 job.
 
+Lock-free replay: at-least-once adapters redeliver often, and a
+redelivered operation that already completed needs none of the above.
+_replay_completed_sync_jobs() reads its job, checks its payload, and
+rebuilds its result in one statement before any advisory lock is taken;
+only an operation with no job yet, or one not yet 'completed', goes on to
+the locked path, which still makes every decision that path made before.
+The pre-check runs on the replay_connection a caller passes — the API's
+own request connection, so a replay never checks out a second one while
+holding it; a caller that passes none gets exactly the locked path.
+
+Backlog replay (apply_foundry_combat_sync_batch): an adapter reconnecting
+after a dropped connection delivers its queued operations for one
+encounter in one call rather than one call each. The batch keeps every
+per-operation rule above — the same advisory-lock keys, the payload
+check before anything else, completed operations replayed rather than
+re-run, retries under the same sync_jobs row — but takes all of its
+locks in one statement, claims every job in one transaction, and
+applies the claimed turns in one work transaction through
+dnd_ai.commands.encounters._resolve_combat_turns_impl(), which locks the
+encounter once. Only when that transaction fails does it fall back to
+the single call's per-operation work/fail steps, so a failure leaves
+exactly the state sequential delivery up to that operation would have.
+
 HTTP exposure (docs/PLAN.md Phase 10, `dnd_ai.api.integration`):
 register_external_system and map_external_identifier are reachable over
 HTTP as of Phase 10 workstream 10 — both split into a connection-taking
@@ -210,10 +233,11 @@ import logging
 import secrets
 import threading
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import Connection, Engine, text
+from sqlalchemy import Connection, Engine, Row, text
 
 from dnd_ai.domain.access import (
     foundry_issuer,
@@ -222,7 +246,13 @@ from dnd_ai.domain.access import (
 )
 from dnd_ai.domain.errors import DomainAuthorizationError, SafeMessageError
 
-from .encounters import ResolveCombatTurnResult, _resolve_combat_turn_impl
+from .encounters import (
+    CombatTurn,
+    EncounterWorkingSetCache,
+    ResolveCombatTurnResult,
+    _resolve_combat_turn_impl,
+    _resolve_combat_turns_impl,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -322,6 +352,16 @@ class ApplyFoundryCombatSyncResult:
     replayed: bool
 
 
+@dataclass(frozen=True)
+class FoundryCombatSyncOperation:
+    """One operation of an `apply_foundry_combat_sync_batch` backlog: its
+    idempotency key plus `apply_foundry_combat_sync`'s per-turn arguments."""
+
+    external_operation_id: str
+    turn: CombatTurn
+    raw_payload: dict[str, Any] | None = None
+
+
 def _register_external_system_impl(
     connection: Connection,
     *,
@@ -757,40 +797,55 @@ def _find_existing_sync_job(
     ).one_or_none()
 
 
+# The columns, and the joins producing them, that rebuild a completed
+# combat-sync job's ResolveCombatTurnResult from any relation aliased `job`
+# carrying its resulting_encounter_turn_id and resulting_event_id: shared by
+# _reconstruct_combat_result() on the locked path and
+# _replay_completed_sync_jobs() before it, so both read the same rows.
+_COMBAT_RESULT_COLUMNS = """
+    job.resulting_encounter_turn_id, job.resulting_event_id, turn.combat_action_id,
+    effect.previous_value, effect.new_value
+"""
+_COMBAT_RESULT_JOINS = """
+    LEFT JOIN narrative.encounter_turns turn
+        ON turn.encounter_turn_id = job.resulting_encounter_turn_id
+    LEFT JOIN narrative.event_effects effect
+        ON effect.event_id = job.resulting_event_id
+       AND effect.target_component = 'current_hit_points'
+"""
+
+
+def _combat_result_from_row(row: Row[Any]) -> ResolveCombatTurnResult:
+    """The ResolveCombatTurnResult a row selecting _COMBAT_RESULT_COLUMNS
+    describes; its turn must exist (combat_action_id non-NULL)."""
+    assert isinstance(row.combat_action_id, uuid.UUID)
+    return ResolveCombatTurnResult(
+        encounter_turn_id=row.resulting_encounter_turn_id,
+        combat_action_id=row.combat_action_id,
+        event_id=row.resulting_event_id,
+        previous_hit_points=row.previous_value,
+        new_hit_points=row.new_value,
+    )
+
+
 def _reconstruct_combat_result(
     connection: Connection,
     *,
     resulting_event_id: uuid.UUID | None,
     resulting_encounter_turn_id: uuid.UUID,
 ) -> ResolveCombatTurnResult:
-    combat_action_id = connection.execute(
-        text(
-            "SELECT combat_action_id FROM narrative.encounter_turns WHERE encounter_turn_id = :turn"
-        ),
-        {"turn": resulting_encounter_turn_id},
-    ).scalar()
-    assert isinstance(combat_action_id, uuid.UUID)
-
-    previous_hit_points: int | None = None
-    new_hit_points: int | None = None
-    if resulting_event_id is not None:
-        row = connection.execute(
-            text("""
-                SELECT previous_value, new_value FROM narrative.event_effects
-                WHERE event_id = :event AND target_component = 'current_hit_points'
-            """),
-            {"event": resulting_event_id},
-        ).one_or_none()
-        if row is not None:
-            previous_hit_points, new_hit_points = row.previous_value, row.new_value
-
-    return ResolveCombatTurnResult(
-        encounter_turn_id=resulting_encounter_turn_id,
-        combat_action_id=combat_action_id,
-        event_id=resulting_event_id,
-        previous_hit_points=previous_hit_points,
-        new_hit_points=new_hit_points,
-    )
+    row = connection.execute(
+        text(f"""
+            SELECT {_COMBAT_RESULT_COLUMNS}
+            FROM (
+                SELECT CAST(:turn AS uuid) AS resulting_encounter_turn_id,
+                       CAST(:event AS uuid) AS resulting_event_id
+            ) job
+            {_COMBAT_RESULT_JOINS}
+        """),
+        {"turn": resulting_encounter_turn_id, "event": resulting_event_id},
+    ).one()
+    return _combat_result_from_row(row)
 
 
 def _insert_sync_job(
@@ -855,6 +910,23 @@ def _unlock_advisory_lock(connection: Connection, lock_params: dict[str, str]) -
     return released is True
 
 
+def _unlock_advisory_locks(
+    connection: Connection, lock_params: dict[str, str], operation_ids: Sequence[str]
+) -> bool:
+    """_unlock_advisory_lock() for every lock apply_foundry_combat_sync_batch()
+    took, in one statement — confirmed only if PostgreSQL confirms every
+    one of them."""
+    released = connection.execute(
+        text("""
+            SELECT bool_and(pg_advisory_unlock(hashtext(:a), hashtext(operation)))
+            FROM unnest(CAST(:operations AS text[])) AS operation
+        """),
+        {"a": lock_params["a"], "operations": list(operation_ids)},
+    ).scalar()
+    connection.commit()
+    return released is True
+
+
 def _quarantine_lock_connection(connection: Connection, lock_params: dict[str, str]) -> None:
     """Retain a strong, process-lifetime reference to connection, called
     only from _release_lock_connection()'s double-failure branch (both
@@ -907,7 +979,12 @@ def _quarantine_lock_connection(connection: Connection, lock_params: dict[str, s
     )
 
 
-def _release_lock_connection(connection: Connection, lock_params: dict[str, str]) -> None:
+def _release_lock_connection(
+    connection: Connection,
+    lock_params: dict[str, str],
+    *,
+    operation_ids: Sequence[str] | None = None,
+) -> None:
     """Release the advisory lock held by connection and finalize the
     connection wrapper — the entire body of apply_foundry_combat_sync()'s
     finally block, factored out so its state machine is directly testable
@@ -918,6 +995,10 @@ def _release_lock_connection(connection: Connection, lock_params: dict[str, str]
     (a domain failure, a claim/work/fail-step exception, or a normal
     return).
 
+    operation_ids is set by apply_foundry_combat_sync_batch(), whose
+    connection holds one lock per operation id (_unlock_advisory_locks);
+    the state machine below is otherwise identical for both callers.
+
     State machine:
       1. Attempt the unlock and confirm it via pg_advisory_unlock()'s own
          boolean result (_unlock_advisory_lock) — a raised exception here
@@ -989,7 +1070,10 @@ def _release_lock_connection(connection: Connection, lock_params: dict[str, str]
             trouble.
     """
     try:
-        unlock_confirmed = _unlock_advisory_lock(connection, lock_params)
+        if operation_ids is None:
+            unlock_confirmed = _unlock_advisory_lock(connection, lock_params)
+        else:
+            unlock_confirmed = _unlock_advisory_locks(connection, lock_params, operation_ids)
     except Exception:
         unlock_confirmed = False
 
@@ -1096,6 +1180,25 @@ def _complete_sync_job(
         {"job": sync_job_id, "number": attempt_number},
     )
 
+    _upsert_sync_state(
+        connection,
+        external_system_id=external_system_id,
+        target_encounter_id=target_encounter_id,
+        target_entity_id=target_entity_id,
+        sync_job_id=sync_job_id,
+    )
+
+
+def _upsert_sync_state(
+    connection: Connection,
+    *,
+    external_system_id: uuid.UUID,
+    target_encounter_id: uuid.UUID | None,
+    target_entity_id: uuid.UUID | None,
+    sync_job_id: uuid.UUID,
+) -> None:
+    """The atomic sync_state upsert _complete_sync_job()'s docstring
+    describes, also run once per batch by _complete_sync_jobs()."""
     if target_entity_id is not None:
         connection.execute(
             text("""
@@ -1131,6 +1234,167 @@ def _complete_sync_job(
         )
 
 
+def _complete_sync_jobs(
+    connection: Connection,
+    *,
+    external_system_id: uuid.UUID,
+    target_encounter_id: uuid.UUID,
+    sync_job_ids: Sequence[uuid.UUID],
+    combat_results: Sequence[ResolveCombatTurnResult],
+) -> None:
+    """_complete_sync_job() for every job of an apply_foundry_combat_sync_batch()
+    work step, in that step's transaction: one UPDATE, one delivery-attempt
+    INSERT and one sync_state upsert, naming the batch's last job — the row
+    sequential delivery of the same jobs would have left behind."""
+    connection.execute(
+        text("""
+            UPDATE integration.sync_jobs AS job
+            SET status = 'completed', resulting_event_id = result.event_id,
+                resulting_encounter_turn_id = result.encounter_turn_id, error_message = NULL,
+                updated_at = now()
+            FROM unnest(CAST(:jobs AS uuid[]), CAST(:events AS uuid[]), CAST(:turns AS uuid[]))
+                AS result(sync_job_id, event_id, encounter_turn_id)
+            WHERE job.sync_job_id = result.sync_job_id
+        """),
+        {
+            "jobs": list(sync_job_ids),
+            "events": [result.event_id for result in combat_results],
+            "turns": [result.encounter_turn_id for result in combat_results],
+        },
+    )
+    connection.execute(
+        text("""
+            INSERT INTO integration.delivery_attempts (sync_job_id, attempt_number, succeeded)
+            SELECT job.sync_job_id,
+                   COALESCE((SELECT MAX(attempt.attempt_number)
+                             FROM integration.delivery_attempts AS attempt
+                             WHERE attempt.sync_job_id = job.sync_job_id), 0) + 1,
+                   true
+            FROM unnest(CAST(:jobs AS uuid[])) AS job(sync_job_id)
+        """),
+        {"jobs": list(sync_job_ids)},
+    )
+    _upsert_sync_state(
+        connection,
+        external_system_id=external_system_id,
+        target_encounter_id=target_encounter_id,
+        target_entity_id=None,
+        sync_job_id=sync_job_ids[-1],
+    )
+
+
+def _apply_sync_job(
+    lock_connection: Connection,
+    *,
+    sync_job_id: uuid.UUID,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    turn: CombatTurn,
+    campaign_id: uuid.UUID | None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> ResolveCombatTurnResult:
+    """Steps 2 (work) and 3 (fail) of this module's docstring for one
+    claimed job, on the connection holding its advisory lock."""
+    try:
+        with lock_connection.begin():
+            combat_result = _resolve_combat_turn_impl(
+                lock_connection,
+                encounter_id=encounter_id,
+                round_number=turn.round_number,
+                turn_order=turn.turn_order,
+                actor_entity_id=turn.actor_entity_id,
+                world_time_id=turn.world_time_id,
+                action_kind=turn.action_kind,
+                target_entity_id=turn.target_entity_id,
+                item_instance_id=turn.item_instance_id,
+                spell_id=turn.spell_id,
+                hit=turn.hit,
+                damage_amount=turn.damage_amount,
+                damage_type_id=turn.damage_type_id,
+                resulting_condition_id=turn.resulting_condition_id,
+                interaction_type_code=turn.interaction_type_code,
+                campaign_id=campaign_id,
+                session_id=turn.session_id,
+                event_details=turn.event_details,
+                working_set_cache=working_set_cache,
+            )
+            _complete_sync_job(
+                lock_connection,
+                sync_job_id=sync_job_id,
+                external_system_id=external_system_id,
+                target_encounter_id=encounter_id,
+                target_entity_id=None,
+                resulting_event_id=combat_result.event_id,
+                resulting_encounter_turn_id=combat_result.encounter_turn_id,
+            )
+    except Exception as exc:
+        # Step 3: fail. Only reached once step 2 has fully rolled back.
+        try:
+            with lock_connection.begin():
+                _fail_sync_job(lock_connection, sync_job_id=sync_job_id, error_message=str(exc))
+        except Exception:
+            # A failure recording the failure must never replace the original domain
+            # exception — the caller needs to see what step 2 actually raised, not a
+            # secondary bookkeeping error.
+            pass
+        raise
+    return combat_result
+
+
+def _replay_completed_sync_jobs(
+    connection: Connection,
+    *,
+    external_system_id: uuid.UUID,
+    payloads: dict[str, dict[str, Any]],
+) -> dict[str, ApplyFoundryCombatSyncResult]:
+    """The lock-free replay pre-check: the replayed result of every
+    operation in payloads (external_operation_id -> canonical payload)
+    whose job is already 'completed', read in one statement on the
+    caller's own connection. Raises ConflictingSyncPayloadError for an
+    existing job of any status whose payload differs.
+
+    Safe without the advisory lock because neither fact it relies on can
+    change under it: a job's payload_jsonb is written once, when the job
+    is inserted, and 'completed' is final — it commits in the same
+    transaction as the turn, action and event the result is rebuilt from.
+    Any other status, or a completed job whose resulting turn has since
+    been deleted, is left to the locked path, which decides it exactly as
+    before."""
+    rows = {
+        row.external_operation_id: row
+        for row in connection.execute(
+            text(f"""
+                SELECT job.sync_job_id, job.external_operation_id, job.status,
+                       job.payload_jsonb, {_COMBAT_RESULT_COLUMNS}
+                FROM integration.sync_jobs job
+                {_COMBAT_RESULT_JOINS}
+                WHERE job.external_system_id = :system
+                  AND job.external_operation_id = ANY(CAST(:operations AS text[]))
+            """),
+            {"system": external_system_id, "operations": list(payloads)},
+        )
+    }
+
+    replayed: dict[str, ApplyFoundryCombatSyncResult] = {}
+    for operation_id, payload in payloads.items():
+        row = rows.get(operation_id)
+        if row is None:
+            continue
+        if row.payload_jsonb != payload:
+            raise ConflictingSyncPayloadError(
+                f"external_operation_id {operation_id!r} on external system "
+                f"{external_system_id} was already used with a different payload"
+            )
+        if row.status != "completed" or row.combat_action_id is None:
+            continue
+        replayed[operation_id] = ApplyFoundryCombatSyncResult(
+            sync_job_id=row.sync_job_id,
+            combat_result=_combat_result_from_row(row),
+            replayed=True,
+        )
+    return replayed
+
+
 def apply_foundry_combat_sync(
     engine: Engine,
     *,
@@ -1154,6 +1418,8 @@ def apply_foundry_combat_sync(
     event_details: str | None = None,
     raw_payload: dict[str, Any] | None = None,
     campaign_id: uuid.UUID | None = None,
+    replay_connection: Connection | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
 ) -> ApplyFoundryCombatSyncResult:
     """Route an inbound Foundry combat-turn payload through the real combat-
     resolution logic (never a raw write), exactly once per
@@ -1205,26 +1471,71 @@ def apply_foundry_combat_sync(
     external_operation_id whose item/spell/condition/etc. disagrees with
     the original call is still detected as a conflicting payload, not
     silently ignored.
+
+    Given replay_connection, an operation already 'completed' is replayed
+    by _replay_completed_sync_jobs() on it without taking the advisory
+    lock at all; only a missing, pending, in-progress or failed job reaches
+    the locked path. Without it every call takes the locked path, which
+    replays a completed operation too — after the lock.
+
+    working_set_cache reaches the turn's resolution unchanged — see
+    dnd_ai.commands.encounters' module docstring, "Working set".
     """
-    payload = _canonical_payload(
-        encounter_id=encounter_id,
-        round_number=round_number,
-        turn_order=turn_order,
-        actor_entity_id=actor_entity_id,
-        world_time_id=world_time_id,
-        action_kind=action_kind,
-        target_entity_id=target_entity_id,
-        item_instance_id=item_instance_id,
-        spell_id=spell_id,
-        hit=hit,
-        damage_amount=damage_amount,
-        damage_type_id=damage_type_id,
-        resulting_condition_id=resulting_condition_id,
-        interaction_type_code=interaction_type_code,
-        session_id=session_id,
-        event_details=event_details,
+    operation = FoundryCombatSyncOperation(
+        external_operation_id=external_operation_id,
+        turn=CombatTurn(
+            round_number=round_number,
+            turn_order=turn_order,
+            actor_entity_id=actor_entity_id,
+            world_time_id=world_time_id,
+            action_kind=action_kind,
+            target_entity_id=target_entity_id,
+            item_instance_id=item_instance_id,
+            spell_id=spell_id,
+            hit=hit,
+            damage_amount=damage_amount,
+            damage_type_id=damage_type_id,
+            resulting_condition_id=resulting_condition_id,
+            interaction_type_code=interaction_type_code,
+            session_id=session_id,
+            event_details=event_details,
+        ),
         raw_payload=raw_payload,
     )
+    payload = _operation_payload(encounter_id, operation)
+    if replay_connection is not None:
+        replayed = _replay_completed_sync_jobs(
+            replay_connection,
+            external_system_id=external_system_id,
+            payloads={external_operation_id: payload},
+        )
+        if external_operation_id in replayed:
+            return replayed[external_operation_id]
+    return _apply_foundry_combat_sync_locked(
+        engine,
+        external_system_id=external_system_id,
+        encounter_id=encounter_id,
+        operation=operation,
+        payload=payload,
+        campaign_id=campaign_id,
+        working_set_cache=working_set_cache,
+    )
+
+
+def _apply_foundry_combat_sync_locked(
+    engine: Engine,
+    *,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    operation: FoundryCombatSyncOperation,
+    payload: dict[str, Any],
+    campaign_id: uuid.UUID | None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> ApplyFoundryCombatSyncResult:
+    """apply_foundry_combat_sync() past its lock-free replay pre-check: the
+    advisory lock and the claim/work/fail steps this module's docstring
+    describes, and every call's path when no replay_connection is given."""
+    external_operation_id = operation.external_operation_id
     lock_params = {"a": str(external_system_id), "b": external_operation_id}
 
     # Everything below — the claim, work, and (on failure) fail steps — runs
@@ -1287,48 +1598,15 @@ def apply_foundry_combat_sync(
 
         # Step 2: work. The domain mutation and its completion bookkeeping
         # commit or roll back together — see this module's docstring.
-        try:
-            with lock_connection.begin():
-                combat_result = _resolve_combat_turn_impl(
-                    lock_connection,
-                    encounter_id=encounter_id,
-                    round_number=round_number,
-                    turn_order=turn_order,
-                    actor_entity_id=actor_entity_id,
-                    world_time_id=world_time_id,
-                    action_kind=action_kind,
-                    target_entity_id=target_entity_id,
-                    item_instance_id=item_instance_id,
-                    spell_id=spell_id,
-                    hit=hit,
-                    damage_amount=damage_amount,
-                    damage_type_id=damage_type_id,
-                    resulting_condition_id=resulting_condition_id,
-                    interaction_type_code=interaction_type_code,
-                    campaign_id=campaign_id,
-                    session_id=session_id,
-                    event_details=event_details,
-                )
-                _complete_sync_job(
-                    lock_connection,
-                    sync_job_id=sync_job_id,
-                    external_system_id=external_system_id,
-                    target_encounter_id=encounter_id,
-                    target_entity_id=None,
-                    resulting_event_id=combat_result.event_id,
-                    resulting_encounter_turn_id=combat_result.encounter_turn_id,
-                )
-        except Exception as exc:
-            # Step 3: fail. Only reached once step 2 has fully rolled back.
-            try:
-                with lock_connection.begin():
-                    _fail_sync_job(lock_connection, sync_job_id=sync_job_id, error_message=str(exc))
-            except Exception:
-                # A failure recording the failure must never replace the original domain
-                # exception — the caller needs to see what step 2 actually raised, not a
-                # secondary bookkeeping error.
-                pass
-            raise
+        combat_result = _apply_sync_job(
+            lock_connection,
+            sync_job_id=sync_job_id,
+            external_system_id=external_system_id,
+            encounter_id=encounter_id,
+            turn=operation.turn,
+            campaign_id=campaign_id,
+            working_set_cache=working_set_cache,
+        )
 
         return ApplyFoundryCombatSyncResult(
             sync_job_id=sync_job_id, combat_result=combat_result, replayed=False
@@ -1338,3 +1616,270 @@ def apply_foundry_combat_sync(
         # unlock/invalidate/detach state machine and why nothing in it can
         # mask an exception already propagating from the try block above.
         _release_lock_connection(lock_connection, lock_params)
+
+
+def _operation_payload(
+    encounter_id: uuid.UUID, operation: FoundryCombatSyncOperation
+) -> dict[str, Any]:
+    turn = operation.turn
+    return _canonical_payload(
+        encounter_id=encounter_id,
+        round_number=turn.round_number,
+        turn_order=turn.turn_order,
+        actor_entity_id=turn.actor_entity_id,
+        world_time_id=turn.world_time_id,
+        action_kind=turn.action_kind,
+        target_entity_id=turn.target_entity_id,
+        item_instance_id=turn.item_instance_id,
+        spell_id=turn.spell_id,
+        hit=turn.hit,
+        damage_amount=turn.damage_amount,
+        damage_type_id=turn.damage_type_id,
+        resulting_condition_id=turn.resulting_condition_id,
+        interaction_type_code=turn.interaction_type_code,
+        session_id=turn.session_id,
+        event_details=turn.event_details,
+        raw_payload=operation.raw_payload,
+    )
+
+
+def apply_foundry_combat_sync_batch(
+    engine: Engine,
+    *,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    operations: Sequence[FoundryCombatSyncOperation],
+    campaign_id: uuid.UUID | None = None,
+    replay_connection: Connection | None = None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> tuple[ApplyFoundryCombatSyncResult, ...]:
+    """apply_foundry_combat_sync() for an ordered backlog of operations on
+    one encounter — what a Foundry adapter replays after reconnecting —
+    with the same exactly-once result per operation that delivering them
+    one call at a time, in order, would have produced.
+
+    Given replay_connection, operations already 'completed' are replayed
+    first, without any lock, by the same pre-check
+    apply_foundry_combat_sync() runs there; a backlog that was entirely
+    delivered already returns there. For the rest, one connection takes
+    every operation's advisory lock (the same
+    (external_system_id, external_operation_id) keys a single call takes,
+    so the two paths still serialize against each other) in one statement,
+    in hashtext order, so two overlapping backlogs can never deadlock.
+    The claim is one transaction: one FOR UPDATE read of every existing
+    job, the payload-conflict check for all of them before anything is
+    written — a conflicting operation rejects the whole batch — and one
+    statement claiming every job that still needs work ('failed',
+    crash-orphaned 'in_progress', or 'pending' are reset; unknown ids are
+    inserted), as 'pending' until its work step completes it. Completed
+    operations are replayed from their recorded results.
+
+    The work step applies every claimed operation in one transaction via
+    _resolve_combat_turns_impl() and _complete_sync_jobs(). If that
+    raises, it has rolled back in full and the operations are applied
+    again one transaction each (_apply_sync_job(), exactly the single
+    call's steps 2 and 3), stopping at and re-raising the first failure:
+    the operations before it are completed, it is 'failed', and the rest
+    stay 'pending' for the adapter's next delivery to retry — the state a
+    sequential delivery stopping at that operation leaves behind.
+
+    Raises ValueError for an empty batch or a repeated
+    external_operation_id.
+    """
+    if not operations:
+        raise ValueError("a combat-sync batch needs at least one operation")
+    operation_ids = [operation.external_operation_id for operation in operations]
+    if len(set(operation_ids)) != len(operation_ids):
+        raise ValueError("a combat-sync batch must not repeat an external_operation_id")
+    payloads = {
+        operation.external_operation_id: _operation_payload(encounter_id, operation)
+        for operation in operations
+    }
+    results = (
+        _replay_completed_sync_jobs(
+            replay_connection, external_system_id=external_system_id, payloads=payloads
+        )
+        if replay_connection is not None
+        else {}
+    )
+    remaining = [
+        operation for operation in operations if operation.external_operation_id not in results
+    ]
+    if remaining:
+        applied = _apply_foundry_combat_sync_batch_locked(
+            engine,
+            external_system_id=external_system_id,
+            encounter_id=encounter_id,
+            operations=remaining,
+            payloads=[payloads[operation.external_operation_id] for operation in remaining],
+            campaign_id=campaign_id,
+            working_set_cache=working_set_cache,
+        )
+        for operation, result in zip(remaining, applied, strict=True):
+            results[operation.external_operation_id] = result
+    return tuple(results[operation_id] for operation_id in operation_ids)
+
+
+def _apply_foundry_combat_sync_batch_locked(
+    engine: Engine,
+    *,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    operations: Sequence[FoundryCombatSyncOperation],
+    payloads: Sequence[dict[str, Any]],
+    campaign_id: uuid.UUID | None,
+    working_set_cache: EncounterWorkingSetCache | None = None,
+) -> tuple[ApplyFoundryCombatSyncResult, ...]:
+    """apply_foundry_combat_sync_batch() for the operations its lock-free
+    pre-check could not replay."""
+    operation_ids = [operation.external_operation_id for operation in operations]
+    # Only "a" is used for unlocking; "b" identifies the batch in
+    # _quarantine_lock_connection()'s log line.
+    lock_params = {
+        "a": str(external_system_id),
+        "b": f"{operation_ids[0]}..{operation_ids[-1]} ({len(operation_ids)} operations)",
+    }
+
+    lock_connection = engine.connect()
+    try:
+        lock_connection.execute(
+            text("""
+                SELECT pg_advisory_lock(hashtext(:system), hashtext(operation))
+                FROM (
+                    SELECT operation FROM unnest(CAST(:operations AS text[])) AS operation
+                    ORDER BY hashtext(operation), operation
+                ) AS ordered
+            """),
+            {"system": str(external_system_id), "operations": operation_ids},
+        ).all()
+        lock_connection.commit()
+
+        # Step 1: claim, for every operation at once.
+        with lock_connection.begin():
+            existing = {
+                row.external_operation_id: row
+                for row in lock_connection.execute(
+                    text("""
+                        SELECT sync_job_id, external_operation_id, status, payload_jsonb,
+                               resulting_event_id, resulting_encounter_turn_id
+                        FROM integration.sync_jobs
+                        WHERE external_system_id = :system
+                          AND external_operation_id = ANY(CAST(:operations AS text[]))
+                        FOR UPDATE
+                    """),
+                    {"system": external_system_id, "operations": operation_ids},
+                )
+            }
+            for operation_id, payload in zip(operation_ids, payloads, strict=True):
+                row = existing.get(operation_id)
+                if row is not None and row.payload_jsonb != payload:
+                    raise ConflictingSyncPayloadError(
+                        f"external_operation_id {operation_id!r} on external system "
+                        f"{external_system_id} was already used with a different payload"
+                    )
+
+            new = [
+                (operation_id, payload)
+                for operation_id, payload in zip(operation_ids, payloads, strict=True)
+                if operation_id not in existing
+            ]
+            inserted = {
+                row.external_operation_id: row.sync_job_id
+                for row in lock_connection.execute(
+                    text("""
+                        WITH retried AS (
+                            UPDATE integration.sync_jobs
+                            SET status = 'pending', error_message = NULL, updated_at = now()
+                            WHERE sync_job_id = ANY(CAST(:retried AS uuid[]))
+                        )
+                        INSERT INTO integration.sync_jobs
+                            (external_system_id, direction, job_type, target_encounter_id,
+                             status, payload_jsonb, external_operation_id)
+                        SELECT CAST(:system AS uuid), 'inbound', 'combat_turn',
+                               CAST(:encounter AS uuid), 'pending', CAST(spec.payload AS jsonb),
+                               spec.operation
+                        FROM unnest(CAST(:operations AS text[]), CAST(:payloads AS text[]))
+                            AS spec(operation, payload)
+                        RETURNING sync_job_id, external_operation_id
+                    """),
+                    {
+                        "retried": [
+                            row.sync_job_id
+                            for row in existing.values()
+                            if row.status != "completed"
+                        ],
+                        "system": external_system_id,
+                        "encounter": encounter_id,
+                        "operations": [operation_id for operation_id, _ in new],
+                        "payloads": [json.dumps(payload) for _, payload in new],
+                    },
+                )
+            }
+
+            results: list[ApplyFoundryCombatSyncResult | None] = []
+            claimed: list[tuple[int, uuid.UUID, FoundryCombatSyncOperation]] = []
+            for index, operation in enumerate(operations):
+                row = existing.get(operation.external_operation_id)
+                if row is not None and row.status == "completed":
+                    results.append(
+                        ApplyFoundryCombatSyncResult(
+                            sync_job_id=row.sync_job_id,
+                            combat_result=_reconstruct_combat_result(
+                                lock_connection,
+                                resulting_event_id=row.resulting_event_id,
+                                resulting_encounter_turn_id=row.resulting_encounter_turn_id,
+                            ),
+                            replayed=True,
+                        )
+                    )
+                    continue
+                sync_job_id = (
+                    row.sync_job_id
+                    if row is not None
+                    else inserted[operation.external_operation_id]
+                )
+                results.append(None)
+                claimed.append((index, sync_job_id, operation))
+
+        if claimed:
+            # Step 2: work, every claimed operation in one transaction.
+            try:
+                with lock_connection.begin():
+                    combat_results = _resolve_combat_turns_impl(
+                        lock_connection,
+                        encounter_id=encounter_id,
+                        turns=[operation.turn for _, _, operation in claimed],
+                        campaign_id=campaign_id,
+                        working_set_cache=working_set_cache,
+                    )
+                    _complete_sync_jobs(
+                        lock_connection,
+                        external_system_id=external_system_id,
+                        target_encounter_id=encounter_id,
+                        sync_job_ids=[sync_job_id for _, sync_job_id, _ in claimed],
+                        combat_results=combat_results,
+                    )
+            except Exception:
+                # Rolled back in full; find the failing operation the way
+                # sequential delivery would, one transaction each.
+                combat_results = tuple(
+                    _apply_sync_job(
+                        lock_connection,
+                        sync_job_id=sync_job_id,
+                        external_system_id=external_system_id,
+                        encounter_id=encounter_id,
+                        turn=operation.turn,
+                        campaign_id=campaign_id,
+                        working_set_cache=working_set_cache,
+                    )
+                    for _, sync_job_id, operation in claimed
+                )
+
+            for (index, sync_job_id, _), combat_result in zip(claimed, combat_results, strict=True):
+                results[index] = ApplyFoundryCombatSyncResult(
+                    sync_job_id=sync_job_id, combat_result=combat_result, replayed=False
+                )
+
+        return tuple(result for result in results if result is not None)
+    finally:
+        _release_lock_connection(lock_connection, lock_params, operation_ids=operation_ids)
@@ -21,14 +21,81 @@ Full-text search: `websearch_to_tsquery('english', ...)`, which accepts
 ordinary natural-language query text (quoted phrases, `-exclusion`) rather
 than requiring the caller to construct `tsquery` syntax — the "PostgreSQL
 full-text indexing"/"deterministic passage selection where practical" §18.3
-calls for, no embeddings.
+calls for.
+
+Hybrid retrieval is optional and happens only when the caller passes a
+`dnd_ai.domain.embeddings.PassageEmbedder`. Ingestion given an embedder stores
+each passage's vector (`ai.reference_passages.embedding`/`.embedding_model`,
+migration 102), and `embed_reference_passages` backfills or re-embeds a
+source. Retrieval given one ranks the authorized passages twice: once by
+`ts_rank`, once by cosine similarity to the query's vector, with only
+vectors from the same `embedding_model` compared. It keeps the top
+`_HYBRID_CANDIDATE_COUNT` of each and fuses them by reciprocal-rank
+fusion: the sum over both lists of 1 / (`_RRF_K` + rank). A passage
+worded differently from the question can therefore still surface through
+the vector side. Each side ranks house-rule passages ahead of the rest
+before cutting candidates, and the final order is house rule first, as
+in lexical mode, so §18.3's precedence survives the fusion. The audit
+records both component scores (`lexical_score`, `vector_score`) next to
+the fused `relevance_score`.
+
+Ingestion writes passages in batches of `_PASSAGE_BATCH_SIZE`, each one
+multi-row `INSERT ... SELECT FROM unnest(...)`, never one round trip per
+passage — a full sourcebook is thousands of passages.
+`ingest_reference_passage_stream` takes any iterable, so a caller can feed
+it from a stream (`dnd_ai.api.reference_corpus`'s NDJSON upload) without
+ever holding the whole book in memory; only the returned ids accumulate.
+
+Retrieval can reuse an earlier ranking through a `ReferenceRetrievalCache`
+(one per process, `dnd_ai.api.reference_corpus`). An entry is keyed by what
+decides the ranking: the campaign's ruleset version, the query text with
+case and whitespace normalized, the limit, the embedder (or none) and a
+fingerprint of the campaign's authorized sources and house-rule flags.
+Campaigns that see the same sources therefore share entries. An entry is
+only reused while the ruleset version's corpus generation
+(`ai.reference_corpus_generations`, migration 103) is the one it was
+computed at. Triggers bump that generation in the same transaction as any
+registration, ingestion, grant, revocation or removal, so a corpus change
+is visible to the next retrieval from every process. The generation,
+fingerprint and ruleset version come from one read per call, which
+replaces the ranking query on a hit. A hit still writes the audit rows
+(`ai.reference_retrievals`/`.reference_retrieval_results`) for the caller's
+own query text, so the audit trail is the same with or without the cache.
+
+Which sources a campaign may retrieve from — an active source of its own
+ruleset version that is general or actively granted to it, with the
+grant's house-rule flag — is not worked out per query. Triggers keep
+`ai.campaign_authorized_sources` (migration 104) current from every
+registration, status change, grant, revocation, removal and campaign
+edition change. Both ranking queries and the cache fingerprint start from
+the campaign's rows there and join straight to the passages, with no
+per-query grant join or aggregate. `scripts/benchmark_reference_retrieval.py`
+compares the plans.
+
+The audit rows of a retrieval — its `ai.reference_retrievals` row and one
+`ai.reference_retrieval_results` row per passage — are written by one
+set-based statement (`_insert_retrieval_audits`), by default inside the
+retrieval's own transaction. A caller may instead pass a
+`RetrievalAuditQueue`, which takes the record for a batched write from a
+background thread (`dnd_ai.api.retrieval_audit`). That trades the audit's
+durability for latency: a queued record is lost if the process dies before
+its batch is flushed. A queue that is full or shut down refuses the record,
+and the retrieval writes it synchronously as usual.
 """
 
+import dataclasses
+import itertools
+import time
 import uuid
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Protocol
 
-from sqlalchemy import Connection, Engine, text
+from sqlalchemy import Connection, Engine, Row, text
 
+from dnd_ai.caching import GenerationCache
+from dnd_ai.domain.embeddings import PassageEmbedder
 from dnd_ai.domain.errors import DomainAuthorizationError, SafeMessageError
 
 from ._shared import lookup_id
@@ -69,6 +136,19 @@ class DuplicateFileHashError(SafeMessageError):
     safe_message = "A source document with this file hash is already registered."
 
 
+# Rows per INSERT statement during ingestion. Content is capped at 20,000
+# characters (ck_reference_passages_content_length), so a batch's
+# parameters stay within a few tens of megabytes at worst.
+_PASSAGE_BATCH_SIZE = 1000
+
+# Reciprocal-rank fusion constant (the customary 60): large enough that the
+# top few ranks of either list do not drown out agreement between both.
+_RRF_K = 60
+
+# Candidates kept from each side of a hybrid retrieval before fusion.
+_HYBRID_CANDIDATE_COUNT = 50
+
+
 @dataclass(frozen=True)
 class PassageInput:
     passage_order: int
@@ -92,6 +172,8 @@ class CitedPassage:
     is_house_rule: bool
     rank: int
     relevance_score: float
+    lexical_score: float | None = None
+    vector_score: float | None = None
 
 
 def _register_source_document_impl(
@@ -224,7 +306,11 @@ def register_source_document(
 
 
 def _ingest_reference_passages_impl(
-    connection: Connection, *, source_document_id: uuid.UUID, passages: tuple[PassageInput, ...]
+    connection: Connection,
+    *,
+    source_document_id: uuid.UUID,
+    passages: tuple[PassageInput, ...],
+    embedder: PassageEmbedder | None = None,
 ) -> tuple[uuid.UUID, ...]:
     """The actual work of `ingest_reference_passages()`, on a connection the
     caller already has open. Structured extraction itself (turning a source
@@ -232,7 +318,34 @@ def _ingest_reference_passages_impl(
     operator/tooling step outside this database, per §18.3's own
     "structured extraction ... deterministic passage selection where
     practical" — this command's input is the result of that step, not raw
-    document bytes; no PDF/OCR/NLP pipeline lives in this codebase."""
+    document bytes; no PDF/OCR/NLP pipeline lives in this codebase. With
+    an `embedder`, each passage's vector is stored alongside it."""
+    _require_indexable_source(connection, source_document_id)
+    passage_ids: dict[int, uuid.UUID] = {}
+    for batch in _batched(passages, _PASSAGE_BATCH_SIZE):
+        passage_ids.update(_insert_passage_batch(connection, source_document_id, batch, embedder))
+    return tuple(passage_ids[passage.passage_order] for passage in passages)
+
+
+def _ingest_reference_passage_stream_impl(
+    connection: Connection,
+    *,
+    source_document_id: uuid.UUID,
+    passages: Iterable[PassageInput],
+    embedder: PassageEmbedder | None = None,
+    batch_size: int = _PASSAGE_BATCH_SIZE,
+) -> tuple[uuid.UUID, ...]:
+    """`_ingest_reference_passages_impl` over an iterable consumed one
+    batch at a time. Returns the new ids in ascending `passage_order`,
+    whatever order the stream arrived in."""
+    _require_indexable_source(connection, source_document_id)
+    passage_ids: dict[int, uuid.UUID] = {}
+    for batch in _batched(passages, batch_size):
+        passage_ids.update(_insert_passage_batch(connection, source_document_id, batch, embedder))
+    return tuple(passage_ids[order] for order in sorted(passage_ids))
+
+
+def _require_indexable_source(connection: Connection, source_document_id: uuid.UUID) -> None:
     allow_indexing = connection.execute(
         text("SELECT allow_indexing FROM core.source_documents WHERE source_document_id = :id"),
         {"id": source_document_id},
@@ -242,33 +355,80 @@ def _ingest_reference_passages_impl(
     if not allow_indexing:
         raise SourceDocumentNotIndexableError()
 
-    passage_ids: list[uuid.UUID] = []
-    for passage in passages:
-        passage_id = connection.execute(
-            text("""
-                INSERT INTO ai.reference_passages
-                    (source_document_id, passage_order, chapter, section, page_label,
-                     heading, content)
-                VALUES (:source, :order, :chapter, :section, :page, :heading, :content)
-                RETURNING reference_passage_id
-            """),
-            {
-                "source": source_document_id,
-                "order": passage.passage_order,
-                "chapter": passage.chapter,
-                "section": passage.section,
-                "page": passage.page_label,
-                "heading": passage.heading,
-                "content": passage.content,
-            },
-        ).scalar()
-        assert isinstance(passage_id, uuid.UUID)
-        passage_ids.append(passage_id)
-    return tuple(passage_ids)
+
+def _batched(passages: Iterable[PassageInput], size: int) -> Iterator[list[PassageInput]]:
+    iterator = iter(passages)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _insert_passage_batch(
+    connection: Connection,
+    source_document_id: uuid.UUID,
+    batch: list[PassageInput],
+    embedder: PassageEmbedder | None,
+) -> dict[int, uuid.UUID]:
+    """One statement for the whole batch, keyed by `passage_order` (unique
+    per source — `ux_reference_passages_source_order`), since `RETURNING`
+    makes no promise about row order. Vectors travel as one flat array
+    sliced per row (`_flat_vectors`), since a two-dimensional array
+    parameter would not `unnest` row by row."""
+    vectors, dimensions = _flat_vectors(embedder, [passage.content for passage in batch])
+    rows = connection.execute(
+        text("""
+            INSERT INTO ai.reference_passages
+                (source_document_id, passage_order, chapter, section, page_label,
+                 heading, content, embedding, embedding_model)
+            SELECT :source, p.passage_order, p.chapter, p.section, p.page_label,
+                   p.heading, p.content,
+                   (CAST(:vectors AS real[]))[
+                       (p.n - 1) * CAST(:dimensions AS integer) + 1
+                       : p.n * CAST(:dimensions AS integer)
+                   ],
+                   CAST(:model AS text)
+            FROM unnest(
+                CAST(:orders AS integer[]), CAST(:chapters AS text[]),
+                CAST(:sections AS text[]), CAST(:pages AS text[]),
+                CAST(:headings AS text[]), CAST(:contents AS text[])
+            ) WITH ORDINALITY AS p(passage_order, chapter, section, page_label, heading, content, n)
+            RETURNING passage_order, reference_passage_id
+        """),
+        {
+            "source": source_document_id,
+            "vectors": vectors,
+            "dimensions": dimensions,
+            "model": embedder.model_identifier if embedder is not None else None,
+            "orders": [passage.passage_order for passage in batch],
+            "chapters": [passage.chapter for passage in batch],
+            "sections": [passage.section for passage in batch],
+            "pages": [passage.page_label for passage in batch],
+            "headings": [passage.heading for passage in batch],
+            "contents": [passage.content for passage in batch],
+        },
+    )
+    return {row.passage_order: row.reference_passage_id for row in rows}
+
+
+def _flat_vectors(
+    embedder: PassageEmbedder | None, texts: list[str]
+) -> tuple[list[float] | None, int]:
+    """`texts`' vectors concatenated, and their common length — (None, 0)
+    without an embedder."""
+    if embedder is None:
+        return None, 0
+    vectors = embedder.embed(texts)
+    dimensions = len(vectors[0])
+    if any(len(vector) != dimensions for vector in vectors):
+        raise ValueError(f"{embedder.model_identifier} returned vectors of differing lengths")
+    return [value for vector in vectors for value in vector], dimensions
 
 
 def ingest_reference_passages(
-    engine: Engine, *, source_document_id: uuid.UUID, passages: tuple[PassageInput, ...]
+    engine: Engine,
+    *,
+    source_document_id: uuid.UUID,
+    passages: tuple[PassageInput, ...],
+    embedder: PassageEmbedder | None = None,
 ) -> tuple[uuid.UUID, ...]:
     """Insert the already-extracted, already-structured passages for a
     source document, atomically. Public convenience API: opens and commits
@@ -276,7 +436,94 @@ def ingest_reference_passages(
     composable form."""
     with engine.begin() as connection:
         return _ingest_reference_passages_impl(
-            connection, source_document_id=source_document_id, passages=passages
+            connection, source_document_id=source_document_id, passages=passages, embedder=embedder
+        )
+
+
+def ingest_reference_passage_stream(
+    engine: Engine,
+    *,
+    source_document_id: uuid.UUID,
+    passages: Iterable[PassageInput],
+    embedder: PassageEmbedder | None = None,
+) -> tuple[uuid.UUID, ...]:
+    """Insert a stream of passages for a source document, atomically — all
+    of them or none. Public convenience API: opens and commits its own
+    transaction. See `_ingest_reference_passage_stream_impl()` for the
+    composable form."""
+    with engine.begin() as connection:
+        return _ingest_reference_passage_stream_impl(
+            connection, source_document_id=source_document_id, passages=passages, embedder=embedder
+        )
+
+
+def _embed_reference_passages_impl(
+    connection: Connection,
+    *,
+    source_document_id: uuid.UUID,
+    embedder: PassageEmbedder,
+    batch_size: int = _PASSAGE_BATCH_SIZE,
+) -> int:
+    """(Re-)embeds every passage of a source that has no vector from
+    `embedder` yet — one ingested without an embedder, or under a previous
+    `embedding_model` — in `passage_order` batches. Returns how many
+    passages were updated."""
+    _require_indexable_source(connection, source_document_id)
+    updated = 0
+    after = -1
+    while True:
+        rows = connection.execute(
+            text("""
+                SELECT reference_passage_id, passage_order, content
+                FROM ai.reference_passages
+                WHERE source_document_id = :source
+                  AND passage_order > :after
+                  AND embedding_model IS DISTINCT FROM :model
+                ORDER BY passage_order
+                LIMIT :batch_size
+            """),
+            {
+                "source": source_document_id,
+                "after": after,
+                "model": embedder.model_identifier,
+                "batch_size": batch_size,
+            },
+        ).all()
+        if not rows:
+            return updated
+        vectors, dimensions = _flat_vectors(embedder, [row.content for row in rows])
+        connection.execute(
+            text("""
+                UPDATE ai.reference_passages p
+                SET embedding = (CAST(:vectors AS real[]))[
+                        (u.n - 1) * CAST(:dimensions AS integer) + 1
+                        : u.n * CAST(:dimensions AS integer)
+                    ],
+                    embedding_model = :model
+                FROM unnest(CAST(:ids AS uuid[])) WITH ORDINALITY AS u(reference_passage_id, n)
+                WHERE p.reference_passage_id = u.reference_passage_id
+            """),
+            {
+                "ids": [row.reference_passage_id for row in rows],
+                "vectors": vectors,
+                "dimensions": dimensions,
+                "model": embedder.model_identifier,
+            },
+        )
+        updated += len(rows)
+        after = rows[-1].passage_order
+
+
+def embed_reference_passages(
+    engine: Engine, *, source_document_id: uuid.UUID, embedder: PassageEmbedder
+) -> int:
+    """Backfill or refresh a source's passage vectors for `embedder`,
+    atomically. Public convenience API: opens and commits its own
+    transaction. See `_embed_reference_passages_impl()` for the composable
+    form."""
+    with engine.begin() as connection:
+        return _embed_reference_passages_impl(
+            connection, source_document_id=source_document_id, embedder=embedder
         )
 
 
@@ -381,6 +628,100 @@ def remove_source_document(
         )
 
 
+@dataclass(frozen=True)
+class RetrievalAuditRecord:
+    """One retrieval's audit rows, as `_insert_retrieval_audits` writes
+    them. `created_at` is None when written in the retrieval's own
+    transaction (the column's `now()`), and the retrieval time when the
+    record is queued for a background writer."""
+
+    reference_retrieval_id: uuid.UUID
+    campaign_id: uuid.UUID
+    ruleset_version_id: uuid.UUID
+    query_text: str
+    requested_by_user_id: uuid.UUID | None
+    context_request_id: uuid.UUID | None
+    embedding_model: str | None
+    passages: tuple[CitedPassage, ...]
+    created_at: datetime | None = None
+
+
+class RetrievalAuditQueue(Protocol):
+    def submit(self, record: RetrievalAuditRecord) -> bool:
+        """Queue `record` for a later batched write. False means it was
+        not queued and the caller must write it itself."""
+        ...
+
+
+_RetrievalCacheKey = tuple[uuid.UUID, str, str, int, str | None]
+
+
+class ReferenceRetrievalCache(GenerationCache[_RetrievalCacheKey, tuple[CitedPassage, ...]]):
+    """See this module's docstring: a `GenerationCache` keyed on the
+    corpus state and query, at the campaign's retrieval generation, so
+    every retrieval ranks afresh when disabled. `latency_saved_seconds`
+    counts how long the ranking query took."""
+
+
+def _normalize_query_text(query_text: str) -> str:
+    """Case and whitespace never change a ranking: `websearch_to_tsquery`
+    lowercases its input and splits on whitespace, and so does
+    `dnd_ai.domain.embeddings.HashingEmbedder`."""
+    return " ".join(query_text.split()).lower()
+
+
+@dataclass(frozen=True)
+class _CorpusState:
+    ruleset_version_id: uuid.UUID
+    generation: int
+    source_fingerprint: str
+
+
+def _read_corpus_state(connection: Connection, *, campaign_id: uuid.UUID) -> _CorpusState:
+    """The campaign's ruleset version, that version's corpus generation (0
+    before any corpus write), and an md5 over the campaign's authorized
+    sources and house-rule flags (`ai.campaign_authorized_sources`, the
+    ranking queries' own source set), in one statement."""
+    row = connection.execute(
+        text("""
+            SELECT
+                c.ruleset_version_id,
+                COALESCE(g.generation, 0) AS generation,
+                (
+                    SELECT md5(COALESCE(string_agg(
+                        s.source_document_id::text || ':' || s.is_house_rule::text,
+                        ',' ORDER BY s.source_document_id
+                    ), ''))
+                    FROM ai.campaign_authorized_sources s
+                    WHERE s.campaign_id = c.campaign_id
+                ) AS source_fingerprint
+            FROM campaign.campaigns c
+            LEFT JOIN ai.reference_corpus_generations g
+                ON g.ruleset_version_id = c.ruleset_version_id
+            WHERE c.campaign_id = :campaign
+        """),
+        {"campaign": campaign_id},
+    ).one_or_none()
+    if row is None:
+        raise SourceDocumentNotFoundError(f"campaign {campaign_id} not found")
+    return _CorpusState(
+        ruleset_version_id=row.ruleset_version_id,
+        generation=int(row.generation),
+        source_fingerprint=row.source_fingerprint,
+    )
+
+
+def _campaign_ruleset_version_id(connection: Connection, *, campaign_id: uuid.UUID) -> uuid.UUID:
+    ruleset_version_id = connection.execute(
+        text("SELECT ruleset_version_id FROM campaign.campaigns WHERE campaign_id = :campaign"),
+        {"campaign": campaign_id},
+    ).scalar()
+    if ruleset_version_id is None:
+        raise SourceDocumentNotFoundError(f"campaign {campaign_id} not found")
+    assert isinstance(ruleset_version_id, uuid.UUID)
+    return ruleset_version_id
+
+
 def _retrieve_cited_passages_impl(
     connection: Connection,
     *,
@@ -389,34 +730,200 @@ def _retrieve_cited_passages_impl(
     requested_by_user_id: uuid.UUID | None,
     context_request_id: uuid.UUID | None,
     limit: int,
+    embedder: PassageEmbedder | None = None,
+    cache: ReferenceRetrievalCache | None = None,
+    audit_queue: RetrievalAuditQueue | None = None,
 ) -> tuple[CitedPassage, ...]:
-    ruleset_version_id = connection.execute(
-        text("SELECT ruleset_version_id FROM campaign.campaigns WHERE campaign_id = :campaign"),
-        {"campaign": campaign_id},
-    ).scalar()
-    if ruleset_version_id is None:
-        raise SourceDocumentNotFoundError(f"campaign {campaign_id} not found")
+    embedding_model = embedder.model_identifier if embedder is not None else None
+    passages: tuple[CitedPassage, ...] | None = None
+    state: _CorpusState | None = None
+    cache_key: _RetrievalCacheKey | None = None
+    if cache is not None and cache.enabled:
+        state = _read_corpus_state(connection, campaign_id=campaign_id)
+        ruleset_version_id = state.ruleset_version_id
+        cache_key = (
+            ruleset_version_id,
+            state.source_fingerprint,
+            _normalize_query_text(query_text),
+            limit,
+            embedding_model,
+        )
+        passages = cache.lookup(cache_key, generation=state.generation)
+    else:
+        ruleset_version_id = _campaign_ruleset_version_id(connection, campaign_id=campaign_id)
 
-    rows = connection.execute(
+    if passages is None:
+        started = time.perf_counter()
+        passages = _rank_cited_passages(
+            connection,
+            campaign_id=campaign_id,
+            ruleset_version_id=ruleset_version_id,
+            query_text=query_text,
+            limit=limit,
+            embedder=embedder,
+        )
+        if cache is not None and state is not None and cache_key is not None:
+            cache.store(
+                cache_key,
+                passages,
+                generation=state.generation,
+                compute_seconds=time.perf_counter() - started,
+            )
+
+    record = RetrievalAuditRecord(
+        reference_retrieval_id=uuid.uuid4(),
+        campaign_id=campaign_id,
+        ruleset_version_id=ruleset_version_id,
+        query_text=query_text,
+        requested_by_user_id=requested_by_user_id,
+        context_request_id=context_request_id,
+        embedding_model=embedding_model,
+        passages=passages,
+        created_at=datetime.now(UTC) if audit_queue is not None else None,
+    )
+    if audit_queue is None or not audit_queue.submit(record):
+        _insert_retrieval_audits(connection, (dataclasses.replace(record, created_at=None),))
+    return passages
+
+
+def _rank_cited_passages(
+    connection: Connection,
+    *,
+    campaign_id: uuid.UUID,
+    ruleset_version_id: uuid.UUID,
+    query_text: str,
+    limit: int,
+    embedder: PassageEmbedder | None,
+) -> tuple[CitedPassage, ...]:
+    if embedder is None:
+        rows = _lexical_candidates(
+            connection,
+            campaign_id=campaign_id,
+            ruleset_version_id=ruleset_version_id,
+            query_text=query_text,
+            limit=limit,
+        )
+    else:
+        rows = _hybrid_candidates(
+            connection,
+            campaign_id=campaign_id,
+            ruleset_version_id=ruleset_version_id,
+            query_text=query_text,
+            query_vector=embedder.embed([query_text])[0],
+            embedding_model=embedder.model_identifier,
+            limit=limit,
+        )
+    return tuple(
+        CitedPassage(
+            reference_passage_id=row.reference_passage_id,
+            source_document_id=row.source_document_id,
+            source_title=row.title,
+            chapter=row.chapter,
+            section=row.section,
+            page_label=row.page_label,
+            heading=row.heading,
+            content=row.content,
+            is_house_rule=row.is_house_rule,
+            rank=rank,
+            relevance_score=float(row.relevance_score),
+            lexical_score=_optional_float(row.lexical_score),
+            vector_score=_optional_float(row.vector_score),
+        )
+        for rank, row in enumerate(rows, start=1)
+    )
+
+
+def _insert_retrieval_audits(
+    connection: Connection, records: Sequence[RetrievalAuditRecord]
+) -> None:
+    """Every record's `ai.reference_retrievals` row and all of their
+    `ai.reference_retrieval_results` rows in one statement: the retrievals
+    are inserted by a data-modifying CTE the results then join against.
+    A synchronous retrieval passes one record; the background writer
+    (`dnd_ai.api.retrieval_audit`) a whole batch."""
+    results = [(record, passage) for record in records for passage in record.passages]
+    connection.execute(
+        text("""
+            WITH retrievals AS (
+                INSERT INTO ai.reference_retrievals
+                    (reference_retrieval_id, campaign_id, requested_by_user_id,
+                     context_request_id, query_text, ruleset_version_id, retrieval_mode,
+                     embedding_model, created_at)
+                SELECT r.reference_retrieval_id, r.campaign_id, r.requested_by_user_id,
+                       r.context_request_id, r.query_text, r.ruleset_version_id,
+                       CASE WHEN r.embedding_model IS NULL THEN 'lexical' ELSE 'hybrid' END,
+                       r.embedding_model, COALESCE(r.created_at, now())
+                FROM unnest(
+                    CAST(:retrieval_ids AS uuid[]), CAST(:campaigns AS uuid[]),
+                    CAST(:requested_by AS uuid[]), CAST(:context_requests AS uuid[]),
+                    CAST(:queries AS text[]), CAST(:ruleset_versions AS uuid[]),
+                    CAST(:embedding_models AS text[]), CAST(:created_at AS timestamptz[])
+                ) AS r(reference_retrieval_id, campaign_id, requested_by_user_id,
+                       context_request_id, query_text, ruleset_version_id, embedding_model,
+                       created_at)
+                RETURNING reference_retrieval_id
+            )
+            INSERT INTO ai.reference_retrieval_results
+                (reference_retrieval_id, reference_passage_id, rank, relevance_score,
+                 lexical_score, vector_score)
+            SELECT x.reference_retrieval_id, x.reference_passage_id, x.rank, x.relevance_score,
+                   x.lexical_score, x.vector_score
+            FROM unnest(
+                CAST(:result_retrieval_ids AS uuid[]), CAST(:passages AS uuid[]),
+                CAST(:ranks AS integer[]), CAST(:scores AS real[]),
+                CAST(:lexical_scores AS real[]), CAST(:vector_scores AS real[])
+            ) AS x(reference_retrieval_id, reference_passage_id, rank, relevance_score,
+                   lexical_score, vector_score)
+            JOIN retrievals USING (reference_retrieval_id)
+        """),
+        {
+            "retrieval_ids": [record.reference_retrieval_id for record in records],
+            "campaigns": [record.campaign_id for record in records],
+            "requested_by": [record.requested_by_user_id for record in records],
+            "context_requests": [record.context_request_id for record in records],
+            "queries": [record.query_text for record in records],
+            "ruleset_versions": [record.ruleset_version_id for record in records],
+            "embedding_models": [record.embedding_model for record in records],
+            "created_at": [record.created_at for record in records],
+            "result_retrieval_ids": [record.reference_retrieval_id for record, _ in results],
+            "passages": [passage.reference_passage_id for _, passage in results],
+            "ranks": [passage.rank for _, passage in results],
+            "scores": [passage.relevance_score for _, passage in results],
+            "lexical_scores": [passage.lexical_score for _, passage in results],
+            "vector_scores": [passage.vector_score for _, passage in results],
+        },
+    )
+
+
+def _optional_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def _lexical_candidates(
+    connection: Connection,
+    *,
+    campaign_id: uuid.UUID,
+    ruleset_version_id: uuid.UUID,
+    query_text: str,
+    limit: int,
+) -> Sequence[Row[Any]]:
+    return connection.execute(
         text("""
             SELECT
                 p.reference_passage_id, p.source_document_id, sd.title, p.chapter, p.section,
-                p.page_label, p.heading, p.content,
-                COALESCE(bool_or(rsc.is_house_rule), false) AS is_house_rule,
-                ts_rank(p.content_tsv, websearch_to_tsquery('english', :query)) AS relevance_score
-            FROM ai.reference_passages p
-            JOIN core.source_documents sd ON sd.source_document_id = p.source_document_id
-            LEFT JOIN ai.reference_source_campaigns rsc
-                ON rsc.source_document_id = sd.source_document_id
-               AND rsc.campaign_id = :campaign
-               AND rsc.revoked_at IS NULL
-            WHERE sd.status = 'active'
+                p.page_label, p.heading, p.content, cas.is_house_rule,
+                lexical.score AS relevance_score, lexical.score AS lexical_score,
+                CAST(NULL AS real) AS vector_score
+            FROM ai.campaign_authorized_sources cas
+            JOIN core.source_documents sd ON sd.source_document_id = cas.source_document_id
+            JOIN ai.reference_passages p ON p.source_document_id = cas.source_document_id
+            CROSS JOIN LATERAL (
+                SELECT ts_rank(p.content_tsv, websearch_to_tsquery('english', :query)) AS score
+            ) lexical
+            WHERE cas.campaign_id = :campaign
               AND sd.ruleset_version_id = :ruleset_version
-              AND (sd.visibility = 'general' OR rsc.reference_source_campaign_id IS NOT NULL)
               AND p.content_tsv @@ websearch_to_tsquery('english', :query)
-            GROUP BY p.reference_passage_id, p.source_document_id, sd.title, p.chapter,
-                     p.section, p.page_label, p.heading, p.content
-            ORDER BY is_house_rule DESC, relevance_score DESC, p.passage_order ASC
+            ORDER BY cas.is_house_rule DESC, relevance_score DESC, p.passage_order ASC
             LIMIT :limit
         """),
         {
@@ -427,55 +934,98 @@ def _retrieve_cited_passages_impl(
         },
     ).all()
 
-    retrieval_id = connection.execute(
+
+def _hybrid_candidates(
+    connection: Connection,
+    *,
+    campaign_id: uuid.UUID,
+    ruleset_version_id: uuid.UUID,
+    query_text: str,
+    query_vector: list[float],
+    embedding_model: str,
+    limit: int,
+) -> Sequence[Row[Any]]:
+    """See this module's docstring. The authorization filter is the
+    lexical path's own (the campaign's `ai.campaign_authorized_sources`
+    rows, same ruleset version), resolved once per source in `sources`.
+    Vectors are unit length, so the dot product is the cosine; a
+    non-positive one is no evidence of relevance and never makes a
+    passage a vector candidate."""
+    return connection.execute(
         text("""
-            INSERT INTO ai.reference_retrievals
-                (campaign_id, requested_by_user_id, context_request_id, query_text,
-                 ruleset_version_id)
-            VALUES (:campaign, :requested_by, :context_request, :query, :ruleset_version)
-            RETURNING reference_retrieval_id
+            WITH sources AS (
+                SELECT sd.source_document_id, sd.title, cas.is_house_rule
+                FROM ai.campaign_authorized_sources cas
+                JOIN core.source_documents sd ON sd.source_document_id = cas.source_document_id
+                WHERE cas.campaign_id = :campaign
+                  AND sd.ruleset_version_id = :ruleset_version
+            ),
+            lexical_scores AS (
+                SELECT p.reference_passage_id, p.passage_order, s.is_house_rule,
+                       ts_rank(p.content_tsv, websearch_to_tsquery('english', :query)) AS score
+                FROM ai.reference_passages p
+                JOIN sources s ON s.source_document_id = p.source_document_id
+                WHERE p.content_tsv @@ websearch_to_tsquery('english', :query)
+            ),
+            lexical AS (
+                SELECT reference_passage_id, score,
+                       row_number() OVER (
+                           ORDER BY is_house_rule DESC, score DESC, passage_order
+                       ) AS rank
+                FROM lexical_scores
+                ORDER BY rank
+                LIMIT :candidates
+            ),
+            vector_scores AS (
+                SELECT p.reference_passage_id, p.passage_order, s.is_house_rule,
+                       (
+                           SELECT sum(a * b)
+                           FROM unnest(p.embedding, CAST(:query_vector AS real[])) AS v(a, b)
+                       ) AS score
+                FROM ai.reference_passages p
+                JOIN sources s ON s.source_document_id = p.source_document_id
+                WHERE p.embedding_model = :embedding_model
+            ),
+            vector AS (
+                SELECT reference_passage_id, score,
+                       row_number() OVER (
+                           ORDER BY is_house_rule DESC, score DESC, passage_order
+                       ) AS rank
+                FROM vector_scores
+                WHERE score > 0
+                ORDER BY rank
+                LIMIT :candidates
+            ),
+            fused AS (
+                SELECT reference_passage_id,
+                       l.score AS lexical_score,
+                       v.score AS vector_score,
+                       COALESCE(1.0 / (:rrf_k + l.rank), 0)
+                           + COALESCE(1.0 / (:rrf_k + v.rank), 0) AS relevance_score
+                FROM lexical l
+                FULL JOIN vector v USING (reference_passage_id)
+            )
+            SELECT
+                p.reference_passage_id, p.source_document_id, s.title, p.chapter, p.section,
+                p.page_label, p.heading, p.content, s.is_house_rule,
+                f.relevance_score, f.lexical_score, f.vector_score
+            FROM fused f
+            JOIN ai.reference_passages p ON p.reference_passage_id = f.reference_passage_id
+            JOIN sources s ON s.source_document_id = p.source_document_id
+            ORDER BY s.is_house_rule DESC, f.relevance_score DESC, p.passage_order ASC
+            LIMIT :limit
         """),
         {
             "campaign": campaign_id,
-            "requested_by": requested_by_user_id,
-            "context_request": context_request_id,
-            "query": query_text,
             "ruleset_version": ruleset_version_id,
+            "query": query_text,
+            "query_vector": query_vector,
+            "embedding_model": embedding_model,
+            "candidates": max(limit, _HYBRID_CANDIDATE_COUNT),
+            "rrf_k": _RRF_K,
+            "limit": limit,
         },
-    ).scalar()
-    assert isinstance(retrieval_id, uuid.UUID)
-
-    results = []
-    for rank, row in enumerate(rows, start=1):
-        connection.execute(
-            text("""
-                INSERT INTO ai.reference_retrieval_results
-                    (reference_retrieval_id, reference_passage_id, rank, relevance_score)
-                VALUES (:retrieval, :passage, :rank, :score)
-            """),
-            {
-                "retrieval": retrieval_id,
-                "passage": row.reference_passage_id,
-                "rank": rank,
-                "score": float(row.relevance_score),
-            },
-        )
-        results.append(
-            CitedPassage(
-                reference_passage_id=row.reference_passage_id,
-                source_document_id=row.source_document_id,
-                source_title=row.title,
-                chapter=row.chapter,
-                section=row.section,
-                page_label=row.page_label,
-                heading=row.heading,
-                content=row.content,
-                is_house_rule=row.is_house_rule,
-                rank=rank,
-                relevance_score=float(row.relevance_score),
-            )
-        )
-    return tuple(results)
+    ).all()
 
 
 def retrieve_cited_passages(
@@ -486,6 +1036,9 @@ def retrieve_cited_passages(
     requested_by_user_id: uuid.UUID | None = None,
     context_request_id: uuid.UUID | None = None,
     limit: int = 5,
+    embedder: PassageEmbedder | None = None,
+    cache: ReferenceRetrievalCache | None = None,
+    audit_queue: RetrievalAuditQueue | None = None,
 ) -> tuple[CitedPassage, ...]:
     """Retrieve cited passages for `query_text`, filtered to the campaign's
     own selected ruleset/edition and authorized sources, ordered by §18.3's
@@ -493,12 +1046,18 @@ def retrieve_cited_passages(
     retrieval for audit (`ai.reference_retrievals`/
     `.reference_retrieval_results`). Opens and commits its own transaction
     — see this module's docstring for why this is a command, not a query,
-    despite being read-mostly.
+    despite being read-mostly. With an `embedder` the ranking is hybrid
+    (lexical and vector, fused — see this module's docstring); without
+    one it is full-text relevance alone. With a `cache` an unchanged corpus
+    answers a repeated query without ranking it again (see this module's
+    docstring); the retrieval is audited either way. With an
+    `audit_queue` that accepts the record, the audit rows are written
+    later by a background writer instead of in this transaction.
 
     A conflicting edition is excluded structurally (`sd.ruleset_version_id
     = :ruleset_version`, the campaign's own pinned version — never any
     other edition's passages, even from an otherwise-authorized source);
-    an unauthorized source is excluded by the `visibility`/grant predicate.
+    an unauthorized source has no `ai.campaign_authorized_sources` row.
     Passages from a source with `usage_rights_status = 'pending_review'`
     are still retrievable once ingested — this function does not
     re-validate usage rights on every read, matching `docs/architecture/
@@ -514,4 +1073,7 @@ def retrieve_cited_passages(
             requested_by_user_id=requested_by_user_id,
             context_request_id=context_request_id,
             limit=limit,
+            embedder=embedder,
+            cache=cache,
+            audit_queue=audit_queue,
         )
@@ -214,6 +214,17 @@ _APPLICATION_SETTINGS_ENV_VARS = frozenset(
         "DND_AI_LOG_LEVEL",
         "DND_AI_DATABASE_URL",
         "DATABASE_URL",
+        "DND_AI_DATABASE_POOL_SIZE",
+        "DND_AI_DATABASE_MAX_OVERFLOW",
+        "DND_AI_DATABASE_POOL_TIMEOUT_SECONDS",
+        "DND_AI_DATABASE_POOL_RECYCLE_SECONDS",
+        "DND_AI_DATABASE_POOL_PRE_PING",
+        "DND_AI_DATABASE_STATEMENT_TIMEOUT_MS",
+        "DND_AI_DATABASE_LOCK_TIMEOUT_MS",
+        "DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE",
+        "DND_AI_DATABASE_READ_REPLICA_URL",
+        "DND_AI_DATABASE_READ_REPLICA_MAX_LAG_SECONDS",
+        "DND_AI_DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS",
         "DND_AI_FEATURE_AI_NPC_DIALOGUE",
         "DND_AI_FEATURE_DISCORD_INTEGRATION",
         "DND_AI_FEATURE_FOUNDRY_INTEGRATION",
@@ -225,6 +236,34 @@ _APPLICATION_SETTINGS_ENV_VARS = frozenset(
         "DND_AI_AI_PROVIDER_API_KEY",
         "DND_AI_AI_PROVIDER_MODEL",
         "DND_AI_AI_PROVIDER_BASE_URL",
+        "DND_AI_AI_PROVIDER_MAX_CONNECTIONS",
+        "DND_AI_AI_PROVIDER_MAX_KEEPALIVE_CONNECTIONS",
+        "DND_AI_AI_PROVIDER_KEEPALIVE_EXPIRY_SECONDS",
+        "DND_AI_AI_PROVIDER_HTTP2",
+        "DND_AI_REFERENCE_EMBEDDER",
+        "DND_AI_REFERENCE_EMBEDDING_DIMENSIONS",
+        "DND_AI_ACCESS_CONTEXT_CACHE_MAX_ENTRIES",
+        "DND_AI_ACCESS_CONTEXT_CACHE_TTL_SECONDS",
+        "DND_AI_OIDC_TOKEN_CACHE_MAX_ENTRIES",
+        "DND_AI_OIDC_TOKEN_CACHE_MAX_TTL_SECONDS",
+        "DND_AI_EXTERNAL_IDENTITY_CACHE_MAX_ENTRIES",
+        "DND_AI_EXTERNAL_IDENTITY_CACHE_TTL_SECONDS",
+        "DND_AI_FOUNDRY_PRINCIPAL_CACHE_MAX_ENTRIES",
+        "DND_AI_FOUNDRY_PRINCIPAL_CACHE_TTL_SECONDS",
+        "DND_AI_REFERENCE_RETRIEVAL_CACHE_MAX_ENTRIES",
+        "DND_AI_REFERENCE_RETRIEVAL_CACHE_TTL_SECONDS",
+        "DND_AI_NPC_CONTEXT_CACHE_MAX_ENTRIES",
+        "DND_AI_NPC_CONTEXT_CACHE_TTL_SECONDS",
+        "DND_AI_ENCOUNTER_WORKING_SET_CACHE_MAX_ENTRIES",
+        "DND_AI_PROMPT_TOKENIZER",
+        "DND_AI_NPC_PROMPT_MAX_TOKENS",
+        "DND_AI_SYNTHESIS_PROMPT_MAX_TOKENS",
+        "DND_AI_NPC_TURN_SINGLE_FLIGHT",
+        "DND_AI_NPC_TURN_MAX_QUEUED",
+        "DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE",
+        "DND_AI_REFERENCE_RETRIEVAL_AUDIT_BATCH_SIZE",
+        "DND_AI_REFERENCE_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS",
+        "DND_AI_REFERENCE_RETRIEVAL_AUDIT_MAX_QUEUED",
     }
 )
 
@@ -426,6 +465,35 @@ class Settings(BaseSettings):
     # compatibility only, deliberately excluded from the production check.
     legacy_database_url: str | None = Field(default=None, validation_alias="DATABASE_URL")
 
+    # Connection pool and server-side timeouts for every engine
+    # dnd_ai.api.deps builds (see _validate_database_timeouts). The two
+    # timeouts are milliseconds with PostgreSQL's own meaning — 0 disables
+    # them — and are sent as connection startup options, so they bound
+    # every statement on every pooled connection, pg_advisory_lock waits
+    # included. advisory_lock_pool_size > 0 gives
+    # dnd_ai.commands.integration.apply_foundry_combat_sync's long-held
+    # lock connections their own small pool (no overflow) instead of the
+    # request pool; 0 keeps them on the request pool.
+    database_pool_size: int = Field(default=5, ge=1)
+    database_max_overflow: int = Field(default=10, ge=0)
+    database_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    database_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+    database_pool_pre_ping: bool = True
+    database_statement_timeout_ms: int = Field(default=0, ge=0)
+    database_lock_timeout_ms: int = Field(default=0, ge=0)
+    database_advisory_lock_pool_size: int = Field(default=0, ge=0)
+
+    # Optional read replica for dnd_ai.api.deps.get_read_connection (the
+    # dnd_ai.queries.* GET routes). Unset, every read uses the primary.
+    # Reads fall back to the primary whenever the replica's measured replay
+    # lag exceeds max_lag_seconds or cannot be measured; the measurement is
+    # refreshed at most once per lag_check_interval_seconds. Point it at a
+    # login with SELECT only (app_read_only) — get_read_connection also opens
+    # every replica transaction READ ONLY, but the role is the real guarantee.
+    database_read_replica_url: str | None = None
+    database_read_replica_max_lag_seconds: float = Field(default=5.0, gt=0)
+    database_read_replica_lag_check_interval_seconds: float = Field(default=1.0, ge=0)
+
     feature_ai_npc_dialogue: bool = False
     feature_discord_integration: bool = False
     feature_foundry_integration: bool = False
@@ -456,6 +524,99 @@ class Settings(BaseSettings):
     ai_provider_model: str = "gpt-4o"
     ai_provider_base_url: str = _DEFAULT_OPENAI_BASE_URL
 
+    # Connection pool of the long-lived HTTP client every provider call goes
+    # through (dnd_ai.domain.ai_provider.build_async_ai_http_client, owned by
+    # dnd_ai.api.ai_npc.get_ai_http_client). ai_provider_http2 only takes
+    # effect when the optional h2 package is installed.
+    ai_provider_max_connections: int = Field(default=20, ge=1)
+    ai_provider_max_keepalive_connections: int = Field(default=10, ge=0)
+    ai_provider_keepalive_expiry_seconds: float = Field(default=30.0, ge=0)
+    ai_provider_http2: bool = True
+
+    # Local passage embedder for the reference corpus's hybrid retrieval
+    # (dnd_ai.domain.embeddings.build_passage_embedder). "none" keeps
+    # retrieval lexical-only and ingestion embedding-free; changing either
+    # setting changes the embedder's model identifier, so passages embedded
+    # under the old one are ignored by hybrid queries until re-embedded.
+    reference_embedder: Literal["none", "hashing"] = "none"
+    reference_embedding_dimensions: int = Field(default=256, ge=16, le=4096)
+
+    # Cross-request AccessContext cache (dnd_ai.api.access_cache). Entries
+    # are invalidated by migration 099's per-campaign security generation
+    # and by their own rows' expires_at; the TTL is only a backstop.
+    # max_entries=0 disables the cache (plain per-request resolution).
+    access_context_cache_max_entries: int = Field(default=10_000, ge=0)
+    access_context_cache_ttl_seconds: float = Field(default=60.0, gt=0)
+
+    # Verified-bearer-token cache (dnd_ai.domain.tokens.VerifiedTokenCache).
+    # An entry never outlives its token's exp minus leeway; max_ttl_seconds
+    # additionally bounds how long a rotated-out signing key keeps vouching
+    # for tokens it already verified. max_entries=0 disables it.
+    oidc_token_cache_max_entries: int = Field(default=10_000, ge=0)
+    oidc_token_cache_max_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # (issuer, subject) -> user_id cache (dnd_ai.api.identity_cache). No
+    # generation backs this one, so the TTL *is* how long an identity
+    # revocation or user deactivation can lag; keep it short.
+    # max_entries=0 disables it.
+    external_identity_cache_max_entries: int = Field(default=10_000, ge=0)
+    external_identity_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+
+    # Foundry-adapter principal cache (dnd_ai.api.foundry_principal_cache).
+    # Invalidated by migration 100's per-system credential generation; the
+    # TTL is the configured maximum for accepting a cached credential at all.
+    # max_entries=0 disables it.
+    foundry_principal_cache_max_entries: int = Field(default=1_000, ge=0)
+    foundry_principal_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+
+    # Reference-corpus retrieval result cache (dnd_ai.commands.
+    # reference_corpus.ReferenceRetrievalCache). Invalidated by migration
+    # 103's per-ruleset-version corpus generation; the TTL is only a
+    # backstop. max_entries=0 disables it.
+    reference_retrieval_cache_max_entries: int = Field(default=1_000, ge=0)
+    reference_retrieval_cache_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # NPC-conversation context cache (dnd_ai.commands.ai_npc.
+    # NpcContextCache). Invalidated by migration 106's per-timeline
+    # NPC-context generation; the TTL is only a backstop. max_entries=0
+    # disables it.
+    npc_context_cache_max_entries: int = Field(default=1_000, ge=0)
+    npc_context_cache_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # Encounter working-set cache (dnd_ai.commands.encounters.
+    # EncounterWorkingSetCache). Checked against migration 108's
+    # per-encounter working_set_version under the encounter lock, so it
+    # needs no TTL. max_entries=0 disables it.
+    encounter_working_set_cache_max_entries: int = Field(default=1_000, ge=0)
+
+    # Prompt-size budgets (dnd_ai.domain.prompt_budget). Assembled NPC and
+    # synthesis contexts lose their lowest-priority items until their
+    # estimated size fits; every snapshot records its token counts either
+    # way. A budget of 0 disables trimming.
+    prompt_tokenizer: Literal["approximate", "characters"] = "approximate"
+    npc_prompt_max_tokens: int = Field(default=6_000, ge=0)
+    synthesis_prompt_max_tokens: int = Field(default=6_000, ge=0)
+
+    # Per-NPC turn serialization (dnd_ai.commands.ai_npc.NpcTurnGate). One
+    # turn per agent assignment runs at a time in this process, with at
+    # most npc_turn_max_queued waiting behind it; the next is refused with
+    # a 429. Disabling it lets concurrent turns for one NPC run in parallel.
+    npc_turn_single_flight: bool = True
+    npc_turn_max_queued: int = Field(default=4, ge=0)
+
+    # Reference-retrieval audit durability (dnd_ai.api.retrieval_audit).
+    # "sync" writes each retrieval's audit rows in its own transaction;
+    # "async" queues them for a background writer that flushes batches of
+    # up to batch_size at most flush_interval_seconds after the first
+    # queued record. A crash loses whatever is not yet committed: up to
+    # max_queued queued records plus the batch_size batch being written,
+    # when a slow database has let the queue fill. A full queue falls back
+    # to a synchronous write.
+    reference_retrieval_audit_mode: Literal["sync", "async"] = "sync"
+    reference_retrieval_audit_batch_size: int = Field(default=500, ge=1)
+    reference_retrieval_audit_flush_interval_seconds: float = Field(default=1.0, gt=0)
+    reference_retrieval_audit_max_queued: int = Field(default=10_000, ge=1)
+
     @model_validator(mode="after")
     def _resolve_database_url(self) -> "Settings":
         """No silent fallback to the local development database/credentials
@@ -487,6 +648,22 @@ class Settings(BaseSettings):
         )
         return self
 
+    @model_validator(mode="after")
+    def _validate_database_timeouts(self) -> "Settings":
+        """A lock_timeout at or above a non-zero statement_timeout can never
+        fire — the statement timeout always aborts the lock wait first — so
+        a configuration that sets both that way is rejected rather than
+        silently ignoring one of them."""
+        statement_ms = self.database_statement_timeout_ms
+        lock_ms = self.database_lock_timeout_ms
+        if statement_ms and lock_ms and lock_ms >= statement_ms:
+            raise ValueError(
+                "DND_AI_DATABASE_LOCK_TIMEOUT_MS must be lower than "
+                "DND_AI_DATABASE_STATEMENT_TIMEOUT_MS when both are set "
+                f"(got {lock_ms} and {statement_ms})."
+            )
+        return self
+
     @model_validator(mode="after")
     def _require_app_read_write_identity_in_production(self) -> "Settings":
         """Static half of the app_read_write enforcement (finding: a stale
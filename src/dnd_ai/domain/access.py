@@ -45,6 +45,7 @@ Deferred to later Phase 10 workstreams, per §19.7's own step list:
 import hashlib
 import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
 
 from sqlalchemy import Connection, text
 
@@ -77,9 +78,16 @@ class AccessContext:
     """A resolved snapshot of one user's effective access to one campaign
     timeline, per docs/architecture/DATABASE_MODEL.md §19.7 steps 1-7.
 
-    Resolve fresh per request rather than caching across requests — roles,
-    relationships, and grants can change between calls, and nothing here
-    subscribes to invalidation.
+    Roles, relationships, and grants can change between calls, so a
+    context is never cached across requests on its own authority: the one
+    cross-request cache (`dnd_ai.api.access_cache.AccessContextCache`)
+    reuses a context only while its campaign's trigger-maintained security
+    generation (`read_campaign_security_generation`, migration 099) is
+    unchanged and the database clock is still before `valid_until` — the
+    earliest `expires_at` among the role assignments, character
+    relationships, and resource grants this context was resolved from
+    (`None` if none of them expire). Expiry is the one change no row write
+    announces, so it has to travel with the context itself.
 
     `principal`, when set, is the full `AuthenticatedPrincipal` this context
     was resolved for — `dnd_ai.api.access.require_campaign_capability`
@@ -103,6 +111,7 @@ class AccessContext:
     character_capabilities: dict[uuid.UUID, frozenset[str]]
     grant_effects: dict[_GrantKey, dict[str, str]] = field(repr=False)
     principal: "AuthenticatedPrincipal | None" = None
+    valid_until: datetime | None = field(default=None, repr=False, compare=False)
 
     def has_capability(
         self,
@@ -515,6 +524,27 @@ def resolve_foundry_system_principal(
     )
 
 
+def read_foundry_credential_generation(
+    connection: Connection, *, external_system_id: uuid.UUID
+) -> int | None:
+    """The external system's current `credential_generation` — bumped by
+    trigger, in the writing transaction itself, on every change to a row
+    `resolve_foundry_system_principal` reads for it (migration 100). None if
+    the system does not exist, which a caller must treat as "nothing to
+    compare against," never as a match.
+
+    Read this *before* resolving a principal it will be stored against, for
+    the same reason `read_campaign_security_generation` gives."""
+    return connection.execute(
+        text("""
+            SELECT credential_generation
+            FROM integration.external_systems
+            WHERE external_system_id = :system
+        """),
+        {"system": external_system_id},
+    ).scalar_one_or_none()
+
+
 class UnauthorizedTimelineError(DomainAuthorizationError):
     """Raised by `resolve_access_context()` when a caller-supplied
     `timeline_id` is not the campaign's own pinned timeline. A domain
@@ -559,32 +589,122 @@ def resolve_access_context(
     capabilities or resource grants (finding 2) — a branch timeline is
     rejected exactly like an unrelated same-world or different-world one,
     since none of them are the campaign's own timeline.
+
+    One round trip: membership, campaign timeline, role capabilities,
+    character capabilities, and grant effects are all resolved by a single
+    CTE statement, which also folds deny-overrides-allow per (target,
+    capability) server-side (`bool_or`) and returns `valid_until` as the
+    `LEAST` of each source's earliest `expires_at`. Python only reshapes the
+    arrays/JSON it returns into an `AccessContext`. Character IDs and grant
+    target IDs come back as JSON strings and are parsed here.
     """
-    membership_id = connection.execute(
-        text("""
-            SELECT cm.campaign_membership_id
-            FROM security.campaign_memberships cm
-            JOIN security.membership_statuses ms
-              ON ms.membership_status_id = cm.membership_status_id
-            WHERE cm.campaign_id = :campaign_id
-              AND cm.user_id = :user_id
-              AND cm.ended_at IS NULL
-              AND ms.code = 'active'
-              AND ms.is_active
+    target_field_case = " ".join(
+        f"WHEN rg.{column} IS NOT NULL THEN '{column}'" for column in _TARGET_COLUMNS
+    )
+    target_id_coalesce = ", ".join(f"rg.{column}" for column in _TARGET_COLUMNS)
+    row = connection.execute(
+        text(f"""
+            WITH membership AS (
+                SELECT cm.campaign_membership_id, c.timeline_id
+                FROM security.campaign_memberships cm
+                JOIN security.membership_statuses ms
+                  ON ms.membership_status_id = cm.membership_status_id
+                LEFT JOIN campaign.campaigns c ON c.campaign_id = cm.campaign_id
+                WHERE cm.campaign_id = :campaign_id
+                  AND cm.user_id = :user_id
+                  AND cm.ended_at IS NULL
+                  AND ms.code = 'active'
+                  AND ms.is_active
+            ),
+            role_caps AS (
+                SELECT cap.code, mr.expires_at
+                FROM membership m
+                JOIN security.membership_roles mr
+                  ON mr.campaign_membership_id = m.campaign_membership_id
+                JOIN security.roles r ON r.role_id = mr.role_id
+                JOIN security.role_capabilities rc ON rc.role_id = r.role_id
+                JOIN security.capabilities cap ON cap.capability_id = rc.capability_id
+                WHERE mr.revoked_at IS NULL
+                  AND (mr.expires_at IS NULL OR mr.expires_at > now())
+                  AND r.is_active
+                  AND cap.is_active
+            ),
+            character_caps AS (
+                SELECT mcr.character_id, cap.code, mcr.expires_at
+                FROM membership m
+                JOIN security.membership_character_relationships mcr
+                  ON mcr.campaign_membership_id = m.campaign_membership_id
+                JOIN security.character_relationship_type_capabilities rtc
+                  ON rtc.character_relationship_type_id = mcr.character_relationship_type_id
+                JOIN security.capabilities cap ON cap.capability_id = rtc.capability_id
+                WHERE mcr.revoked_at IS NULL
+                  AND (mcr.expires_at IS NULL OR mcr.expires_at > now())
+                  AND (mcr.timeline_id IS NULL OR mcr.timeline_id = m.timeline_id)
+                  AND cap.is_active
+            ),
+            member_groups AS (
+                SELECT agm.access_group_id
+                FROM membership m
+                JOIN security.access_group_memberships agm
+                  ON agm.campaign_membership_id = m.campaign_membership_id
+                WHERE agm.removed_at IS NULL
+            ),
+            grants AS (
+                SELECT CASE {target_field_case} END AS target_field,
+                       COALESCE({target_id_coalesce}) AS target_id,
+                       cap.code AS capability_code,
+                       CASE WHEN bool_or(rg.effect = 'deny') THEN 'deny' ELSE 'allow' END
+                           AS effect,
+                       min(rg.expires_at) AS expires_at
+                FROM membership m
+                JOIN security.resource_grants rg ON rg.campaign_id = :campaign_id
+                JOIN security.capabilities cap ON cap.capability_id = rg.capability_id
+                WHERE rg.revoked_at IS NULL
+                  AND (rg.expires_at IS NULL OR rg.expires_at > now())
+                  AND (rg.timeline_id IS NULL OR rg.timeline_id = m.timeline_id)
+                  AND cap.is_active
+                  AND (
+                        rg.grantee_campaign_membership_id = m.campaign_membership_id
+                        OR rg.grantee_access_group_id IN (SELECT access_group_id FROM member_groups)
+                      )
+                GROUP BY 1, 2, 3
+            )
+            SELECT
+                m.campaign_membership_id,
+                m.timeline_id,
+                ARRAY(SELECT DISTINCT code FROM role_caps) AS role_capabilities,
+                (
+                    SELECT COALESCE(jsonb_object_agg(character_id, codes), '{{}}'::jsonb)
+                    FROM (
+                        SELECT character_id, jsonb_agg(DISTINCT code) AS codes
+                        FROM character_caps
+                        GROUP BY character_id
+                    ) per_character
+                ) AS character_capabilities,
+                (
+                    SELECT COALESCE(
+                        jsonb_agg(
+                            jsonb_build_array(target_field, target_id, capability_code, effect)
+                        ),
+                        '[]'::jsonb
+                    )
+                    FROM grants
+                ) AS grant_effects,
+                LEAST(
+                    (SELECT min(expires_at) FROM role_caps),
+                    (SELECT min(expires_at) FROM character_caps),
+                    (SELECT min(expires_at) FROM grants)
+                ) AS valid_until
+            FROM membership m
         """),
         {"campaign_id": campaign_id, "user_id": user_id},
-    ).scalar()
-    if membership_id is None:
+    ).one_or_none()
+    if row is None:
         return None
-    membership_id = _as_uuid(membership_id)
-
-    campaign_timeline = connection.execute(
-        text("SELECT timeline_id FROM campaign.campaigns WHERE campaign_id = :campaign_id"),
-        {"campaign_id": campaign_id},
-    ).scalar()
-    if campaign_timeline is None:
+    membership_id = _as_uuid(row.campaign_membership_id)
+    if row.timeline_id is None:
         raise ValueError(f"campaign {campaign_id} does not exist")
-    campaign_timeline_id = _as_uuid(campaign_timeline)
+    campaign_timeline_id = _as_uuid(row.timeline_id)
 
     if timeline_id is not None and timeline_id != campaign_timeline_id:
         raise UnauthorizedTimelineError(
@@ -593,88 +713,61 @@ def resolve_access_context(
             "for a campaign's own pinned timeline; see its docstring for the rule."
         )
 
-    role_capabilities = frozenset(
-        _as_str(code)
-        for code in connection.execute(
-            text("""
-                SELECT DISTINCT cap.code
-                FROM security.membership_roles mr
-                JOIN security.roles r ON r.role_id = mr.role_id
-                JOIN security.role_capabilities rc ON rc.role_id = r.role_id
-                JOIN security.capabilities cap ON cap.capability_id = rc.capability_id
-                WHERE mr.campaign_membership_id = :membership_id
-                  AND mr.revoked_at IS NULL
-                  AND (mr.expires_at IS NULL OR mr.expires_at > now())
-                  AND r.is_active
-                  AND cap.is_active
-            """),
-            {"membership_id": membership_id},
-        ).scalars()
-    )
-
-    character_capabilities: dict[uuid.UUID, set[str]] = {}
-    for row in connection.execute(
-        text("""
-            SELECT mcr.character_id, cap.code
-            FROM security.membership_character_relationships mcr
-            JOIN security.character_relationship_type_capabilities rtc
-              ON rtc.character_relationship_type_id = mcr.character_relationship_type_id
-            JOIN security.capabilities cap ON cap.capability_id = rtc.capability_id
-            WHERE mcr.campaign_membership_id = :membership_id
-              AND mcr.revoked_at IS NULL
-              AND (mcr.expires_at IS NULL OR mcr.expires_at > now())
-              AND (mcr.timeline_id IS NULL OR mcr.timeline_id = :timeline_id)
-              AND cap.is_active
-        """),
-        {"membership_id": membership_id, "timeline_id": campaign_timeline_id},
-    ).mappings():
-        character_id = _as_uuid(row["character_id"])
-        character_capabilities.setdefault(character_id, set()).add(_as_str(row["code"]))
-
     grant_effects: dict[_GrantKey, dict[str, str]] = {}
-    target_column_list = ", ".join(f"rg.{column}" for column in _TARGET_COLUMNS)
-    for row in connection.execute(
-        text(f"""
-            SELECT {target_column_list}, cap.code AS capability_code, rg.effect
-            FROM security.resource_grants rg
-            JOIN security.capabilities cap ON cap.capability_id = rg.capability_id
-            WHERE rg.campaign_id = :campaign_id
-              AND rg.revoked_at IS NULL
-              AND (rg.expires_at IS NULL OR rg.expires_at > now())
-              AND (rg.timeline_id IS NULL OR rg.timeline_id = :timeline_id)
-              AND cap.is_active
-              AND (
-                    rg.grantee_campaign_membership_id = :membership_id
-                    OR rg.grantee_access_group_id IN (
-                        SELECT agm.access_group_id
-                        FROM security.access_group_memberships agm
-                        WHERE agm.campaign_membership_id = :membership_id
-                          AND agm.removed_at IS NULL
-                    )
-                  )
-        """),
-        {
-            "campaign_id": campaign_id,
-            "timeline_id": campaign_timeline_id,
-            "membership_id": membership_id,
-        },
-    ).mappings():
-        target_field = next(column for column in _TARGET_COLUMNS if row[column] is not None)
-        key = (target_field, _as_uuid(row[target_field]))
-        capability_code = _as_str(row["capability_code"])
-        bucket = grant_effects.setdefault(key, {})
-        if bucket.get(capability_code) == "deny":
-            continue
-        bucket[capability_code] = _as_str(row["effect"])
+    for target_field, target_id, capability_code, effect in row.grant_effects:
+        grant_effects.setdefault((target_field, uuid.UUID(target_id)), {})[capability_code] = effect
 
     return AccessContext(
         user_id=user_id,
         campaign_id=campaign_id,
         campaign_membership_id=membership_id,
         timeline_id=campaign_timeline_id,
-        role_capabilities=role_capabilities,
+        role_capabilities=frozenset(row.role_capabilities),
         character_capabilities={
-            character_id: frozenset(codes) for character_id, codes in character_capabilities.items()
+            uuid.UUID(character_id): frozenset(codes)
+            for character_id, codes in row.character_capabilities.items()
         },
         grant_effects=grant_effects,
+        valid_until=row.valid_until,
     )
+
+
+@dataclass(frozen=True)
+class CampaignSecurityGeneration:
+    """One read of `security.campaign_security_generations` (migration 099)
+    for a campaign, paired with the database's own `now()` at that read —
+    the clock every `expires_at` comparison in `resolve_access_context`
+    uses, and so the only clock `AccessContext.valid_until` may be compared
+    against (an application-host clock can drift from it in either
+    direction)."""
+
+    generation: int
+    observed_at: datetime
+
+
+def read_campaign_security_generation(
+    connection: Connection, *, campaign_id: uuid.UUID
+) -> CampaignSecurityGeneration | None:
+    """The campaign's current security generation — bumped by trigger, in
+    the writing transaction itself, on every change to a row
+    `resolve_access_context` reads for it (see migration 099's docstring
+    for the exact table list). None if the campaign has no generation row,
+    which in practice means the campaign does not exist; a caller must
+    treat that as "nothing to compare against," never as a match.
+
+    Read this *before* resolving a context it will be stored against:
+    under READ COMMITTED a security write that commits between the two
+    reads then leaves the context tagged with the older generation, so the
+    next comparison misses and re-resolves. The opposite order could tag a
+    stale context with the newer generation and serve it indefinitely."""
+    row = connection.execute(
+        text("""
+            SELECT generation, now() AS observed_at
+            FROM security.campaign_security_generations
+            WHERE campaign_id = :campaign_id
+        """),
+        {"campaign_id": campaign_id},
+    ).one_or_none()
+    if row is None:
+        return None
+    return CampaignSecurityGeneration(generation=row.generation, observed_at=row.observed_at)
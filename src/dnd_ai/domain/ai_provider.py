@@ -36,11 +36,49 @@ calling fidelity still varies by local model/runtime; a model that ignores
 (`_extract_tool_call` returning `None`), the same as any other malformed
 provider response — never a crash, and never treated as this class's own
 bug.
+
+`AsyncAiProvider`/`AsyncOpenAiCompatibleProvider`/`FakeAsyncAiProvider` are
+the awaitable counterparts the HTTP routes use, so a provider call that
+takes tens of seconds waits on the event loop instead of pinning one of
+Starlette's worker threads. Request building and response handling are
+shared module functions (`_npc_turn_request_json`, `_npc_turn_result`, and
+their synthesis twins), so the two families cannot drift apart on what
+they send or how they judge what comes back.
+
+Both real providers send every call through one long-lived, pooled
+`httpx.Client`/`httpx.AsyncClient` (`build_ai_http_client`/
+`build_async_ai_http_client`) rather than a one-shot `httpx.post`, so
+consecutive turns reuse a kept-alive connection instead of paying a TCP
+and TLS handshake each — against a local model server answering a short
+turn, that handshake is most of the call. HTTP/2 is negotiated when
+requested and the optional `h2` package is installed, and silently left
+off otherwise. Each call's timings are taken from httpcore's `trace`
+request extension (`_CallTimer`): `connect_ms` is the time to a usable
+connection (0 when a pooled one was reused), `first_byte_ms` the time to
+the response headers, and `latency_ms` the whole call. A transport that
+emits no trace events (`httpx.MockTransport`) leaves the first two None.
+
+`StreamingAiProvider.stream_npc_turn` is the same NPC turn requested with
+`"stream": true`. The forced function call still carries the whole turn;
+its `arguments` JSON just arrives in fragments. `_DialogueStreamDecoder`
+pulls the `dialogue` string out of those fragments as they come, so the
+player can read the reply while the model is still writing it. The
+stream's chunks are reassembled into an ordinary response body
+(`_StreamedCompletion`) and judged by the same `_npc_turn_body_result`
+as a non-streamed call. Forwarded dialogue is therefore only ever a
+preview: a stream whose final arguments fail validation still ends in an
+`error_message` result, with no `structured_output`.
+`first_token_ms` is the time to the first forwarded dialogue.
 """
 
+import asyncio
+import dataclasses
+import importlib.util
 import json
+import re
 import time
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
@@ -127,6 +165,17 @@ class ProviderResult:
     finish_reason: str | None
     latency_ms: int | None
     error_message: str | None
+    connect_ms: int | None = None
+    first_byte_ms: int | None = None
+    first_token_ms: int | None = None
+
+
+@dataclass(frozen=True)
+class DialogueDelta:
+    """The next piece of a streamed turn's dialogue, in order; joined, the
+    deltas of a successful turn are its `NpcTurnOutput.dialogue`."""
+
+    text: str
 
 
 @dataclass(frozen=True)
@@ -136,6 +185,8 @@ class SynthesisProviderResult:
     finish_reason: str | None
     latency_ms: int | None
     error_message: str | None
+    connect_ms: int | None = None
+    first_byte_ms: int | None = None
 
 
 class AiProvider(Protocol):
@@ -148,6 +199,33 @@ class AiProvider(Protocol):
     ) -> SynthesisProviderResult: ...
 
 
+class AsyncAiProvider(Protocol):
+    """`AiProvider` for an async caller (`dnd_ai.commands.ai_npc.
+    request_npc_conversation_turn_async`, `dnd_ai.commands.ai_synthesis.
+    request_campaign_synthesis_async`): the same two calls, awaited, so the
+    provider's network wait never occupies a worker thread."""
+
+    async def generate_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> ProviderResult: ...
+
+    async def generate_synthesis(
+        self, *, context: dict[str, Any], audience_tier: str, question_text: str
+    ) -> SynthesisProviderResult: ...
+
+
+class StreamingAiProvider(AsyncAiProvider, Protocol):
+    """`AsyncAiProvider` that can also stream an NPC turn
+    (`dnd_ai.commands.ai_npc.open_npc_conversation_turn_stream`): yields a
+    `DialogueDelta` for each new piece of dialogue as the model produces
+    it, then exactly one `ProviderResult`, last, validated the same way
+    `generate_npc_turn`'s is."""
+
+    def stream_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> AsyncIterator[DialogueDelta | ProviderResult]: ...
+
+
 class FakeAiProvider:
     """Deterministic, network-free provider for automated tests
     (`tests/unit`, `tests/database`) — never used outside test code.
@@ -228,6 +306,56 @@ class FakeAiProvider:
         )
 
 
+class FakeAsyncAiProvider:
+    """`FakeAiProvider`'s `AsyncAiProvider` counterpart — identical canned
+    output for the identical flags — plus `latency_seconds`, an
+    `asyncio.sleep` before each answer, so a test can hold many calls in
+    flight at once without any network."""
+
+    def __init__(
+        self,
+        *,
+        dialogue: str = "Hello there.",
+        reveal_first_candidate: bool = False,
+        advance_first_candidate: bool = False,
+        advance_new_status: Literal["completed", "failed"] = "completed",
+        latency_seconds: float = 0.0,
+    ) -> None:
+        self._sync = FakeAiProvider(
+            dialogue=dialogue,
+            reveal_first_candidate=reveal_first_candidate,
+            advance_first_candidate=advance_first_candidate,
+            advance_new_status=advance_new_status,
+        )
+        self._latency_seconds = latency_seconds
+
+    async def generate_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> ProviderResult:
+        await asyncio.sleep(self._latency_seconds)
+        return self._sync.generate_npc_turn(context=context, player_message=player_message)
+
+    async def stream_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> AsyncIterator[DialogueDelta | ProviderResult]:
+        """The canned dialogue one word (with its trailing space) per
+        delta, after `latency_seconds`."""
+        await asyncio.sleep(self._latency_seconds)
+        result = self._sync.generate_npc_turn(context=context, player_message=player_message)
+        assert result.structured_output is not None
+        for word in re.findall(r"\S+\s*", result.structured_output.dialogue):
+            yield DialogueDelta(text=word)
+        yield dataclasses.replace(result, first_token_ms=0)
+
+    async def generate_synthesis(
+        self, *, context: dict[str, Any], audience_tier: str, question_text: str
+    ) -> SynthesisProviderResult:
+        await asyncio.sleep(self._latency_seconds)
+        return self._sync.generate_synthesis(
+            context=context, audience_tier=audience_tier, question_text=question_text
+        )
+
+
 def _npc_turn_function_schema() -> dict[str, Any]:
     return {
         "type": "function",
@@ -292,12 +420,494 @@ def _build_system_prompt(context: NpcConversationContext) -> str:
     )
 
 
+def _npc_turn_request_json(
+    model_identifier: str, context: NpcConversationContext, player_message: str
+) -> dict[str, Any]:
+    return {
+        "model": model_identifier,
+        "messages": [
+            {"role": "system", "content": _build_system_prompt(context)},
+            {"role": "user", "content": player_message},
+        ],
+        "tools": [_npc_turn_function_schema()],
+        "tool_choice": {
+            "type": "function",
+            "function": {"name": _RECORD_NPC_TURN_FUNCTION_NAME},
+        },
+    }
+
+
+def _synthesis_request_json(
+    model_identifier: str, context: dict[str, Any], audience_tier: str, question_text: str
+) -> dict[str, Any]:
+    return {
+        "model": model_identifier,
+        "messages": [
+            {
+                "role": "system",
+                "content": _build_synthesis_system_prompt(context, audience_tier=audience_tier),
+            },
+            {"role": "user", "content": question_text},
+        ],
+        "tools": [_synthesis_answer_function_schema()],
+        "tool_choice": {
+            "type": "function",
+            "function": {"name": _RECORD_SYNTHESIS_ANSWER_FUNCTION_NAME},
+        },
+    }
+
+
+# httpcore trace events that mark a new connection as ready to carry the
+# request — TCP (or Unix socket) established, then TLS, when there is one.
+_CONNECTION_READY_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.complete",
+        "connection.connect_unix_socket.complete",
+        "connection.start_tls.complete",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _CallTimings:
+    latency_ms: int
+    connect_ms: int | None
+    first_byte_ms: int | None
+    first_token_ms: int | None = None
+
+
+class _CallTimer:
+    """Times one provider call. Pass `trace` (sync client) or `atrace`
+    (async client) as the request's `trace` extension; a streamed call
+    also reports `first_token()` when its first dialogue arrives; `stop()`
+    once the call has returned or failed."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._connected: float | None = None
+        self._first_byte: float | None = None
+        self._first_token: float | None = None
+
+    def trace(self, event_name: str, _info: dict[str, Any]) -> None:
+        if event_name in _CONNECTION_READY_EVENTS:
+            self._connected = time.monotonic()
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self._first_byte = time.monotonic()
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        self.trace(event_name, info)
+
+    def first_token(self) -> None:
+        if self._first_token is None:
+            self._first_token = time.monotonic()
+
+    def stop(self) -> _CallTimings:
+        connect_ms: int | None = None
+        if self._connected is not None:
+            connect_ms = self._ms_since_start(self._connected)
+        elif self._first_byte is not None:
+            # Headers arrived without any connect event: a kept-alive
+            # connection was reused.
+            connect_ms = 0
+        return _CallTimings(
+            latency_ms=self._ms_since_start(time.monotonic()),
+            connect_ms=connect_ms,
+            first_byte_ms=(
+                self._ms_since_start(self._first_byte) if self._first_byte is not None else None
+            ),
+            first_token_ms=(
+                self._ms_since_start(self._first_token) if self._first_token is not None else None
+            ),
+        )
+
+    def _ms_since_start(self, at: float) -> int:
+        return int((at - self._started) * 1000)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _client_options(
+    *,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry_seconds: float,
+    http2: bool,
+) -> dict[str, Any]:
+    import httpx
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        ),
+        "http2": http2 and _http2_available(),
+    }
+
+
+def build_ai_http_client(
+    *,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry_seconds: float = 30.0,
+    http2: bool = True,
+) -> "httpx.Client":
+    """The pooled, keep-alive client `OpenAiCompatibleProvider` sends every
+    call through. `http2` is only a request: it takes effect when `h2` is
+    installed. The caller owns the client and closes it."""
+    import httpx
+
+    return httpx.Client(
+        **_client_options(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry_seconds=keepalive_expiry_seconds,
+            http2=http2,
+        )
+    )
+
+
+def build_async_ai_http_client(
+    *,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry_seconds: float = 30.0,
+    http2: bool = True,
+) -> "httpx.AsyncClient":
+    """`build_ai_http_client` for `AsyncOpenAiCompatibleProvider`."""
+    import httpx
+
+    return httpx.AsyncClient(
+        **_client_options(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry_seconds=keepalive_expiry_seconds,
+            http2=http2,
+        )
+    )
+
+
+def _transport_error_message(exc: Exception) -> str:
+    return f"{type(exc).__name__} calling the chat completions endpoint"
+
+
+def _npc_turn_result(response: "httpx.Response", *, timings: _CallTimings) -> ProviderResult:
+    """Everything after a 2xx response — body parsing, tool-call
+    extraction, schema validation — shared by the sync and async
+    providers, so both report the identical `error_message` for the
+    identical malformed response."""
+    body, parse_error = _parse_response_body(response)
+    if body is None:
+        return ProviderResult(
+            raw_response=None,
+            structured_output=None,
+            finish_reason=None,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            error_message=parse_error,
+        )
+    return _npc_turn_body_result(body, timings=timings)
+
+
+def _npc_turn_body_result(body: dict[str, Any], *, timings: _CallTimings) -> ProviderResult:
+    """Tool-call extraction and schema validation of a parsed Chat
+    Completions body — a whole response's, or the one
+    `_StreamedCompletion` assembles from a stream's chunks."""
+    raw_response = str(body)
+    finish_reason = _finish_reason(body)
+    tool_input = _extract_tool_call(body, function_name=_RECORD_NPC_TURN_FUNCTION_NAME)
+    if tool_input is None:
+        return ProviderResult(
+            raw_response=raw_response,
+            structured_output=None,
+            finish_reason=finish_reason,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            first_token_ms=timings.first_token_ms,
+            error_message="Provider response did not include the expected function call.",
+        )
+    try:
+        structured_output = NpcTurnOutput.model_validate(tool_input)
+    except ValidationError as exc:
+        return ProviderResult(
+            raw_response=raw_response,
+            structured_output=None,
+            finish_reason=finish_reason,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            first_token_ms=timings.first_token_ms,
+            error_message=f"Provider function call failed schema validation: {exc.error_count()} error(s)",
+        )
+    return ProviderResult(
+        raw_response=raw_response,
+        structured_output=structured_output,
+        finish_reason=finish_reason,
+        latency_ms=timings.latency_ms,
+        connect_ms=timings.connect_ms,
+        first_byte_ms=timings.first_byte_ms,
+        first_token_ms=timings.first_token_ms,
+        error_message=None,
+    )
+
+
+_JSON_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class _DialogueStreamDecoder:
+    """Decodes the top-level `dialogue` string of a `record_npc_turn`
+    call's JSON arguments while they are still arriving, fragment by
+    fragment, so it can be forwarded before the call is complete.
+    `feed()` returns the dialogue text the fragment completed; an escape
+    sequence split across fragments is held back until its end arrives,
+    and an invalid one ends what is forwarded (the final parse then
+    rejects the arguments). Nothing here is trusted: the whole arguments string is parsed and
+    validated again once the stream ends (`_npc_turn_body_result`), and
+    only that decides the turn's `structured_output`."""
+
+    def __init__(self) -> None:
+        self._held = ""
+        self._depth = 0
+        self._expect_key = False
+        self._key_chars: list[str] | None = None
+        self._last_key: str | None = None
+        self._value_key: str | None = None
+        self._in_string = False
+        self._in_dialogue = False
+        self._done = False
+
+    def feed(self, fragment: str) -> str:
+        text = self._held + fragment
+        self._held = ""
+        out: list[str] = []
+        i = 0
+        while i < len(text) and not self._done:
+            char = text[i]
+            if self._in_string:
+                if char == "\\":
+                    decoded, width = _decode_escape(text, i)
+                    if width == 0:
+                        self._held = text[i:]
+                        break
+                    if width < 0:
+                        self._done = True
+                        break
+                    self._string_char(decoded, out)
+                    i += width
+                    continue
+                if char == '"':
+                    self._end_string()
+                else:
+                    self._string_char(char, out)
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_chars = []
+                elif self._depth == 1 and self._value_key == "dialogue":
+                    self._in_dialogue = True
+            elif char in "{[":
+                self._depth += 1
+                self._expect_key = char == "{" and self._depth == 1
+            elif char in "}]":
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                self._expect_key = True
+                self._value_key = None
+            elif char == ":" and self._depth == 1:
+                self._expect_key = False
+                self._value_key = self._last_key
+            i += 1
+        return "".join(out)
+
+    def _string_char(self, char: str, out: list[str]) -> None:
+        if self._in_dialogue:
+            out.append(char)
+        elif self._key_chars is not None:
+            self._key_chars.append(char)
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._in_dialogue:
+            self._done = True
+        elif self._key_chars is not None:
+            self._last_key = "".join(self._key_chars)
+            self._key_chars = None
+
+
+def _decode_escape(text: str, start: int) -> tuple[str, int]:
+    """The character the JSON escape at `text[start]` stands for and how
+    many characters it spans, `("", 0)` when it is cut off at the end of
+    `text`, or `("", -1)` when it is not a valid escape. A surrogate pair
+    is decoded as one character."""
+    if start + 1 >= len(text):
+        return "", 0
+    kind = text[start + 1]
+    if kind != "u":
+        if kind not in _JSON_ESCAPES:
+            return "", -1
+        return _JSON_ESCAPES[kind], 2
+    if start + 6 > len(text):
+        return "", 0
+    code = _hex_code_unit(text[start + 2 : start + 6])
+    if code is None:
+        return "", -1
+    if 0xD800 <= code < 0xDC00:
+        if start + 12 > len(text):
+            return "", 0
+        if text[start + 6 : start + 8] == "\\u":
+            low = _hex_code_unit(text[start + 8 : start + 12])
+            if low is not None and 0xDC00 <= low < 0xE000:
+                return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+    return chr(code), 6
+
+
+def _hex_code_unit(digits: str) -> int | None:
+    # Exactly four hex digits: int(..., 16) alone would also accept a
+    # sign, whitespace or underscores.
+    if not all(digit in "0123456789abcdefABCDEF" for digit in digits):
+        return None
+    return int(digits, 16)
+
+
+class _StreamedCompletion:
+    """Accumulates a streamed Chat Completions response (`"stream": true`
+    server-sent events) back into the non-streamed body shape, so the end
+    of a stream goes through exactly the extraction and validation a
+    whole response does. Each tool call's `function.arguments` arrives as
+    fragments keyed by the call's `index`."""
+
+    def __init__(self) -> None:
+        self._finish_reason: str | None = None
+        self._calls: dict[int, dict[str, str]] = {}
+
+    def add(self, chunk: dict[str, Any]) -> str:
+        """Folds one chunk in; returns the `record_npc_turn` arguments
+        fragment it carried, if any."""
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+            return ""
+        choice = choices[0]
+        if isinstance(choice.get("finish_reason"), str):
+            self._finish_reason = choice["finish_reason"]
+        delta = choice.get("delta")
+        tool_calls = delta.get("tool_calls") if isinstance(delta, dict) else None
+        if not isinstance(tool_calls, list):
+            return ""
+        fragments: list[str] = []
+        for call in tool_calls:
+            if not isinstance(call, dict):
+                continue
+            index = call.get("index", 0)
+            entry = self._calls.setdefault(
+                index if isinstance(index, int) else 0, {"name": "", "arguments": ""}
+            )
+            function = call.get("function")
+            if not isinstance(function, dict):
+                continue
+            if isinstance(function.get("name"), str):
+                entry["name"] += function["name"]
+            if isinstance(function.get("arguments"), str):
+                entry["arguments"] += function["arguments"]
+                if entry["name"] == _RECORD_NPC_TURN_FUNCTION_NAME:
+                    fragments.append(function["arguments"])
+        return "".join(fragments)
+
+    def body(self) -> dict[str, Any]:
+        return {
+            "choices": [
+                {
+                    "finish_reason": self._finish_reason,
+                    "message": {
+                        "tool_calls": [
+                            {"function": call} for _index, call in sorted(self._calls.items())
+                        ]
+                    },
+                }
+            ]
+        }
+
+
+def _synthesis_result(
+    response: "httpx.Response", *, timings: _CallTimings
+) -> SynthesisProviderResult:
+    """`_npc_turn_result`'s counterpart for `generate_synthesis`."""
+    body, parse_error = _parse_response_body(response)
+    if body is None:
+        return SynthesisProviderResult(
+            raw_response=None,
+            structured_output=None,
+            finish_reason=None,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            error_message=parse_error,
+        )
+    raw_response = str(body)
+    finish_reason = _finish_reason(body)
+    tool_input = _extract_tool_call(body, function_name=_RECORD_SYNTHESIS_ANSWER_FUNCTION_NAME)
+    if tool_input is None:
+        return SynthesisProviderResult(
+            raw_response=raw_response,
+            structured_output=None,
+            finish_reason=finish_reason,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            error_message="Provider response did not include the expected function call.",
+        )
+    try:
+        structured_output = SynthesisOutput.model_validate(tool_input)
+    except ValidationError as exc:
+        return SynthesisProviderResult(
+            raw_response=raw_response,
+            structured_output=None,
+            finish_reason=finish_reason,
+            latency_ms=timings.latency_ms,
+            connect_ms=timings.connect_ms,
+            first_byte_ms=timings.first_byte_ms,
+            error_message=f"Provider function call failed schema validation: {exc.error_count()} error(s)",
+        )
+    return SynthesisProviderResult(
+        raw_response=raw_response,
+        structured_output=structured_output,
+        finish_reason=finish_reason,
+        latency_ms=timings.latency_ms,
+        connect_ms=timings.connect_ms,
+        first_byte_ms=timings.first_byte_ms,
+        error_message=None,
+    )
+
+
+def _headers(api_key: str | None) -> dict[str, str]:
+    headers = {"content-type": "application/json"}
+    if api_key:
+        headers["authorization"] = f"Bearer {api_key}"
+    return headers
+
+
 class OpenAiCompatibleProvider:
     """The real provider — one HTTPS call per turn against an OpenAI Chat
     Completions-shaped endpoint, structured output forced via function
     calling. Never constructed by normal automated tests; see this
     module's own docstring for why this one class covers both real OpenAI
-    and a locally hosted, OpenAI-API-compatible model server."""
+    and a locally hosted, OpenAI-API-compatible model server.
+
+    Sends through `client` when given (the caller then owns it); otherwise
+    builds its own with `build_ai_http_client()`'s defaults, which
+    `close()` releases."""
 
     def __init__(
         self,
@@ -306,168 +916,221 @@ class OpenAiCompatibleProvider:
         model_identifier: str,
         base_url: str = _DEFAULT_OPENAI_BASE_URL,
         timeout_seconds: float = 30.0,
+        client: "httpx.Client | None" = None,
     ) -> None:
+        self._owns_client = client is None
+        self._client = build_ai_http_client() if client is None else client
         self._api_key = api_key
         self._model_identifier = model_identifier
         self._base_url = base_url.rstrip("/")
         self._timeout_seconds = timeout_seconds
 
-    def _headers(self) -> dict[str, str]:
-        headers = {"content-type": "application/json"}
-        if self._api_key:
-            headers["authorization"] = f"Bearer {self._api_key}"
-        return headers
+    def close(self) -> None:
+        if self._owns_client:
+            self._client.close()
 
     def generate_npc_turn(
         self, *, context: NpcConversationContext, player_message: str
     ) -> ProviderResult:
         import httpx
 
-        started = time.monotonic()
+        timer = _CallTimer()
         try:
-            response = httpx.post(
+            response = self._client.post(
                 f"{self._base_url}/chat/completions",
-                headers=self._headers(),
-                json={
-                    "model": self._model_identifier,
-                    "messages": [
-                        {"role": "system", "content": _build_system_prompt(context)},
-                        {"role": "user", "content": player_message},
-                    ],
-                    "tools": [_npc_turn_function_schema()],
-                    "tool_choice": {
-                        "type": "function",
-                        "function": {"name": _RECORD_NPC_TURN_FUNCTION_NAME},
-                    },
-                },
+                headers=_headers(self._api_key),
+                json=_npc_turn_request_json(self._model_identifier, context, player_message),
                 timeout=self._timeout_seconds,
+                extensions={"trace": timer.trace},
             )
             response.raise_for_status()
         except httpx.HTTPError as exc:
+            timings = timer.stop()
             return ProviderResult(
                 raw_response=None,
                 structured_output=None,
                 finish_reason=None,
-                latency_ms=int((time.monotonic() - started) * 1000),
-                error_message=f"{type(exc).__name__} calling the chat completions endpoint",
-            )
-
-        latency_ms = int((time.monotonic() - started) * 1000)
-        body, parse_error = _parse_response_body(response)
-        if body is None:
-            return ProviderResult(
-                raw_response=None,
-                structured_output=None,
-                finish_reason=None,
-                latency_ms=latency_ms,
-                error_message=parse_error,
-            )
-        raw_response = str(body)
-        finish_reason = _finish_reason(body)
-        tool_input = _extract_tool_call(body, function_name=_RECORD_NPC_TURN_FUNCTION_NAME)
-        if tool_input is None:
-            return ProviderResult(
-                raw_response=raw_response,
-                structured_output=None,
-                finish_reason=finish_reason,
-                latency_ms=latency_ms,
-                error_message="Provider response did not include the expected function call.",
-            )
-        try:
-            structured_output = NpcTurnOutput.model_validate(tool_input)
-        except ValidationError as exc:
-            return ProviderResult(
-                raw_response=raw_response,
-                structured_output=None,
-                finish_reason=finish_reason,
-                latency_ms=latency_ms,
-                error_message=f"Provider function call failed schema validation: {exc.error_count()} error(s)",
+                latency_ms=timings.latency_ms,
+                connect_ms=timings.connect_ms,
+                first_byte_ms=timings.first_byte_ms,
+                error_message=_transport_error_message(exc),
             )
-        return ProviderResult(
-            raw_response=raw_response,
-            structured_output=structured_output,
-            finish_reason=finish_reason,
-            latency_ms=latency_ms,
-            error_message=None,
-        )
+        return _npc_turn_result(response, timings=timer.stop())
 
     def generate_synthesis(
         self, *, context: dict[str, Any], audience_tier: str, question_text: str
     ) -> SynthesisProviderResult:
         import httpx
 
-        started = time.monotonic()
+        timer = _CallTimer()
         try:
-            response = httpx.post(
+            response = self._client.post(
                 f"{self._base_url}/chat/completions",
-                headers=self._headers(),
-                json={
-                    "model": self._model_identifier,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": _build_synthesis_system_prompt(
-                                context, audience_tier=audience_tier
-                            ),
-                        },
-                        {"role": "user", "content": question_text},
-                    ],
-                    "tools": [_synthesis_answer_function_schema()],
-                    "tool_choice": {
-                        "type": "function",
-                        "function": {"name": _RECORD_SYNTHESIS_ANSWER_FUNCTION_NAME},
-                    },
-                },
+                headers=_headers(self._api_key),
+                json=_synthesis_request_json(
+                    self._model_identifier, context, audience_tier, question_text
+                ),
                 timeout=self._timeout_seconds,
+                extensions={"trace": timer.trace},
             )
             response.raise_for_status()
         except httpx.HTTPError as exc:
+            timings = timer.stop()
             return SynthesisProviderResult(
                 raw_response=None,
                 structured_output=None,
                 finish_reason=None,
-                latency_ms=int((time.monotonic() - started) * 1000),
-                error_message=f"{type(exc).__name__} calling the chat completions endpoint",
+                latency_ms=timings.latency_ms,
+                connect_ms=timings.connect_ms,
+                first_byte_ms=timings.first_byte_ms,
+                error_message=_transport_error_message(exc),
             )
+        return _synthesis_result(response, timings=timer.stop())
 
-        latency_ms = int((time.monotonic() - started) * 1000)
-        body, parse_error = _parse_response_body(response)
-        if body is None:
-            return SynthesisProviderResult(
+
+class AsyncOpenAiCompatibleProvider:
+    """`OpenAiCompatibleProvider`'s `AsyncAiProvider` counterpart — the same
+    request and the same response handling, awaited on a caller-owned,
+    shared `httpx.AsyncClient` instead of a blocking `httpx.Client`, so a
+    slow provider holds an event-loop task rather than a worker thread.
+    The client's lifetime is the caller's (`dnd_ai.api.ai_npc.
+    get_ai_http_client`); this class never opens or closes it."""
+
+    def __init__(
+        self,
+        *,
+        client: "httpx.AsyncClient",
+        api_key: str | None,
+        model_identifier: str,
+        base_url: str = _DEFAULT_OPENAI_BASE_URL,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        self._client = client
+        self._api_key = api_key
+        self._model_identifier = model_identifier
+        self._base_url = base_url.rstrip("/")
+        self._timeout_seconds = timeout_seconds
+
+    async def generate_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> ProviderResult:
+        import httpx
+
+        timer = _CallTimer()
+        try:
+            response = await self._client.post(
+                f"{self._base_url}/chat/completions",
+                headers=_headers(self._api_key),
+                json=_npc_turn_request_json(self._model_identifier, context, player_message),
+                timeout=self._timeout_seconds,
+                extensions={"trace": timer.atrace},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            timings = timer.stop()
+            return ProviderResult(
                 raw_response=None,
                 structured_output=None,
                 finish_reason=None,
-                latency_ms=latency_ms,
-                error_message=parse_error,
+                latency_ms=timings.latency_ms,
+                connect_ms=timings.connect_ms,
+                first_byte_ms=timings.first_byte_ms,
+                error_message=_transport_error_message(exc),
             )
-        raw_response = str(body)
-        finish_reason = _finish_reason(body)
-        tool_input = _extract_tool_call(body, function_name=_RECORD_SYNTHESIS_ANSWER_FUNCTION_NAME)
-        if tool_input is None:
-            return SynthesisProviderResult(
-                raw_response=raw_response,
+        return _npc_turn_result(response, timings=timer.stop())
+
+    async def stream_npc_turn(
+        self, *, context: NpcConversationContext, player_message: str
+    ) -> AsyncIterator[DialogueDelta | ProviderResult]:
+        """`generate_npc_turn` with `"stream": true`: the same request
+        otherwise, read as server-sent events. Dialogue is forwarded as
+        `_DialogueStreamDecoder` pulls it out of the arguments fragments;
+        `first_token_ms` is the time to the first of it. A transport error
+        or a malformed chunk mid-stream ends the turn with an ordinary
+        `error_message` result, after whatever dialogue was already
+        forwarded."""
+        import httpx
+
+        timer = _CallTimer()
+        completion = _StreamedCompletion()
+        decoder = _DialogueStreamDecoder()
+        error_message: str | None = None
+        try:
+            async with self._client.stream(
+                "POST",
+                f"{self._base_url}/chat/completions",
+                headers=_headers(self._api_key),
+                json={
+                    **_npc_turn_request_json(self._model_identifier, context, player_message),
+                    "stream": True,
+                },
+                timeout=self._timeout_seconds,
+                extensions={"trace": timer.atrace},
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        error_message = "Provider stream chunk was not valid JSON."
+                        break
+                    if not isinstance(chunk, dict):
+                        continue
+                    text = decoder.feed(completion.add(chunk))
+                    if text:
+                        timer.first_token()
+                        yield DialogueDelta(text=text)
+        except httpx.HTTPError as exc:
+            error_message = _transport_error_message(exc)
+        timings = timer.stop()
+        if error_message is not None:
+            yield ProviderResult(
+                raw_response=None,
                 structured_output=None,
-                finish_reason=finish_reason,
-                latency_ms=latency_ms,
-                error_message="Provider response did not include the expected function call.",
+                finish_reason=None,
+                latency_ms=timings.latency_ms,
+                connect_ms=timings.connect_ms,
+                first_byte_ms=timings.first_byte_ms,
+                first_token_ms=timings.first_token_ms,
+                error_message=error_message,
             )
+            return
+        yield _npc_turn_body_result(completion.body(), timings=timings)
+
+    async def generate_synthesis(
+        self, *, context: dict[str, Any], audience_tier: str, question_text: str
+    ) -> SynthesisProviderResult:
+        import httpx
+
+        timer = _CallTimer()
         try:
-            structured_output = SynthesisOutput.model_validate(tool_input)
-        except ValidationError as exc:
+            response = await self._client.post(
+                f"{self._base_url}/chat/completions",
+                headers=_headers(self._api_key),
+                json=_synthesis_request_json(
+                    self._model_identifier, context, audience_tier, question_text
+                ),
+                timeout=self._timeout_seconds,
+                extensions={"trace": timer.atrace},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            timings = timer.stop()
             return SynthesisProviderResult(
-                raw_response=raw_response,
+                raw_response=None,
                 structured_output=None,
-                finish_reason=finish_reason,
-                latency_ms=latency_ms,
-                error_message=f"Provider function call failed schema validation: {exc.error_count()} error(s)",
+                finish_reason=None,
+                latency_ms=timings.latency_ms,
+                connect_ms=timings.connect_ms,
+                first_byte_ms=timings.first_byte_ms,
+                error_message=_transport_error_message(exc),
             )
-        return SynthesisProviderResult(
-            raw_response=raw_response,
-            structured_output=structured_output,
-            finish_reason=finish_reason,
-            latency_ms=latency_ms,
-            error_message=None,
-        )
+        return _synthesis_result(response, timings=timer.stop())
 
 
 def _synthesis_answer_function_schema() -> dict[str, Any]:
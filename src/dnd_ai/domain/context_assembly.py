@@ -35,16 +35,35 @@ terminal — see `AdvanceableObjective`'s own docstring for the full
 membership rule. `dnd_ai.commands.ai_npc` only ever accepts a `quest_
 objective_id` from this set, the same never-trust-the-model's-own-id
 posture `reveal_knowledge_item_id` already established.
+
+`budget_npc_conversation_context`/`budget_campaign_synthesis_context` fit
+an assembled context to a `dnd_ai.domain.prompt_budget.PromptBudget`
+(see that module's docstring) and return the trimmed context itself, not
+just a trimmed payload: the commands send, record and validate proposals
+against that one object, so a revealable item or objective cut from the
+prompt is also gone from the candidate set the model's answer is checked
+against. Known facts lose their oldest entries first, then revealable
+knowledge, advanceable objectives and related quests lose their last;
+the NPC, the requesting character and the relationship are never
+trimmed. Synthesis trims the party's oldest known facts, then the oldest
+recent events, and never the session title or recap.
 """
 
+import dataclasses
 import uuid
 from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy import Connection, text
 
+from dnd_ai.domain.prompt_budget import (
+    PromptBudget,
+    PromptBudgetReport,
+    TrimmableSection,
+    budget_prompt_payload,
+)
 from dnd_ai.queries.character import get_character_view
-from dnd_ai.queries.quest import get_quest_view
+from dnd_ai.queries.quest import get_quest_views
 from dnd_ai.queries.summary import get_campaign_summary_view
 
 # Mirrors dnd_ai.commands.quests._TERMINAL_OBJECTIVE_STATUSES — that module
@@ -84,7 +103,7 @@ class AdvanceableObjective:
     `reveal_knowledge`. Membership already proves every safety property the
     exit criteria require: it belongs to a quest this NPC participates in
     (`related_quests`' own scope), it is the requesting party's own
-    effective view (`dnd_ai.queries.quest.get_quest_view`, party-scoped,
+    effective view (`dnd_ai.queries.quest.get_quest_views`, party-scoped,
     `include_hidden=False` — so a `'gm_only'` objective, or one this party
     has no visibility into yet, can never appear here), and its current
     status is not already terminal — `dnd_ai.commands.ai_npc` only ever
@@ -299,26 +318,28 @@ def _advanceable_objectives(
 ) -> tuple[AdvanceableObjective, ...]:
     """Objectives eligible for an `advance_quest_objective` proposal, drawn
     only from quests this NPC already participates in (`related_quests`) —
-    never a campaign-wide objective scan. For each such quest, reuses
-    `dnd_ai.queries.quest.get_quest_view` (`include_hidden=False`, the same
-    party-scoped, non-GM audience filter every other player-facing query in
-    this codebase applies) rather than re-deriving visibility/status
-    resolution here, so this candidate set can never drift from what that
-    query already treats as "this party can see." An objective whose
-    current effective status is already terminal (or would be excluded
-    entirely by that query's own audience filter — `'gm_only'`, or a
+    never a campaign-wide objective scan. Reuses `dnd_ai.queries.quest.
+    get_quest_views` for all of those quests at once (`include_hidden=
+    False`, the same party-scoped, non-GM audience filter every other
+    player-facing query in this codebase applies) rather than re-deriving
+    visibility/status resolution here, so this candidate set can never
+    drift from what `get_quest_view` already treats as "this party can
+    see," and a quest giver tied into a dozen quests costs the same two
+    statements as one tied into a single quest. An objective whose current
+    effective status is already terminal (or would be excluded entirely by
+    that query's own audience filter — `'gm_only'`, or a
     `'hidden_until_active'`/`'hidden_until_discovered'` objective with no
     state row yet) is never included."""
+    quest_views = get_quest_views(
+        connection,
+        quest_ids=[related.quest_id for related in related_quests],
+        timeline_id=timeline_id,
+        expected_world_id=expected_world_id,
+        party_id=party_id,
+        include_hidden=False,
+    )
     candidates: list[AdvanceableObjective] = []
-    for related in related_quests:
-        quest_view = get_quest_view(
-            connection,
-            quest_id=related.quest_id,
-            timeline_id=timeline_id,
-            expected_world_id=expected_world_id,
-            party_id=party_id,
-            include_hidden=False,
-        )
+    for quest_view in quest_views:
         for stage in quest_view.stages:
             for objective in stage.objectives:
                 if objective.status_code in _TERMINAL_OBJECTIVE_STATUSES:
@@ -326,7 +347,7 @@ def _advanceable_objectives(
                 candidates.append(
                     AdvanceableObjective(
                         quest_objective_id=objective.quest_objective_id,
-                        quest_id=related.quest_id,
+                        quest_id=quest_view.quest_id,
                         name=objective.name,
                         current_status_code=objective.status_code,
                     )
@@ -407,6 +428,40 @@ def assemble_npc_conversation_context(
     )
 
 
+# Lowest priority first — see this module's docstring.
+_NPC_TRIM_ORDER = (
+    TrimmableSection("known_facts_about_npc", drop_from_front=True),
+    TrimmableSection("revealable_knowledge"),
+    TrimmableSection("advanceable_objectives"),
+    TrimmableSection("related_quests"),
+)
+
+
+def _kept(items: tuple[Any, ...], section: TrimmableSection, report: PromptBudgetReport) -> Any:
+    dropped = report.trimmed_items(section.name)
+    return items[dropped:] if section.drop_from_front else items[: len(items) - dropped]
+
+
+def budget_npc_conversation_context(
+    context: NpcConversationContext, *, budget: PromptBudget
+) -> tuple[NpcConversationContext, PromptBudgetReport]:
+    """`context` with its lowest-priority items removed until its prompt
+    payload fits `budget`, and the report of what that cost and removed."""
+    _payload, report = budget_prompt_payload(
+        context.as_prompt_payload(), budget=budget, trim_order=_NPC_TRIM_ORDER
+    )
+    return (
+        dataclasses.replace(
+            context,
+            **{
+                section.name: _kept(getattr(context, section.name), section, report)
+                for section in _NPC_TRIM_ORDER
+            },
+        ),
+        report,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Audience-aware campaign synthesis (GM brief / player-character question /
 # observer-safe summary) — `dnd_ai.commands.ai_synthesis.request_campaign_
@@ -527,3 +582,30 @@ def assemble_campaign_synthesis_context(
         recent_event_summaries=tuple(e.summary or e.name for e in summary.recent_events),
         party_known_facts=party_known,
     )
+
+
+_SYNTHESIS_TRIM_ORDER = (
+    TrimmableSection("party_known_facts"),
+    TrimmableSection("recent_event_summaries"),
+)
+
+
+def budget_campaign_synthesis_context(
+    context: CampaignSynthesisContext, *, budget: PromptBudget
+) -> tuple[CampaignSynthesisContext, PromptBudgetReport]:
+    """`budget_npc_conversation_context` for a synthesis context. Both
+    trimmable lists are newest first, so trimming from their end drops
+    the oldest entries."""
+    _payload, report = budget_prompt_payload(
+        context.as_prompt_payload(), budget=budget, trim_order=_SYNTHESIS_TRIM_ORDER
+    )
+    return (
+        dataclasses.replace(
+            context,
+            **{
+                section.name: _kept(getattr(context, section.name), section, report)
+                for section in _SYNTHESIS_TRIM_ORDER
+            },
+        ),
+        report,
+    )
@@ -0,0 +1,86 @@
+"""Passage embedders for the reference corpus's optional hybrid retrieval
+(`dnd_ai.commands.reference_corpus`).
+
+`PassageEmbedder` is a `Protocol`, the same seam `dnd_ai.domain.
+ai_provider.AiProvider` gives the NPC commands: ingestion and retrieval
+depend only on `model_identifier` and `embed()`, never on a concrete
+class, and whichever embedder the deployment selects
+(`dnd_ai.config.Settings.reference_embedder`, resolved by
+`build_passage_embedder`) is handed in by the caller. Embedding is local
+and CPU-only — no network call, no API key — because it runs inline with
+ingestion and with every hybrid query.
+
+`HashingEmbedder` is the one implementation shipped: signed feature
+hashing (word tokens plus the character trigrams of each token) into a
+fixed number of dimensions, L2-normalized so a dot product is a cosine.
+It is deterministic across processes and machines (`hashlib.blake2b`,
+never the salted builtin `hash()`), which is what lets tests assert exact
+rankings. The trigrams give it a little morphological reach ("attacks"
+still shares most features with "attack"); it has no notion of synonyms,
+so a trained sentence-embedding model is the natural replacement — any
+object satisfying `PassageEmbedder` plugs in without touching the
+commands.
+
+`model_identifier` is stored next to every passage's vector
+(`ai.reference_passages.embedding_model`) and a query is only ever
+compared against vectors from the same identifier, so switching embedders
+or dimensions can never silently mix incompatible vector spaces. It must
+therefore change whenever the embedder's output would.
+"""
+
+import hashlib
+import math
+import re
+from collections.abc import Sequence
+from typing import Literal, Protocol
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class PassageEmbedder(Protocol):
+    @property
+    def model_identifier(self) -> str: ...
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """One unit-length vector per text, in input order."""
+        ...
+
+
+class HashingEmbedder:
+    """See this module's docstring."""
+
+    def __init__(self, *, dimensions: int = 256) -> None:
+        if dimensions < 1:
+            raise ValueError("dimensions must be positive")
+        self._dimensions = dimensions
+
+    @property
+    def model_identifier(self) -> str:
+        return f"hashing-v1-{self._dimensions}"
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        return [self._embed_one(text) for text in texts]
+
+    def _embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimensions
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            padded = f"#{token}#"
+            features = [token, *(padded[i : i + 3] for i in range(len(padded) - 2))]
+            for feature in features:
+                digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self._dimensions
+                vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0.0:
+            return vector
+        return [value / norm for value in vector]
+
+
+def build_passage_embedder(
+    kind: Literal["none", "hashing"], *, dimensions: int
+) -> PassageEmbedder | None:
+    """The embedder `dnd_ai.config.Settings.reference_embedder` names, or
+    None when hybrid retrieval is switched off."""
+    if kind == "hashing":
+        return HashingEmbedder(dimensions=dimensions)
+    return None
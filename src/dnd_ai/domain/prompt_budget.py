@@ -0,0 +1,190 @@
+"""Prompt-size accounting and budgeting for assembled AI contexts
+(`dnd_ai.domain.context_assembly`).
+
+`PromptTokenizer` is a `Protocol`, the same seam `dnd_ai.domain.embeddings.
+PassageEmbedder` gives hybrid retrieval: budgeting depends only on
+`tokenizer_identifier` and `count()`, and whichever tokenizer the
+deployment selects (`dnd_ai.config.Settings.prompt_tokenizer`, resolved by
+`build_prompt_tokenizer`) is handed in by the caller. Counting is local and
+CPU-only, because it runs inline with every NPC turn and synthesis request.
+Neither shipped tokenizer is the provider's own: `ApproximateTokenizer`
+splits words into four-character pieces and counts every punctuation mark,
+which tracks BPE tokenizers closely on English prose and JSON, and
+`CharacterTokenizer` is the cruder characters-divided-by-four rule. A
+model-specific tokenizer plugs in without touching the commands.
+
+`budget_prompt_payload` trims a prompt payload to `PromptBudget.
+max_tokens`. Only the list-valued sections named in `trim_order` are ever
+trimmed, lowest priority first, one item at a time from the end that
+section's `TrimmableSection` names, until the serialized payload fits or
+every trimmable item is gone. Every other section is kept whole, so an
+over-budget payload of untrimmable sections is sent over budget rather
+than broken. The result depends only on the payload, the budget and the
+tokenizer, never on timing or dict iteration order, so the same context
+always produces the same prompt.
+
+`PromptBudgetReport` is what the commands record next to the payload in
+`ai.context_snapshots` (migration 107): the total, each section's token
+count and item count, and how many items each section lost.
+"""
+
+import json
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal, Protocol
+
+_APPROXIMATE_PIECE_PATTERN = re.compile(r"\w+|[^\w\s]")
+_CHARACTERS_PER_TOKEN = 4
+
+
+class PromptTokenizer(Protocol):
+    @property
+    def tokenizer_identifier(self) -> str: ...
+
+    def count(self, text: str) -> int:
+        """The number of tokens `text` is estimated to cost."""
+        ...
+
+
+class ApproximateTokenizer:
+    """See this module's docstring."""
+
+    @property
+    def tokenizer_identifier(self) -> str:
+        return "approximate-v1"
+
+    def count(self, text: str) -> int:
+        return sum(
+            math.ceil(len(piece) / _CHARACTERS_PER_TOKEN)
+            for piece in _APPROXIMATE_PIECE_PATTERN.findall(text)
+        )
+
+
+class CharacterTokenizer:
+    """See this module's docstring."""
+
+    @property
+    def tokenizer_identifier(self) -> str:
+        return "characters-v1"
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / _CHARACTERS_PER_TOKEN)
+
+
+def build_prompt_tokenizer(kind: Literal["approximate", "characters"]) -> PromptTokenizer:
+    """The tokenizer `dnd_ai.config.Settings.prompt_tokenizer` names."""
+    if kind == "characters":
+        return CharacterTokenizer()
+    return ApproximateTokenizer()
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    """`max_tokens=0` records token counts without trimming anything."""
+
+    tokenizer: PromptTokenizer = field(default_factory=ApproximateTokenizer)
+    max_tokens: int = 0
+
+
+@dataclass(frozen=True)
+class TrimmableSection:
+    """A list-valued payload section that may lose items, from its end
+    (`drop_from_front=False`) or its start."""
+
+    name: str
+    drop_from_front: bool = False
+
+
+@dataclass(frozen=True)
+class SectionTokens:
+    name: str
+    tokens: int
+    items: int | None
+    trimmed_items: int
+
+
+@dataclass(frozen=True)
+class PromptBudgetReport:
+    tokenizer_identifier: str
+    max_tokens: int
+    total_tokens: int
+    sections: tuple[SectionTokens, ...]
+
+    def trimmed_items(self, name: str) -> int:
+        """How many items section `name` lost."""
+        for section in self.sections:
+            if section.name == name:
+                return section.trimmed_items
+        raise KeyError(name)
+
+    def as_record(self) -> dict[str, Any]:
+        """The JSON-serializable form stored in `ai.context_snapshots.
+        prompt_budget`."""
+        return {
+            "tokenizer": self.tokenizer_identifier,
+            "max_tokens": self.max_tokens,
+            "total_tokens": self.total_tokens,
+            "sections": {
+                section.name: {
+                    "tokens": section.tokens,
+                    "items": section.items,
+                    "trimmed_items": section.trimmed_items,
+                }
+                for section in self.sections
+            },
+        }
+
+
+def _serialized(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def budget_prompt_payload(
+    payload: dict[str, Any],
+    *,
+    budget: PromptBudget,
+    trim_order: Sequence[TrimmableSection],
+) -> tuple[dict[str, Any], PromptBudgetReport]:
+    """`payload` trimmed to `budget` as this module's docstring describes,
+    with its report. `payload` itself is never modified."""
+    tokenizer = budget.tokenizer
+    trimmed_payload = {
+        name: list(value) if isinstance(value, list) else value for name, value in payload.items()
+    }
+    trimmed_items = dict.fromkeys(payload, 0)
+
+    if budget.max_tokens > 0:
+        total = tokenizer.count(_serialized(trimmed_payload))
+        for section in trim_order:
+            items = trimmed_payload[section.name]
+            # Item costs are counted once; the whole payload is recounted
+            # only when the running estimate says it may now fit, so a
+            # section of n items costs O(n) counts, not O(n^2).
+            costs = [tokenizer.count(_serialized(item)) + 1 for item in items]
+            index = 0 if section.drop_from_front else -1
+            while total > budget.max_tokens and items:
+                total -= costs.pop(index)
+                del items[index]
+                trimmed_items[section.name] += 1
+                if total <= budget.max_tokens:
+                    total = tokenizer.count(_serialized(trimmed_payload))
+            if total <= budget.max_tokens:
+                break
+
+    sections = tuple(
+        SectionTokens(
+            name=name,
+            tokens=tokenizer.count(_serialized(value)),
+            items=len(value) if isinstance(value, list) else None,
+            trimmed_items=trimmed_items[name],
+        )
+        for name, value in trimmed_payload.items()
+    )
+    return trimmed_payload, PromptBudgetReport(
+        tokenizer_identifier=tokenizer.tokenizer_identifier,
+        max_tokens=budget.max_tokens,
+        total_tokens=tokenizer.count(_serialized(trimmed_payload)),
+        sections=sections,
+    )
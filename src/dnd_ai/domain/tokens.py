@@ -29,14 +29,30 @@ AuthenticationError`. No other exception type escapes `verify_bearer_token`,
 so a caller (`dnd_ai.api.auth.get_verified_token_claims`) never needs to
 know which specific way a token was rejected; that generic-by-design
 behavior already exists on `AuthenticationError` itself.
+
+`VerifiedTokenCache` is an optional, process-local memo of successful
+verifications, keyed by a SHA-256 digest of the raw token together with
+the issuer and audience it was verified against — a hit is only ever
+possible for the byte-identical token under the identical expectations, so
+a token verified for one audience can never be served for another. An
+entry is trusted no longer than the token's own `exp` minus the leeway (so
+strictly inside the window `jwt.decode` itself would accept) and never
+longer than the cache's own `max_ttl_seconds`, which is what bounds how
+long a signing key rotated out of the JWKS document keeps vouching for
+tokens it already verified. Failures are never cached: every rejected
+token is re-verified in full on each attempt.
 """
 
+import hashlib
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 
 import jwt
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 
+from dnd_ai.caching import GenerationCache
+
 from .errors import AuthenticationError
 
 #: Resolves a token's `kid` (key ID) header to the RSA public key that
@@ -63,6 +79,71 @@ class VerifiedTokenClaims:
     email: str | None
 
 
+_TokenCacheKey = tuple[bytes, str, str]
+
+
+@dataclass(frozen=True)
+class _TokenCacheEntry:
+    claims: VerifiedTokenClaims
+    valid_until: float
+
+
+class VerifiedTokenCache(GenerationCache[_TokenCacheKey, _TokenCacheEntry]):
+    """See this module's docstring: a `dnd_ai.caching.GenerationCache` with
+    no generation to compare, whose entries each carry their own
+    `valid_until`. `clock` is the wall clock `exp` is measured against —
+    injectable so tests can step across the expiry boundary without
+    sleeping."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(max_entries=max_entries)
+        self._max_ttl_seconds = max_ttl_seconds
+        self._clock = clock
+
+    @staticmethod
+    def _key(token: str, *, issuer: str, audience: str) -> _TokenCacheKey:
+        return (hashlib.sha256(token.encode()).digest(), issuer, audience)
+
+    def get(self, token: str, *, issuer: str, audience: str) -> VerifiedTokenClaims | None:
+        if not self.enabled:
+            return None
+        now = self._clock()
+        entry = self.lookup(
+            self._key(token, issuer=issuer, audience=audience),
+            generation=None,
+            is_current=lambda cached: now < cached.valid_until,
+        )
+        return None if entry is None else entry.claims
+
+    def put(
+        self,
+        token: str,
+        *,
+        issuer: str,
+        audience: str,
+        claims: VerifiedTokenClaims,
+        expires_at: float,
+        leeway_seconds: int,
+    ) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        valid_until = min(expires_at - leeway_seconds, now + self._max_ttl_seconds)
+        if valid_until <= now:
+            return
+        self.store(
+            self._key(token, issuer=issuer, audience=audience),
+            _TokenCacheEntry(claims=claims, valid_until=valid_until),
+            generation=None,
+        )
+
+
 def verify_bearer_token(
     token: str,
     *,
@@ -70,6 +151,7 @@ def verify_bearer_token(
     audience: str,
     get_signing_key: GetSigningKey,
     leeway_seconds: int = _DEFAULT_LEEWAY_SECONDS,
+    cache: VerifiedTokenCache | None = None,
 ) -> VerifiedTokenClaims:
     """Verify `token`'s signature, issuer, audience, and expiry, and return
     its claims. Raises `AuthenticationError` for every failure mode —
@@ -80,7 +162,17 @@ def verify_bearer_token(
     `leeway_seconds` tolerates ordinary clock drift between this process
     and whatever issued the token (the default, 60 seconds, is a common
     OIDC-client convention, not a value derived from anything this
-    codebase measured)."""
+    codebase measured).
+
+    With a `cache`, a token this function already verified under the same
+    `issuer`/`audience` is answered from it until shortly before its `exp`
+    (see `VerifiedTokenCache`), skipping signing-key resolution and the
+    RS256 check; anything else is verified in full and, on success, stored."""
+    if cache is not None:
+        cached = cache.get(token, issuer=issuer, audience=audience)
+        if cached is not None:
+            return cached
+
     try:
         header = jwt.get_unverified_header(token)
     except jwt.exceptions.InvalidTokenError as exc:
@@ -123,4 +215,14 @@ def verify_bearer_token(
     if email is not None and not isinstance(email, str):
         raise AuthenticationError("token 'email' claim must be a string when present")
 
-    return VerifiedTokenClaims(issuer=resolved_issuer, subject=subject, email=email)
+    claims = VerifiedTokenClaims(issuer=resolved_issuer, subject=subject, email=email)
+    if cache is not None:
+        cache.put(
+            token,
+            issuer=issuer,
+            audience=audience,
+            claims=claims,
+            expires_at=float(payload["exp"]),
+            leeway_seconds=leeway_seconds,
+        )
+    return claims
@@ -36,13 +36,16 @@ from .ai import (
     agent_assignments,
     agent_roles,
     agents,
+    campaign_authorized_sources,
     change_reviews,
     context_requests,
     context_snapshots,
     generated_outputs,
+    npc_context_generations,
     prompt_fragments,
     prompt_templates,
     proposed_changes,
+    reference_corpus_generations,
     reference_passages,
     reference_retrieval_results,
     reference_retrievals,
@@ -241,6 +244,7 @@ from .security import (
     campaign_creation_reservations,
     campaign_invitations,
     campaign_memberships,
+    campaign_security_generations,
     capabilities,
     character_relationship_type_capabilities,
     character_relationship_types,
@@ -279,10 +283,12 @@ __all__ = [
     "businesses",
     "calendar_months",
     "calendars",
+    "campaign_authorized_sources",
     "campaign_creation_reservations",
     "campaign_invitations",
     "campaign_memberships",
     "campaign_parties",
+    "campaign_security_generations",
     "campaigns",
     "canon_statuses",
     "capabilities",
@@ -384,6 +390,7 @@ __all__ = [
     "metadata",
     "military_units",
     "name_types",
+    "npc_context_generations",
     "npcs",
     "objective_dependencies",
     "objective_state",
@@ -415,6 +422,7 @@ __all__ = [
     "quest_state",
     "quest_statuses",
     "quests",
+    "reference_corpus_generations",
     "reference_passages",
     "reference_retrieval_results",
     "reference_retrievals",
@@ -4,7 +4,11 @@ Part of the src/dnd_ai/persistence/tables package. See
 src/dnd_ai/persistence/tables/__init__.py for the metadata-authority note
 this module inherits: this is compared against the live database by
 `alembic check`, so declared tables/columns/comments must match migrations
-093_ai_domain, 094_reference_corpus, and 098_ai_domain_fk_indexes exactly.
+093_ai_domain, 094_reference_corpus, 098_ai_domain_fk_indexes,
+101_ai_output_timings, 102_reference_embeddings,
+103_corpus_generations, 104_campaign_authorized_sources,
+105_ai_output_first_token, 106_npc_context_generations, and
+107_context_prompt_budget exactly.
 `core.source_documents` (094_reference_corpus) lives in tables/core.py
 instead, alongside its sources/source_types siblings — see that module's
 own comment.
@@ -12,6 +16,7 @@ own comment.
 
 from sqlalchemy import (
     REAL,
+    BigInteger,
     Boolean,
     Column,
     Computed,
@@ -23,7 +28,7 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, TSVECTOR, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, TSVECTOR, UUID
 from sqlalchemy.types import Integer
 
 from ._shared import _timestamps, _uuid_pk, metadata
@@ -239,6 +244,23 @@ context_snapshots = Table(
     ),
     Column("assembled_context", JSONB(), nullable=False),
     Column("created_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    Column(
+        "prompt_token_count",
+        Integer(),
+        comment=(
+            "Estimated token count of assembled_context, by the tokenizer named in "
+            "prompt_budget. NULL for a snapshot recorded before token accounting."
+        ),
+    ),
+    Column(
+        "prompt_budget",
+        JSONB(),
+        comment=(
+            "The tokenizer, token budget, total and per-section token and item "
+            "counts of assembled_context, and how many items each section lost to "
+            "the budget. NULL for a snapshot recorded before token accounting."
+        ),
+    ),
     UniqueConstraint("context_request_id", name="ux_context_snapshots_request"),
     schema="ai",
     comment=(
@@ -267,9 +289,41 @@ generated_outputs = Table(
     Column("raw_response", Text()),
     Column("structured_output", JSONB()),
     Column("finish_reason", Text()),
-    Column("latency_ms", Integer()),
+    Column(
+        "latency_ms",
+        Integer(),
+        comment=(
+            "Total wall-clock time of the provider call, including connecting and "
+            "reading the whole response."
+        ),
+    ),
     Column("error_message", Text()),
     Column("created_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    Column(
+        "connect_ms",
+        Integer(),
+        comment=(
+            "Time until the provider call had a usable connection; 0 when a pooled "
+            "keep-alive connection was reused. NULL when the transport reported no "
+            "connection events."
+        ),
+    ),
+    Column(
+        "first_byte_ms",
+        Integer(),
+        comment=(
+            "Time until the provider's response headers arrived. NULL when the call "
+            "failed first or the transport reported no response events."
+        ),
+    ),
+    Column(
+        "first_token_ms",
+        Integer(),
+        comment=(
+            "Time until the first piece of dialogue of a streamed NPC turn arrived. "
+            "NULL for a call that was not streamed or produced no dialogue."
+        ),
+    ),
     schema="ai",
     comment=(
         "The provider response for one context request — recorded whether "
@@ -406,6 +460,24 @@ reference_passages = Table(
         Computed("to_tsvector('english'::regconfig, content)", persisted=True),
     ),
     Column("created_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    # 102_reference_embeddings
+    Column(
+        "embedding",
+        ARRAY(REAL()),
+        comment=(
+            "Unit-length vector of content from a local embedder, computed at "
+            "ingestion; compared only against query vectors from the same "
+            "embedding_model. NULL when ingested without an embedder."
+        ),
+    ),
+    Column(
+        "embedding_model",
+        Text(),
+        comment=(
+            "Identifier of the embedder that produced embedding "
+            "(dnd_ai.domain.embeddings.PassageEmbedder.model_identifier)."
+        ),
+    ),
     UniqueConstraint(
         "source_document_id", "passage_order", name="ux_reference_passages_source_order"
     ),
@@ -414,10 +486,10 @@ reference_passages = Table(
         "One retrievable, citable chunk of a registered source document "
         "(docs/PLAN.md §18.3): chapter/section/page_label carry citation "
         "location, content_tsv is a generated, indexed tsvector column — "
-        "PostgreSQL-native full-text search, no embeddings or external "
-        "search service for this phase. passage_order is the source's own "
-        "ordinal position, used for deterministic tie-breaking and as a "
-        "stable citation reference alongside chapter/section/page_label."
+        "PostgreSQL-native full-text search — and embedding an optional "
+        "local-embedder vector for hybrid retrieval. passage_order is the "
+        "source's own ordinal position, used for deterministic tie-breaking "
+        "and as a stable citation reference alongside chapter/section/page_label."
     ),
 )
 
@@ -502,6 +574,24 @@ reference_retrievals = Table(
         nullable=False,
     ),
     Column("created_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    # 102_reference_embeddings
+    Column(
+        "retrieval_mode",
+        Text(),
+        nullable=False,
+        server_default=text("'lexical'::text"),
+        comment=(
+            "'lexical' ranks by full-text relevance alone; 'hybrid' fuses the "
+            "full-text and vector rankings by reciprocal-rank fusion."
+        ),
+    ),
+    Column(
+        "embedding_model",
+        Text(),
+        comment=(
+            "Embedder used for the query vector of a hybrid retrieval; NULL for a lexical one."
+        ),
+    ),
     schema="ai",
     comment=(
         "One corpus retrieval — the audit trail docs/PLAN.md §18.3 requires "
@@ -544,6 +634,24 @@ reference_retrieval_results = Table(
     ),
     Column("rank", Integer(), nullable=False),
     Column("relevance_score", REAL()),
+    # 102_reference_embeddings
+    Column(
+        "lexical_score",
+        REAL(),
+        comment=(
+            "ts_rank of the passage against the query; NULL when the passage was "
+            "not a full-text candidate."
+        ),
+    ),
+    Column(
+        "vector_score",
+        REAL(),
+        comment=(
+            "Cosine similarity of the passage and query vectors in a hybrid "
+            "retrieval; NULL for a lexical retrieval or a passage that was not a "
+            "vector candidate."
+        ),
+    ),
     # No explicit name — the migration's own inline `PRIMARY KEY (...)`
     # clause leaves Postgres to assign its default `<table>_pkey` name,
     # which SQLAlchemy also leaves unset here so autogenerate matches it.
@@ -559,3 +667,124 @@ reference_retrieval_results = Table(
 Index(
     "ix_reference_retrieval_results_passage_id", reference_retrieval_results.c.reference_passage_id
 )
+
+# ---------------------------------------------------------------------------
+# Reference-retrieval cache invalidation (revision 103_corpus_generations)
+# ---------------------------------------------------------------------------
+
+reference_corpus_generations = Table(
+    "reference_corpus_generations",
+    metadata,
+    Column(
+        "ruleset_version_id",
+        UUID(),
+        ForeignKey("rules.ruleset_versions.ruleset_version_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "generation",
+        BigInteger(),
+        nullable=False,
+        server_default=text("1"),
+        comment=(
+            "Incremented on every corpus write for the ruleset version; a version "
+            "with no row reads as 0. Only equality with a previously read value is "
+            "meaningful."
+        ),
+    ),
+    Column("updated_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    schema="ai",
+    comment=(
+        "One monotonically increasing counter per ruleset version, bumped by "
+        "trigger in the same transaction as any write to that edition's source "
+        "documents, passages, or campaign source grants. The invalidation key "
+        "for the reference-retrieval result cache — never an authorization input."
+    ),
+)
+
+# ---------------------------------------------------------------------------
+# Per-campaign retrievable sources (revision 104_campaign_authorized_sources)
+# ---------------------------------------------------------------------------
+
+campaign_authorized_sources = Table(
+    "campaign_authorized_sources",
+    metadata,
+    Column(
+        "campaign_id",
+        UUID(),
+        ForeignKey("campaign.campaigns.campaign_id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "source_document_id",
+        UUID(),
+        ForeignKey("core.source_documents.source_document_id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "is_house_rule",
+        Boolean(),
+        nullable=False,
+        comment=(
+            "The active grant's is_house_rule; false for a general source without "
+            "a grant. House-rule passages rank first in retrieval."
+        ),
+    ),
+    Column("updated_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    PrimaryKeyConstraint("campaign_id", "source_document_id"),
+    schema="ai",
+    comment=(
+        "Trigger-maintained projection: one row per (campaign, source document) "
+        "the campaign may retrieve from — an active source of the campaign's own "
+        "ruleset version that is general or actively granted to it. Derived "
+        "entirely from core.source_documents, ai.reference_source_campaigns and "
+        "campaign.campaigns; never written directly."
+    ),
+)
+
+Index(
+    "ix_campaign_authorized_sources_source_document_id",
+    campaign_authorized_sources.c.source_document_id,
+)
+
+# ---------------------------------------------------------------------------
+# NPC-context cache invalidation (revision 106_npc_context_generations)
+# ---------------------------------------------------------------------------
+
+npc_context_generations = Table(
+    "npc_context_generations",
+    metadata,
+    Column(
+        "timeline_id",
+        UUID(),
+        ForeignKey("campaign.timelines.timeline_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "generation",
+        BigInteger(),
+        nullable=False,
+        server_default=text("1"),
+        comment=(
+            "Incremented once per committing transaction that wrote the timeline's "
+            "state or its world's authored content; a timeline with no row reads as "
+            "0. Only equality with a previously read value is meaningful."
+        ),
+    ),
+    Column(
+        "bumped_xact",
+        BigInteger(),
+        comment=(
+            "pg_current_xact_id() of the transaction that last incremented "
+            "generation, so one transaction bumps it at most once."
+        ),
+    ),
+    Column("updated_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    schema="ai",
+    comment=(
+        "One monotonically increasing counter per timeline, bumped by trigger at "
+        "the commit of any transaction that wrote a row NPC-conversation context "
+        "assembly reads for that timeline. The invalidation key for the "
+        "NPC-context cache — never an authorization input."
+    ),
+)
@@ -1,4 +1,5 @@
-"""Encounter domain tables — narrative and interaction schemas (revision 078).
+"""Encounter domain tables — narrative and interaction schemas (revisions 078
+and 108_encounter_working_set).
 
 Part of the src/dnd_ai/persistence/tables package. See
 src/dnd_ai/persistence/tables/__init__.py for the metadata-authority note
@@ -11,6 +12,7 @@ __init__.py note for why (alembic does not compare them; tests cover them).
 """
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     ForeignKey,
@@ -76,6 +78,18 @@ encounters = Table(
         ),
     ),
     *_timestamps(),
+    Column(
+        "working_set_version",
+        BigInteger(),
+        nullable=False,
+        server_default=text("nextval('narrative.encounter_working_set_version_seq'::regclass)"),
+        comment=(
+            "Set from narrative.encounter_working_set_version_seq whenever one of "
+            "the encounter's participants or rounds is written. The invalidation "
+            "key for the encounter working-set cache; only equality with a "
+            "previously read value is meaningful."
+        ),
+    ),
     schema="narrative",
     comment=(
         "A combat or tactical encounter (docs/DOMAIN_MODEL.md §17.1) — not "
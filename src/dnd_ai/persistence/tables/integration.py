@@ -11,6 +11,7 @@ __init__.py note for why (alembic does not compare them; tests cover them).
 """
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     ForeignKey,
@@ -65,6 +66,19 @@ external_systems = Table(
             "credential resolves to."
         ),
     ),
+    Column(
+        "credential_generation",
+        BigInteger(),
+        nullable=False,
+        server_default=text("1"),
+        comment=(
+            "Incremented whenever this row's system_key_hash, is_active, "
+            "system_key_principal_user_id, or world_id changes, or the bound user's "
+            "lifecycle status changes. The invalidation key for the API layer's "
+            "cached Foundry-adapter principals; only equality with a previously read "
+            "value is meaningful."
+        ),
+    ),
     *_timestamps(),
     UniqueConstraint("system_key_hash", name="ux_external_systems_system_key_hash"),
     schema="integration",
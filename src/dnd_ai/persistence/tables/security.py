@@ -1,4 +1,4 @@
-"""Security tables — security schema (revisions 003, 080, 082, 087, 088).
+"""Security tables — security schema (revisions 003, 080, 082, 087, 088, 099).
 
 Part of the src/dnd_ai/persistence/tables package. See
 src/dnd_ai/persistence/tables/__init__.py for the metadata-authority note
@@ -11,6 +11,7 @@ __init__.py note for why (alembic does not compare them; tests cover them).
 """
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     ForeignKey,
@@ -1064,3 +1065,39 @@ Index(
     campaign_creation_reservations.c.created_campaign_id,
     postgresql_where=campaign_creation_reservations.c.created_campaign_id.isnot(None),
 )
+
+# ---------------------------------------------------------------------------
+# Access-resolution cache invalidation (revision 099)
+# ---------------------------------------------------------------------------
+
+campaign_security_generations = Table(
+    "campaign_security_generations",
+    metadata,
+    Column(
+        "campaign_id",
+        UUID(),
+        ForeignKey("campaign.campaigns.campaign_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "generation",
+        BigInteger(),
+        nullable=False,
+        server_default=text("1"),
+        comment=(
+            "Incremented on every write to the campaign's memberships, invitations, "
+            "role assignments, character relationships, access-group memberships, "
+            "or resource grants, and on every write to the shared role/capability "
+            "lookup tables. Only equality with a previously read value is meaningful."
+        ),
+    ),
+    Column("updated_at", TIMESTAMP(timezone=True), nullable=False, server_default=text("now()")),
+    schema="security",
+    comment=(
+        "One monotonically increasing counter per campaign, bumped by trigger in "
+        "the same transaction as any write to a security row that "
+        "dnd_ai.domain.access.resolve_access_context reads for that campaign. "
+        "The invalidation key for the API layer's cross-request AccessContext "
+        "cache — never an authorization input in its own right."
+    ),
+)
@@ -34,12 +34,18 @@ falls back to the campaign-wide row. Like `dnd_ai.queries.dungeon`, this
 module performs no authorization of its own — `party_id` must already be
 an authorized perspective (`dnd_ai.api.access.resolve_party_perspective`)
 by the time it reaches here.
+
+`get_quest_views` is the same view for a list of quests, in two statements
+however long the list is; `get_quest_view` is that for one id, so both
+share one copy of the filtering and status rules above. `dnd_ai.domain.
+context_assembly` uses the batch for every quest an NPC participates in.
 """
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from sqlalchemy import Connection, text
+from sqlalchemy import Connection, RowMapping, text
 
 from dnd_ai.domain.errors import DomainAuthorizationError
 
@@ -99,142 +105,176 @@ def get_quest_view(
     campaign-wide row). Raises `QuestNotFoundError` for a nonexistent quest
     or one belonging to a different world than `expected_world_id` (always
     the caller's own resolved-timeline world — `dnd_ai.api._shared.
-    timeline_world_id`, never caller-supplied)."""
-    quest_row = (
-        connection.execute(
-            text("""
-                SELECT q.quest_id, e.world_id, e.canonical_name
-                FROM narrative.quests q
-                JOIN core.entities e ON e.entity_id = q.quest_id
-                WHERE q.quest_id = :quest
-            """),
-            {"quest": quest_id},
-        )
-        .mappings()
-        .one_or_none()
+    timeline_world_id`, never caller-supplied). `get_quest_views` for one
+    id."""
+    (view,) = get_quest_views(
+        connection,
+        quest_ids=(quest_id,),
+        timeline_id=timeline_id,
+        expected_world_id=expected_world_id,
+        party_id=party_id,
+        include_hidden=include_hidden,
     )
+    return view
 
-    if quest_row is None or quest_row["world_id"] != expected_world_id:
-        raise QuestNotFoundError(
-            f"quest {quest_id} does not exist in world {expected_world_id} "
-            f"(actual world: {quest_row['world_id'] if quest_row is not None else None})"
-        )
 
-    quest_status_row = (
-        connection.execute(
+def get_quest_views(
+    connection: Connection,
+    *,
+    quest_ids: Sequence[uuid.UUID],
+    timeline_id: uuid.UUID,
+    expected_world_id: uuid.UUID,
+    party_id: uuid.UUID | None,
+    include_hidden: bool,
+) -> tuple[QuestView, ...]:
+    """`get_quest_view` for many quests in two statements, whatever their
+    number: one for the quests and their statuses, one for every stage
+    with its audience-filtered objectives. Views come back in `quest_ids`
+    order, once per distinct id. Raises `QuestNotFoundError` if any id is
+    nonexistent or from another world, naming only the first such id, so
+    a batch never reveals more than a single lookup would."""
+    distinct_ids = list(dict.fromkeys(quest_ids))
+    if not distinct_ids:
+        return ()
+
+    quest_rows = {
+        row["quest_id"]: row
+        for row in connection.execute(
             text("""
-                SELECT qs_party.code AS party_status_code,
+                SELECT q.quest_id, e.world_id, e.canonical_name,
+                       qs_party.code AS party_status_code,
                        qs_campaign.code AS campaign_status_code
-                FROM (SELECT 1) AS one_row
+                FROM narrative.quests q
+                JOIN core.entities e ON e.entity_id = q.quest_id
                 LEFT JOIN campaign.quest_state qst_party
-                       ON qst_party.timeline_id = :timeline AND qst_party.quest_id = :quest
+                       ON qst_party.timeline_id = :timeline AND qst_party.quest_id = q.quest_id
                       AND qst_party.party_id = :party
                 LEFT JOIN campaign.quest_statuses qs_party
                        ON qs_party.quest_status_id = qst_party.quest_status_id
                 LEFT JOIN campaign.quest_state qst_campaign
-                       ON qst_campaign.timeline_id = :timeline AND qst_campaign.quest_id = :quest
+                       ON qst_campaign.timeline_id = :timeline
+                      AND qst_campaign.quest_id = q.quest_id
                       AND qst_campaign.party_id IS NULL
                 LEFT JOIN campaign.quest_statuses qs_campaign
                        ON qs_campaign.quest_status_id = qst_campaign.quest_status_id
+                WHERE q.quest_id = ANY(CAST(:quests AS uuid[]))
             """),
-            {"timeline": timeline_id, "quest": quest_id, "party": party_id},
-        )
-        .mappings()
-        .one()
-    )
-    quest_status_code = (
-        quest_status_row["party_status_code"]
-        if party_id is not None and quest_status_row["party_status_code"] is not None
-        else quest_status_row["campaign_status_code"]
-    )
+            {"timeline": timeline_id, "party": party_id, "quests": distinct_ids},
+        ).mappings()
+    }
+
+    for quest_id in distinct_ids:
+        quest_row = quest_rows.get(quest_id)
+        if quest_row is None or quest_row["world_id"] != expected_world_id:
+            raise QuestNotFoundError(
+                f"quest {quest_id} does not exist in world {expected_world_id} "
+                f"(actual world: {quest_row['world_id'] if quest_row is not None else None})"
+            )
 
-    objective_rows = connection.execute(
+    # One row per visible objective, or one objective-less row for a stage
+    # with none visible, in the same stage and objective order a single
+    # view has always used.
+    stage_rows = connection.execute(
         text("""
-            SELECT qo.quest_objective_id, qo.quest_stage_id, qo.name, qo.description,
-                   qo.requirement_level, qo.completion_mode, qo.visibility_policy,
-                   qo.quantity_required,
-                   os_party.code AS party_status_code,
-                   os_campaign.code AS campaign_status_code,
-                   (ost_party.objective_state_id IS NOT NULL
-                    OR ost_campaign.objective_state_id IS NOT NULL) AS has_state
-            FROM narrative.quest_objectives qo
-            JOIN narrative.quest_stages qs ON qs.quest_stage_id = qo.quest_stage_id
-            LEFT JOIN campaign.objective_state ost_party
-                   ON ost_party.timeline_id = :timeline
-                  AND ost_party.quest_objective_id = qo.quest_objective_id
-                  AND ost_party.party_id = :party
-            LEFT JOIN campaign.objective_statuses os_party
-                   ON os_party.objective_status_id = ost_party.objective_status_id
-            LEFT JOIN campaign.objective_state ost_campaign
-                   ON ost_campaign.timeline_id = :timeline
-                  AND ost_campaign.quest_objective_id = qo.quest_objective_id
-                  AND ost_campaign.party_id IS NULL
-            LEFT JOIN campaign.objective_statuses os_campaign
-                   ON os_campaign.objective_status_id = ost_campaign.objective_status_id
-            WHERE qs.quest_id = :quest
-              AND (
-                :include_hidden
-                OR qo.visibility_policy = 'visible'
-                OR (
-                    qo.visibility_policy IN ('hidden_until_active', 'hidden_until_discovered')
-                    AND (ost_party.objective_state_id IS NOT NULL
-                         OR ost_campaign.objective_state_id IS NOT NULL)
-                )
-              )
-            ORDER BY qo.quest_objective_id
+            SELECT qs.quest_id, qs.quest_stage_id, qs.name AS stage_name,
+                   qs.description AS stage_description, qs.sequence_number, qs.stage_type,
+                   o.*
+            FROM narrative.quest_stages qs
+            LEFT JOIN LATERAL (
+                SELECT qo.quest_objective_id, qo.name, qo.description,
+                       qo.requirement_level, qo.completion_mode, qo.visibility_policy,
+                       qo.quantity_required,
+                       os_party.code AS party_status_code,
+                       os_campaign.code AS campaign_status_code
+                FROM narrative.quest_objectives qo
+                LEFT JOIN campaign.objective_state ost_party
+                       ON ost_party.timeline_id = :timeline
+                      AND ost_party.quest_objective_id = qo.quest_objective_id
+                      AND ost_party.party_id = :party
+                LEFT JOIN campaign.objective_statuses os_party
+                       ON os_party.objective_status_id = ost_party.objective_status_id
+                LEFT JOIN campaign.objective_state ost_campaign
+                       ON ost_campaign.timeline_id = :timeline
+                      AND ost_campaign.quest_objective_id = qo.quest_objective_id
+                      AND ost_campaign.party_id IS NULL
+                LEFT JOIN campaign.objective_statuses os_campaign
+                       ON os_campaign.objective_status_id = ost_campaign.objective_status_id
+                WHERE qo.quest_stage_id = qs.quest_stage_id
+                  AND (
+                    :include_hidden
+                    OR qo.visibility_policy = 'visible'
+                    OR (
+                        qo.visibility_policy IN ('hidden_until_active', 'hidden_until_discovered')
+                        AND (ost_party.objective_state_id IS NOT NULL
+                             OR ost_campaign.objective_state_id IS NOT NULL)
+                    )
+                  )
+            ) o ON true
+            WHERE qs.quest_id = ANY(CAST(:quests AS uuid[]))
+            ORDER BY qs.quest_id, qs.sequence_number, qs.quest_stage_id, o.quest_objective_id
         """),
         {
             "timeline": timeline_id,
-            "quest": quest_id,
             "party": party_id,
+            "quests": distinct_ids,
             "include_hidden": include_hidden,
         },
     ).mappings()
 
+    stage_rows_by_quest: dict[uuid.UUID, list[RowMapping]] = {}
     objectives_by_stage: dict[uuid.UUID, list[QuestObjectiveView]] = {}
-    for obj_row in objective_rows:
-        status_code = (
-            obj_row["party_status_code"]
-            if party_id is not None and obj_row["party_status_code"] is not None
-            else obj_row["campaign_status_code"]
-        )
-        objectives_by_stage.setdefault(obj_row["quest_stage_id"], []).append(
+    for row in stage_rows:
+        stage_id = row["quest_stage_id"]
+        if stage_id not in objectives_by_stage:
+            objectives_by_stage[stage_id] = []
+            stage_rows_by_quest.setdefault(row["quest_id"], []).append(row)
+        if row["quest_objective_id"] is None:
+            continue
+        objectives_by_stage[stage_id].append(
             QuestObjectiveView(
-                quest_objective_id=obj_row["quest_objective_id"],
-                name=obj_row["name"],
-                description=obj_row["description"],
-                requirement_level=obj_row["requirement_level"],
-                completion_mode=obj_row["completion_mode"],
-                visibility_policy=obj_row["visibility_policy"],
-                quantity_required=obj_row["quantity_required"],
-                status_code=status_code,
+                quest_objective_id=row["quest_objective_id"],
+                name=row["name"],
+                description=row["description"],
+                requirement_level=row["requirement_level"],
+                completion_mode=row["completion_mode"],
+                visibility_policy=row["visibility_policy"],
+                quantity_required=row["quantity_required"],
+                status_code=_effective_status(
+                    party_id, row["party_status_code"], row["campaign_status_code"]
+                ),
             )
         )
 
-    stage_rows = connection.execute(
-        text("""
-            SELECT quest_stage_id, name, description, sequence_number, stage_type
-            FROM narrative.quest_stages
-            WHERE quest_id = :quest
-            ORDER BY sequence_number, quest_stage_id
-        """),
-        {"quest": quest_id},
-    ).mappings()
-    stages = tuple(
-        QuestStageView(
-            quest_stage_id=stage_row["quest_stage_id"],
-            name=stage_row["name"],
-            description=stage_row["description"],
-            sequence_number=stage_row["sequence_number"],
-            stage_type=stage_row["stage_type"],
-            objectives=tuple(objectives_by_stage.get(stage_row["quest_stage_id"], [])),
+    return tuple(
+        QuestView(
+            quest_id=quest_id,
+            name=quest_rows[quest_id]["canonical_name"],
+            status_code=_effective_status(
+                party_id,
+                quest_rows[quest_id]["party_status_code"],
+                quest_rows[quest_id]["campaign_status_code"],
+            ),
+            stages=tuple(
+                QuestStageView(
+                    quest_stage_id=stage_row["quest_stage_id"],
+                    name=stage_row["stage_name"],
+                    description=stage_row["stage_description"],
+                    sequence_number=stage_row["sequence_number"],
+                    stage_type=stage_row["stage_type"],
+                    objectives=tuple(objectives_by_stage[stage_row["quest_stage_id"]]),
+                )
+                for stage_row in stage_rows_by_quest.get(quest_id, [])
+            ),
         )
-        for stage_row in stage_rows
+        for quest_id in distinct_ids
     )
 
-    return QuestView(
-        quest_id=quest_row["quest_id"],
-        name=quest_row["canonical_name"],
-        status_code=quest_status_code,
-        stages=stages,
-    )
+
+def _effective_status(
+    party_id: uuid.UUID | None, party_status_code: str | None, campaign_status_code: str | None
+) -> str | None:
+    """The party's own status when `party_id` is supplied and it has one,
+    otherwise the campaign-wide status — see this module's docstring."""
+    if party_id is not None and party_status_code is not None:
+        return party_status_code
+    return campaign_status_code
@@ -0,0 +1,255 @@
+"""Tests for revision 099's per-campaign security generation triggers and
+the cross-request AccessContext cache built on them
+(src/dnd_ai/api/access_cache.py).
+
+The triggers are asserted table by table: a security write that forgets
+to bump the generation is exactly the silent failure that would let a
+revoked grant or role keep authorizing from a cached context.
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import Connection, text
+
+from dnd_ai.api.access_cache import AccessContextCache
+from dnd_ai.domain.access import read_campaign_security_generation, resolve_access_context
+from tests.factories import (
+    make_access_group,
+    make_access_group_membership,
+    make_campaign,
+    make_campaign_membership,
+    make_capability,
+    make_character,
+    make_character_relationship_type,
+    make_membership_character_relationship,
+    make_membership_role,
+    make_quest,
+    make_relationship_type_capability,
+    make_resource_grant,
+    make_role,
+    make_role_capability,
+    make_timeline,
+    make_user,
+    make_world,
+)
+
+pytestmark = pytest.mark.database
+
+
+class Fixture:
+    def __init__(self, connection: Connection) -> None:
+        self.world_id = make_world(connection, slug="access-cache-world")
+        self.timeline_id = make_timeline(connection, self.world_id, "Primary", is_primary=True)
+        self.campaign_id = make_campaign(connection, self.timeline_id)
+        self.other_campaign_id = make_campaign(connection, self.timeline_id, "Other")
+        self.character_id = make_character(connection, self.world_id, name="PC")
+        self.quest_id = make_quest(connection, self.world_id)
+
+        self.user_id = make_user(connection, "Access Cache User")
+        self.membership_id = make_campaign_membership(connection, self.campaign_id, self.user_id)
+
+        self.role_id = make_role(connection, campaign_id=self.campaign_id)
+        self.capability_id = make_capability(connection, "test.cached_capability")
+        make_role_capability(connection, self.role_id, self.capability_id)
+        self.relationship_type_id = make_character_relationship_type(connection)
+        make_relationship_type_capability(connection, self.relationship_type_id, self.capability_id)
+        self.access_group_id = make_access_group(connection, self.campaign_id)
+
+
+@pytest.fixture
+def f(db_connection: Connection) -> Fixture:
+    return Fixture(db_connection)
+
+
+def _generation(connection: Connection, campaign_id: uuid.UUID) -> int:
+    current = read_campaign_security_generation(connection, campaign_id=campaign_id)
+    assert current is not None
+    return current.generation
+
+
+# ---------------------------------------------------------------------------
+# Generation row lifecycle
+# ---------------------------------------------------------------------------
+
+
+def test_every_new_campaign_gets_a_generation_row(db_connection: Connection, f: Fixture) -> None:
+    assert read_campaign_security_generation(db_connection, campaign_id=f.campaign_id) is not None
+
+
+def test_unknown_campaign_has_no_generation(db_connection: Connection) -> None:
+    assert read_campaign_security_generation(db_connection, campaign_id=uuid.uuid4()) is None
+
+
+# ---------------------------------------------------------------------------
+# Campaign-scoped bump triggers — one test per table, and each must leave
+# every other campaign's generation untouched.
+# ---------------------------------------------------------------------------
+
+
+def test_membership_write_bumps_only_its_campaign(db_connection: Connection, f: Fixture) -> None:
+    before = _generation(db_connection, f.campaign_id)
+    other_before = _generation(db_connection, f.other_campaign_id)
+    make_campaign_membership(db_connection, f.campaign_id, make_user(db_connection, "New"))
+    assert _generation(db_connection, f.campaign_id) > before
+    assert _generation(db_connection, f.other_campaign_id) == other_before
+
+
+def test_membership_role_revocation_bumps(db_connection: Connection, f: Fixture) -> None:
+    membership_role_id = make_membership_role(db_connection, f.membership_id, f.role_id)
+    before = _generation(db_connection, f.campaign_id)
+    db_connection.execute(
+        text(
+            "UPDATE security.membership_roles SET revoked_at = now() WHERE membership_role_id = :id"
+        ),
+        {"id": membership_role_id},
+    )
+    assert _generation(db_connection, f.campaign_id) > before
+
+
+def test_character_relationship_write_bumps(db_connection: Connection, f: Fixture) -> None:
+    before = _generation(db_connection, f.campaign_id)
+    make_membership_character_relationship(
+        db_connection, f.membership_id, f.character_id, f.relationship_type_id
+    )
+    assert _generation(db_connection, f.campaign_id) > before
+
+
+def test_access_group_membership_removal_bumps(db_connection: Connection, f: Fixture) -> None:
+    group_membership_id = make_access_group_membership(
+        db_connection, f.access_group_id, f.membership_id
+    )
+    before = _generation(db_connection, f.campaign_id)
+    db_connection.execute(
+        text(
+            "UPDATE security.access_group_memberships SET removed_at = now() "
+            "WHERE access_group_membership_id = :id"
+        ),
+        {"id": group_membership_id},
+    )
+    assert _generation(db_connection, f.campaign_id) > before
+
+
+def test_resource_grant_write_bumps(db_connection: Connection, f: Fixture) -> None:
+    before = _generation(db_connection, f.campaign_id)
+    make_resource_grant(
+        db_connection,
+        f.campaign_id,
+        f.capability_id,
+        grantee_campaign_membership_id=f.membership_id,
+        quest_id=f.quest_id,
+    )
+    assert _generation(db_connection, f.campaign_id) > before
+
+
+def test_shared_capability_write_bumps_every_campaign(
+    db_connection: Connection, f: Fixture
+) -> None:
+    before = _generation(db_connection, f.campaign_id)
+    other_before = _generation(db_connection, f.other_campaign_id)
+    db_connection.execute(
+        text("UPDATE security.capabilities SET is_active = false WHERE capability_id = :id"),
+        {"id": f.capability_id},
+    )
+    assert _generation(db_connection, f.campaign_id) > before
+    assert _generation(db_connection, f.other_campaign_id) > other_before
+
+
+# ---------------------------------------------------------------------------
+# valid_until — the earliest expires_at among contributing rows
+# ---------------------------------------------------------------------------
+
+
+def test_valid_until_is_the_earliest_contributing_expiry(
+    db_connection: Connection, f: Fixture
+) -> None:
+    membership_role_id = make_membership_role(db_connection, f.membership_id, f.role_id)
+    grant_id = make_resource_grant(
+        db_connection,
+        f.campaign_id,
+        f.capability_id,
+        grantee_campaign_membership_id=f.membership_id,
+        quest_id=f.quest_id,
+    )
+    db_connection.execute(
+        text(
+            "UPDATE security.membership_roles SET expires_at = now() + interval '2 hours' "
+            "WHERE membership_role_id = :id"
+        ),
+        {"id": membership_role_id},
+    )
+    db_connection.execute(
+        text(
+            "UPDATE security.resource_grants SET expires_at = now() + interval '1 hour' "
+            "WHERE resource_grant_id = :id"
+        ),
+        {"id": grant_id},
+    )
+    now = db_connection.execute(text("SELECT now()")).scalar_one()
+
+    ctx = resolve_access_context(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+
+    assert ctx is not None
+    assert ctx.valid_until == now + timedelta(hours=1)
+
+
+def test_valid_until_is_none_when_nothing_expires(db_connection: Connection, f: Fixture) -> None:
+    make_membership_role(db_connection, f.membership_id, f.role_id)
+    ctx = resolve_access_context(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+    assert ctx is not None
+    assert ctx.valid_until is None
+
+
+# ---------------------------------------------------------------------------
+# AccessContextCache end to end
+# ---------------------------------------------------------------------------
+
+
+def test_cache_serves_the_same_context_while_the_generation_holds(
+    db_connection: Connection, f: Fixture
+) -> None:
+    cache = AccessContextCache(max_entries=16, ttl_seconds=60)
+    first = cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+    second = cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+    assert first is not None
+    assert second is first
+
+
+def test_cache_never_serves_a_revoked_role(db_connection: Connection, f: Fixture) -> None:
+    membership_role_id = make_membership_role(db_connection, f.membership_id, f.role_id)
+    cache = AccessContextCache(max_entries=16, ttl_seconds=60)
+    cached = cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+    assert cached is not None
+    assert cached.has_capability("test.cached_capability")
+
+    db_connection.execute(
+        text(
+            "UPDATE security.membership_roles SET revoked_at = now() WHERE membership_role_id = :id"
+        ),
+        {"id": membership_role_id},
+    )
+
+    fresh = cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id)
+    assert fresh is not None
+    assert not fresh.has_capability("test.cached_capability")
+
+
+def test_cache_never_serves_a_suspended_membership(db_connection: Connection, f: Fixture) -> None:
+    cache = AccessContextCache(max_entries=16, ttl_seconds=60)
+    assert cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id) is not None
+
+    db_connection.execute(
+        text("""
+            UPDATE security.campaign_memberships
+            SET membership_status_id = (
+                SELECT membership_status_id FROM security.membership_statuses
+                WHERE code = 'suspended'
+            )
+            WHERE campaign_membership_id = :id
+        """),
+        {"id": f.membership_id},
+    )
+
+    assert cache.resolve(db_connection, user_id=f.user_id, campaign_id=f.campaign_id) is None
+    assert len(cache) == 0
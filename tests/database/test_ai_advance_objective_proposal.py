@@ -1681,6 +1681,10 @@ def test_review_still_rejects_a_proposal_from_a_different_campaign(
         )
 
     with postgres_engine.begin() as cleanup:
+        cleanup.execute(
+            text("DELETE FROM security.campaign_security_generations WHERE campaign_id = :c"),
+            {"c": other_campaign_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE campaign_id = :c"),
             {"c": other_campaign_id},
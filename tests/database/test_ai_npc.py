@@ -4,12 +4,15 @@ Generated -> Proposed -> Validated -> Approved -> Applied proposal
 lifecycle (docs/PLAN.md Phase 12, docs/ENTITY_LIFECYCLE.md §10).
 
 Context assembly is tested against the rollback-wrapped `db_connection`
-fixture; the full proposal pipeline (`request_npc_conversation_turn`/
+fixture, as is the migration-106 trigger that bumps `ai.npc_context_
+generations` at commit (forced early with `SET CONSTRAINTS ALL
+IMMEDIATE`); the full proposal pipeline (`request_npc_conversation_turn`/
 `review_proposed_change`) is engine-based and multi-transaction (see
 `dnd_ai.commands.ai_npc`'s own docstring for why), so those tests use the
 real, session-scoped `postgres_engine` with explicit cleanup — the same
 shape `tests/database/test_api_integration.py` already established for
-engine-based commands.
+engine-based commands. Prompt budgeting is tested at both levels: which
+sections a budget trims, and what a budgeted turn records and offers.
 """
 
 import json
@@ -19,10 +22,14 @@ from collections.abc import Iterator
 import pytest
 from sqlalchemy import Connection, Engine, text
 
-from dnd_ai.commands.ai_npc import request_npc_conversation_turn
+from dnd_ai.commands.ai_npc import NpcContextCache, request_npc_conversation_turn
 from dnd_ai.commands.ai_proposals import ProposedChangeNotFoundError, review_proposed_change
 from dnd_ai.domain.ai_provider import FakeAiProvider
-from dnd_ai.domain.context_assembly import assemble_npc_conversation_context
+from dnd_ai.domain.context_assembly import (
+    assemble_npc_conversation_context,
+    budget_npc_conversation_context,
+)
+from dnd_ai.domain.prompt_budget import PromptBudget
 from tests.factories import (
     cleanup_committed_ai_world,
     make_agent,
@@ -155,6 +162,53 @@ def test_context_payload_is_json_serializable(db_connection: Connection, f: Fixt
     json.dumps(context.as_prompt_payload())  # must not raise
 
 
+def test_budgeting_trims_known_facts_before_any_candidate(
+    db_connection: Connection, f: Fixture
+) -> None:
+    context = assemble_npc_conversation_context(
+        db_connection,
+        npc_entity_id=f.npc_id,
+        timeline_id=f.timeline_id,
+        expected_world_id=f.world_id,
+        requesting_character_id=f.pc_id,
+        requesting_party_id=f.party_id,
+    )
+    _unbounded, unbounded_report = budget_npc_conversation_context(context, budget=PromptBudget())
+
+    trimmed, report = budget_npc_conversation_context(
+        context, budget=PromptBudget(max_tokens=unbounded_report.total_tokens - 1)
+    )
+
+    assert trimmed.known_facts_about_npc == ()
+    assert trimmed.revealable_knowledge == context.revealable_knowledge
+    assert trimmed.related_quests == context.related_quests
+    assert report.trimmed_items("known_facts_about_npc") == 1
+    assert report.total_tokens < unbounded_report.total_tokens
+
+
+def _npc_context_generation(connection: Connection, timeline_id: uuid.UUID) -> int:
+    generation = connection.execute(
+        text("SELECT generation FROM ai.npc_context_generations WHERE timeline_id = :t"),
+        {"t": timeline_id},
+    ).scalar()
+    return generation or 0
+
+
+def test_state_writes_bump_the_timeline_generation_once_at_commit(
+    db_connection: Connection, f: Fixture
+) -> None:
+    # Deferred: the fixture's own writes have bumped nothing yet.
+    assert _npc_context_generation(db_connection, f.timeline_id) == 0
+
+    db_connection.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))
+    assert _npc_context_generation(db_connection, f.timeline_id) == 1
+
+    make_party_knowledge(db_connection, f.timeline_id, f.party_id, f.secret_id)
+    db_connection.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))
+    # Still one transaction, so still one bump.
+    assert _npc_context_generation(db_connection, f.timeline_id) == 1
+
+
 @pytest.fixture
 def committed(postgres_engine: Engine) -> Iterator[Fixture]:
     with postgres_engine.begin() as connection:
@@ -259,6 +313,10 @@ def test_review_rejects_a_proposal_from_a_different_campaign(
         assert status == "pending"
 
     with postgres_engine.begin() as cleanup:
+        cleanup.execute(
+            text("DELETE FROM security.campaign_security_generations WHERE campaign_id = :c"),
+            {"c": other_campaign_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE campaign_id = :c"),
             {"c": other_campaign_id},
@@ -389,3 +447,120 @@ def test_rejecting_a_proposal_leaves_canonical_state_unchanged(
         cleanup.execute(
             text("DELETE FROM security.users WHERE user_id = :u"), {"u": reviewer_user_id}
         )
+
+
+def test_consecutive_turns_reuse_the_context_until_canonical_state_changes(
+    postgres_engine: Engine, committed: Fixture
+) -> None:
+    cache = NpcContextCache(max_entries=10, ttl_seconds=60)
+
+    def turn(*, reveal: bool) -> uuid.UUID:
+        result = request_npc_conversation_turn(
+            postgres_engine,
+            agent_assignment_id=committed.assignment_id,
+            requesting_user_id=None,
+            requesting_character_id=committed.pc_id,
+            requesting_party_id=committed.party_id,
+            player_message="Tell me something about yourself.",
+            provider=FakeAiProvider(dialogue="Hm.", reveal_first_candidate=reveal),
+            timeline_id=committed.timeline_id,
+            expected_world_id=committed.world_id,
+            world_time_id=committed.world_time_id,
+            context_cache=cache,
+        )
+        return result.context_request_id
+
+    first = turn(reveal=False)
+    # A hit: the context is reused, and the auto-approved reveal it offers
+    # is applied, which bumps the generation at commit.
+    second = turn(reveal=True)
+    third = turn(reveal=False)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    with postgres_engine.connect() as verify:
+        snapshots = dict(
+            verify.execute(
+                text("""
+                    SELECT context_request_id, assembled_context FROM ai.context_snapshots
+                    WHERE context_request_id IN (:a, :b, :c)
+                """),
+                {"a": first, "b": second, "c": third},
+            ).all()
+        )
+    # Every turn still records its own snapshot.
+    assert set(snapshots) == {first, second, third}
+    assert snapshots[second] == snapshots[first]
+    assert [k["statement"] for k in snapshots[first]["revealable_knowledge"]] == [
+        "The innkeeper is secretly a retired adventurer."
+    ]
+    assert snapshots[third]["revealable_knowledge"] == []
+    assert (
+        "The innkeeper is secretly a retired adventurer."
+        in (snapshots[third]["known_facts_about_npc"])
+    )
+
+
+def test_a_turn_records_token_accounting_and_never_offers_a_trimmed_candidate(
+    postgres_engine: Engine, committed: Fixture
+) -> None:
+    # Too small for any trimmable section: the unknown secret is cut from
+    # the prompt, so the provider's "reveal the first candidate" finds none.
+    result = request_npc_conversation_turn(
+        postgres_engine,
+        agent_assignment_id=committed.assignment_id,
+        requesting_user_id=None,
+        requesting_character_id=committed.pc_id,
+        requesting_party_id=committed.party_id,
+        player_message="Tell me something about yourself.",
+        provider=FakeAiProvider(dialogue="Hm.", reveal_first_candidate=True),
+        timeline_id=committed.timeline_id,
+        expected_world_id=committed.world_id,
+        world_time_id=committed.world_time_id,
+        prompt_budget=PromptBudget(max_tokens=1),
+    )
+
+    assert result.ai_proposed_change_id is None
+    with postgres_engine.connect() as verify:
+        snapshot = verify.execute(
+            text("""
+                SELECT assembled_context, prompt_token_count, prompt_budget
+                FROM ai.context_snapshots WHERE context_request_id = :request
+            """),
+            {"request": result.context_request_id},
+        ).one()
+    assert snapshot.assembled_context["revealable_knowledge"] == []
+    assert snapshot.assembled_context["npc"]["name"] == "Old Innkeeper"
+    assert snapshot.prompt_budget["tokenizer"] == "approximate-v1"
+    assert snapshot.prompt_budget["max_tokens"] == 1
+    assert snapshot.prompt_budget["total_tokens"] == snapshot.prompt_token_count
+    assert snapshot.prompt_budget["sections"]["revealable_knowledge"] == {
+        "tokens": 2,
+        "items": 0,
+        "trimmed_items": 1,
+    }
+    assert snapshot.prompt_budget["sections"]["known_facts_about_npc"]["trimmed_items"] == 1
+    assert snapshot.prompt_budget["sections"]["npc"]["items"] is None
+
+
+def test_an_authored_world_write_bumps_every_timeline_of_the_world(
+    postgres_engine: Engine, committed: Fixture
+) -> None:
+    with postgres_engine.begin() as connection:
+        branch_id = make_timeline(connection, committed.world_id)
+    with postgres_engine.connect() as connection:
+        before = {
+            t: _npc_context_generation(connection, t) for t in (committed.timeline_id, branch_id)
+        }
+
+    with postgres_engine.begin() as connection:
+        connection.execute(
+            text(
+                "UPDATE core.entities SET canonical_name = 'Grumpy Innkeeper' WHERE entity_id = :e"
+            ),
+            {"e": committed.npc_id},
+        )
+
+    with postgres_engine.connect() as connection:
+        after = {t: _npc_context_generation(connection, t) for t in before}
+    assert after == {t: generation + 1 for t, generation in before.items()}
@@ -16,7 +16,9 @@ from dnd_ai.domain.context_assembly import (
     OBSERVER_SUMMARY,
     PLAYER_SUMMARY,
     assemble_campaign_synthesis_context,
+    budget_campaign_synthesis_context,
 )
+from dnd_ai.domain.prompt_budget import PromptBudget
 from tests.factories import (
     cleanup_committed_ai_world,
     make_agent,
@@ -120,6 +122,28 @@ def test_player_summary_excludes_drafts_but_includes_party_knowledge(
     assert any("haunted" in fact for fact in context.party_known_facts)
 
 
+def test_budgeting_drops_party_facts_before_recent_events(
+    db_connection: Connection, f: Fixture
+) -> None:
+    context = assemble_campaign_synthesis_context(
+        db_connection,
+        campaign_id=f.campaign_id,
+        audience_tier=PLAYER_SUMMARY,
+        timeline_id=f.timeline_id,
+        requesting_party_id=f.party_id,
+    )
+    _unbounded, unbounded_report = budget_campaign_synthesis_context(context, budget=PromptBudget())
+
+    trimmed, report = budget_campaign_synthesis_context(
+        context, budget=PromptBudget(max_tokens=unbounded_report.total_tokens - 1)
+    )
+
+    assert trimmed.party_known_facts == ()
+    assert trimmed.recent_event_summaries == context.recent_event_summaries
+    assert report.trimmed_items("party_known_facts") == 1
+    assert report.trimmed_items("recent_event_summaries") == 0
+
+
 @pytest.fixture
 def committed(postgres_engine: Engine) -> Iterator[Fixture]:
     with postgres_engine.begin() as connection:
@@ -168,3 +192,14 @@ def test_request_campaign_synthesis_records_output(
             {"id": result.generated_output_id},
         ).scalar()
         assert output_count == 1
+
+        token_count, budget = verify.execute(
+            text("""
+                SELECT prompt_token_count, prompt_budget FROM ai.context_snapshots
+                WHERE context_request_id = :id
+            """),
+            {"id": result.context_request_id},
+        ).one()
+        assert token_count is not None and token_count > 0
+        assert budget["max_tokens"] == 0
+        assert budget["total_tokens"] == token_count
@@ -267,6 +267,16 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
                 """),
                 {"w": world_id},
             )
+            cleanup.execute(
+                text("""
+                    DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                        SELECT campaign_id FROM campaign.campaigns WHERE timeline_id IN (
+                            SELECT timeline_id FROM campaign.timelines WHERE world_id = :w
+                        )
+                    )
+                """),
+                {"w": world_id},
+            )
             cleanup.execute(
                 text("""
                     DELETE FROM campaign.campaigns WHERE timeline_id IN (
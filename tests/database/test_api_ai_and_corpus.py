@@ -11,6 +11,7 @@ the same "wiring, not re-proof" scope `tests/database/test_api_quests.py`'s
 own docstring establishes for its domain.
 """
 
+import json
 import uuid
 from collections.abc import Callable, Iterator
 
@@ -22,7 +23,8 @@ from dnd_ai.api.ai_npc import _resolve_provider
 from dnd_ai.api.app import create_app
 from dnd_ai.api.auth import get_authenticated_user_id
 from dnd_ai.api.deps import get_engine
-from dnd_ai.domain.ai_provider import FakeAiProvider
+from dnd_ai.config import settings
+from dnd_ai.domain.ai_provider import FakeAsyncAiProvider
 from tests.factories import (
     cleanup_committed_ai_world,
     lookup_id,
@@ -173,7 +175,7 @@ def client_factory(postgres_engine: Engine) -> Callable[[uuid.UUID], TestClient]
         app = create_app()
         app.dependency_overrides[get_engine] = lambda: postgres_engine
         app.dependency_overrides[get_authenticated_user_id] = lambda: oidc_principal(user_id)
-        app.dependency_overrides[_resolve_provider] = lambda: FakeAiProvider(
+        app.dependency_overrides[_resolve_provider] = lambda: FakeAsyncAiProvider(
             dialogue="Welcome, traveler.", reveal_first_candidate=False
         )
         return TestClient(app, raise_server_exceptions=False)
@@ -229,6 +231,180 @@ def test_register_source_document_outsider_not_found(
     assert response.status_code == 404
 
 
+def _register_source(client: TestClient, f: Fixture) -> str:
+    response = client.post(
+        f"/campaigns/{f.campaign_id}/reference-corpus/sources", json=_register_source_body(f)
+    )
+    assert response.status_code == 201
+    return str(response.json()["source_document_id"])
+
+
+def _ndjson(*passages: dict[str, object]) -> bytes:
+    return b"".join(json.dumps(passage).encode() + b"\n" for passage in passages)
+
+
+def test_ingest_passage_stream_gm_succeeds(
+    client_factory: Callable[[uuid.UUID], TestClient], postgres_engine: Engine, f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        source_id = _register_source(client, f)
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{source_id}/passages/ndjson",
+            content=_ndjson(
+                {"passage_order": 2, "content": "Third."},
+                {"passage_order": 0, "content": "First.", "page_label": "12"},
+                {"passage_order": 1, "content": "Second."},
+            ),
+            headers={"content-type": "application/x-ndjson"},
+        )
+    assert response.status_code == 201
+    with postgres_engine.connect() as connection:
+        stored = connection.execute(
+            text("""
+                SELECT reference_passage_id FROM ai.reference_passages
+                WHERE source_document_id = :source ORDER BY passage_order
+            """),
+            {"source": source_id},
+        ).scalars()
+        assert response.json()["reference_passage_ids"] == [str(row) for row in stored]
+
+
+def test_ingest_passage_stream_rejects_other_media_types(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        source_id = _register_source(client, f)
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{source_id}/passages/ndjson",
+            content=_ndjson({"passage_order": 0, "content": "First."}),
+            headers={"content-type": "application/json"},
+        )
+    assert response.status_code == 415
+    assert response.json()["error"]["code"] == "unsupported_media_type"
+
+
+def test_ingest_passage_stream_malformed_line_commits_nothing(
+    client_factory: Callable[[uuid.UUID], TestClient], postgres_engine: Engine, f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        source_id = _register_source(client, f)
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{source_id}/passages/ndjson",
+            content=_ndjson({"passage_order": 0, "content": "First."}) + b"{not json\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "invalid_passage_stream"
+    with postgres_engine.connect() as connection:
+        count = connection.execute(
+            text("SELECT count(*) FROM ai.reference_passages WHERE source_document_id = :source"),
+            {"source": source_id},
+        ).scalar()
+    assert count == 0
+
+
+def test_ingest_passage_stream_capless_member_forbidden(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.capless_user_id) as client:
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{uuid.uuid4()}/passages/ndjson",
+            content=_ndjson({"passage_order": 0, "content": "First."}),
+            headers={"content-type": "application/x-ndjson"},
+        )
+    assert response.status_code == 403
+
+
+def test_hybrid_query_without_an_embedder_is_unavailable(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.viewer_user_id) as client:
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/query",
+            json={"query_text": "fireball", "mode": "hybrid"},
+        )
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == "hybrid_retrieval_unavailable"
+
+
+def test_hybrid_query_uses_the_configured_embedder(
+    client_factory: Callable[[uuid.UUID], TestClient],
+    f: Fixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "reference_embedder", "hashing")
+    with client_factory(f.gm_user_id) as client:
+        source_id = _register_source(client, f)
+        ingested = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{source_id}/passages",
+            json={"passages": [{"passage_order": 0, "content": "Fireball deals fire damage."}]},
+        )
+        assert ingested.status_code == 201
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/query",
+            json={"query_text": "firebal damge", "mode": "hybrid"},
+        )
+    assert response.status_code == 200
+    (passage,) = response.json()["passages"]
+    assert passage["lexical_score"] is None
+    assert passage["vector_score"] > 0
+
+
+def test_repeated_query_is_served_from_the_cache_and_reported_by_metricsz(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        source_id = _register_source(client, f)
+        ingested = client.post(
+            f"/campaigns/{f.campaign_id}/reference-corpus/sources/{source_id}/passages",
+            json={"passages": [{"passage_order": 0, "content": "Grappling uses Athletics."}]},
+        )
+        assert ingested.status_code == 201
+        responses = [
+            client.post(
+                f"/campaigns/{f.campaign_id}/reference-corpus/query",
+                json={"query_text": "grappling"},
+            )
+            for _ in range(2)
+        ]
+        metrics = client.get("/metricsz").json()
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert responses[0].json() == responses[1].json()
+    cache = metrics["reference_retrieval_cache"]
+    assert (cache["hits"], cache["misses"], cache["entries"]) == (1, 1, 1)
+    assert cache["hit_ratio"] == 0.5
+    assert cache["latency_saved_seconds"] > 0
+
+
+def test_async_audit_mode_writes_the_audit_rows_by_shutdown(
+    client_factory: Callable[[uuid.UUID], TestClient],
+    f: Fixture,
+    monkeypatch: pytest.MonkeyPatch,
+    postgres_engine: Engine,
+) -> None:
+    monkeypatch.setattr(settings, "reference_retrieval_audit_mode", "async")
+    monkeypatch.setattr(settings, "reference_retrieval_audit_flush_interval_seconds", 60.0)
+    with client_factory(f.viewer_user_id) as client:
+        responses = [
+            client.post(
+                f"/campaigns/{f.campaign_id}/reference-corpus/query",
+                json={"query_text": f"question {i}"},
+            )
+            for i in range(3)
+        ]
+        metrics = client.get("/metricsz").json()
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert metrics["reference_retrieval_audit"]["refused"] == 0
+    with postgres_engine.connect() as connection:
+        audited = connection.execute(
+            text("SELECT count(*) FROM ai.reference_retrievals WHERE campaign_id = :c"),
+            {"c": f.campaign_id},
+        ).scalar()
+    assert audited == 3
+
+
 # ---------------------------------------------------------------------------
 # dnd_ai.api.ai_npc
 # ---------------------------------------------------------------------------
@@ -269,6 +445,52 @@ def test_npc_conversation_capless_member_forbidden(
     assert response.status_code == 403
 
 
+def test_npc_conversation_stream_sends_dialogue_then_the_result(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/ai/npc-conversation/stream",
+            json={
+                "agent_assignment_id": str(f.assignment_id),
+                "requesting_character_id": str(f.pc_id),
+                "requesting_party_id": str(f.party_id),
+                "player_message": "Hello!",
+                "world_time_id": str(f.world_time_id),
+            },
+        )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == ["dialogue", "dialogue", "result"]
+    assert "".join(line["text"] for line in lines[:-1]) == "Welcome, traveler."
+    assert lines[-1]["dialogue"] == "Welcome, traveler."
+    with postgres_engine.connect() as connection:
+        first_token_ms = connection.execute(
+            text("SELECT first_token_ms FROM ai.generated_outputs WHERE generated_output_id = :o"),
+            {"o": lines[-1]["generated_output_id"]},
+        ).scalar()
+    assert first_token_ms == 0
+
+
+def test_npc_conversation_stream_unknown_assignment_is_an_ordinary_404(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/ai/npc-conversation/stream",
+            json={
+                "agent_assignment_id": str(uuid.uuid4()),
+                "requesting_character_id": str(f.pc_id),
+                "requesting_party_id": str(f.party_id),
+                "player_message": "Hello!",
+                "world_time_id": str(f.world_time_id),
+            },
+        )
+    assert response.status_code == 404
+    assert response.headers["content-type"].startswith("application/json")
+
+
 # ---------------------------------------------------------------------------
 # dnd_ai.api.ai_synthesis
 # ---------------------------------------------------------------------------
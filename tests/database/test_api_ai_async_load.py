@@ -0,0 +1,335 @@
+"""Concurrency coverage for the async AI routes (`dnd_ai.api.ai_npc`) —
+many NPC turns against a slow model server at once, over the real
+`AsyncOpenAiCompatibleProvider` and a real local HTTP server standing in
+for an OpenAI-compatible endpoint, with injected per-request latency.
+
+The worker-thread limiter is deliberately shrunk below the number of
+concurrent turns: a sync route would hold one thread for the whole
+provider wait, so at most that many calls could ever be in flight. The
+async routes hold a thread only for their short database steps, so every
+turn reaches the model server at once and the wave finishes in roughly
+one provider latency, not one per turn. That wave is one NPC's, so it
+runs with the per-NPC turn gate off; with the gate on, the same wave runs
+one turn at a time and the turns beyond its queue are refused.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anyio.to_thread
+import httpx
+import pytest
+from sqlalchemy import Connection, Engine, text
+
+from dnd_ai.api import ai_npc
+from dnd_ai.api.app import create_app
+from dnd_ai.api.auth import get_authenticated_user_id
+from dnd_ai.api.deps import get_engine
+from dnd_ai.commands.ai_npc import NpcTurnGate, NpcTurnGateStats
+from dnd_ai.config import settings
+from tests.factories import (
+    cleanup_committed_ai_world,
+    lookup_id,
+    make_agent,
+    make_agent_assignment,
+    make_campaign,
+    make_campaign_membership,
+    make_campaign_party,
+    make_character,
+    make_membership_role,
+    make_party,
+    make_party_membership,
+    make_role,
+    make_role_capability,
+    make_ruleset_version_for_world,
+    make_timeline,
+    make_user,
+    make_world,
+    make_world_time,
+    oidc_principal,
+)
+
+pytestmark = pytest.mark.database
+
+# More turns than postgres_engine's whole pool (5 + 10 overflow): a turn
+# holds a connection only for its short database steps, never across the
+# provider wait, so the wave still overlaps in full.
+_CONCURRENT_TURNS = 20
+_PROVIDER_LATENCY_SECONDS = 0.5
+_WORKER_THREADS = 2
+
+
+class _FakeModelServer(ThreadingHTTPServer):
+    """Answers every chat-completions POST with a fixed `record_npc_turn`
+    tool call after `latency_seconds`, counting how many requests it is
+    holding at once."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.latency_seconds = _PROVIDER_LATENCY_SECONDS
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+
+
+class _FakeModelHandler(BaseHTTPRequestHandler):
+    server: _FakeModelServer
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler's own naming convention
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.peak_in_flight = max(self.server.peak_in_flight, self.server.in_flight)
+        try:
+            time.sleep(self.server.latency_seconds)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+        arguments = json.dumps({"dialogue": "Welcome, traveler."})
+        body = json.dumps(
+            {
+                "choices": [
+                    {
+                        "finish_reason": "stop",
+                        "message": {
+                            "tool_calls": [
+                                {"function": {"name": "record_npc_turn", "arguments": arguments}}
+                            ]
+                        },
+                    }
+                ]
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass  # silence BaseHTTPRequestHandler's default stderr access log
+
+
+@pytest.fixture
+def model_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[_FakeModelServer]:
+    server = _FakeModelServer(("127.0.0.1", 0), _FakeModelHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        settings, "ai_provider_base_url", f"http://127.0.0.1:{server.server_port}/v1"
+    )
+    monkeypatch.setattr(settings, "ai_provider_api_key", "sk-test")
+    monkeypatch.setattr(ai_npc, "_ai_http_client", None)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+class Fixture:
+    def __init__(self, connection: Connection, slug: str) -> None:
+        self.world_id = make_world(connection, slug=slug)
+        self.ruleset_version_id = make_ruleset_version_for_world(connection, self.world_id)
+        self.timeline_id = make_timeline(connection, self.world_id, is_primary=True)
+        self.world_time_id = make_world_time(connection, self.world_id, 100)
+        self.campaign_id = make_campaign(
+            connection,
+            self.timeline_id,
+            ruleset_version_id=self.ruleset_version_id,
+            lifecycle_status_code="pending",
+        )
+        self.pc_id = make_character(connection, self.world_id, name="Hero")
+        self.npc_id = make_character(connection, self.world_id, name="Innkeeper")
+        self.party_id = make_party(connection, self.world_id)
+        make_campaign_party(connection, self.campaign_id, self.party_id)
+        make_party_membership(
+            connection, self.timeline_id, self.party_id, self.pc_id, self.world_time_id
+        )
+        self.agent_id = make_agent(connection)
+        self.assignment_id = make_agent_assignment(
+            connection, self.agent_id, self.campaign_id, self.npc_id
+        )
+
+        self.user_id = make_user(connection, "Async Load Player")
+        membership_id = make_campaign_membership(connection, self.campaign_id, self.user_id)
+        role_id = make_role(
+            connection, campaign_id=self.campaign_id, code=f"player_{uuid.uuid4().hex[:8]}"
+        )
+        for code in ("character.interact", "campaign.view"):
+            make_role_capability(
+                connection,
+                role_id,
+                lookup_id(connection, "security", "capabilities", "capability_id", code),
+            )
+        make_membership_role(connection, membership_id, role_id)
+
+
+@pytest.fixture
+def f(postgres_engine: Engine) -> Iterator[Fixture]:
+    with postgres_engine.begin() as connection:
+        fixture = Fixture(connection, f"ai-async-load-{uuid.uuid4().hex[:8]}")
+    yield fixture
+    with postgres_engine.begin() as cleanup:
+        cleanup.execute(text("SET LOCAL session_replication_role = replica"))
+        cleanup.execute(
+            text("""
+                DELETE FROM security.membership_roles WHERE role_id IN (
+                    SELECT role_id FROM security.roles WHERE campaign_id = :c
+                )
+            """),
+            {"c": fixture.campaign_id},
+        )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.role_capabilities WHERE role_id IN (
+                    SELECT role_id FROM security.roles WHERE campaign_id = :c
+                )
+            """),
+            {"c": fixture.campaign_id},
+        )
+        cleanup.execute(
+            text("DELETE FROM security.roles WHERE campaign_id = :c"), {"c": fixture.campaign_id}
+        )
+        cleanup.execute(
+            text("DELETE FROM security.campaign_memberships WHERE campaign_id = :c"),
+            {"c": fixture.campaign_id},
+        )
+        cleanup.execute(
+            text("DELETE FROM security.users WHERE user_id = :u"), {"u": fixture.user_id}
+        )
+        cleanup_committed_ai_world(
+            cleanup,
+            world_id=fixture.world_id,
+            campaign_id=fixture.campaign_id,
+            agent_id=fixture.agent_id,
+        )
+
+
+def test_concurrent_npc_turns_overlap_their_provider_waits(
+    postgres_engine: Engine, model_server: _FakeModelServer, f: Fixture
+) -> None:
+    app = create_app()
+    app.dependency_overrides[get_engine] = lambda: postgres_engine
+    app.dependency_overrides[get_authenticated_user_id] = lambda: oidc_principal(f.user_id)
+    app.dependency_overrides[ai_npc.get_npc_turn_gate] = lambda: None
+    turn = {
+        "agent_assignment_id": str(f.assignment_id),
+        "requesting_character_id": str(f.pc_id),
+        "requesting_party_id": str(f.party_id),
+        "player_message": "Hello!",
+        "world_time_id": str(f.world_time_id),
+    }
+
+    async def run() -> tuple[list[httpx.Response], float, float]:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = _WORKER_THREADS
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+                async def liveness_during_wave() -> float:
+                    await asyncio.sleep(_PROVIDER_LATENCY_SECONDS / 2)
+                    started = time.monotonic()
+                    response = await client.get("/healthz")
+                    assert response.status_code == 200
+                    return time.monotonic() - started
+
+                started = time.monotonic()
+                *responses, healthz_seconds = await asyncio.gather(
+                    *(
+                        client.post(f"/campaigns/{f.campaign_id}/ai/npc-conversation", json=turn)
+                        for _ in range(_CONCURRENT_TURNS)
+                    ),
+                    liveness_during_wave(),
+                )
+                elapsed = time.monotonic() - started
+        finally:
+            await ai_npc.dispose_ai_http_client()
+        return responses, elapsed, healthz_seconds
+
+    responses, elapsed, healthz_seconds = asyncio.run(run())
+
+    assert [r.status_code for r in responses] == [200] * _CONCURRENT_TURNS
+    assert {r.json()["dialogue"] for r in responses} == {"Welcome, traveler."}
+    assert model_server.requests == _CONCURRENT_TURNS
+    assert model_server.peak_in_flight == _CONCURRENT_TURNS
+    # Serially this wave would take _CONCURRENT_TURNS provider latencies.
+    assert elapsed < _PROVIDER_LATENCY_SECONDS * _CONCURRENT_TURNS / 2
+    assert healthz_seconds < _PROVIDER_LATENCY_SECONDS
+
+    with postgres_engine.connect() as connection:
+        recorded = connection.execute(
+            text("""
+                SELECT count(*) FROM ai.generated_outputs o
+                JOIN ai.context_requests r ON r.context_request_id = o.context_request_id
+                WHERE r.agent_assignment_id = :a AND o.error_message IS NULL
+                  AND o.connect_ms IS NOT NULL
+                  AND o.first_byte_ms >= :latency_ms
+            """),
+            {"a": f.assignment_id, "latency_ms": int(_PROVIDER_LATENCY_SECONDS * 1000)},
+        ).scalar()
+    assert recorded == _CONCURRENT_TURNS
+
+
+def test_the_turn_gate_runs_one_npcs_turns_one_at_a_time_and_refuses_the_overflow(
+    postgres_engine: Engine, model_server: _FakeModelServer, f: Fixture
+) -> None:
+    gate = NpcTurnGate(max_queued=1)
+    app = create_app()
+    app.dependency_overrides[get_engine] = lambda: postgres_engine
+    app.dependency_overrides[get_authenticated_user_id] = lambda: oidc_principal(f.user_id)
+    app.dependency_overrides[ai_npc.get_npc_turn_gate] = lambda: gate
+    model_server.latency_seconds = 0.2
+    turn = {
+        "agent_assignment_id": str(f.assignment_id),
+        "requesting_character_id": str(f.pc_id),
+        "requesting_party_id": str(f.party_id),
+        "player_message": "Hello!",
+        "world_time_id": str(f.world_time_id),
+    }
+
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return list(
+                    await asyncio.gather(
+                        *(
+                            client.post(
+                                f"/campaigns/{f.campaign_id}/ai/npc-conversation", json=turn
+                            )
+                            for _ in range(_CONCURRENT_TURNS)
+                        )
+                    )
+                )
+        finally:
+            await ai_npc.dispose_ai_http_client()
+
+    responses = asyncio.run(run())
+
+    # One running and one queued; every other turn is refused up front.
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses == [200, 200] + [429] * (_CONCURRENT_TURNS - 2)
+    refused = next(r for r in responses if r.status_code == 429)
+    assert refused.json()["error"]["code"] == "npc_busy"
+    assert model_server.requests == 2
+    assert model_server.peak_in_flight == 1
+    assert gate.stats() == NpcTurnGateStats(
+        busy_assignments=0, queued_turns=0, admitted=2, rejected=_CONCURRENT_TURNS - 2
+    )
+
+    with postgres_engine.connect() as connection:
+        requests = connection.execute(
+            text("SELECT count(*) FROM ai.context_requests WHERE agent_assignment_id = :a"),
+            {"a": f.assignment_id},
+        ).scalar()
+    assert requests == 2
@@ -128,6 +128,10 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             text("DELETE FROM security.campaign_memberships WHERE campaign_id = :c"),
             {"c": fixture.campaign_id},
         )
+        cleanup.execute(
+            text("DELETE FROM security.campaign_security_generations WHERE campaign_id = :c"),
+            {"c": fixture.campaign_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE campaign_id = :c"),
             {"c": fixture.campaign_id},
@@ -181,6 +181,16 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             """),
             {"worlds": [fixture.world_id, fixture.other_world_id]},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id IN (
+                        SELECT timeline_id FROM campaign.timelines WHERE world_id = ANY(:worlds)
+                    )
+                )
+            """),
+            {"worlds": [fixture.world_id, fixture.other_world_id]},
+        )
         cleanup.execute(
             text("""
                 DELETE FROM campaign.campaigns WHERE timeline_id IN (
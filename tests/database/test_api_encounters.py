@@ -152,6 +152,14 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             ),
             {"t": fixture.timeline_id},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id = :t
+                )
+            """),
+            {"t": fixture.timeline_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE timeline_id = :t"),
             {"t": fixture.timeline_id},
@@ -401,6 +409,106 @@ def test_replaying_the_same_round_and_participant_conflicts_rather_than_duplicat
     assert replay.status_code == 409
 
 
+# ---------------------------------------------------------------------------
+# turns:batch
+# ---------------------------------------------------------------------------
+
+
+def test_a_batch_of_turns_resolves_a_round_in_order(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        started = _start_encounter(client, f)
+        encounter_id = started["encounter_id"]
+
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/encounters/{encounter_id}/turns:batch",
+            json={
+                "turns": [
+                    {
+                        "round_number": 1,
+                        "turn_order": 0,
+                        "actor_entity_id": str(f.attacker_id),
+                        "world_time_id": str(f.world_time_id),
+                        "target_entity_id": str(f.defender_id),
+                        "hit": True,
+                        "damage_amount": 7,
+                        "session_id": str(f.session_id),
+                    },
+                    {
+                        "round_number": 1,
+                        "turn_order": 1,
+                        "actor_entity_id": str(f.defender_id),
+                        "world_time_id": str(f.world_time_id),
+                        "target_entity_id": str(f.attacker_id),
+                        "hit": False,
+                    },
+                    {
+                        "round_number": 2,
+                        "turn_order": 0,
+                        "actor_entity_id": str(f.attacker_id),
+                        "world_time_id": str(f.world_time_id),
+                        "target_entity_id": str(f.defender_id),
+                        "hit": True,
+                        "damage_amount": 4,
+                    },
+                ]
+            },
+        )
+
+    assert response.status_code == 201, response.text
+    turns = response.json()["turns"]
+    assert [(t["previous_hit_points"], t["new_hit_points"]) for t in turns] == [
+        (20, 13),
+        (None, None),
+        (13, 9),
+    ]
+    assert turns[1]["event_id"] is None
+
+    with postgres_engine.connect() as verify:
+        hp = verify.execute(
+            text(
+                "SELECT current_hit_points FROM campaign.character_state "
+                "WHERE timeline_id = :t AND character_id = :c"
+            ),
+            {"t": f.timeline_id, "c": f.defender_id},
+        ).scalar()
+        assert hp == 9
+
+
+def test_a_batch_repeating_a_round_and_participant_records_nothing(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    turn_body = {
+        "round_number": 1,
+        "turn_order": 0,
+        "actor_entity_id": str(f.attacker_id),
+        "world_time_id": str(f.world_time_id),
+    }
+    with client_factory(f.gm_user_id) as client:
+        started = _start_encounter(client, f)
+        encounter_id = started["encounter_id"]
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/encounters/{encounter_id}/turns:batch",
+            json={"turns": [turn_body, {**turn_body, "turn_order": 1}]},
+        )
+
+    assert response.status_code == 409
+    _no_turn_side_effects(postgres_engine, encounter_id)
+
+
+def test_an_empty_batch_of_turns_is_rejected(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        started = _start_encounter(client, f)
+        response = client.post(
+            f"/campaigns/{f.campaign_id}/encounters/{started['encounter_id']}/turns:batch",
+            json={"turns": []},
+        )
+    assert response.status_code == 422
+
+
 # ---------------------------------------------------------------------------
 # end_encounter
 # ---------------------------------------------------------------------------
@@ -41,6 +41,7 @@ pytestmark = pytest.mark.database
 # deliberately (tests assert on the public audit.change_log contract, not
 # by importing the module's private constants).
 _RECORD_EVENT_COMMAND = "record_event"
+_RECORD_EVENT_BATCH_COMMAND = "record_event_batch"
 
 
 class Fixture:
@@ -132,6 +133,14 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             ),
             {"t": fixture.timeline_id},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id = :t
+                )
+            """),
+            {"t": fixture.timeline_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE timeline_id = :t"),
             {"t": fixture.timeline_id},
@@ -261,6 +270,121 @@ def test_a_session_from_a_different_campaign_is_rejected(
     assert response.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# events:batch
+# ---------------------------------------------------------------------------
+
+
+def _batch_url(f: Fixture) -> str:
+    return f"/campaigns/{f.campaign_id}/events:batch"
+
+
+def test_a_batch_records_every_event_in_order_with_an_audit_row_each(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    body = {
+        "events": [
+            {**_minimal_body(f), "name": f"Log line {index}", "session_id": str(f.session_id)}
+            for index in range(25)
+        ]
+    }
+    body["events"][3]["participants"] = [{"entity_id": str(f.actor_id), "role_code": "actor"}]
+    correlation_id = str(uuid.uuid4())
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(
+            _batch_url(f), json=body, headers={"X-Correlation-Id": correlation_id}
+        )
+    assert response.status_code == 201, response.text
+    event_ids = [uuid.UUID(event_id) for event_id in response.json()["event_ids"]]
+    assert len(event_ids) == 25
+
+    with postgres_engine.connect() as verify:
+        rows = verify.execute(
+            text("""
+                SELECT e.entity_id, e.canonical_name, ev.campaign_id, ev.session_id
+                FROM core.entities e
+                JOIN narrative.events ev ON ev.event_id = e.entity_id
+                WHERE e.entity_id = ANY (:ids)
+            """),
+            {"ids": event_ids},
+        ).all()
+        by_id = {row.entity_id: row for row in rows}
+        assert [by_id[event_id].canonical_name for event_id in event_ids] == [
+            f"Log line {index}" for index in range(25)
+        ]
+        assert {(row.campaign_id, row.session_id) for row in rows} == {
+            (f.campaign_id, f.session_id)
+        }
+
+        participant = verify.execute(
+            text("SELECT event_id FROM narrative.event_participants WHERE event_id = ANY (:ids)"),
+            {"ids": event_ids},
+        ).scalar_one()
+        assert participant == event_ids[3]
+
+        audit_rows = verify.execute(
+            text("""
+                SELECT event_id, entity_id, actor_user_id, correlation_id, world_id
+                FROM audit.change_log
+                WHERE event_id = ANY (:ids) AND command_name = :c
+            """),
+            {"ids": event_ids, "c": _RECORD_EVENT_BATCH_COMMAND},
+        ).all()
+    assert {row.event_id for row in audit_rows} == set(event_ids)
+    assert all(row.entity_id == row.event_id for row in audit_rows)
+    assert {(row.actor_user_id, row.correlation_id, row.world_id) for row in audit_rows} == {
+        (f.gm_user_id, uuid.UUID(correlation_id), f.world_id)
+    }
+
+
+def test_one_foreign_session_rejects_the_whole_batch(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    body = {
+        "events": [
+            {**_minimal_body(f), "name": "Fine"},
+            {**_minimal_body(f), "name": "Foreign", "session_id": str(f.other_session_id)},
+        ]
+    }
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(_batch_url(f), json=body)
+    assert response.status_code == 404
+
+    with postgres_engine.connect() as verify:
+        count = verify.execute(
+            text("SELECT count(*) FROM narrative.events WHERE timeline_id = :t"),
+            {"t": f.timeline_id},
+        ).scalar()
+    assert count == 0
+
+
+def test_an_empty_batch_is_rejected(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(_batch_url(f), json={"events": []})
+    assert response.status_code == 422
+
+
+def test_a_replayed_batch_records_nothing_new(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    key = f"batch-replay-{uuid.uuid4().hex[:8]}"
+    body = {"events": [_minimal_body(f), {**_minimal_body(f), "name": "Second"}]}
+    with client_factory(f.gm_user_id) as client:
+        first = client.post(_batch_url(f), json=body, headers={"Idempotency-Key": key})
+        second = client.post(_batch_url(f), json=body, headers={"Idempotency-Key": key})
+
+    assert first.status_code == 201, first.text
+    assert second.json() == first.json()
+    with postgres_engine.connect() as verify:
+        count = verify.execute(
+            text("SELECT count(*) FROM narrative.events WHERE timeline_id = :t"),
+            {"t": f.timeline_id},
+        ).scalar()
+    assert count == 2
+
+
 # ---------------------------------------------------------------------------
 # Auditing (dnd_ai.api.audit, audit.change_log)
 # ---------------------------------------------------------------------------
@@ -20,7 +20,7 @@ from collections.abc import Callable, Iterator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import Connection, Engine, text
+from sqlalchemy import Connection, Engine, event, text
 
 from dnd_ai.api.app import create_app
 from dnd_ai.api.auth import get_authenticated_user_id
@@ -226,6 +226,16 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             """),
             {"worlds": [fixture.world_id, fixture.other_world_id]},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id IN (
+                        SELECT timeline_id FROM campaign.timelines WHERE world_id = ANY(:worlds)
+                    )
+                )
+            """),
+            {"worlds": [fixture.world_id, fixture.other_world_id]},
+        )
         cleanup.execute(
             text("""
                 DELETE FROM campaign.campaigns WHERE timeline_id IN (
@@ -1037,6 +1047,37 @@ def test_replaying_the_same_operation_id_is_idempotent(
     assert second.json()["new_hit_points"] == first.json()["new_hit_points"]
 
 
+def test_a_replayed_combat_sync_checks_out_only_the_request_connection(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
+) -> None:
+    # The replay pre-check reads on the connection the access check already
+    # holds: a second checkout per request could exhaust the pool with every
+    # request holding one and waiting on the other.
+    external_system_id = _register_system_as_gm(client_factory, f, f.campaign_id)
+    checkouts: list[object] = []
+
+    def _count_checkout(*args: object) -> None:
+        checkouts.append(args)
+
+    with client_factory(f.gm_user_id) as client:
+        encounter_id = _start_encounter(client, f)
+        body = _combat_sync_body(
+            f,
+            encounter_id,
+            external_system_id=external_system_id,
+            external_operation_id=f"op-{uuid.uuid4().hex[:8]}",
+        )
+        assert client.post(_combat_sync_url(f.campaign_id), json=body).status_code == 201
+        event.listen(postgres_engine, "checkout", _count_checkout)
+        try:
+            replay = client.post(_combat_sync_url(f.campaign_id), json=body)
+        finally:
+            event.remove(postgres_engine, "checkout", _count_checkout)
+    assert replay.status_code == 201, replay.text
+    assert replay.json()["replayed"] is True
+    assert len(checkouts) == 1
+
+
 def test_a_conflicting_replay_is_rejected_as_a_conflict(
     client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
 ) -> None:
@@ -1057,6 +1098,71 @@ def test_a_conflicting_replay_is_rejected_as_a_conflict(
     assert second.status_code == 409, second.text
 
 
+def test_a_combat_sync_batch_applies_a_backlog_in_order_and_replays_delivered_operations(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    external_system_id = _register_system_as_gm(client_factory, f, f.campaign_id)
+    operation_ids = [f"op-{uuid.uuid4().hex[:8]}" for _ in range(3)]
+    with client_factory(f.gm_user_id) as client:
+        encounter_id = _start_encounter(client, f)
+        delivered = client.post(
+            _combat_sync_url(f.campaign_id),
+            json=_combat_sync_body(
+                f,
+                encounter_id,
+                external_system_id=external_system_id,
+                external_operation_id=operation_ids[0],
+            ),
+        )
+        operations = []
+        for round_number, operation_id in enumerate(operation_ids, start=1):
+            operation = _combat_sync_body(
+                f,
+                encounter_id,
+                external_system_id=external_system_id,
+                external_operation_id=operation_id,
+            )
+            del operation["external_system_id"], operation["encounter_id"]
+            # The first operation is the one already delivered, unchanged.
+            if round_number > 1:
+                operation = {**operation, "round_number": round_number, "damage_amount": 3}
+            operations.append(operation)
+        response = client.post(
+            f"{_combat_sync_url(f.campaign_id)}:batch",
+            json={
+                "external_system_id": str(external_system_id),
+                "encounter_id": str(encounter_id),
+                "operations": operations,
+            },
+        )
+    assert delivered.status_code == 201, delivered.text
+    assert response.status_code == 201, response.text
+    results = response.json()["operations"]
+    assert [result["replayed"] for result in results] == [True, False, False]
+    assert results[0] == {**delivered.json(), "replayed": True}
+    assert [(r["previous_hit_points"], r["new_hit_points"]) for r in results] == [
+        (20, 13),
+        (13, 10),
+        (10, 7),
+    ]
+
+
+def test_an_empty_combat_sync_batch_is_rejected(
+    client_factory: Callable[[uuid.UUID], TestClient], f: Fixture
+) -> None:
+    external_system_id = _register_system_as_gm(client_factory, f, f.campaign_id)
+    with client_factory(f.gm_user_id) as client:
+        response = client.post(
+            f"{_combat_sync_url(f.campaign_id)}:batch",
+            json={
+                "external_system_id": str(external_system_id),
+                "encounter_id": str(uuid.uuid4()),
+                "operations": [],
+            },
+        )
+    assert response.status_code == 422
+
+
 def test_a_real_foundry_credential_can_call_the_combat_sync_endpoint(
     client_factory: Callable[[uuid.UUID], TestClient], f: Fixture, postgres_engine: Engine
 ) -> None:
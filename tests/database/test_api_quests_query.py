@@ -15,7 +15,9 @@ Covers: access control (non-member 404, capless-member 403),
 GM, 'hidden_until_active'/'hidden_until_discovered' shown to a non-GM only
 once a `campaign.objective_state` row exists), the party-scoped-over-
 campaign-wide status fallback for both quest- and objective-level state,
-and cross-world/nonexistent-quest rejection.
+cross-world/nonexistent-quest rejection, and `get_quest_views` (the batch
+`get_quest_view` delegates to) agreeing with one view per quest in two
+statements.
 """
 
 import uuid
@@ -23,11 +25,12 @@ from collections.abc import Callable, Iterator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import Connection, Engine, text
+from sqlalchemy import Connection, Engine, event, text
 
 from dnd_ai.api.app import create_app
 from dnd_ai.api.auth import get_authenticated_user_id
 from dnd_ai.api.deps import get_engine
+from dnd_ai.queries.quest import QuestNotFoundError, get_quest_view, get_quest_views
 from tests.factories import (
     lookup_id,
     make_access_group,
@@ -343,6 +346,16 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
                 """),
                 {"w": world_id},
             )
+            cleanup.execute(
+                text("""
+                    DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                        SELECT campaign_id FROM campaign.campaigns WHERE timeline_id IN (
+                            SELECT timeline_id FROM campaign.timelines WHERE world_id = :w
+                        )
+                    )
+                """),
+                {"w": world_id},
+            )
             cleanup.execute(
                 text("""
                     DELETE FROM campaign.campaigns WHERE timeline_id IN (
@@ -639,3 +652,122 @@ def test_a_nonexistent_quest_is_rejected(
     with client_factory(f.gm_user_id) as client:
         response = client.get(_quest_url(f, uuid.uuid4()))
     assert response.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# get_quest_views — the batch behind get_quest_view
+# ---------------------------------------------------------------------------
+
+
+def test_the_batch_matches_one_view_per_quest_in_input_order(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    with postgres_engine.connect() as connection:
+        # Uncommitted — rolled back when the connection closes. One quest
+        # with an objective-less stage, one with no stages at all.
+        second_quest_id = make_quest(connection, f.world_id, name="Mend the Bridge")
+        make_quest_stage(connection, second_quest_id, name="Empty Stage", sequence_number=1)
+        early_stage_id = make_quest_stage(connection, second_quest_id, sequence_number=0)
+        make_quest_objective(connection, early_stage_id, visibility_policy="gm_only")
+        third_quest_id = make_quest(connection, f.world_id, name="Count the Stones")
+        quest_ids = [third_quest_id, f.quest_id, second_quest_id, f.quest_id]
+
+        for party_id in (f.party_id, None):
+            for include_hidden in (True, False):
+                views = get_quest_views(
+                    connection,
+                    quest_ids=quest_ids,
+                    timeline_id=f.timeline_id,
+                    expected_world_id=f.world_id,
+                    party_id=party_id,
+                    include_hidden=include_hidden,
+                )
+                assert views == tuple(
+                    get_quest_view(
+                        connection,
+                        quest_id=quest_id,
+                        timeline_id=f.timeline_id,
+                        expected_world_id=f.world_id,
+                        party_id=party_id,
+                        include_hidden=include_hidden,
+                    )
+                    for quest_id in (third_quest_id, f.quest_id, second_quest_id)
+                )
+
+        # Stages stay in sequence order, whether or not any objective of
+        # theirs survives the audience filter.
+        (second_view,) = get_quest_views(
+            connection,
+            quest_ids=[second_quest_id],
+            timeline_id=f.timeline_id,
+            expected_world_id=f.world_id,
+            party_id=None,
+            include_hidden=False,
+        )
+        assert [(stage.name, stage.objectives) for stage in second_view.stages] == [
+            ("Test Stage", ()),
+            ("Empty Stage", ()),
+        ]
+
+
+def test_the_batch_runs_two_statements_however_many_quests(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    with postgres_engine.connect() as connection:
+        quest_ids = [f.quest_id] + [
+            make_quest(connection, f.world_id, name=f"Errand {index}") for index in range(5)
+        ]
+        statements: list[str] = []
+
+        def _record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            views = get_quest_views(
+                connection,
+                quest_ids=quest_ids,
+                timeline_id=f.timeline_id,
+                expected_world_id=f.world_id,
+                party_id=f.party_id,
+                include_hidden=True,
+            )
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+    assert [view.quest_id for view in views] == quest_ids
+    assert len(statements) == 2
+
+
+def test_an_empty_batch_is_empty(postgres_engine: Engine, f: Fixture) -> None:
+    with postgres_engine.connect() as connection:
+        assert (
+            get_quest_views(
+                connection,
+                quest_ids=[],
+                timeline_id=f.timeline_id,
+                expected_world_id=f.world_id,
+                party_id=None,
+                include_hidden=False,
+            )
+            == ()
+        )
+
+
+@pytest.mark.parametrize("foreign", ["other_world", "nonexistent"])
+def test_one_foreign_quest_rejects_the_whole_batch(
+    postgres_engine: Engine, f: Fixture, foreign: str
+) -> None:
+    foreign_id = f.other_world_quest_id if foreign == "other_world" else uuid.uuid4()
+    with (
+        postgres_engine.connect() as connection,
+        pytest.raises(QuestNotFoundError, match=str(foreign_id)),
+    ):
+        get_quest_views(
+            connection,
+            quest_ids=[f.quest_id, foreign_id],
+            timeline_id=f.timeline_id,
+            expected_world_id=f.world_id,
+            party_id=None,
+            include_hidden=True,
+        )
@@ -0,0 +1,69 @@
+"""Tests for `scripts/benchmark_access_resolution.py`. Imports the script's
+functions directly (never subprocess), the same way
+tests/database/test_foundry_provision.py does.
+
+The latency numbers themselves are never asserted — they depend on the
+machine and are only meaningful from a manual run. What is asserted is
+that the single-statement `resolve_access_context` and the five-query
+`legacy_resolve_access_context` baseline resolve the identical
+`AccessContext` on the benchmark's own grant-heavy fixture, so the
+benchmark keeps comparing two implementations of the same answer.
+"""
+
+import pytest
+from benchmark_access_resolution import (
+    assert_paths_agree,
+    build_fixture,
+    legacy_resolve_access_context,
+    run_benchmark,
+)
+from sqlalchemy import Connection
+
+from dnd_ai.domain.access import resolve_access_context
+
+pytestmark = pytest.mark.database
+
+
+def test_both_paths_resolve_the_same_context_on_hundreds_of_grants(
+    db_connection: Connection,
+) -> None:
+    fixture = build_fixture(db_connection, grants=400, groups=200)
+
+    assert_paths_agree(db_connection, fixture)
+
+    access = resolve_access_context(
+        db_connection, user_id=fixture.user_id, campaign_id=fixture.campaign_id
+    )
+    assert access is not None
+    effects = [effect for bucket in access.grant_effects.values() for effect in bucket.values()]
+    assert len(effects) == 200
+    assert "deny" in effects and "allow" in effects
+    assert access.valid_until is not None
+
+
+def test_legacy_path_still_returns_none_for_a_non_member(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection, grants=4, groups=2)
+    other = build_fixture(db_connection, grants=4, groups=2)
+
+    assert (
+        legacy_resolve_access_context(
+            db_connection, user_id=other.user_id, campaign_id=fixture.campaign_id
+        )
+        is None
+    )
+    assert (
+        resolve_access_context(
+            db_connection, user_id=other.user_id, campaign_id=fixture.campaign_id
+        )
+        is None
+    )
+
+
+def test_run_benchmark_reports_both_paths(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection, grants=20, groups=4)
+
+    timings = run_benchmark(db_connection, fixture, iterations=5)
+
+    assert [timing.name for timing in timings] == ["legacy (5 queries)", "single statement"]
+    for timing in timings:
+        assert 0 < timing.p50_ms <= timing.p99_ms
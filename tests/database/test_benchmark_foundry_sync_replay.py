@@ -0,0 +1,96 @@
+"""Tests for `scripts/benchmark_foundry_sync_replay.py`. Imports the
+script's functions directly (never subprocess), the same way
+tests/database/test_benchmark_npc_context.py does.
+
+The timings themselves are never asserted. What is asserted is that both
+paths replay the fixture's completed operations and apply the new ones,
+and that the baseline checks out a lock connection for every delivery
+while the pre-check path checks one out only for the new operations.
+Unlike the other benchmark tests this one commits — the command under
+test owns its transactions — so it runs on `postgres_engine` and drops
+its fixture afterwards.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from benchmark_foundry_sync_replay import (
+    BenchmarkFixture,
+    build_fixture,
+    deliver,
+    drop_fixture,
+    run_path,
+)
+from sqlalchemy import Engine, create_engine, text
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def fixture(postgres_engine: Engine) -> Iterator[BenchmarkFixture]:
+    built = build_fixture(postgres_engine, completed=5)
+    yield built
+    drop_fixture(postgres_engine, built)
+
+
+def test_the_fixture_completes_its_operations(
+    postgres_engine: Engine, fixture: BenchmarkFixture
+) -> None:
+    with postgres_engine.connect() as verify:
+        statuses = verify.execute(
+            text("SELECT status FROM integration.sync_jobs WHERE external_system_id = :s"),
+            {"s": fixture.external_system_id},
+        ).scalars()
+        assert list(statuses) == ["completed"] * 5
+
+    for path_engine in (None, postgres_engine):
+        result = deliver(
+            fixture,
+            fixture.completed[0],
+            lock_engine=postgres_engine,
+            request_engine=path_engine,
+        )
+        assert result.replayed is True
+
+
+def test_only_the_baseline_takes_a_lock_connection_for_a_replay(
+    postgres_engine: Engine, fixture: BenchmarkFixture
+) -> None:
+    lock_engine = create_engine(postgres_engine.url, pool_size=2, max_overflow=0)
+    try:
+        locked = run_path(
+            fixture,
+            name="locked",
+            lock_engine=lock_engine,
+            request_engine=None,
+            calls=20,
+            replay_percent=90,
+            rate=200,
+            threads=2,
+        )
+        lock_free = run_path(
+            fixture,
+            name="lock-free",
+            lock_engine=lock_engine,
+            request_engine=postgres_engine,
+            calls=20,
+            replay_percent=90,
+            rate=200,
+            threads=2,
+        )
+    finally:
+        lock_engine.dispose()
+
+    new_operations = 20 - locked.replays
+    assert lock_free.replays == locked.replays < 20
+    assert locked.lock_checkouts == 20
+    assert lock_free.lock_checkouts == new_operations
+    with postgres_engine.connect() as verify:
+        completed = verify.execute(
+            text("""
+                SELECT count(*) FROM integration.sync_jobs
+                WHERE external_system_id = :s AND status = 'completed'
+            """),
+            {"s": fixture.external_system_id},
+        ).scalar()
+    assert completed == 5 + 2 * new_operations
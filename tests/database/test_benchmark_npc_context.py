@@ -0,0 +1,37 @@
+"""Tests for `scripts/benchmark_npc_context.py`. Imports the script's
+functions directly (never subprocess), the same way
+tests/database/test_benchmark_reference_retrieval.py does.
+
+The timings themselves are never asserted. What is asserted is that the
+fixture seeds the long campaign the benchmark describes, and that the
+budgeted payload fits its budget by trimming only the trimmable sections.
+"""
+
+import pytest
+from benchmark_npc_context import assemble, build_fixture, run_benchmark
+from sqlalchemy import Connection
+
+pytestmark = pytest.mark.database
+
+
+def test_the_fixture_seeds_a_long_campaign(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection, facts=40, quests=6)
+
+    context = assemble(db_connection, fixture)
+
+    assert len(context.known_facts_about_npc) == 20
+    assert len(context.revealable_knowledge) == 20
+    assert len(context.related_quests) == 6
+    assert len(context.advanceable_objectives) == 36
+
+
+def test_run_benchmark_fits_the_payload_to_its_budget(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection, facts=40, quests=6)
+
+    result = run_benchmark(db_connection, fixture, max_tokens=500, runs=1)
+
+    assert result.unbudgeted.total_tokens > 500 >= result.budgeted.total_tokens
+    assert result.budgeted_bytes < result.unbudgeted_bytes
+    assert result.budgeted.trimmed_items("known_facts_about_npc") == 20
+    assert result.budgeted.trimmed_items("npc") == 0
+    assert result.median_assembly_ms >= 0 and result.median_budgeting_ms >= 0
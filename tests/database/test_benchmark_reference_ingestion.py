@@ -0,0 +1,46 @@
+"""Tests for `scripts/benchmark_reference_ingestion.py`. Imports the
+script's functions directly (never subprocess), the same way
+tests/database/test_benchmark_access_resolution.py does.
+
+The timings themselves are never asserted. What is asserted is that the
+batched ingestion path and the row-at-a-time
+`legacy_ingest_reference_passages` baseline store identical rows for the
+benchmark's own synthetic passages, so the benchmark keeps comparing two
+implementations of the same write.
+"""
+
+import pytest
+from benchmark_reference_ingestion import (
+    assert_paths_agree,
+    build_fixture,
+    run_benchmark,
+    synthetic_passages,
+)
+from sqlalchemy import Connection
+
+pytestmark = pytest.mark.database
+
+
+def test_both_paths_store_the_same_passages_across_several_batches(
+    db_connection: Connection,
+) -> None:
+    fixture = build_fixture(db_connection)
+
+    assert_paths_agree(db_connection, fixture, passages=2_500)
+
+
+def test_synthetic_passages_cover_every_order_once() -> None:
+    orders = [passage.passage_order for passage in synthetic_passages(500)]
+
+    assert sorted(orders) == list(range(500))
+    assert orders != sorted(orders)
+
+
+def test_run_benchmark_reports_both_paths(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection)
+
+    timings = run_benchmark(db_connection, fixture, passages=50, runs=2)
+
+    assert [timing.name for timing in timings] == ["legacy (row at a time)", "batched unnest"]
+    for timing in timings:
+        assert timing.median_seconds > 0 and timing.passages_per_second > 0
@@ -0,0 +1,35 @@
+"""Tests for `scripts/benchmark_reference_retrieval.py`. Imports the
+script's functions directly (never subprocess), the same way
+tests/database/test_benchmark_reference_ingestion.py does.
+
+The timings themselves are never asserted. What is asserted is that the
+`ai.campaign_authorized_sources` projection and the
+`legacy_lexical_candidates` baseline agree on every campaign's sources and
+passages for the benchmark's own fixture, so the benchmark keeps comparing
+two implementations of the same filter.
+"""
+
+import pytest
+from benchmark_reference_retrieval import assert_paths_agree, build_fixture, run_benchmark
+from sqlalchemy import Connection
+
+pytestmark = pytest.mark.database
+
+
+def test_both_paths_return_the_same_passages_for_every_campaign(
+    db_connection: Connection,
+) -> None:
+    fixture = build_fixture(db_connection, campaigns=8, sources=30, passages=5)
+
+    assert_paths_agree(db_connection, fixture)
+
+
+def test_run_benchmark_reports_both_plans(db_connection: Connection) -> None:
+    fixture = build_fixture(db_connection, campaigns=2, sources=10, passages=3)
+
+    timings = run_benchmark(db_connection, fixture, runs=1)
+
+    assert [timing.name for timing in timings] == ["legacy (group by)", "authorized sources"]
+    assert [timing.aggregates for timing in timings] == [True, False]
+    for timing in timings:
+        assert timing.median_execution_ms >= 0 and timing.median_planning_ms > 0
@@ -12,10 +12,16 @@ transaction the test fixture would discard.
 import uuid
 
 import pytest
-from sqlalchemy import Engine, text
+from sqlalchemy import Engine, event, text
 
-from dnd_ai.commands._shared import LookupCodeNotFoundError
-from dnd_ai.commands.events import EventParticipant, record_event
+from dnd_ai.commands._shared import LookupCodeNotFoundError, get_lookup_code_registry
+from dnd_ai.commands.events import (
+    EventParticipant,
+    EventSpec,
+    _insert_event_rows,
+    record_event,
+    record_events,
+)
 from tests.factories import (
     make_character,
     make_interaction,
@@ -159,3 +165,153 @@ def test_record_event_rejects_an_unknown_event_type_code_before_writing_anything
             {"t": timeline_id},
         ).scalar()
         assert count == 0, "a rejected record_event() call left an events row behind"
+
+
+# ---------------------------------------------------------------------------
+# record_events — the set-based batch form
+# ---------------------------------------------------------------------------
+
+
+def test_record_events_writes_each_event_in_order_as_record_event_would(
+    postgres_engine: Engine, world: uuid.UUID
+) -> None:
+    with postgres_engine.begin() as connection:
+        timeline_id = make_timeline(connection, world, is_primary=True)
+        world_time_id = make_world_time(connection, world, 100)
+        actor_id = make_character(connection, world, name="Rin")
+        target_id = make_character(connection, world, name="Goblin")
+        interaction_id = make_interaction(connection, timeline_id, world_time_id)
+
+    results = record_events(
+        postgres_engine,
+        world_id=world,
+        timeline_id=timeline_id,
+        events=[
+            EventSpec(world_time_id=world_time_id, event_type_code="other", name="Arrival"),
+            EventSpec(
+                world_time_id=world_time_id,
+                event_type_code="other",
+                name="Rin strikes",
+                details="A clean hit.",
+                participants=(
+                    EventParticipant(entity_id=actor_id, role_code="actor"),
+                    EventParticipant(entity_id=target_id, role_code="target", notes="bloodied"),
+                ),
+                cause_interaction_id=interaction_id,
+            ),
+            EventSpec(
+                world_time_id=world_time_id,
+                event_type_code="other",
+                name="Aftermath",
+                cause_description="The fight ends.",
+            ),
+        ],
+    )
+
+    event_ids = [result.event_id for result in results]
+    with postgres_engine.connect() as verify:
+        names = verify.execute(
+            text("""
+                SELECT e.canonical_name FROM core.entities e
+                JOIN narrative.events ev ON ev.event_id = e.entity_id
+                WHERE e.entity_id = ANY (:ids)
+                ORDER BY array_position(CAST(:ids AS uuid[]), e.entity_id)
+            """),
+            {"ids": event_ids},
+        ).scalars()
+        assert list(names) == ["Arrival", "Rin strikes", "Aftermath"]
+
+        participants = verify.execute(
+            text("""
+                SELECT p.event_id, p.participant_entity_id, r.code, p.notes
+                FROM narrative.event_participants p
+                JOIN narrative.event_participant_roles r
+                    ON r.event_participant_role_id = p.participant_role_id
+                WHERE p.event_id = ANY (:ids)
+            """),
+            {"ids": event_ids},
+        ).all()
+        assert {tuple(row) for row in participants} == {
+            (event_ids[1], actor_id, "actor", None),
+            (event_ids[1], target_id, "target", "bloodied"),
+        }
+
+        causes = verify.execute(
+            text("""
+                SELECT event_id, cause_interaction_id, cause_description
+                FROM narrative.event_causes WHERE event_id = ANY (:ids)
+            """),
+            {"ids": event_ids},
+        ).all()
+        assert {tuple(row) for row in causes} == {
+            (event_ids[1], interaction_id, None),
+            (event_ids[2], None, "The fight ends."),
+        }
+
+
+def test_a_batch_costs_the_same_few_statements_however_large_it_is(
+    postgres_engine: Engine, world: uuid.UUID
+) -> None:
+    with postgres_engine.begin() as connection:
+        timeline_id = make_timeline(connection, world, is_primary=True)
+        world_time_id = make_world_time(connection, world, 100)
+        actor_id = make_character(connection, world, name="Rin")
+
+    statements: list[str] = []
+    with postgres_engine.begin() as connection:
+        get_lookup_code_registry(postgres_engine)
+        event.listen(
+            connection,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        event_ids = _insert_event_rows(
+            connection,
+            world_id=world,
+            timeline_id=timeline_id,
+            events=[
+                EventSpec(
+                    world_time_id=world_time_id,
+                    event_type_code="other",
+                    name=f"Round {index}",
+                    participants=(EventParticipant(entity_id=actor_id, role_code="actor"),),
+                    cause_description=f"Round {index - 1} ended." if index else None,
+                )
+                for index in range(200)
+            ],
+        )
+
+    assert len(event_ids) == len(set(event_ids)) == 200
+    # core.entities, narrative.events, participants, causes — lookup codes
+    # are served from the registry.
+    assert len(statements) == 4
+
+
+def test_a_batch_with_one_unknown_code_writes_nothing(
+    postgres_engine: Engine, world: uuid.UUID
+) -> None:
+    with postgres_engine.begin() as connection:
+        timeline_id = make_timeline(connection, world, is_primary=True)
+        world_time_id = make_world_time(connection, world, 100)
+
+    with pytest.raises(LookupCodeNotFoundError):
+        record_events(
+            postgres_engine,
+            world_id=world,
+            timeline_id=timeline_id,
+            events=[
+                EventSpec(world_time_id=world_time_id, event_type_code="other", name="Fine"),
+                EventSpec(
+                    world_time_id=world_time_id,
+                    event_type_code="not_a_real_event_type",
+                    name="Should not exist",
+                ),
+            ],
+        )
+
+    with postgres_engine.connect() as verify:
+        count = verify.execute(
+            text("SELECT count(*) FROM narrative.events WHERE timeline_id = :t"),
+            {"t": timeline_id},
+        ).scalar()
+        assert count == 0
@@ -0,0 +1,123 @@
+"""Tests for src/dnd_ai/api/deps.py's configurable engine construction —
+pool sizing, PostgreSQL `statement_timeout`/`lock_timeout` applied to every
+pooled connection, the optional dedicated advisory-lock pool — and the
+`/metricsz` pool gauges (src/dnd_ai/api/pool_metrics.py).
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
+
+from dnd_ai.api import deps
+from dnd_ai.api.app import create_app
+from dnd_ai.api.deps import get_advisory_lock_engine, get_engine
+from dnd_ai.api.pool_metrics import read_pool_gauges, record_checkout_wait
+from dnd_ai.config import settings
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def configured(postgres_engine: Engine, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Points the real `get_engine` singleton at the test database and
+    guarantees whatever engines a test builds are disposed afterwards."""
+    monkeypatch.setattr(
+        settings, "database_url", postgres_engine.url.render_as_string(hide_password=False)
+    )
+    monkeypatch.setattr(deps, "_engine", None)
+    monkeypatch.setattr(deps, "_advisory_lock_engine", None)
+    try:
+        yield
+    finally:
+        deps.dispose_engine()
+
+
+def test_get_engine_applies_the_configured_pool(
+    configured: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "database_pool_size", 3)
+    monkeypatch.setattr(settings, "database_max_overflow", 1)
+    monkeypatch.setattr(settings, "database_pool_timeout_seconds", 2.5)
+
+    engine = get_engine()
+
+    gauges = read_pool_gauges(engine)
+    assert gauges.size == 3
+    assert engine.pool.timeout() == 2.5  # type: ignore[attr-defined]
+
+
+def test_server_side_timeouts_apply_to_every_pooled_connection(
+    configured: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "database_statement_timeout_ms", 1500)
+    monkeypatch.setattr(settings, "database_lock_timeout_ms", 500)
+
+    with get_engine().connect() as connection:
+        assert connection.execute(text("SHOW statement_timeout")).scalar() == "1500ms"
+        assert connection.execute(text("SHOW lock_timeout")).scalar() == "500ms"
+        with pytest.raises(OperationalError, match="statement timeout"):
+            connection.execute(text("SELECT pg_sleep(5)"))
+
+
+def test_no_timeouts_are_sent_by_default(configured: None) -> None:
+    with get_engine().connect() as connection:
+        assert connection.execute(text("SHOW statement_timeout")).scalar() == "0"
+        assert connection.execute(text("SHOW lock_timeout")).scalar() == "0"
+
+
+def test_the_advisory_lock_path_shares_the_request_engine_by_default(
+    configured: None,
+) -> None:
+    engine = get_engine()
+
+    assert get_advisory_lock_engine(engine) is engine
+    assert deps.peek_advisory_lock_engine() is None
+
+
+def test_a_dedicated_advisory_lock_pool_is_small_and_separate(
+    configured: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "database_advisory_lock_pool_size", 2)
+    monkeypatch.setattr(settings, "database_pool_timeout_seconds", 0.2)
+    engine = get_engine()
+
+    lock_engine = get_advisory_lock_engine(engine)
+
+    assert lock_engine is not engine
+    assert get_advisory_lock_engine(engine) is lock_engine
+    assert read_pool_gauges(lock_engine).size == 2
+    with lock_engine.connect(), lock_engine.connect():
+        # No overflow: a third lock connection waits out the pool timeout
+        # rather than growing the pool...
+        with pytest.raises(SQLAlchemyTimeoutError):
+            lock_engine.connect()
+        # ...while the request pool is untouched.
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_metricsz_reports_pool_gauges(postgres_engine: Engine) -> None:
+    app = create_app()
+    app.dependency_overrides[get_engine] = lambda: postgres_engine
+    record_checkout_wait(postgres_engine, 0.25)
+
+    with TestClient(app) as client:
+        response = client.get("/metricsz")
+
+    assert response.status_code == 200
+    primary = response.json()["pools"]["primary"]
+    assert set(primary) == {
+        "size",
+        "checked_out",
+        "checked_in",
+        "overflow",
+        "checkout_wait_count",
+        "checkout_wait_seconds_total",
+        "checkout_wait_seconds_max",
+    }
+    assert primary["checkout_wait_count"] >= 1
+    assert primary["checkout_wait_seconds_max"] >= 0.25
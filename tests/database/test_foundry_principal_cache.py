@@ -0,0 +1,214 @@
+"""Tests for revision 100's per-system credential generation triggers and
+the cross-request Foundry-adapter principal cache built on them
+(src/dnd_ai/api/foundry_principal_cache.py).
+
+Each invalidating change the cache promises to see — key rotation,
+deactivation, and a lifecycle change on the bound user — is asserted both
+as a bumped generation and as a cached credential that stops
+authenticating.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import Connection, text
+
+from dnd_ai.api.foundry_principal_cache import FoundryPrincipalCache
+from dnd_ai.commands.integration import (
+    _issue_foundry_system_key_impl,
+    _link_foundry_identity_impl,
+)
+from dnd_ai.domain.access import AuthenticatedPrincipal, read_foundry_credential_generation
+from tests.factories import make_external_system, make_user, make_world, status_id
+
+pytestmark = pytest.mark.database
+
+
+class Fixture:
+    def __init__(self, connection: Connection) -> None:
+        self.world_id = make_world(connection, slug="foundry-principal-cache-world")
+        self.external_system_id = make_external_system(connection, self.world_id)
+        self.user_id = make_user(connection, "Foundry Principal Cache GM")
+        _link_foundry_identity_impl(
+            connection,
+            external_system_id=self.external_system_id,
+            foundry_user_id="gm-foundry-user",
+            user_id=self.user_id,
+        )
+        self.raw_key = self.issue_key(connection)
+
+    def issue_key(self, connection: Connection) -> str:
+        return _issue_foundry_system_key_impl(
+            connection,
+            external_system_id=self.external_system_id,
+            principal_foundry_user_id="gm-foundry-user",
+        ).raw_key
+
+
+@pytest.fixture
+def f(db_connection: Connection) -> Fixture:
+    return Fixture(db_connection)
+
+
+@pytest.fixture
+def cache() -> FoundryPrincipalCache:
+    return FoundryPrincipalCache(max_entries=8, ttl_seconds=60)
+
+
+def _generation(connection: Connection, external_system_id: uuid.UUID) -> int:
+    current = read_foundry_credential_generation(connection, external_system_id=external_system_id)
+    assert current is not None
+    return current
+
+
+def _resolve(
+    connection: Connection, cache: FoundryPrincipalCache, f: Fixture, raw_key: str
+) -> AuthenticatedPrincipal | None:
+    return cache.resolve(
+        connection,
+        external_system_id=f.external_system_id,
+        raw_key=raw_key,
+        claimed_foundry_actor_id=None,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Triggers
+# ---------------------------------------------------------------------------
+
+
+def test_an_unknown_system_has_no_generation(db_connection: Connection) -> None:
+    assert (
+        read_foundry_credential_generation(db_connection, external_system_id=uuid.uuid4()) is None
+    )
+
+
+def test_rotating_the_key_bumps_the_generation(db_connection: Connection, f: Fixture) -> None:
+    before = _generation(db_connection, f.external_system_id)
+
+    f.issue_key(db_connection)
+
+    assert _generation(db_connection, f.external_system_id) > before
+
+
+def test_deactivating_the_system_bumps_the_generation(
+    db_connection: Connection, f: Fixture
+) -> None:
+    before = _generation(db_connection, f.external_system_id)
+
+    db_connection.execute(
+        text(
+            "UPDATE integration.external_systems SET is_active = false WHERE external_system_id = :id"
+        ),
+        {"id": f.external_system_id},
+    )
+
+    assert _generation(db_connection, f.external_system_id) > before
+
+
+def test_a_bound_users_lifecycle_change_bumps_the_generation(
+    db_connection: Connection, f: Fixture
+) -> None:
+    before = _generation(db_connection, f.external_system_id)
+
+    db_connection.execute(
+        text("UPDATE security.users SET lifecycle_status_id = :status WHERE user_id = :id"),
+        {"status": status_id(db_connection, "lifecycle_statuses", "archived"), "id": f.user_id},
+    )
+
+    assert _generation(db_connection, f.external_system_id) > before
+
+
+def test_unrelated_writes_leave_the_generation_alone(db_connection: Connection, f: Fixture) -> None:
+    before = _generation(db_connection, f.external_system_id)
+
+    db_connection.execute(
+        text(
+            "UPDATE integration.external_systems SET display_name = 'Renamed' "
+            "WHERE external_system_id = :id"
+        ),
+        {"id": f.external_system_id},
+    )
+    db_connection.execute(
+        text("UPDATE security.users SET display_name = 'Renamed GM' WHERE user_id = :id"),
+        {"id": f.user_id},
+    )
+
+    assert _generation(db_connection, f.external_system_id) == before
+
+
+# ---------------------------------------------------------------------------
+# FoundryPrincipalCache against the real schema
+# ---------------------------------------------------------------------------
+
+
+def test_a_cached_principal_carries_the_current_requests_actor_claim(
+    db_connection: Connection, f: Fixture, cache: FoundryPrincipalCache
+) -> None:
+    first = cache.resolve(
+        db_connection,
+        external_system_id=f.external_system_id,
+        raw_key=f.raw_key,
+        claimed_foundry_actor_id="actor-1",
+    )
+    second = cache.resolve(
+        db_connection,
+        external_system_id=f.external_system_id,
+        raw_key=f.raw_key,
+        claimed_foundry_actor_id="actor-2",
+    )
+
+    assert first is not None and second is not None
+    assert len(cache) == 1
+    assert second.user_id == first.user_id == f.user_id
+    assert second.foundry_world_id == f.world_id
+    assert first.foundry_claimed_actor_id == "actor-1"
+    assert second.foundry_claimed_actor_id == "actor-2"
+
+
+def test_a_rotated_out_key_stops_authenticating(
+    db_connection: Connection, f: Fixture, cache: FoundryPrincipalCache
+) -> None:
+    assert _resolve(db_connection, cache, f, f.raw_key) is not None
+
+    new_key = f.issue_key(db_connection)
+
+    assert _resolve(db_connection, cache, f, f.raw_key) is None
+    assert _resolve(db_connection, cache, f, new_key) is not None
+
+
+def test_a_deactivated_system_stops_authenticating(
+    db_connection: Connection, f: Fixture, cache: FoundryPrincipalCache
+) -> None:
+    assert _resolve(db_connection, cache, f, f.raw_key) is not None
+
+    db_connection.execute(
+        text(
+            "UPDATE integration.external_systems SET is_active = false WHERE external_system_id = :id"
+        ),
+        {"id": f.external_system_id},
+    )
+
+    assert _resolve(db_connection, cache, f, f.raw_key) is None
+
+
+def test_a_deactivated_bound_user_stops_authenticating(
+    db_connection: Connection, f: Fixture, cache: FoundryPrincipalCache
+) -> None:
+    assert _resolve(db_connection, cache, f, f.raw_key) is not None
+
+    db_connection.execute(
+        text("UPDATE security.users SET lifecycle_status_id = :status WHERE user_id = :id"),
+        {"status": status_id(db_connection, "lifecycle_statuses", "archived"), "id": f.user_id},
+    )
+
+    assert _resolve(db_connection, cache, f, f.raw_key) is None
+
+
+def test_a_wrong_key_is_never_served_from_anothers_entry(
+    db_connection: Connection, f: Fixture, cache: FoundryPrincipalCache
+) -> None:
+    assert _resolve(db_connection, cache, f, f.raw_key) is not None
+
+    assert _resolve(db_connection, cache, f, "not-the-key") is None
+    assert len(cache) == 1
@@ -0,0 +1,127 @@
+"""Tests for dnd_ai.commands._shared's process-wide lookup-code registry —
+`lookup_id` served from memory for seeded lookup codes, with a database
+fallback for anything the registry does not hold.
+"""
+
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, event, text
+
+from dnd_ai.commands._shared import (
+    LookupCodeNotFoundError,
+    get_lookup_code_registry,
+    lookup_id,
+    reload_lookup_codes,
+)
+from tests.factories import make_campaign, make_role, make_timeline, make_world
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def statements(db_connection: Connection) -> Iterator[list[str]]:
+    """Every statement `db_connection` sends from here on."""
+    executed: list[str] = []
+
+    def _record(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(db_connection, "before_cursor_execute", _record)
+    try:
+        yield executed
+    finally:
+        event.remove(db_connection, "before_cursor_execute", _record)
+
+
+def test_seeded_codes_resolve_without_a_round_trip(
+    db_connection: Connection, statements: list[str]
+) -> None:
+    get_lookup_code_registry(db_connection.engine)
+    statements.clear()
+
+    canon = lookup_id(db_connection, "core", "canon_statuses", "canon_status_id", "canon")
+    event_type = lookup_id(
+        db_connection, "narrative", "event_types", "event_type_id", "item_transferred"
+    )
+
+    assert statements == []
+    assert (
+        canon
+        == db_connection.execute(
+            text("SELECT canon_status_id FROM core.canon_statuses WHERE code = 'canon'")
+        ).scalar()
+    )
+    assert (
+        event_type
+        == db_connection.execute(
+            text("SELECT event_type_id FROM narrative.event_types WHERE code = 'item_transferred'")
+        ).scalar()
+    )
+
+
+def test_a_code_inserted_by_the_callers_transaction_falls_back_to_the_database(
+    db_connection: Connection,
+) -> None:
+    registry = get_lookup_code_registry(db_connection.engine)
+    code = f"test_status_{uuid.uuid4().hex[:8]}"
+    inserted = db_connection.execute(
+        text("""
+            INSERT INTO campaign.hazard_statuses (code, display_name)
+            VALUES (:code, :code)
+            RETURNING hazard_status_id
+        """),
+        {"code": code},
+    ).scalar()
+
+    resolved = lookup_id(db_connection, "campaign", "hazard_statuses", "hazard_status_id", code)
+
+    assert resolved == inserted
+    assert registry.get("campaign", "hazard_statuses", "hazard_status_id", code) is None
+
+
+def test_a_transaction_that_has_written_loads_only_committed_codes_off_its_connection(
+    db_connection: Connection, statements: list[str]
+) -> None:
+    reload_lookup_codes(db_connection.engine)
+    code = f"test_status_{uuid.uuid4().hex[:8]}"
+    db_connection.execute(
+        text("INSERT INTO campaign.hazard_statuses (code, display_name) VALUES (:code, :code)"),
+        {"code": code},
+    )
+    statements.clear()
+
+    assert lookup_id(db_connection, "core", "canon_statuses", "canon_status_id", "canon")
+
+    assert statements == []
+    registry = get_lookup_code_registry(db_connection.engine)
+    assert registry.get("campaign", "hazard_statuses", "hazard_status_id", code) is None
+
+
+def test_an_unknown_code_still_raises(db_connection: Connection) -> None:
+    with pytest.raises(LookupCodeNotFoundError):
+        lookup_id(db_connection, "core", "canon_statuses", "canon_status_id", "no_such_code")
+
+
+def test_scope_unique_codes_are_not_preloaded(db_connection: Connection) -> None:
+    registry = get_lookup_code_registry(db_connection.engine)
+    world_id = make_world(db_connection, slug="lookup-registry-world")
+    campaign_id = make_campaign(db_connection, make_timeline(db_connection, world_id))
+    make_role(db_connection, campaign_id=campaign_id, code="lookup_registry_role")
+
+    assert registry.get("security", "roles", "role_id", "lookup_registry_role") is None
+    assert lookup_id(db_connection, "security", "roles", "role_id", "lookup_registry_role")
+
+
+def test_reload_discards_the_engines_registry(db_connection: Connection) -> None:
+    before = get_lookup_code_registry(db_connection.engine)
+
+    reload_lookup_codes(db_connection.engine)
+
+    after = get_lookup_code_registry(db_connection.engine)
+    assert after is not before
+    assert after.get("core", "canon_statuses", "canon_status_id", "canon") == before.get(
+        "core", "canon_statuses", "canon_status_id", "canon"
+    )
@@ -0,0 +1,254 @@
+"""Tests for src/dnd_ai/api/deps.py's read routing — `get_read_replica_engine`'s
+freshness gate and `get_read_connection`'s choice between a `READ ONLY`
+replica transaction and the request's own connection — against a second database on the same PostgreSQL cluster
+standing in for the replica. The stand-in is migrated to head but holds
+none of the primary's rows, so a query route's response shows which of
+the two served it: the campaign-summary route sees the primary's session
+only when it read the primary. The stand-in is not in recovery, so its
+measured lag is zero; lag past the threshold is simulated by raising the
+measurement, never by a real standby.
+"""
+
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Connection, Engine, create_engine, text
+from sqlalchemy.exc import InternalError
+
+from dnd_ai.api import deps
+from dnd_ai.api.app import create_app
+from dnd_ai.api.auth import get_authenticated_user_id
+from dnd_ai.api.deps import get_engine, get_read_connection, get_read_replica_engine
+from dnd_ai.api.read_replica import measure_replica_lag_seconds
+from dnd_ai.config import settings
+from tests.conftest import _run_alembic_upgrade
+from tests.factories import (
+    lookup_id,
+    make_campaign,
+    make_campaign_membership,
+    make_membership_role,
+    make_role,
+    make_role_capability,
+    make_session,
+    make_timeline,
+    make_user,
+    make_world,
+    oidc_principal,
+)
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture(scope="module")
+def replica_url(postgres_engine: Engine) -> Iterator[str]:
+    name = f"dnd_ai_test_replica_{uuid.uuid4().hex[:12]}"
+    admin = postgres_engine.execution_options(isolation_level="AUTOCOMMIT")
+    with admin.connect() as connection:
+        connection.execute(text(f'CREATE DATABASE "{name}"'))
+    try:
+        url = postgres_engine.url.set(database=name).render_as_string(hide_password=False)
+        _run_alembic_upgrade(url)
+        yield url
+    finally:
+        with admin.connect() as connection:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+
+@pytest.fixture
+def replica_configured(replica_url: str, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Points `DND_AI_DATABASE_READ_REPLICA_URL` at the stand-in and
+    disposes whatever replica engine a test builds afterwards. Yields the
+    stand-in's database name."""
+    monkeypatch.setattr(settings, "database_read_replica_url", replica_url)
+    monkeypatch.setattr(deps, "_read_replica_engine", None)
+    monkeypatch.setattr(deps, "_read_replica_lag_monitor", None)
+    try:
+        yield replica_url.rsplit("/", 1)[1]
+    finally:
+        deps.dispose_read_replica_engine()
+
+
+class SummaryFixture:
+    """A campaign with one session and a `campaign.view` member, on the
+    primary only."""
+
+    def __init__(self, connection: Connection, slug: str) -> None:
+        self.world_id = make_world(connection, slug=slug)
+        self.timeline_id = make_timeline(connection, self.world_id, is_primary=True)
+        self.campaign_id = make_campaign(
+            connection, self.timeline_id, lifecycle_status_code="pending"
+        )
+        self.session_id = make_session(connection, self.campaign_id, 1, title="Prologue")
+        self.user_id = make_user(connection, "Read Replica Viewer")
+        membership_id = make_campaign_membership(connection, self.campaign_id, self.user_id)
+        role_id = make_role(
+            connection, campaign_id=self.campaign_id, code=f"viewer_{uuid.uuid4().hex[:8]}"
+        )
+        make_role_capability(
+            connection,
+            role_id,
+            lookup_id(connection, "security", "capabilities", "capability_id", "campaign.view"),
+        )
+        make_membership_role(connection, membership_id, role_id)
+
+
+@pytest.fixture
+def summary(postgres_engine: Engine) -> Iterator[SummaryFixture]:
+    with postgres_engine.begin() as connection:
+        fixture = SummaryFixture(connection, f"read-replica-{uuid.uuid4().hex[:8]}")
+    yield fixture
+    with postgres_engine.begin() as cleanup:
+        # See tests/database/test_api_dungeon.py's cleanup comment for why
+        # session_replication_role = replica and explicit deletes.
+        cleanup.execute(text("SET LOCAL session_replication_role = replica"))
+        for statement in (
+            """DELETE FROM security.membership_roles WHERE role_id IN
+                (SELECT role_id FROM security.roles WHERE campaign_id = :c)""",
+            """DELETE FROM security.role_capabilities WHERE role_id IN
+                (SELECT role_id FROM security.roles WHERE campaign_id = :c)""",
+            "DELETE FROM security.roles WHERE campaign_id = :c",
+            "DELETE FROM security.campaign_memberships WHERE campaign_id = :c",
+            "DELETE FROM campaign.sessions WHERE campaign_id = :c",
+            "DELETE FROM security.campaign_security_generations WHERE campaign_id = :c",
+            "DELETE FROM campaign.campaigns WHERE campaign_id = :c",
+        ):
+            cleanup.execute(text(statement), {"c": fixture.campaign_id})
+        cleanup.execute(
+            text("DELETE FROM core.entities WHERE world_id = :w"), {"w": fixture.world_id}
+        )
+        cleanup.execute(
+            text("DELETE FROM core.worlds WHERE world_id = :w"), {"w": fixture.world_id}
+        )
+        cleanup.execute(
+            text("DELETE FROM security.users WHERE user_id = :u"), {"u": fixture.user_id}
+        )
+
+
+def _get_summary(postgres_engine: Engine, summary: SummaryFixture) -> dict[str, object]:
+    app = create_app()
+    app.dependency_overrides[get_engine] = lambda: postgres_engine
+    app.dependency_overrides[get_authenticated_user_id] = lambda: oidc_principal(summary.user_id)
+    with TestClient(app) as client:
+        response = client.get(f"/campaigns/{summary.campaign_id}/summary")
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert isinstance(body, dict)
+    return body
+
+
+def _current_database(connection: Connection) -> str:
+    value = connection.execute(text("SELECT current_database()")).scalar()
+    assert isinstance(value, str)
+    return value
+
+
+@contextmanager
+def _read_connection(engine: Engine) -> Iterator[Connection]:
+    with engine.connect() as primary:
+        reads = get_read_connection(primary, get_read_replica_engine())
+        try:
+            yield next(reads)
+        finally:
+            reads.close()
+
+
+def test_reads_use_the_request_connection_when_no_replica_is_configured(
+    postgres_engine: Engine,
+) -> None:
+    assert get_read_replica_engine() is None
+    assert deps.peek_read_replica() is None
+    with postgres_engine.connect() as primary:
+        reads = get_read_connection(primary, None)
+        try:
+            assert next(reads) is primary
+        finally:
+            reads.close()
+
+
+def test_concurrent_reads_past_the_pool_size_never_take_a_second_connection(
+    postgres_engine: Engine, summary: SummaryFixture
+) -> None:
+    # A request holding its get_connection connection while waiting for a
+    # second one from the same pool would time out here: one connection,
+    # four requests at once.
+    engine = create_engine(postgres_engine.url, pool_size=1, max_overflow=0, pool_timeout=10)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            bodies = list(executor.map(lambda _: _get_summary(engine, summary), range(4)))
+    finally:
+        engine.dispose()
+
+    for body in bodies:
+        current_session = body["current_session"]
+        assert isinstance(current_session, dict)
+        assert current_session["session_id"] == str(summary.session_id)
+
+
+def test_a_fresh_replica_serves_reads(postgres_engine: Engine, replica_configured: str) -> None:
+    with _read_connection(postgres_engine) as connection:
+        assert _current_database(connection) == replica_configured
+        assert connection.execute(text("SHOW transaction_read_only")).scalar() == "on"
+        assert measure_replica_lag_seconds(connection) == 0.0
+
+
+def test_a_lagging_replica_falls_back_to_the_primary(
+    postgres_engine: Engine, replica_configured: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "database_read_replica_max_lag_seconds", 1.0)
+    replica = deps._get_read_replica()
+    assert replica is not None
+    _, lag_monitor = replica
+    monkeypatch.setattr(lag_monitor, "_measure", lambda _connection: 30.0)
+
+    assert get_read_replica_engine() is None
+    assert lag_monitor.last_lag_seconds == 30.0
+    assert lag_monitor.fallback_count == 1
+
+
+def test_metricsz_reports_the_replica(postgres_engine: Engine, replica_configured: str) -> None:
+    app = create_app()
+    app.dependency_overrides[get_engine] = lambda: postgres_engine
+    assert get_read_replica_engine() is not None
+
+    with TestClient(app) as client:
+        body = client.get("/metricsz").json()
+
+    assert "read_replica" in body["pools"]
+    assert body["read_replica"] == {"last_lag_seconds": 0.0, "fallback_count": 0}
+
+
+def test_a_write_on_the_replica_read_connection_fails_as_read_only(
+    postgres_engine: Engine, replica_configured: str
+) -> None:
+    with _read_connection(postgres_engine) as connection:
+        assert _current_database(connection) == replica_configured
+        with pytest.raises(InternalError, match="read-only transaction"):
+            connection.execute(text("INSERT INTO security.users (display_name) VALUES ('x')"))
+
+
+def test_a_query_route_reads_from_a_fresh_replica(
+    postgres_engine: Engine, replica_configured: str, summary: SummaryFixture
+) -> None:
+    # Authorization read the primary; the summary itself read the replica,
+    # which has no sessions.
+    assert _get_summary(postgres_engine, summary)["current_session"] is None
+
+
+def test_a_query_route_reads_from_the_primary_while_the_replica_lags(
+    postgres_engine: Engine,
+    replica_configured: str,
+    summary: SummaryFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    replica = deps._get_read_replica()
+    assert replica is not None
+    monkeypatch.setattr(replica[1], "_measure", lambda _connection: 30.0)
+
+    current_session = _get_summary(postgres_engine, summary)["current_session"]
+
+    assert isinstance(current_session, dict)
+    assert current_session["session_id"] == str(summary.session_id)
@@ -9,6 +9,8 @@ own transaction and would not see this fixture's uncommitted setup rows.
 """
 
 import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
 
 import pytest
 from sqlalchemy import Connection, text
@@ -17,11 +19,18 @@ from sqlalchemy.exc import IntegrityError
 from dnd_ai.commands.reference_corpus import (
     DuplicateFileHashError,
     PassageInput,
+    ReferenceRetrievalCache,
+    RetrievalAuditRecord,
     SourceDocumentNotIndexableError,
+    _embed_reference_passages_impl,
+    _ingest_reference_passage_stream_impl,
     _ingest_reference_passages_impl,
+    _insert_retrieval_audits,
     _register_source_document_impl,
+    _remove_source_document_impl,
     _retrieve_cited_passages_impl,
 )
+from dnd_ai.domain.embeddings import HashingEmbedder
 from tests.factories import (
     make_campaign,
     make_reference_passage,
@@ -34,6 +43,8 @@ from tests.factories import (
 
 pytestmark = pytest.mark.database
 
+_EMBEDDER = HashingEmbedder(dimensions=128)
+
 
 class Fixture:
     def __init__(self, connection: Connection, slug: str) -> None:
@@ -86,6 +97,64 @@ def test_ingest_requires_allow_indexing(db_connection: Connection, f: Fixture) -
         )
 
 
+def test_ingest_returns_ids_in_input_order_across_batches(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    orders = [*range(1500, 0, -1), 0]
+    passage_ids = _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=tuple(
+            PassageInput(passage_order=order, content=f"Passage {order}.") for order in orders
+        ),
+    )
+
+    stored = dict(
+        db_connection.execute(
+            text("""
+                SELECT reference_passage_id, passage_order FROM ai.reference_passages
+                WHERE source_document_id = :source
+            """),
+            {"source": source_id},
+        ).all()
+    )
+    assert [stored[passage_id] for passage_id in passage_ids] == orders
+
+
+def test_stream_ingest_returns_ids_in_passage_order(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f)
+
+    def passages() -> Iterator[PassageInput]:
+        for order in (5, 3, 9, 0, 7, 1):
+            yield PassageInput(passage_order=order, content=f"Passage {order}.", page_label=None)
+
+    passage_ids = _ingest_reference_passage_stream_impl(
+        db_connection, source_document_id=source_id, passages=passages(), batch_size=4
+    )
+
+    rows = db_connection.execute(
+        text("""
+            SELECT reference_passage_id, passage_order, content FROM ai.reference_passages
+            WHERE source_document_id = :source ORDER BY passage_order
+        """),
+        {"source": source_id},
+    ).all()
+    assert list(passage_ids) == [row.reference_passage_id for row in rows]
+    assert [row.passage_order for row in rows] == [0, 1, 3, 5, 7, 9]
+    assert rows[0].content == "Passage 0."
+
+
+def test_stream_ingest_requires_allow_indexing(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f, allow_indexing=False)
+    with pytest.raises(SourceDocumentNotIndexableError):
+        _ingest_reference_passage_stream_impl(
+            db_connection,
+            source_document_id=source_id,
+            passages=iter([PassageInput(passage_order=0, content="Some content.")]),
+        )
+
+
 def test_ingest_and_retrieve_returns_citation_location(
     db_connection: Connection, f: Fixture
 ) -> None:
@@ -274,6 +343,224 @@ def test_retrieval_is_recorded_for_audit(db_connection: Connection, f: Fixture)
     assert result_count == 1
 
 
+# ---------------------------------------------------------------------------
+# Hybrid retrieval
+# ---------------------------------------------------------------------------
+
+
+def _ingest_embedded(
+    connection: Connection, source_id: uuid.UUID, *contents: str
+) -> tuple[uuid.UUID, ...]:
+    return _ingest_reference_passages_impl(
+        connection,
+        source_document_id=source_id,
+        passages=tuple(
+            PassageInput(passage_order=order, content=content)
+            for order, content in enumerate(contents)
+        ),
+        embedder=_EMBEDDER,
+    )
+
+
+def _retrieve_hybrid(connection: Connection, f: Fixture, query: str) -> tuple:
+    return _retrieve_cited_passages_impl(
+        connection,
+        campaign_id=f.campaign_id,
+        query_text=query,
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+        embedder=_EMBEDDER,
+    )
+
+
+def test_ingest_with_an_embedder_stores_each_passage_vector(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    passage_ids = _ingest_embedded(db_connection, source_id, "Extra Attack.", "Fireball.")
+
+    rows = db_connection.execute(
+        text("""
+            SELECT reference_passage_id, embedding, embedding_model FROM ai.reference_passages
+            WHERE source_document_id = :source
+        """),
+        {"source": source_id},
+    ).all()
+    stored = {row.reference_passage_id: row for row in rows}
+    for passage_id, content in zip(passage_ids, ("Extra Attack.", "Fireball."), strict=True):
+        assert stored[passage_id].embedding_model == "hashing-v1-128"
+        assert stored[passage_id].embedding == pytest.approx(_EMBEDDER.embed([content])[0])
+
+
+def test_hybrid_retrieval_finds_a_passage_the_full_text_search_misses(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_embedded(
+        db_connection,
+        source_id,
+        "Fireball deals 8d6 fire damage in a 20-foot radius.",
+        "Goblins are small, black-hearted humanoids.",
+    )
+
+    query = "firebal damge"
+    lexical = _retrieve_cited_passages_impl(
+        db_connection,
+        campaign_id=f.campaign_id,
+        query_text=query,
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+    )
+    hybrid = _retrieve_hybrid(db_connection, f, query)
+
+    assert lexical == ()
+    assert hybrid[0].content.startswith("Fireball")
+    assert hybrid[0].lexical_score is None
+    assert hybrid[0].vector_score is not None and hybrid[0].vector_score > 0
+
+
+def test_hybrid_retrieval_fuses_both_rankings(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_embedded(
+        db_connection,
+        source_id,
+        "Goblins hide in caves.",
+        "Goblins attack twice with the Extra Attack feature.",
+    )
+
+    results = _retrieve_hybrid(db_connection, f, "goblins extra attack")
+
+    assert results[0].content.startswith("Goblins attack twice")
+    assert results[0].lexical_score is not None and results[0].vector_score is not None
+    assert results[0].relevance_score == pytest.approx(2 / 61)
+
+
+def test_hybrid_retrieval_keeps_house_rules_first(db_connection: Connection, f: Fixture) -> None:
+    general_source_id = _register(db_connection, f, visibility="general")
+    _ingest_embedded(db_connection, general_source_id, "Goblins have 7 hit points normally.")
+    house_rule_source_id = _register(db_connection, f, visibility="campaign_restricted")
+    _ingest_embedded(db_connection, house_rule_source_id, "House rule: hobgoblin toughness.")
+    make_reference_source_campaign_grant(
+        db_connection, house_rule_source_id, f.campaign_id, is_house_rule=True
+    )
+
+    results = _retrieve_hybrid(db_connection, f, "goblins hit points")
+
+    assert [result.source_document_id for result in results] == [
+        house_rule_source_id,
+        general_source_id,
+    ]
+    assert results[0].is_house_rule is True
+
+
+def test_hybrid_retrieval_excludes_unauthorized_and_other_model_vectors(
+    db_connection: Connection, f: Fixture
+) -> None:
+    restricted_source_id = _register(db_connection, f, visibility="campaign_restricted")
+    _ingest_embedded(db_connection, restricted_source_id, "Secret goblin lore.")
+    other_model_source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=other_model_source_id,
+        passages=(PassageInput(passage_order=0, content="Goblinoid lore sagas."),),
+        embedder=HashingEmbedder(dimensions=64),
+    )
+
+    assert _retrieve_hybrid(db_connection, f, "goblin lore") == ()
+
+
+def test_hybrid_retrieval_records_both_component_scores(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_embedded(db_connection, source_id, "Auditable arcane content.")
+
+    results = _retrieve_hybrid(db_connection, f, "arcane")
+
+    retrieval = db_connection.execute(
+        text("""
+            SELECT r.retrieval_mode, r.embedding_model, rr.relevance_score, rr.lexical_score,
+                   rr.vector_score
+            FROM ai.reference_retrievals r
+            JOIN ai.reference_retrieval_results rr
+              ON rr.reference_retrieval_id = r.reference_retrieval_id
+            WHERE r.campaign_id = :c
+        """),
+        {"c": f.campaign_id},
+    ).one()
+    assert (retrieval.retrieval_mode, retrieval.embedding_model) == ("hybrid", "hashing-v1-128")
+    assert retrieval.relevance_score == pytest.approx(results[0].relevance_score)
+    assert retrieval.lexical_score == pytest.approx(results[0].lexical_score)
+    assert retrieval.vector_score == pytest.approx(results[0].vector_score)
+
+
+def test_lexical_retrieval_records_its_mode_and_lexical_score(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_embedded(db_connection, source_id, "Auditable arcane content.")
+
+    results = _retrieve_cited_passages_impl(
+        db_connection,
+        campaign_id=f.campaign_id,
+        query_text="arcane",
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+    )
+
+    assert results[0].lexical_score == results[0].relevance_score
+    assert results[0].vector_score is None
+    mode = db_connection.execute(
+        text(
+            "SELECT retrieval_mode, embedding_model FROM ai.reference_retrievals WHERE campaign_id = :c"
+        ),
+        {"c": f.campaign_id},
+    ).one()
+    assert tuple(mode) == ("lexical", None)
+
+
+def test_embed_reference_passages_backfills_and_refreshes(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=tuple(
+            PassageInput(passage_order=order, content=f"Passage {order}.") for order in range(5)
+        ),
+    )
+    _embed_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        embedder=HashingEmbedder(dimensions=64),
+        batch_size=2,
+    )
+
+    updated = _embed_reference_passages_impl(
+        db_connection, source_document_id=source_id, embedder=_EMBEDDER, batch_size=2
+    )
+
+    assert updated == 5
+    assert (
+        _embed_reference_passages_impl(
+            db_connection, source_document_id=source_id, embedder=_EMBEDDER
+        )
+        == 0
+    )
+    models = db_connection.execute(
+        text("""
+            SELECT DISTINCT embedding_model, array_length(embedding, 1)
+            FROM ai.reference_passages WHERE source_document_id = :source
+        """),
+        {"source": source_id},
+    ).all()
+    assert [tuple(row) for row in models] == [("hashing-v1-128", 128)]
+
+
 def test_a_house_rule_grant_must_share_the_source_ruleset_version(
     db_connection: Connection, f: Fixture
 ) -> None:
@@ -291,3 +578,446 @@ def test_a_house_rule_grant_must_share_the_source_ruleset_version(
 
     with pytest.raises(IntegrityError):
         make_reference_source_campaign_grant(db_connection, source_id, other_campaign_id)
+
+
+# ---------------------------------------------------------------------------
+# Cached retrieval
+# ---------------------------------------------------------------------------
+
+
+def _retrieve_cached(
+    connection: Connection,
+    campaign_id: uuid.UUID,
+    query: str,
+    cache: ReferenceRetrievalCache,
+) -> tuple:
+    return _retrieve_cited_passages_impl(
+        connection,
+        campaign_id=campaign_id,
+        query_text=query,
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+        cache=cache,
+    )
+
+
+def _corpus_generation(connection: Connection, ruleset_version_id: uuid.UUID) -> int:
+    generation = connection.execute(
+        text("""
+            SELECT generation FROM ai.reference_corpus_generations
+            WHERE ruleset_version_id = :r
+        """),
+        {"r": ruleset_version_id},
+    ).scalar()
+    return generation or 0
+
+
+def test_a_cache_hit_returns_the_same_passages_and_is_still_audited(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Cached arcane content."),),
+    )
+    cache = ReferenceRetrievalCache(max_entries=10, ttl_seconds=60)
+
+    first = _retrieve_cached(db_connection, f.campaign_id, "arcane content", cache)
+    second = _retrieve_cached(db_connection, f.campaign_id, "  Arcane   CONTENT ", cache)
+
+    assert len(first) == 1
+    assert second == first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    audited = db_connection.execute(
+        text("""
+            SELECT r.query_text, rr.reference_passage_id, rr.rank
+            FROM ai.reference_retrievals r
+            JOIN ai.reference_retrieval_results rr
+                ON rr.reference_retrieval_id = r.reference_retrieval_id
+            WHERE r.campaign_id = :c
+            ORDER BY r.created_at, r.query_text
+        """),
+        {"c": f.campaign_id},
+    ).all()
+    assert sorted(tuple(row) for row in audited) == sorted(
+        [
+            ("arcane content", first[0].reference_passage_id, 1),
+            ("  Arcane   CONTENT ", first[0].reference_passage_id, 1),
+        ]
+    )
+
+
+def test_ingestion_invalidates_cached_retrievals(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Owlbears hunt at dusk."),),
+    )
+    cache = ReferenceRetrievalCache(max_entries=10, ttl_seconds=60)
+    assert len(_retrieve_cached(db_connection, f.campaign_id, "owlbears", cache)) == 1
+    generation = _corpus_generation(db_connection, f.ruleset_version_id)
+
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=1, content="Owlbears nest in old forests."),),
+    )
+
+    assert _corpus_generation(db_connection, f.ruleset_version_id) > generation
+    assert len(_retrieve_cached(db_connection, f.campaign_id, "owlbears", cache)) == 2
+    assert cache.stats().hits == 0
+
+
+def test_grant_and_revoke_invalidate_cached_retrievals(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = make_source_document(
+        db_connection, f.ruleset_version_id, visibility="campaign_restricted"
+    )
+    make_reference_passage(db_connection, source_id, content="Secret lore about basilisks.")
+    cache = ReferenceRetrievalCache(max_entries=10, ttl_seconds=60)
+    assert _retrieve_cached(db_connection, f.campaign_id, "basilisks", cache) == ()
+
+    grant_id = make_reference_source_campaign_grant(db_connection, source_id, f.campaign_id)
+    assert len(_retrieve_cached(db_connection, f.campaign_id, "basilisks", cache)) == 1
+
+    db_connection.execute(
+        text("""
+            UPDATE ai.reference_source_campaigns SET revoked_at = now()
+            WHERE reference_source_campaign_id = :g
+        """),
+        {"g": grant_id},
+    )
+    assert _retrieve_cached(db_connection, f.campaign_id, "basilisks", cache) == ()
+    assert cache.stats().hits == 0
+
+
+def test_removal_invalidates_cached_retrievals(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Unique necromancy content."),),
+    )
+    cache = ReferenceRetrievalCache(max_entries=10, ttl_seconds=60)
+    assert len(_retrieve_cached(db_connection, f.campaign_id, "necromancy", cache)) == 1
+
+    _remove_source_document_impl(
+        db_connection, source_document_id=source_id, removed_by_user_id=None
+    )
+
+    assert _retrieve_cached(db_connection, f.campaign_id, "necromancy", cache) == ()
+
+
+def test_campaigns_sharing_a_source_set_share_cache_entries(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Shared lore about wyverns."),),
+    )
+    sibling_campaign_id = make_campaign(
+        db_connection,
+        make_timeline(db_connection, f.world_id),
+        ruleset_version_id=f.ruleset_version_id,
+    )
+    restricted_id = make_source_document(
+        db_connection, f.ruleset_version_id, visibility="campaign_restricted"
+    )
+    make_reference_passage(db_connection, restricted_id, content="Private notes on wyverns.")
+    granted_campaign_id = make_campaign(
+        db_connection,
+        make_timeline(db_connection, f.world_id),
+        ruleset_version_id=f.ruleset_version_id,
+    )
+    make_reference_source_campaign_grant(db_connection, restricted_id, granted_campaign_id)
+    cache = ReferenceRetrievalCache(max_entries=10, ttl_seconds=60)
+
+    first = _retrieve_cached(db_connection, f.campaign_id, "wyverns", cache)
+    sibling = _retrieve_cached(db_connection, sibling_campaign_id, "wyverns", cache)
+    granted = _retrieve_cached(db_connection, granted_campaign_id, "wyverns", cache)
+
+    assert sibling == first
+    assert len(granted) == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+# ---------------------------------------------------------------------------
+# Retrieval audit writes
+# ---------------------------------------------------------------------------
+
+
+class _AcceptingQueue:
+    def __init__(self) -> None:
+        self.records: list[RetrievalAuditRecord] = []
+
+    def submit(self, record: RetrievalAuditRecord) -> bool:
+        self.records.append(record)
+        return True
+
+
+class _RefusingQueue:
+    def submit(self, record: RetrievalAuditRecord) -> bool:
+        return False
+
+
+def _audit_rows(connection: Connection, campaign_id: uuid.UUID) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in connection.execute(
+            text("""
+                SELECT r.query_text, r.retrieval_mode, rr.rank, rr.relevance_score
+                FROM ai.reference_retrievals r
+                LEFT JOIN ai.reference_retrieval_results rr
+                    ON rr.reference_retrieval_id = r.reference_retrieval_id
+                WHERE r.campaign_id = :c
+                ORDER BY r.query_text, rr.rank
+            """),
+            {"c": campaign_id},
+        )
+    ]
+
+
+def test_insert_retrieval_audits_writes_a_batch_in_one_statement(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    passage_ids = _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=tuple(
+            PassageInput(passage_order=i, content=f"Batched audit text {i}.") for i in range(2)
+        ),
+    )
+    cited = _retrieve_cited_passages_impl(
+        db_connection,
+        campaign_id=f.campaign_id,
+        query_text="batched audit",
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+        audit_queue=_AcceptingQueue(),
+    )
+    assert {passage.reference_passage_id for passage in cited} == set(passage_ids)
+    queued_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    records = [
+        RetrievalAuditRecord(
+            reference_retrieval_id=uuid.uuid4(),
+            campaign_id=f.campaign_id,
+            ruleset_version_id=f.ruleset_version_id,
+            query_text=query,
+            requested_by_user_id=None,
+            context_request_id=None,
+            embedding_model=None,
+            passages=passages,
+            created_at=queued_at,
+        )
+        for query, passages in (("first", cited), ("second", ()), ("third", cited[:1]))
+    ]
+
+    _insert_retrieval_audits(db_connection, records)
+
+    assert _audit_rows(db_connection, f.campaign_id) == [
+        ("first", "lexical", 1, pytest.approx(cited[0].relevance_score)),
+        ("first", "lexical", 2, pytest.approx(cited[1].relevance_score)),
+        ("second", "lexical", None, None),
+        ("third", "lexical", 1, pytest.approx(cited[0].relevance_score)),
+    ]
+    created = db_connection.execute(
+        text("SELECT DISTINCT created_at FROM ai.reference_retrievals WHERE campaign_id = :c"),
+        {"c": f.campaign_id},
+    ).scalars()
+    assert list(created) == [queued_at]
+
+
+def test_a_queued_retrieval_is_not_written_in_its_own_transaction(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Queued planar content."),),
+    )
+    audit_queue = _AcceptingQueue()
+
+    cited = _retrieve_cited_passages_impl(
+        db_connection,
+        campaign_id=f.campaign_id,
+        query_text="planar",
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+        audit_queue=audit_queue,
+    )
+
+    assert _audit_rows(db_connection, f.campaign_id) == []
+    (record,) = audit_queue.records
+    assert record.passages == cited
+    assert record.created_at is not None
+
+
+def test_a_refused_record_is_written_synchronously(db_connection: Connection, f: Fixture) -> None:
+    source_id = _register(db_connection, f)
+    _ingest_reference_passages_impl(
+        db_connection,
+        source_document_id=source_id,
+        passages=(PassageInput(passage_order=0, content="Refused astral content."),),
+    )
+
+    _retrieve_cited_passages_impl(
+        db_connection,
+        campaign_id=f.campaign_id,
+        query_text="astral",
+        requested_by_user_id=None,
+        context_request_id=None,
+        limit=5,
+        audit_queue=_RefusingQueue(),
+    )
+
+    assert [row[:3] for row in _audit_rows(db_connection, f.campaign_id)] == [
+        ("astral", "lexical", 1)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Authorized-source projection (migration 104)
+# ---------------------------------------------------------------------------
+
+
+def _projection(connection: Connection, campaign_id: uuid.UUID) -> dict[uuid.UUID, bool]:
+    rows = connection.execute(
+        text("""
+            SELECT source_document_id, is_house_rule FROM ai.campaign_authorized_sources
+            WHERE campaign_id = :c
+        """),
+        {"c": campaign_id},
+    ).all()
+    return {row.source_document_id: row.is_house_rule for row in rows}
+
+
+def _recomputed(connection: Connection, campaign_id: uuid.UUID) -> dict[uuid.UUID, bool]:
+    """The per-query filter retrieval used before the projection existed."""
+    rows = connection.execute(
+        text("""
+            SELECT sd.source_document_id,
+                   COALESCE(bool_or(rsc.is_house_rule), false) AS is_house_rule
+            FROM campaign.campaigns c
+            JOIN core.source_documents sd ON sd.ruleset_version_id = c.ruleset_version_id
+            LEFT JOIN ai.reference_source_campaigns rsc
+                ON rsc.source_document_id = sd.source_document_id
+               AND rsc.campaign_id = c.campaign_id
+               AND rsc.revoked_at IS NULL
+            WHERE c.campaign_id = :c
+              AND sd.status = 'active'
+              AND (sd.visibility = 'general' OR rsc.reference_source_campaign_id IS NOT NULL)
+            GROUP BY sd.source_document_id
+        """),
+        {"c": campaign_id},
+    ).all()
+    return {row.source_document_id: row.is_house_rule for row in rows}
+
+
+def test_projection_follows_grants_house_rules_and_revocation(
+    db_connection: Connection, f: Fixture
+) -> None:
+    general_id = _register(db_connection, f, visibility="general")
+    restricted_id = make_source_document(
+        db_connection, f.ruleset_version_id, visibility="campaign_restricted"
+    )
+    assert _projection(db_connection, f.campaign_id) == {general_id: False}
+
+    grant_id = make_reference_source_campaign_grant(
+        db_connection, restricted_id, f.campaign_id, is_house_rule=True
+    )
+    assert _projection(db_connection, f.campaign_id) == {general_id: False, restricted_id: True}
+
+    db_connection.execute(
+        text("""
+            UPDATE ai.reference_source_campaigns SET is_house_rule = false
+            WHERE reference_source_campaign_id = :g
+        """),
+        {"g": grant_id},
+    )
+    assert _projection(db_connection, f.campaign_id)[restricted_id] is False
+
+    db_connection.execute(
+        text("""
+            UPDATE ai.reference_source_campaigns SET revoked_at = now()
+            WHERE reference_source_campaign_id = :g
+        """),
+        {"g": grant_id},
+    )
+    assert _projection(db_connection, f.campaign_id) == {general_id: False}
+    assert _projection(db_connection, f.campaign_id) == _recomputed(db_connection, f.campaign_id)
+
+
+def test_projection_follows_source_visibility_and_removal(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f, visibility="general")
+    other_campaign_id = make_campaign(
+        db_connection,
+        make_timeline(db_connection, f.world_id),
+        ruleset_version_id=f.ruleset_version_id,
+    )
+    assert source_id in _projection(db_connection, other_campaign_id)
+
+    db_connection.execute(
+        text("""
+            UPDATE core.source_documents SET visibility = 'campaign_restricted'
+            WHERE source_document_id = :s
+        """),
+        {"s": source_id},
+    )
+    assert _projection(db_connection, f.campaign_id) == {}
+    assert _projection(db_connection, other_campaign_id) == {}
+
+    db_connection.execute(
+        text("""
+            UPDATE core.source_documents SET visibility = 'general'
+            WHERE source_document_id = :s
+        """),
+        {"s": source_id},
+    )
+    _remove_source_document_impl(
+        db_connection, source_document_id=source_id, removed_by_user_id=None
+    )
+    assert _projection(db_connection, f.campaign_id) == {}
+
+
+def test_projection_follows_a_campaign_edition_change(
+    db_connection: Connection, f: Fixture
+) -> None:
+    source_id = _register(db_connection, f, visibility="general")
+    other_version_id = make_ruleset_version_for_world(db_connection, f.world_id)
+    other_source_id = make_source_document(db_connection, other_version_id)
+    assert _projection(db_connection, f.campaign_id) == {source_id: False}
+
+    db_connection.execute(
+        text("UPDATE campaign.campaigns SET ruleset_version_id = :v WHERE campaign_id = :c"),
+        {"v": other_version_id, "c": f.campaign_id},
+    )
+
+    assert _projection(db_connection, f.campaign_id) == {other_source_id: False}
+    assert _projection(db_connection, f.campaign_id) == _recomputed(db_connection, f.campaign_id)
+
+
+def test_projection_is_written_for_a_new_campaign(db_connection: Connection, f: Fixture) -> None:
+    general_id = _register(db_connection, f, visibility="general")
+    make_source_document(db_connection, f.ruleset_version_id, visibility="campaign_restricted")
+
+    campaign_id = make_campaign(
+        db_connection,
+        make_timeline(db_connection, f.world_id),
+        ruleset_version_id=f.ruleset_version_id,
+    )
+
+    assert _projection(db_connection, campaign_id) == {general_id: False}
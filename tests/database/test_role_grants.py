@@ -207,6 +207,8 @@ MANAGED_TABLES = [
     ("security", "timeline_bootstrap_grants"),
     # Phase 10, workstream 33 — pre-campaign idempotency
     ("security", "campaign_creation_reservations"),
+    # Cross-request AccessContext cache invalidation (revision 099)
+    ("security", "campaign_security_generations"),
     # Phase 12 — rules/reference corpus: the registered source document
     # itself lives in core (alongside its §5.5 siblings, core.sources/.
     # source_types), while the corpus's extracted/indexed/retrieved halves
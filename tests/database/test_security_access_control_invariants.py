@@ -403,6 +403,13 @@ def test_concurrent_removal_of_both_owners_cannot_both_commit(postgres_engine: E
     real concurrent transactions and committed setup data, and db_connection
     wraps everything in one transaction it always rolls back (and deferred
     constraint triggers never fire on rollback at all).
+
+    Since revision 099 the second transaction usually blocks one statement
+    earlier — on the campaign's security.campaign_security_generations row,
+    which the first transaction's revocation already bumped — rather than
+    at the deferred access-manager check. Either lock is the serialization
+    this test exists to prove, so the expected contention may surface at
+    either statement.
     """
     engine = postgres_engine
     slug = f"access-control-concurrency-{uuid.uuid4().hex[:8]}"
@@ -427,13 +434,14 @@ def test_concurrent_removal_of_both_owners_cannot_both_commit(postgres_engine: E
             first.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))  # owner B still active — passes
 
             second.execute(text("SET LOCAL lock_timeout = '2s'"))
-            second.execute(
-                text(
-                    "UPDATE security.membership_roles SET revoked_at = now() WHERE membership_role_id = :r"
-                ),
-                {"r": role_assignment_b},
-            )
             with pytest.raises(Exception) as exc:
+                second.execute(
+                    text(
+                        "UPDATE security.membership_roles SET revoked_at = now() "
+                        "WHERE membership_role_id = :r"
+                    ),
+                    {"r": role_assignment_b},
+                )
                 second.execute(text("SET CONSTRAINTS ALL IMMEDIATE"))
 
             message = str(exc.value)
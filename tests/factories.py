@@ -3058,10 +3058,26 @@ def cleanup_committed_ai_world(
         """),
         {"w": world_id},
     )
+    connection.execute(
+        text("DELETE FROM security.campaign_security_generations WHERE campaign_id = :c"),
+        {"c": campaign_id},
+    )
+    connection.execute(
+        text("DELETE FROM ai.campaign_authorized_sources WHERE campaign_id = :c"),
+        {"c": campaign_id},
+    )
     connection.execute(
         text("DELETE FROM campaign.campaigns WHERE campaign_id = :c"), {"c": campaign_id}
     )
     connection.execute(text("DELETE FROM campaign.parties WHERE world_id = :w"), {"w": world_id})
+    connection.execute(
+        text("""
+            DELETE FROM ai.npc_context_generations WHERE timeline_id IN (
+                SELECT timeline_id FROM campaign.timelines WHERE world_id = :w
+            )
+        """),
+        {"w": world_id},
+    )
     connection.execute(text("DELETE FROM campaign.timelines WHERE world_id = :w"), {"w": world_id})
     connection.execute(text("DELETE FROM core.entities WHERE world_id = :w"), {"w": world_id})
     connection.execute(text("DELETE FROM core.worlds WHERE world_id = :w"), {"w": world_id})
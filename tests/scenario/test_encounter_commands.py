@@ -18,18 +18,22 @@ import uuid
 from collections.abc import Iterator
 
 import pytest
-from sqlalchemy import Connection, Engine, text
+from sqlalchemy import Connection, Engine, event, text
 from sqlalchemy.exc import IntegrityError, InternalError, ProgrammingError
 
 from dnd_ai.commands.encounters import (
+    CombatTurn,
     EncounterNotActiveError,
     EncounterNotFoundError,
+    EncounterWorkingSetCache,
     EndEncounterResult,
     ResolveCombatTurnResult,
     SessionNotInCampaignError,
     _resolve_combat_turn_impl,
+    _resolve_combat_turns_impl,
     end_encounter,
     resolve_combat_turn,
+    resolve_combat_turns,
     start_encounter,
 )
 from tests.factories import (
@@ -105,6 +109,14 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             ),
             {"t": fixture.timeline_id},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id = :t
+                )
+            """),
+            {"t": fixture.timeline_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE timeline_id = :t"),
             {"t": fixture.timeline_id},
@@ -356,7 +368,7 @@ def test_resolving_a_turn_for_a_non_participant_fails_cleanly(
     postgres_engine: Engine, f: Fixture
 ) -> None:
     """Atomicity proof: an actor who never joined the encounter fails
-    _participant_id()'s lookup after the round has already been created —
+    _require_participants() after the round has already been created —
     the whole transaction must roll back, leaving no round or turn behind."""
     start = start_encounter(
         postgres_engine,
@@ -386,6 +398,328 @@ def test_resolving_a_turn_for_a_non_participant_fails_cleanly(
         assert round_count == 0, "a round row survived a rolled-back resolve_combat_turn"
 
 
+# ---------------------------------------------------------------------------
+# resolve_combat_turns — a batch under one encounter lock
+# ---------------------------------------------------------------------------
+
+
+def test_a_batch_applies_each_turns_damage_in_order_under_one_lock(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id),
+        campaign_id=f.campaign_id,
+    )
+
+    statements: list[str] = []
+    with postgres_engine.begin() as connection:
+        event.listen(
+            connection,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        results = _resolve_combat_turns_impl(
+            connection,
+            encounter_id=start.encounter_id,
+            turns=[
+                CombatTurn(
+                    round_number=1,
+                    turn_order=0,
+                    actor_entity_id=f.attacker_id,
+                    world_time_id=f.world_time_id,
+                    target_entity_id=f.defender_id,
+                    hit=True,
+                    damage_amount=7,
+                ),
+                CombatTurn(
+                    round_number=1,
+                    turn_order=1,
+                    actor_entity_id=f.defender_id,
+                    world_time_id=f.world_time_id,
+                    target_entity_id=f.attacker_id,
+                    hit=False,
+                ),
+                CombatTurn(
+                    round_number=2,
+                    turn_order=0,
+                    actor_entity_id=f.attacker_id,
+                    world_time_id=f.world_time_id,
+                    target_entity_id=f.defender_id,
+                    damage_amount=5,
+                    session_id=f.session_id,
+                ),
+            ],
+        )
+
+    assert [(r.previous_hit_points, r.new_hit_points) for r in results] == [
+        (20, 13),
+        (None, None),
+        (13, 8),
+    ]
+    assert results[1].event_id is None
+    assert _character_hit_points(postgres_engine, f.timeline_id, f.defender_id) == 8
+    # The encounter, the timeline's world and the defender's HP are each
+    # read once for the whole batch.
+    assert sum("FROM narrative.encounters" in s for s in statements) == 1
+    assert sum("FROM campaign.timelines" in s for s in statements) == 1
+    assert sum("SELECT current_hit_points" in s for s in statements) == 1
+
+    with postgres_engine.connect() as verify:
+        effects = verify.execute(
+            text("""
+                SELECT previous_value, new_value FROM narrative.event_effects
+                WHERE event_id = ANY (:events)
+                ORDER BY array_position(CAST(:events AS uuid[]), event_id)
+            """),
+            {"events": [results[0].event_id, results[2].event_id]},
+        ).all()
+    assert [tuple(row) for row in effects] == [(20, 13), (13, 8)]
+
+
+def test_a_batch_with_one_bad_turn_records_none_of_them(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id),
+    )
+    with postgres_engine.begin() as connection:
+        outsider_id = make_character(connection, f.world_id, name="Outsider")
+
+    with pytest.raises(ValueError, match="is not a participant"):
+        resolve_combat_turns(
+            postgres_engine,
+            encounter_id=start.encounter_id,
+            turns=[
+                CombatTurn(
+                    round_number=1,
+                    turn_order=0,
+                    actor_entity_id=f.attacker_id,
+                    world_time_id=f.world_time_id,
+                    target_entity_id=f.defender_id,
+                    damage_amount=7,
+                ),
+                CombatTurn(
+                    round_number=1,
+                    turn_order=1,
+                    actor_entity_id=outsider_id,
+                    world_time_id=f.world_time_id,
+                ),
+            ],
+        )
+
+    assert _character_hit_points(postgres_engine, f.timeline_id, f.defender_id) == 20
+    with postgres_engine.connect() as verify:
+        round_count = verify.execute(
+            text("SELECT count(*) FROM narrative.encounter_rounds WHERE encounter_id = :e"),
+            {"e": start.encounter_id},
+        ).scalar()
+    assert round_count == 0
+
+
+def _resolve_capturing_statements(
+    postgres_engine: Engine,
+    f: Fixture,
+    encounter_id: uuid.UUID,
+    cache: EncounterWorkingSetCache,
+    *,
+    round_number: int,
+    turn_order: int,
+    actor_entity_id: uuid.UUID,
+) -> list[str]:
+    statements: list[str] = []
+    with postgres_engine.begin() as connection:
+        event.listen(
+            connection,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        _resolve_combat_turn_impl(
+            connection,
+            encounter_id=encounter_id,
+            round_number=round_number,
+            turn_order=turn_order,
+            actor_entity_id=actor_entity_id,
+            world_time_id=f.world_time_id,
+            target_entity_id=f.defender_id,
+            damage_amount=1,
+            working_set_cache=cache,
+        )
+    return statements
+
+
+def _working_set_reads(statements: list[str]) -> list[str]:
+    return [
+        s
+        for s in statements
+        if "FROM narrative.encounter_participants" in s
+        or "FROM campaign.timelines" in s
+        or "narrative.encounter_rounds" in s
+    ]
+
+
+def test_turns_in_a_known_round_resolve_from_the_working_set_cache(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    with postgres_engine.begin() as connection:
+        third_id = make_character(connection, f.world_id, name="Kell")
+    cache = EncounterWorkingSetCache(max_entries=10)
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id, third_id),
+        working_set_cache=cache,
+    )
+    assert len(cache) == 1
+
+    # The first turn of a round creates it, which moves the version; the
+    # next turn re-reads once at the new version and stores that.
+    first = _resolve_capturing_statements(
+        postgres_engine,
+        f,
+        start.encounter_id,
+        cache,
+        round_number=1,
+        turn_order=0,
+        actor_entity_id=f.attacker_id,
+    )
+    assert any("INSERT INTO narrative.encounter_rounds" in s for s in first)
+    second = _resolve_capturing_statements(
+        postgres_engine,
+        f,
+        start.encounter_id,
+        cache,
+        round_number=1,
+        turn_order=1,
+        actor_entity_id=third_id,
+    )
+    assert _working_set_reads(second)
+    third = _resolve_capturing_statements(
+        postgres_engine,
+        f,
+        start.encounter_id,
+        cache,
+        round_number=1,
+        turn_order=2,
+        actor_entity_id=f.defender_id,
+    )
+
+    assert _working_set_reads(third) == []
+    assert sum("FROM narrative.encounters" in s for s in third) == 1
+    assert _character_hit_points(postgres_engine, f.timeline_id, f.defender_id) == 17
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_a_participant_added_outside_the_commands_invalidates_the_working_set(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    cache = EncounterWorkingSetCache(max_entries=10)
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id),
+        working_set_cache=cache,
+    )
+    with postgres_engine.begin() as connection:
+        latecomer_id = make_character(connection, f.world_id, name="Latecomer")
+        connection.execute(
+            text("""
+                INSERT INTO narrative.encounter_participants (encounter_id, participant_entity_id)
+                VALUES (:e, :p)
+            """),
+            {"e": start.encounter_id, "p": latecomer_id},
+        )
+
+    statements = _resolve_capturing_statements(
+        postgres_engine,
+        f,
+        start.encounter_id,
+        cache,
+        round_number=1,
+        turn_order=0,
+        actor_entity_id=latecomer_id,
+    )
+
+    assert any("FROM narrative.encounter_participants" in s for s in statements)
+    assert cache.stats().hits == 0
+
+
+def test_a_round_from_a_rolled_back_turn_is_never_served_from_the_cache(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    cache = EncounterWorkingSetCache(max_entries=10)
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id),
+        working_set_cache=cache,
+    )
+    with postgres_engine.connect() as connection, connection.begin() as transaction:
+        _resolve_combat_turn_impl(
+            connection,
+            encounter_id=start.encounter_id,
+            round_number=1,
+            turn_order=0,
+            actor_entity_id=f.attacker_id,
+            world_time_id=f.world_time_id,
+            working_set_cache=cache,
+        )
+        _resolve_combat_turn_impl(
+            connection,
+            encounter_id=start.encounter_id,
+            round_number=1,
+            turn_order=1,
+            actor_entity_id=f.defender_id,
+            world_time_id=f.world_time_id,
+            working_set_cache=cache,
+        )
+        transaction.rollback()
+
+    # Were the rolled-back round's id served, this turn's INSERTs would fail
+    # its foreign key.
+    result = resolve_combat_turn(
+        postgres_engine,
+        encounter_id=start.encounter_id,
+        round_number=1,
+        turn_order=0,
+        actor_entity_id=f.attacker_id,
+        world_time_id=f.world_time_id,
+        working_set_cache=cache,
+    )
+
+    assert result.combat_action_id is not None
+
+
+def test_ending_an_encounter_discards_its_working_set(postgres_engine: Engine, f: Fixture) -> None:
+    cache = EncounterWorkingSetCache(max_entries=10)
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=f.timeline_id,
+        world_time_id=f.world_time_id,
+        participant_entity_ids=(f.attacker_id, f.defender_id),
+        working_set_cache=cache,
+    )
+
+    end_encounter(
+        postgres_engine,
+        encounter_id=start.encounter_id,
+        world_time_id=f.world_time_id,
+        outcomes=(),
+        working_set_cache=cache,
+    )
+
+    assert len(cache) == 0
+
+
 # ---------------------------------------------------------------------------
 # Encounter lifecycle enforcement
 # ---------------------------------------------------------------------------
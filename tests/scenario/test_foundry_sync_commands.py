@@ -109,6 +109,11 @@ incidental leftover reference, is what keeps it alive. The test restores
 the real SQLAlchemy methods and genuinely disposes of the connection in a
 `finally` block, so it leaves no quarantined connection, leaked pool
 slot, or held advisory lock behind for any other test.
+
+test_a_redelivered_completed_operation_replays_while_its_lock_is_held
+covers the lock-free replay pre-check: with the operation's advisory lock
+held on another connection, redelivering it — alone or in a batch —
+still returns the original result instead of waiting on the lock.
 """
 
 import contextlib
@@ -118,16 +123,20 @@ import time
 import uuid
 import weakref
 from collections.abc import Iterator
+from typing import Any
 
 import pytest
 from sqlalchemy import Connection, Engine, create_engine, text
+from sqlalchemy.exc import IntegrityError
 
 from dnd_ai.commands import integration as integration_module
-from dnd_ai.commands.encounters import start_encounter
+from dnd_ai.commands.encounters import CombatTurn, start_encounter
 from dnd_ai.commands.integration import (
     ApplyFoundryCombatSyncResult,
     ConflictingSyncPayloadError,
+    FoundryCombatSyncOperation,
     apply_foundry_combat_sync,
+    apply_foundry_combat_sync_batch,
     map_external_identifier,
     register_external_system,
 )
@@ -159,8 +168,8 @@ class Fixture:
         )
 
 
-@pytest.fixture
-def f(postgres_engine: Engine) -> Iterator[Fixture]:
+@contextlib.contextmanager
+def _committed_fixture(postgres_engine: Engine) -> Iterator[Fixture]:
     with postgres_engine.begin() as connection:
         fixture = Fixture(connection, f"foundry-sync-{uuid.uuid4().hex[:8]}")
     yield fixture
@@ -184,6 +193,14 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             ),
             {"t": fixture.timeline_id},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id = :t
+                )
+            """),
+            {"t": fixture.timeline_id},
+        )
         cleanup.execute(
             text("DELETE FROM campaign.campaigns WHERE timeline_id = :t"),
             {"t": fixture.timeline_id},
@@ -196,6 +213,20 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
         )
 
 
+@pytest.fixture
+def f(postgres_engine: Engine) -> Iterator[Fixture]:
+    with _committed_fixture(postgres_engine) as fixture:
+        yield fixture
+
+
+@pytest.fixture
+def g(postgres_engine: Engine) -> Iterator[Fixture]:
+    """A second, independent world, for comparing two deliveries of the
+    same operations."""
+    with _committed_fixture(postgres_engine) as fixture:
+        yield fixture
+
+
 def _character_hit_points(
     postgres_engine: Engine, timeline_id: uuid.UUID, character_id: uuid.UUID
 ) -> int:
@@ -1570,3 +1601,375 @@ def test_a_double_failure_after_invalidate_and_detach_fail_quarantines_the_conne
                 c.invalidate()
             with contextlib.suppress(Exception):
                 c.close()
+
+
+def _start_backlog_encounter(
+    postgres_engine: Engine, fixture: Fixture, *, hit_points: int
+) -> tuple[uuid.UUID, uuid.UUID]:
+    """(external_system_id, encounter_id) for an encounter whose two
+    characters both start at hit_points."""
+    system = register_external_system(
+        postgres_engine,
+        world_id=fixture.world_id,
+        system_type="foundry",
+        display_name="Test Foundry",
+    )
+    with postgres_engine.begin() as connection:
+        make_character_state(
+            connection,
+            fixture.timeline_id,
+            fixture.attacker_id,
+            current_hit_points=hit_points,
+            maximum_hit_points=hit_points,
+        )
+        connection.execute(
+            text("""
+                UPDATE campaign.character_state
+                SET current_hit_points = :hp, maximum_hit_points = :hp
+                WHERE timeline_id = :t AND character_id = :c
+            """),
+            {"hp": hit_points, "t": fixture.timeline_id, "c": fixture.defender_id},
+        )
+    start = start_encounter(
+        postgres_engine,
+        timeline_id=fixture.timeline_id,
+        world_time_id=fixture.world_time_id,
+        participant_entity_ids=(fixture.attacker_id, fixture.defender_id),
+    )
+    return system.external_system_id, start.encounter_id
+
+
+def _backlog(fixture: Fixture, rounds: int, *, damage: int = 1) -> list[FoundryCombatSyncOperation]:
+    """Two turns a round — the attacker, then the defender striking back —
+    with every third attack a miss."""
+    operations = []
+    for round_number in range(1, rounds + 1):
+        for turn_order, (actor, target) in enumerate(
+            ((fixture.attacker_id, fixture.defender_id), (fixture.defender_id, fixture.attacker_id))
+        ):
+            hit = (round_number + turn_order) % 3 != 0
+            operations.append(
+                FoundryCombatSyncOperation(
+                    external_operation_id=f"backlog-{round_number}-{turn_order}",
+                    turn=CombatTurn(
+                        round_number=round_number,
+                        turn_order=turn_order,
+                        actor_entity_id=actor,
+                        world_time_id=fixture.world_time_id,
+                        target_entity_id=target,
+                        hit=hit,
+                        damage_amount=damage if hit else None,
+                    ),
+                )
+            )
+    return operations
+
+
+def _deliver_one(
+    postgres_engine: Engine,
+    *,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+    operation: FoundryCombatSyncOperation,
+) -> ApplyFoundryCombatSyncResult:
+    turn = operation.turn
+    return apply_foundry_combat_sync(
+        postgres_engine,
+        external_system_id=external_system_id,
+        external_operation_id=operation.external_operation_id,
+        encounter_id=encounter_id,
+        round_number=turn.round_number,
+        turn_order=turn.turn_order,
+        actor_entity_id=turn.actor_entity_id,
+        world_time_id=turn.world_time_id,
+        target_entity_id=turn.target_entity_id,
+        hit=turn.hit,
+        damage_amount=turn.damage_amount,
+    )
+
+
+def _sync_end_state(
+    postgres_engine: Engine,
+    fixture: Fixture,
+    *,
+    external_system_id: uuid.UUID,
+    encounter_id: uuid.UUID,
+) -> dict[str, object]:
+    """Everything a delivery leaves behind, free of generated ids, so two
+    worlds' deliveries of the same backlog compare equal."""
+    with postgres_engine.connect() as verify:
+        jobs = verify.execute(
+            text("""
+                SELECT job.external_operation_id, job.status,
+                       (SELECT count(*) FROM integration.delivery_attempts attempt
+                        WHERE attempt.sync_job_id = job.sync_job_id) AS attempts,
+                       effect.previous_value, effect.new_value
+                FROM integration.sync_jobs job
+                LEFT JOIN narrative.event_effects effect
+                    ON effect.event_id = job.resulting_event_id
+                   AND effect.target_component = 'current_hit_points'
+                WHERE job.external_system_id = :s
+                ORDER BY job.external_operation_id
+            """),
+            {"s": external_system_id},
+        ).all()
+        turn_count = verify.execute(
+            text("""
+                SELECT count(*) FROM narrative.encounter_turns et
+                JOIN narrative.encounter_rounds er ON er.encounter_round_id = et.encounter_round_id
+                WHERE er.encounter_id = :e
+            """),
+            {"e": encounter_id},
+        ).scalar()
+        last_operation = verify.execute(
+            text("""
+                SELECT job.external_operation_id FROM integration.sync_state state
+                JOIN integration.sync_jobs job ON job.sync_job_id = state.last_sync_job_id
+                WHERE state.external_system_id = :s AND state.target_encounter_id = :e
+            """),
+            {"s": external_system_id, "e": encounter_id},
+        ).scalar_one()
+    return {
+        "attacker_hit_points": _character_hit_points(
+            postgres_engine, fixture.timeline_id, fixture.attacker_id
+        ),
+        "defender_hit_points": _character_hit_points(
+            postgres_engine, fixture.timeline_id, fixture.defender_id
+        ),
+        "jobs": [tuple(row) for row in jobs],
+        "turn_count": turn_count,
+        "last_operation": last_operation,
+    }
+
+
+def test_a_replayed_backlog_ends_in_the_state_sequential_delivery_does(
+    postgres_engine: Engine, f: Fixture, g: Fixture
+) -> None:
+    """A 200-operation backlog, the first 50 of which were delivered one
+    call at a time before the adapter dropped, replayed as one batch: the
+    same HP, turns, job statuses, delivery attempts and sync_state as
+    delivering all 200 one call at a time — and replaying the batch again
+    changes nothing."""
+    sequential_system_id, sequential_encounter_id = _start_backlog_encounter(
+        postgres_engine, g, hit_points=500
+    )
+    for operation in _backlog(g, 100):
+        _deliver_one(
+            postgres_engine,
+            external_system_id=sequential_system_id,
+            encounter_id=sequential_encounter_id,
+            operation=operation,
+        )
+
+    system_id, encounter_id = _start_backlog_encounter(postgres_engine, f, hit_points=500)
+    backlog = _backlog(f, 100)
+    delivered = [
+        _deliver_one(
+            postgres_engine,
+            external_system_id=system_id,
+            encounter_id=encounter_id,
+            operation=operation,
+        )
+        for operation in backlog[:50]
+    ]
+
+    results = apply_foundry_combat_sync_batch(
+        postgres_engine,
+        external_system_id=system_id,
+        encounter_id=encounter_id,
+        operations=backlog,
+    )
+
+    assert [result.replayed for result in results] == [True] * 50 + [False] * 150
+    assert [result.sync_job_id for result in results[:50]] == [
+        result.sync_job_id for result in delivered
+    ]
+    assert [result.combat_result for result in results[:50]] == [
+        result.combat_result for result in delivered
+    ]
+    end_state = _sync_end_state(
+        postgres_engine, f, external_system_id=system_id, encounter_id=encounter_id
+    )
+    assert end_state == _sync_end_state(
+        postgres_engine,
+        g,
+        external_system_id=sequential_system_id,
+        encounter_id=sequential_encounter_id,
+    )
+    assert end_state["turn_count"] == 200
+    assert end_state["last_operation"] == "backlog-100-1"
+
+    replayed = apply_foundry_combat_sync_batch(
+        postgres_engine,
+        external_system_id=system_id,
+        encounter_id=encounter_id,
+        operations=backlog,
+    )
+
+    assert all(result.replayed for result in replayed)
+    assert [result.combat_result for result in replayed] == [
+        result.combat_result for result in results
+    ]
+    assert (
+        _sync_end_state(postgres_engine, f, external_system_id=system_id, encounter_id=encounter_id)
+        == end_state
+    )
+
+
+def test_a_failing_operation_stops_the_batch_where_sequential_delivery_would(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    """Four-point hits on 15 HP: the defender's fourth would take it below
+    zero. The three before it complete, it fails, and the rest stay
+    pending; redelivering the batch replays the three and fails the same
+    operation again under its own job."""
+    system_id, encounter_id = _start_backlog_encounter(postgres_engine, f, hit_points=15)
+    backlog = [
+        FoundryCombatSyncOperation(
+            external_operation_id=f"hit-{round_number}",
+            turn=CombatTurn(
+                round_number=round_number,
+                turn_order=0,
+                actor_entity_id=f.attacker_id,
+                world_time_id=f.world_time_id,
+                target_entity_id=f.defender_id,
+                hit=True,
+                damage_amount=4,
+            ),
+        )
+        for round_number in range(1, 7)
+    ]
+
+    for _ in range(2):
+        with pytest.raises(IntegrityError, match="ck_character_state_hp_nonnegative"):
+            apply_foundry_combat_sync_batch(
+                postgres_engine,
+                external_system_id=system_id,
+                encounter_id=encounter_id,
+                operations=backlog,
+            )
+
+    end_state = _sync_end_state(
+        postgres_engine, f, external_system_id=system_id, encounter_id=encounter_id
+    )
+    assert end_state["defender_hit_points"] == 3
+    assert end_state["turn_count"] == 3
+    assert [
+        (operation, status, attempts) for operation, status, attempts, *_ in end_state["jobs"]
+    ] == [
+        ("hit-1", "completed", 1),
+        ("hit-2", "completed", 1),
+        ("hit-3", "completed", 1),
+        ("hit-4", "failed", 2),
+        ("hit-5", "pending", 0),
+        ("hit-6", "pending", 0),
+    ]
+    assert end_state["last_operation"] == "hit-3"
+
+
+def test_a_conflicting_operation_rejects_the_whole_batch_before_any_work(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    system_id, encounter_id = _start_backlog_encounter(postgres_engine, f, hit_points=500)
+    backlog = _backlog(f, 3)
+    _deliver_one(
+        postgres_engine,
+        external_system_id=system_id,
+        encounter_id=encounter_id,
+        operation=backlog[1],
+    )
+    conflicting = FoundryCombatSyncOperation(
+        external_operation_id=backlog[1].external_operation_id,
+        turn=backlog[0].turn,
+    )
+
+    with pytest.raises(ConflictingSyncPayloadError):
+        apply_foundry_combat_sync_batch(
+            postgres_engine,
+            external_system_id=system_id,
+            encounter_id=encounter_id,
+            operations=[backlog[0], conflicting, *backlog[2:]],
+        )
+
+    end_state = _sync_end_state(
+        postgres_engine, f, external_system_id=system_id, encounter_id=encounter_id
+    )
+    assert end_state["turn_count"] == 1
+    assert [job[0] for job in end_state["jobs"]] == [backlog[1].external_operation_id]
+
+
+def test_a_batch_rejects_a_repeated_operation_id(postgres_engine: Engine, f: Fixture) -> None:
+    system_id, encounter_id = _start_backlog_encounter(postgres_engine, f, hit_points=500)
+    operation = _backlog(f, 1)[0]
+
+    with pytest.raises(ValueError, match="must not repeat"):
+        apply_foundry_combat_sync_batch(
+            postgres_engine,
+            external_system_id=system_id,
+            encounter_id=encounter_id,
+            operations=[operation, operation],
+        )
+
+
+def test_a_redelivered_completed_operation_replays_while_its_lock_is_held(
+    postgres_engine: Engine, f: Fixture
+) -> None:
+    system_id, encounter_id = _start_backlog_encounter(postgres_engine, f, hit_points=500)
+    backlog = _backlog(f, 1)
+    first = apply_foundry_combat_sync_batch(
+        postgres_engine,
+        external_system_id=system_id,
+        encounter_id=encounter_id,
+        operations=backlog,
+    )
+    results: dict[str, Any] = {}
+
+    def _redeliver() -> None:
+        with postgres_engine.connect() as connection:
+            turn = backlog[0].turn
+            results["single"] = apply_foundry_combat_sync(
+                postgres_engine,
+                external_system_id=system_id,
+                external_operation_id=backlog[0].external_operation_id,
+                encounter_id=encounter_id,
+                round_number=turn.round_number,
+                turn_order=turn.turn_order,
+                actor_entity_id=turn.actor_entity_id,
+                world_time_id=turn.world_time_id,
+                target_entity_id=turn.target_entity_id,
+                hit=turn.hit,
+                damage_amount=turn.damage_amount,
+                replay_connection=connection,
+            )
+            results["batch"] = apply_foundry_combat_sync_batch(
+                postgres_engine,
+                external_system_id=system_id,
+                encounter_id=encounter_id,
+                operations=backlog,
+                replay_connection=connection,
+            )
+
+    holder = postgres_engine.connect()
+    try:
+        holder.execute(
+            text("""
+                SELECT pg_advisory_lock(hashtext(:system), hashtext(operation))
+                FROM unnest(CAST(:operations AS text[])) AS operation
+            """),
+            {
+                "system": str(system_id),
+                "operations": [operation.external_operation_id for operation in backlog],
+            },
+        )
+        worker = threading.Thread(target=_redeliver)
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive(), "a completed operation's replay waited on its lock"
+    finally:
+        holder.close()
+        worker.join()
+
+    replays = (results["single"], *results["batch"])
+    assert [(r.replayed, r.sync_job_id, r.combat_result) for r in replays] == [
+        (True, result.sync_job_id, result.combat_result) for result in (first[0], *first)
+    ]
@@ -322,6 +322,17 @@ def f(postgres_engine: Engine) -> Iterator[Fixture]:
             """),
             {"t": fixture.timeline_id},
         )
+        cleanup.execute(
+            text("""
+                DELETE FROM security.campaign_security_generations WHERE campaign_id IN (
+                    SELECT campaign_id FROM campaign.campaigns WHERE timeline_id IN (
+                        SELECT timeline_id FROM campaign.timelines
+                        WHERE timeline_id = :t OR parent_timeline_id = :t
+                    )
+                )
+            """),
+            {"t": fixture.timeline_id},
+        )
         cleanup.execute(
             text("""
                 DELETE FROM campaign.campaigns WHERE timeline_id IN (
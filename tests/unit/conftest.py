@@ -0,0 +1,20 @@
+"""Shared fixtures for tests/unit. Nothing here touches a database, per
+tests/conftest.py's rule that unit tests depend on none of its fixtures."""
+
+import pytest
+
+
+class FakeClock:
+    """A `monotonic` stand-in for the caches and monitors that take one:
+    tests step `now` instead of sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
@@ -0,0 +1,125 @@
+"""Unit tests for dnd_ai.api.access_cache.AccessContextCache's own reuse
+rules — generation match, database-clock expiry, positive-only storage —
+with the two database reads it depends on replaced by in-memory fakes. TTL
+and LRU mechanics are dnd_ai.caching.GenerationCache's
+(tests/unit/test_caching.py); the triggers that make the generation
+trustworthy are covered against a real schema in
+tests/database/test_access_context_cache.py.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from dnd_ai.api import access_cache
+from dnd_ai.api.access_cache import AccessContextCache
+from dnd_ai.domain.access import AccessContext, CampaignSecurityGeneration
+from tests.unit.conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+_NOW = datetime(2026, 8, 21, 12, 0, tzinfo=UTC)
+
+
+class FakeSecurityState:
+    """Stands in for security.campaign_security_generations plus
+    resolve_access_context: counts resolutions so a test can tell a cache
+    hit from a re-resolve."""
+
+    def __init__(self) -> None:
+        self.generation = 1
+        self.observed_at = _NOW
+        self.valid_until: datetime | None = None
+        self.has_membership = True
+        self.resolutions = 0
+
+    def read_generation(
+        self, _connection: Any, *, campaign_id: uuid.UUID
+    ) -> CampaignSecurityGeneration:
+        return CampaignSecurityGeneration(generation=self.generation, observed_at=self.observed_at)
+
+    def resolve(
+        self, _connection: Any, *, user_id: uuid.UUID, campaign_id: uuid.UUID
+    ) -> AccessContext | None:
+        self.resolutions += 1
+        if not self.has_membership:
+            return None
+        return AccessContext(
+            user_id=user_id,
+            campaign_id=campaign_id,
+            campaign_membership_id=uuid.uuid4(),
+            timeline_id=uuid.uuid4(),
+            role_capabilities=frozenset({"campaign.view"}),
+            character_capabilities={},
+            grant_effects={},
+            valid_until=self.valid_until,
+        )
+
+
+@pytest.fixture
+def state(monkeypatch: pytest.MonkeyPatch) -> FakeSecurityState:
+    fake = FakeSecurityState()
+    monkeypatch.setattr(access_cache, "read_campaign_security_generation", fake.read_generation)
+    monkeypatch.setattr(access_cache, "resolve_access_context", fake.resolve)
+    return fake
+
+
+def _resolve(cache: AccessContextCache, user_id: uuid.UUID, campaign_id: uuid.UUID) -> Any:
+    return cache.resolve(object(), user_id=user_id, campaign_id=campaign_id)  # type: ignore[arg-type]
+
+
+def test_reuses_an_entry_while_the_generation_is_unchanged(
+    state: FakeSecurityState, fake_clock: FakeClock
+) -> None:
+    cache = AccessContextCache(max_entries=8, ttl_seconds=60, monotonic=fake_clock)
+    user_id, campaign_id = uuid.uuid4(), uuid.uuid4()
+
+    first = _resolve(cache, user_id, campaign_id)
+    second = _resolve(cache, user_id, campaign_id)
+
+    assert second is first
+    assert state.resolutions == 1
+
+
+def test_a_bumped_generation_forces_a_re_resolve(
+    state: FakeSecurityState, fake_clock: FakeClock
+) -> None:
+    cache = AccessContextCache(max_entries=8, ttl_seconds=60, monotonic=fake_clock)
+    user_id, campaign_id = uuid.uuid4(), uuid.uuid4()
+
+    _resolve(cache, user_id, campaign_id)
+    state.generation += 1
+    _resolve(cache, user_id, campaign_id)
+
+    assert state.resolutions == 2
+
+
+def test_an_entry_is_not_served_at_or_after_its_valid_until(
+    state: FakeSecurityState, fake_clock: FakeClock
+) -> None:
+    cache = AccessContextCache(max_entries=8, ttl_seconds=60, monotonic=fake_clock)
+    user_id, campaign_id = uuid.uuid4(), uuid.uuid4()
+    state.valid_until = _NOW + timedelta(seconds=5)
+
+    _resolve(cache, user_id, campaign_id)
+    state.observed_at = _NOW + timedelta(seconds=4)
+    _resolve(cache, user_id, campaign_id)
+    assert state.resolutions == 1
+
+    state.observed_at = _NOW + timedelta(seconds=5)
+    _resolve(cache, user_id, campaign_id)
+    assert state.resolutions == 2
+
+
+def test_a_none_resolution_is_never_cached(state: FakeSecurityState, fake_clock: FakeClock) -> None:
+    cache = AccessContextCache(max_entries=8, ttl_seconds=60, monotonic=fake_clock)
+    user_id, campaign_id = uuid.uuid4(), uuid.uuid4()
+    state.has_membership = False
+
+    assert _resolve(cache, user_id, campaign_id) is None
+    state.has_membership = True
+    assert _resolve(cache, user_id, campaign_id) is not None
+    assert state.resolutions == 2
+    assert len(cache) == 1
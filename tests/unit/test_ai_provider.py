@@ -3,14 +3,20 @@ OpenAiCompatibleProvider` — the one real AI provider Phase 12 ships — plus
 `NpcTurnOutput`'s own schema rules (the two proposal kinds and their mutual
 exclusion) and `FakeAiProvider`'s matching test-double behavior. This file
 is the only place that constructs `OpenAiCompatibleProvider`; every test
-that does monkeypatches `httpx.post` itself, so no network call and no real
-API key is required. See that module's own docstring for why one class
+that does monkeypatches `httpx.Client.post` itself (or, for the keep-alive
+and timing tests, points it at a local HTTP server), so no external network
+call and no real API key is required. See that module's own docstring for why one class
 serves both hosted OpenAI and a locally hosted, OpenAI-API-compatible model
-server.
+server. `AsyncOpenAiCompatibleProvider` is driven through an
+`httpx.AsyncClient` over `httpx.MockTransport` instead.
 """
 
+import asyncio
 import json
+import threading
 import uuid
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import httpx
@@ -18,10 +24,17 @@ import pytest
 from pydantic import ValidationError
 
 from dnd_ai.domain.ai_provider import (
+    AsyncOpenAiCompatibleProvider,
+    DialogueDelta,
     FakeAiProvider,
+    FakeAsyncAiProvider,
     NpcTurnOutput,
     OpenAiCompatibleProvider,
+    ProviderResult,
+    _DialogueStreamDecoder,
     _npc_turn_function_schema,
+    build_ai_http_client,
+    build_async_ai_http_client,
 )
 from dnd_ai.domain.context_assembly import AdvanceableObjective, NpcConversationContext
 
@@ -48,21 +61,19 @@ def _context() -> NpcConversationContext:
 def _capture_post(
     monkeypatch: pytest.MonkeyPatch, response: httpx.Response | Exception
 ) -> list[dict[str, Any]]:
-    """Replaces `httpx.post` with a fake that records its call kwargs and
-    returns (or raises) `response`. `OpenAiCompatibleProvider` does
-    `import httpx` locally inside each method, but that still binds the same
-    module object `httpx` names at import time, so patching the attribute on
-    the real `httpx` module intercepts it regardless of where it's called
-    from."""
+    """Replaces `httpx.Client.post` with a fake that records its call kwargs
+    and returns (or raises) `response`. Patched on the class, so it
+    intercepts the pooled client `OpenAiCompatibleProvider` builds for
+    itself."""
     calls: list[dict[str, Any]] = []
 
-    def fake_post(url: str, **kwargs: Any) -> httpx.Response:
+    def fake_post(_client: httpx.Client, url: str, **kwargs: Any) -> httpx.Response:
         calls.append({"url": url, **kwargs})
         if isinstance(response, Exception):
             raise response
         return response
 
-    monkeypatch.setattr(httpx, "post", fake_post)
+    monkeypatch.setattr(httpx.Client, "post", fake_post)
     return calls
 
 
@@ -561,3 +572,442 @@ def test_fake_provider_proposes_the_first_advanceable_objective_when_asked() ->
 def test_fake_provider_rejects_both_candidate_flags_at_once() -> None:
     with pytest.raises(ValueError, match="mutually exclusive"):
         FakeAiProvider(reveal_first_candidate=True, advance_first_candidate=True)
+
+
+# ---------------------------------------------------------------------------
+# AsyncOpenAiCompatibleProvider / FakeAsyncAiProvider
+# ---------------------------------------------------------------------------
+
+
+def _async_provider(
+    handler: Any, *, api_key: str | None = "sk-test"
+) -> tuple[AsyncOpenAiCompatibleProvider, httpx.AsyncClient]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider = AsyncOpenAiCompatibleProvider(
+        client=client,
+        api_key=api_key,
+        model_identifier="gpt-4o",
+        base_url="http://localhost:8080/v1/",
+    )
+    return provider, client
+
+
+def test_async_generate_npc_turn_sends_the_same_request_as_the_sync_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sync_calls = _capture_post(
+        monkeypatch,
+        _tool_call_response(function_name="record_npc_turn", arguments={"dialogue": "Hi."}),
+    )
+    OpenAiCompatibleProvider(
+        api_key="sk-test", model_identifier="gpt-4o", base_url="http://localhost:8080/v1/"
+    ).generate_npc_turn(context=_context(), player_message="Hello")
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return _tool_call_response(function_name="record_npc_turn", arguments={"dialogue": "Hi."})
+
+    async def run() -> None:
+        provider, client = _async_provider(handler)
+        async with client:
+            result = await provider.generate_npc_turn(context=_context(), player_message="Hello")
+        assert result.error_message is None
+        assert result.structured_output is not None
+        assert result.structured_output.dialogue == "Hi."
+
+    asyncio.run(run())
+
+    assert len(seen) == 1
+    assert str(seen[0].url) == sync_calls[0]["url"] == "http://localhost:8080/v1/chat/completions"
+    assert seen[0].headers["Authorization"] == "Bearer sk-test"
+    assert json.loads(seen[0].content) == sync_calls[0]["json"]
+
+
+def test_async_generate_synthesis_parses_a_successful_tool_call() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _tool_call_response(
+            function_name="record_synthesis_answer",
+            arguments={"answer": "The party fought bandits."},
+        )
+
+    async def run() -> None:
+        provider, client = _async_provider(handler, api_key=None)
+        async with client:
+            return await provider.generate_synthesis(
+                context={}, audience_tier="gm_brief", question_text="What happened?"
+            )
+
+    result = asyncio.run(run())
+    assert result.error_message is None
+    assert result.structured_output is not None
+    assert result.structured_output.answer == "The party fought bandits."
+
+
+def test_async_generate_npc_turn_connection_error_returns_error_message_not_raise() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def run() -> Any:
+        provider, client = _async_provider(handler)
+        async with client:
+            return await provider.generate_npc_turn(context=_context(), player_message="Hello")
+
+    result = asyncio.run(run())
+    assert result.structured_output is None
+    assert result.error_message is not None
+    assert "ConnectError" in result.error_message
+
+
+def test_fake_async_provider_answers_like_the_fake_provider() -> None:
+    context = _context_with_advanceable_objective()
+    expected = FakeAiProvider(dialogue="Aye.", advance_first_candidate=True).generate_npc_turn(
+        context=context, player_message="Done."
+    )
+
+    result = asyncio.run(
+        FakeAsyncAiProvider(
+            dialogue="Aye.", advance_first_candidate=True, latency_seconds=0.01
+        ).generate_npc_turn(context=context, player_message="Done.")
+    )
+
+    assert result.structured_output == expected.structured_output
+
+
+# ---------------------------------------------------------------------------
+# Streamed NPC turns — dialogue decoded from argument fragments as they
+# arrive, the whole call validated once the stream ends
+# ---------------------------------------------------------------------------
+
+
+def _decode_in_pieces(arguments: str, size: int) -> str:
+    decoder = _DialogueStreamDecoder()
+    return "".join(
+        decoder.feed(arguments[start : start + size]) for start in range(0, len(arguments), size)
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_dialogue_decoder_recovers_the_dialogue_however_the_arguments_are_split(
+    size: int,
+) -> None:
+    dialogue = 'She says "hi"\\back\n\u00e9 \U0001f600 done'
+    arguments = json.dumps(
+        {
+            "reasoning_summary": 'mentions "dialogue"',
+            "nested": {"dialogue": "not this"},
+            "dialogue": dialogue,
+            "propose_reveal_fact_id": None,
+        }
+    )
+    assert "\\ud83d\\ude00" in arguments
+
+    assert _decode_in_pieces(arguments, size) == dialogue
+
+
+def test_dialogue_decoder_stops_at_the_end_of_the_dialogue_string() -> None:
+    decoder = _DialogueStreamDecoder()
+    assert decoder.feed('{"dialogue": "Aye') == "Aye"
+    assert decoder.feed('.", "dialogue": "again"}') == "."
+
+
+def test_dialogue_decoder_stops_at_an_invalid_escape_split_across_fragments() -> None:
+    decoder = _DialogueStreamDecoder()
+    assert decoder.feed('{"dialogue": "hi \\u') == "hi "
+    assert decoder.feed('zzzz there"}') == ""
+
+
+@pytest.mark.parametrize("escape", ["\\u+1a2", "\\u 1a2", "\\u1_a2", "\\q"])
+def test_dialogue_decoder_forwards_nothing_past_an_invalid_escape(escape: str) -> None:
+    decoder = _DialogueStreamDecoder()
+    assert decoder.feed('{"dialogue": "hi ' + escape + ' there"}') == "hi "
+    assert decoder.feed('more"}') == ""
+
+
+def _sse_response(*events: str) -> httpx.Response:
+    body = "".join(f"data: {event}\n\n" for event in events)
+    return httpx.Response(
+        200,
+        content=body.encode(),
+        headers={"content-type": "text/event-stream"},
+        request=httpx.Request("POST", "https://example.invalid"),
+    )
+
+
+def _argument_chunks(arguments: str, size: int) -> list[str]:
+    chunks = [
+        json.dumps(
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": 0,
+                                    "function": {"name": "record_npc_turn", "arguments": ""},
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+        )
+    ]
+    for start in range(0, len(arguments), size):
+        chunks.append(
+            json.dumps(
+                {
+                    "choices": [
+                        {
+                            "delta": {
+                                "tool_calls": [
+                                    {
+                                        "index": 0,
+                                        "function": {"arguments": arguments[start : start + size]},
+                                    }
+                                ]
+                            }
+                        }
+                    ]
+                }
+            )
+        )
+    chunks.append(json.dumps({"choices": [{"delta": {}, "finish_reason": "stop"}]}))
+    return chunks
+
+
+def _collect_stream(provider: Any, client: httpx.AsyncClient) -> list[Any]:
+    async def run() -> list[Any]:
+        async with client:
+            return [
+                event
+                async for event in provider.stream_npc_turn(
+                    context=_context(), player_message="Hello"
+                )
+            ]
+
+    return asyncio.run(run())
+
+
+def test_stream_npc_turn_forwards_dialogue_then_the_validated_result() -> None:
+    seen: list[httpx.Request] = []
+    arguments = json.dumps({"dialogue": "Welcome to the Prancing Pony."})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return _sse_response(*_argument_chunks(arguments, 5), "[DONE]")
+
+    events = _collect_stream(*_async_provider(handler))
+
+    *deltas, result = events
+    assert deltas and all(isinstance(delta, DialogueDelta) for delta in deltas)
+    assert "".join(delta.text for delta in deltas) == "Welcome to the Prancing Pony."
+    assert isinstance(result, ProviderResult)
+    assert result.error_message is None
+    assert result.finish_reason == "stop"
+    assert result.structured_output is not None
+    assert result.structured_output.dialogue == "Welcome to the Prancing Pony."
+    assert result.first_token_ms is not None and result.first_token_ms >= 0
+    assert json.loads(seen[0].content)["stream"] is True
+
+
+def test_stream_npc_turn_still_validates_the_whole_call_at_the_end() -> None:
+    arguments = json.dumps({"dialogue": "Hi.", "propose_reveal_fact_id": "not-a-uuid"})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _sse_response(*_argument_chunks(arguments, 8), "[DONE]")
+
+    *deltas, result = _collect_stream(*_async_provider(handler))
+
+    assert "".join(delta.text for delta in deltas) == "Hi."
+    assert result.structured_output is None
+    assert result.error_message is not None
+
+
+def test_stream_npc_turn_malformed_chunk_returns_error_message_not_raise() -> None:
+    arguments = json.dumps({"dialogue": "Hi there."})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _sse_response(*_argument_chunks(arguments, 4)[:6], "{not json", "[DONE]")
+
+    *deltas, result = _collect_stream(*_async_provider(handler))
+
+    assert "".join(delta.text for delta in deltas) == "Hi the"
+    assert result.structured_output is None
+    assert result.error_message == "Provider stream chunk was not valid JSON."
+
+
+def test_stream_npc_turn_invalid_escape_returns_error_message_not_raise() -> None:
+    arguments = '{"dialogue": "Hi \\uzzzz there."}'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _sse_response(*_argument_chunks(arguments, 4), "[DONE]")
+
+    *deltas, result = _collect_stream(*_async_provider(handler))
+
+    assert "".join(delta.text for delta in deltas) == "Hi "
+    assert isinstance(result, ProviderResult)
+    assert result.structured_output is None
+    assert result.error_message is not None
+
+
+def test_stream_npc_turn_http_status_error_returns_error_message_not_raise() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, request=request)
+
+    events = _collect_stream(*_async_provider(handler))
+
+    assert len(events) == 1
+    assert events[0].structured_output is None
+    assert events[0].error_message is not None
+    assert "HTTPStatusError" in events[0].error_message
+
+
+def test_fake_async_provider_streams_its_dialogue_word_by_word() -> None:
+    provider = FakeAsyncAiProvider(dialogue="Welcome, traveler.")
+
+    async def run() -> list[Any]:
+        return [
+            event
+            async for event in provider.stream_npc_turn(context=_context(), player_message="Hi")
+        ]
+
+    *deltas, result = asyncio.run(run())
+
+    assert [delta.text for delta in deltas] == ["Welcome, ", "traveler."]
+    assert result.structured_output.dialogue == "Welcome, traveler."
+    assert result.first_token_ms == 0
+
+
+# ---------------------------------------------------------------------------
+# Pooled keep-alive client and per-phase timings, against a local server
+# ---------------------------------------------------------------------------
+
+
+class _ChatCompletionsServer(ThreadingHTTPServer):
+    """Answers every POST with a `record_npc_turn` tool call and records
+    the client port of each request, so a test can count connections."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.client_ports: list[int] = []
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    server: _ChatCompletionsServer
+    protocol_version = "HTTP/1.1"  # keep-alive; HTTP/1.0 closes after each response
+
+    def do_POST(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler's own naming convention
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.client_ports.append(self.client_address[1])
+        body = _tool_call_response(
+            function_name="record_npc_turn", arguments={"dialogue": "Hi."}
+        ).content
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass  # silence BaseHTTPRequestHandler's default stderr access log
+
+
+@pytest.fixture
+def chat_server() -> Iterator[_ChatCompletionsServer]:
+    server = _ChatCompletionsServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def _chat_base_url(server: _ChatCompletionsServer) -> str:
+    return f"http://127.0.0.1:{server.server_port}/v1"
+
+
+def test_consecutive_turns_reuse_one_kept_alive_connection(
+    chat_server: _ChatCompletionsServer,
+) -> None:
+    provider = OpenAiCompatibleProvider(
+        api_key=None, model_identifier="local-model", base_url=_chat_base_url(chat_server)
+    )
+    try:
+        first = provider.generate_npc_turn(context=_context(), player_message="Hello")
+        second = provider.generate_npc_turn(context=_context(), player_message="Again")
+    finally:
+        provider.close()
+
+    assert first.error_message is None and second.error_message is None
+    assert len(chat_server.client_ports) == 2
+    assert len(set(chat_server.client_ports)) == 1
+    assert first.connect_ms is not None
+    assert second.connect_ms == 0
+
+
+def test_a_call_reports_connect_first_byte_and_total_timings(
+    chat_server: _ChatCompletionsServer,
+) -> None:
+    provider = OpenAiCompatibleProvider(
+        api_key=None, model_identifier="local-model", base_url=_chat_base_url(chat_server)
+    )
+    try:
+        result = provider.generate_synthesis(
+            context={}, audience_tier="gm_brief", question_text="What happened?"
+        )
+    finally:
+        provider.close()
+
+    assert result.connect_ms is not None and result.first_byte_ms is not None
+    assert result.latency_ms is not None
+    assert 0 <= result.connect_ms <= result.first_byte_ms <= result.latency_ms
+
+
+def test_the_async_provider_reports_timings_over_a_pooled_client(
+    chat_server: _ChatCompletionsServer,
+) -> None:
+    async def run() -> list[Any]:
+        async with build_async_ai_http_client() as client:
+            provider = AsyncOpenAiCompatibleProvider(
+                client=client,
+                api_key=None,
+                model_identifier="local-model",
+                base_url=_chat_base_url(chat_server),
+            )
+            return [
+                await provider.generate_npc_turn(context=_context(), player_message=message)
+                for message in ("Hello", "Again")
+            ]
+
+    first, second = asyncio.run(run())
+
+    assert first.connect_ms is not None and first.first_byte_ms is not None
+    assert second.connect_ms == 0
+    assert len(set(chat_server.client_ports)) == 1
+
+
+def test_a_mock_transport_reports_no_phase_timings() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _tool_call_response(function_name="record_npc_turn", arguments={"dialogue": "Hi."})
+
+    async def run() -> Any:
+        provider, client = _async_provider(handler)
+        async with client:
+            return await provider.generate_npc_turn(context=_context(), player_message="Hello")
+
+    result = asyncio.run(run())
+    assert result.latency_ms is not None
+    assert result.connect_ms is None
+    assert result.first_byte_ms is None
+
+
+def test_http2_is_only_requested_when_h2_is_installed() -> None:
+    # httpx itself raises ImportError for http2=True without h2; the
+    # builder must fall back to HTTP/1.1 instead.
+    with build_ai_http_client(http2=True) as client:
+        assert isinstance(client, httpx.Client)
@@ -0,0 +1,98 @@
+"""Unit tests for dnd_ai.caching.GenerationCache's own mechanics —
+generation match, `is_current`, TTL bound, LRU bound, the disabled
+setting — and its hit/miss accounting. Every cache built on it
+(`dnd_ai.commands.reference_corpus`, `dnd_ai.commands.ai_npc`,
+`dnd_ai.commands.encounters`, `dnd_ai.api.access_cache`,
+`dnd_ai.api.identity_cache`, `dnd_ai.api.foundry_principal_cache`,
+`dnd_ai.domain.tokens`) is tested only for what it adds on top.
+"""
+
+import pytest
+
+from dnd_ai.caching import GenerationCache
+from tests.unit.conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+
+def test_hit_requires_the_stored_generation() -> None:
+    cache: GenerationCache[str, str] = GenerationCache(max_entries=10)
+    cache.store("key", "value", generation=(3, "timeline"))
+
+    assert cache.lookup("key", generation=(3, "timeline")) == "value"
+    assert cache.lookup("key", generation=(4, "timeline")) is None
+    # The stale entry is dropped, not kept for the old generation.
+    assert cache.lookup("key", generation=(3, "timeline")) is None
+    assert len(cache) == 0
+
+
+def test_an_entry_failing_is_current_is_dropped() -> None:
+    cache: GenerationCache[str, int] = GenerationCache(max_entries=10)
+    cache.store("key", 5, generation=None)
+
+    assert cache.lookup("key", generation=None, is_current=lambda value: value > 4) == 5
+    assert cache.lookup("key", generation=None, is_current=lambda value: value > 5) is None
+    assert len(cache) == 0
+
+
+def test_entry_expires_after_the_ttl(fake_clock: FakeClock) -> None:
+    cache: GenerationCache[str, str] = GenerationCache(
+        max_entries=10, ttl_seconds=60, monotonic=fake_clock
+    )
+    cache.store("key", "value", generation=1)
+
+    fake_clock.now += 59
+    assert cache.lookup("key", generation=1) == "value"
+    fake_clock.now += 1
+    assert cache.lookup("key", generation=1) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: GenerationCache[str, str] = GenerationCache(max_entries=2)
+    cache.store("first", "1", generation=1)
+    cache.store("second", "2", generation=1)
+    assert cache.lookup("first", generation=1) == "1"
+
+    cache.store("third", "3", generation=1)
+
+    assert len(cache) == 2
+    assert cache.lookup("second", generation=1) is None
+    assert cache.lookup("first", generation=1) == "1"
+    assert cache.lookup("third", generation=1) == "3"
+
+
+def test_discard_drops_the_entry() -> None:
+    cache: GenerationCache[str, str] = GenerationCache(max_entries=10)
+    cache.store("key", "value", generation=1)
+
+    cache.discard("key")
+    cache.discard("key")
+
+    assert len(cache) == 0
+
+
+def test_stats_report_hit_ratio_and_latency_saved() -> None:
+    cache: GenerationCache[str, str] = GenerationCache(max_entries=10)
+    assert cache.stats().hit_ratio == 0.0
+
+    assert cache.lookup("key", generation=1) is None
+    cache.store("key", "value", generation=1, compute_seconds=0.25)
+    for _ in range(3):
+        cache.lookup("key", generation=1)
+
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (1, 3, 1)
+    assert stats.hit_ratio == pytest.approx(0.75)
+    assert stats.latency_saved_seconds == pytest.approx(0.75)
+
+
+def test_zero_max_entries_disables_the_cache() -> None:
+    disabled: GenerationCache[str, str] = GenerationCache(max_entries=0)
+    assert not disabled.enabled
+
+    disabled.store("key", "value", generation=1)
+
+    assert len(disabled) == 0
+    assert disabled.lookup("key", generation=1) is None
+    assert GenerationCache[str, str](max_entries=1).enabled
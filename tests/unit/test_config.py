@@ -568,12 +568,51 @@ _ALL_TEST_MANAGED_ENV_VARS = (
     "DND_AI_LOG_LEVEL",
     "DND_AI_DATABASE_URL",
     "DATABASE_URL",
+    "DND_AI_DATABASE_POOL_SIZE",
+    "DND_AI_DATABASE_MAX_OVERFLOW",
+    "DND_AI_DATABASE_POOL_TIMEOUT_SECONDS",
+    "DND_AI_DATABASE_POOL_RECYCLE_SECONDS",
+    "DND_AI_DATABASE_POOL_PRE_PING",
+    "DND_AI_DATABASE_STATEMENT_TIMEOUT_MS",
+    "DND_AI_DATABASE_LOCK_TIMEOUT_MS",
+    "DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE",
+    "DND_AI_DATABASE_READ_REPLICA_URL",
+    "DND_AI_DATABASE_READ_REPLICA_MAX_LAG_SECONDS",
+    "DND_AI_DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS",
     "DND_AI_FEATURE_AI_NPC_DIALOGUE",
     "DND_AI_FEATURE_DISCORD_INTEGRATION",
     "DND_AI_FEATURE_FOUNDRY_INTEGRATION",
     "DND_AI_AI_PROVIDER_API_KEY",
     "DND_AI_AI_PROVIDER_MODEL",
     "DND_AI_AI_PROVIDER_BASE_URL",
+    "DND_AI_AI_PROVIDER_MAX_CONNECTIONS",
+    "DND_AI_AI_PROVIDER_MAX_KEEPALIVE_CONNECTIONS",
+    "DND_AI_AI_PROVIDER_KEEPALIVE_EXPIRY_SECONDS",
+    "DND_AI_AI_PROVIDER_HTTP2",
+    "DND_AI_REFERENCE_EMBEDDER",
+    "DND_AI_REFERENCE_EMBEDDING_DIMENSIONS",
+    "DND_AI_ACCESS_CONTEXT_CACHE_MAX_ENTRIES",
+    "DND_AI_ACCESS_CONTEXT_CACHE_TTL_SECONDS",
+    "DND_AI_OIDC_TOKEN_CACHE_MAX_ENTRIES",
+    "DND_AI_OIDC_TOKEN_CACHE_MAX_TTL_SECONDS",
+    "DND_AI_EXTERNAL_IDENTITY_CACHE_MAX_ENTRIES",
+    "DND_AI_EXTERNAL_IDENTITY_CACHE_TTL_SECONDS",
+    "DND_AI_FOUNDRY_PRINCIPAL_CACHE_MAX_ENTRIES",
+    "DND_AI_FOUNDRY_PRINCIPAL_CACHE_TTL_SECONDS",
+    "DND_AI_REFERENCE_RETRIEVAL_CACHE_MAX_ENTRIES",
+    "DND_AI_REFERENCE_RETRIEVAL_CACHE_TTL_SECONDS",
+    "DND_AI_NPC_CONTEXT_CACHE_MAX_ENTRIES",
+    "DND_AI_NPC_CONTEXT_CACHE_TTL_SECONDS",
+    "DND_AI_ENCOUNTER_WORKING_SET_CACHE_MAX_ENTRIES",
+    "DND_AI_PROMPT_TOKENIZER",
+    "DND_AI_NPC_PROMPT_MAX_TOKENS",
+    "DND_AI_SYNTHESIS_PROMPT_MAX_TOKENS",
+    "DND_AI_NPC_TURN_SINGLE_FLIGHT",
+    "DND_AI_NPC_TURN_MAX_QUEUED",
+    "DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE",
+    "DND_AI_REFERENCE_RETRIEVAL_AUDIT_BATCH_SIZE",
+    "DND_AI_REFERENCE_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS",
+    "DND_AI_REFERENCE_RETRIEVAL_AUDIT_MAX_QUEUED",
     "DND_AI_OIDC_ISSUER",
     "DND_AI_OIDC_AUDIENCE",
     "DND_AI_OIDC_JWKS_URL",
@@ -1022,3 +1061,251 @@ def test_production_with_local_model_server_and_mounted_secret_file(
         cwd=tmp_path,
     )
     assert result.returncode == 0, result.stderr
+
+
+# ---------------------------------------------------------------------------
+# Connection pool and server-side timeouts
+# ---------------------------------------------------------------------------
+
+
+def test_pool_and_timeout_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.database_pool_size == 5
+    assert settings.database_max_overflow == 10
+    assert settings.database_pool_pre_ping is True
+    assert settings.database_statement_timeout_ms == 0
+    assert settings.database_lock_timeout_ms == 0
+    assert settings.database_advisory_lock_pool_size == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_DATABASE_POOL_SIZE", "0"),
+        ("DND_AI_DATABASE_MAX_OVERFLOW", "-1"),
+        ("DND_AI_DATABASE_POOL_TIMEOUT_SECONDS", "0"),
+        ("DND_AI_DATABASE_POOL_RECYCLE_SECONDS", "-2"),
+        ("DND_AI_DATABASE_STATEMENT_TIMEOUT_MS", "-1"),
+        ("DND_AI_DATABASE_ADVISORY_LOCK_POOL_SIZE", "-1"),
+    ],
+)
+def test_rejects_out_of_range_pool_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_rejects_a_lock_timeout_that_could_never_fire(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DND_AI_DATABASE_STATEMENT_TIMEOUT_MS", "5000")
+    monkeypatch.setenv("DND_AI_DATABASE_LOCK_TIMEOUT_MS", "5000")
+    with pytest.raises(ValidationError, match="DND_AI_DATABASE_LOCK_TIMEOUT_MS"):
+        Settings()
+
+
+def test_a_lock_timeout_alone_is_accepted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DND_AI_DATABASE_LOCK_TIMEOUT_MS", "2000")
+    assert Settings().database_lock_timeout_ms == 2000
+
+
+# ---------------------------------------------------------------------------
+# AI provider HTTP client pool
+# ---------------------------------------------------------------------------
+
+
+def test_ai_provider_client_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.ai_provider_max_connections == 20
+    assert settings.ai_provider_max_keepalive_connections == 10
+    assert settings.ai_provider_keepalive_expiry_seconds == 30.0
+    assert settings.ai_provider_http2 is True
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_AI_PROVIDER_MAX_CONNECTIONS", "0"),
+        ("DND_AI_AI_PROVIDER_MAX_KEEPALIVE_CONNECTIONS", "-1"),
+        ("DND_AI_AI_PROVIDER_KEEPALIVE_EXPIRY_SECONDS", "-1"),
+    ],
+)
+def test_rejects_out_of_range_ai_provider_client_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Reference-corpus embedder
+# ---------------------------------------------------------------------------
+
+
+def test_reference_embedder_defaults_to_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.reference_embedder == "none"
+    assert settings.reference_embedding_dimensions == 256
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_REFERENCE_EMBEDDER", "openai"),
+        ("DND_AI_REFERENCE_EMBEDDING_DIMENSIONS", "8"),
+        ("DND_AI_REFERENCE_EMBEDDING_DIMENSIONS", "8192"),
+    ],
+)
+def test_rejects_invalid_reference_embedder_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Reference-corpus retrieval cache
+# ---------------------------------------------------------------------------
+
+
+def test_reference_retrieval_cache_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.reference_retrieval_cache_max_entries == 1_000
+    assert settings.reference_retrieval_cache_ttl_seconds == 300.0
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_REFERENCE_RETRIEVAL_CACHE_MAX_ENTRIES", "-1"),
+        ("DND_AI_REFERENCE_RETRIEVAL_CACHE_TTL_SECONDS", "0"),
+    ],
+)
+def test_rejects_out_of_range_reference_retrieval_cache_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# NPC-conversation context cache
+# ---------------------------------------------------------------------------
+
+
+def test_npc_context_cache_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.npc_context_cache_max_entries == 1_000
+    assert settings.npc_context_cache_ttl_seconds == 300.0
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_NPC_CONTEXT_CACHE_MAX_ENTRIES", "-1"),
+        ("DND_AI_NPC_CONTEXT_CACHE_TTL_SECONDS", "0"),
+    ],
+)
+def test_rejects_out_of_range_npc_context_cache_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Encounter working-set cache
+# ---------------------------------------------------------------------------
+
+
+def test_encounter_working_set_cache_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert Settings().encounter_working_set_cache_max_entries == 1_000
+
+
+def test_rejects_a_negative_encounter_working_set_cache_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DND_AI_ENCOUNTER_WORKING_SET_CACHE_MAX_ENTRIES", "-1")
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Prompt-size budgets
+# ---------------------------------------------------------------------------
+
+
+def test_prompt_budget_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.prompt_tokenizer == "approximate"
+    assert settings.npc_prompt_max_tokens == 6_000
+    assert settings.synthesis_prompt_max_tokens == 6_000
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_PROMPT_TOKENIZER", "tiktoken"),
+        ("DND_AI_NPC_PROMPT_MAX_TOKENS", "-1"),
+        ("DND_AI_SYNTHESIS_PROMPT_MAX_TOKENS", "-1"),
+    ],
+)
+def test_rejects_invalid_prompt_budget_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Per-NPC turn serialization
+# ---------------------------------------------------------------------------
+
+
+def test_npc_turn_gate_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings()
+    assert settings.npc_turn_single_flight is True
+    assert settings.npc_turn_max_queued == 4
+
+
+def test_rejects_a_negative_npc_turn_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DND_AI_NPC_TURN_MAX_QUEUED", "-1")
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+# ---------------------------------------------------------------------------
+# Reference-retrieval audit durability
+# ---------------------------------------------------------------------------
+
+
+def test_reference_retrieval_audit_defaults_to_synchronous(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = Settings()
+    assert settings.reference_retrieval_audit_mode == "sync"
+    assert settings.reference_retrieval_audit_batch_size == 500
+    assert settings.reference_retrieval_audit_flush_interval_seconds == 1.0
+    assert settings.reference_retrieval_audit_max_queued == 10_000
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("DND_AI_REFERENCE_RETRIEVAL_AUDIT_MODE", "fire_and_forget"),
+        ("DND_AI_REFERENCE_RETRIEVAL_AUDIT_BATCH_SIZE", "0"),
+        ("DND_AI_REFERENCE_RETRIEVAL_AUDIT_FLUSH_INTERVAL_SECONDS", "0"),
+        ("DND_AI_REFERENCE_RETRIEVAL_AUDIT_MAX_QUEUED", "0"),
+    ],
+)
+def test_rejects_invalid_reference_retrieval_audit_settings(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
@@ -0,0 +1,57 @@
+"""Unit tests for dnd_ai.domain.embeddings — `HashingEmbedder`'s
+determinism, normalization and rough similarity behavior, and
+`build_passage_embedder`'s setting-to-embedder mapping."""
+
+import math
+
+import pytest
+
+from dnd_ai.domain.embeddings import HashingEmbedder, build_passage_embedder
+
+pytestmark = pytest.mark.unit
+
+
+def _cosine(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right, strict=True))
+
+
+def test_vectors_are_unit_length_and_sized_by_dimensions() -> None:
+    (vector,) = HashingEmbedder(dimensions=64).embed(["Fireball deals fire damage."])
+
+    assert len(vector) == 64
+    assert math.sqrt(sum(value * value for value in vector)) == pytest.approx(1.0)
+
+
+def test_embedding_is_deterministic_across_instances() -> None:
+    text = "Extra Attack lets you attack twice."
+
+    assert HashingEmbedder().embed([text]) == HashingEmbedder().embed([text])
+
+
+def test_text_without_tokens_embeds_to_the_zero_vector() -> None:
+    assert HashingEmbedder(dimensions=16).embed(["  ...  "]) == [[0.0] * 16]
+
+
+def test_related_wording_is_closer_than_unrelated_text() -> None:
+    query, related, unrelated = HashingEmbedder().embed(
+        ["attacking twice", "You can attack twice per turn.", "Goblins dwell in caves."]
+    )
+
+    assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+def test_model_identifier_changes_with_dimensions() -> None:
+    assert HashingEmbedder(dimensions=128).model_identifier == "hashing-v1-128"
+    assert HashingEmbedder(dimensions=64).model_identifier != "hashing-v1-128"
+
+
+def test_rejects_non_positive_dimensions() -> None:
+    with pytest.raises(ValueError):
+        HashingEmbedder(dimensions=0)
+
+
+def test_build_passage_embedder_maps_the_setting() -> None:
+    assert build_passage_embedder("none", dimensions=256) is None
+    embedder = build_passage_embedder("hashing", dimensions=32)
+    assert embedder is not None
+    assert embedder.model_identifier == "hashing-v1-32"
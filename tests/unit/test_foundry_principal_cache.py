@@ -0,0 +1,142 @@
+"""Unit tests for dnd_ai.api.foundry_principal_cache.FoundryPrincipalCache's
+own reuse rules — generation match, positive-only storage, the claimed
+actor substituted on a hit — with the two database reads it depends on
+replaced by in-memory fakes. TTL and LRU mechanics are dnd_ai.caching.
+GenerationCache's (tests/unit/test_caching.py); the triggers that make the
+generation trustworthy are covered against a real schema in
+tests/database/test_foundry_principal_cache.py.
+"""
+
+import uuid
+from typing import Any
+
+import pytest
+
+from dnd_ai.api import foundry_principal_cache
+from dnd_ai.api.foundry_principal_cache import FoundryPrincipalCache
+from dnd_ai.domain.access import FOUNDRY_SYSTEM_AUTH_METHOD, AuthenticatedPrincipal
+from tests.unit.conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+_KEY = "raw-system-key"
+
+
+class FakeCredentials:
+    """Stands in for integration.external_systems plus
+    resolve_foundry_system_principal: counts resolutions so a test can tell
+    a cache hit from a re-resolve."""
+
+    def __init__(self) -> None:
+        self.generation: int | None = 1
+        self.valid_key = _KEY
+        self.user_id = uuid.uuid4()
+        self.resolutions = 0
+
+    def read_generation(self, _connection: Any, *, external_system_id: uuid.UUID) -> int | None:
+        return self.generation
+
+    def resolve(
+        self,
+        _connection: Any,
+        *,
+        external_system_id: uuid.UUID,
+        raw_key: str,
+        claimed_foundry_actor_id: str | None,
+    ) -> AuthenticatedPrincipal | None:
+        self.resolutions += 1
+        if raw_key != self.valid_key:
+            return None
+        return AuthenticatedPrincipal(
+            user_id=self.user_id,
+            auth_method=FOUNDRY_SYSTEM_AUTH_METHOD,
+            foundry_external_system_id=external_system_id,
+            foundry_world_id=uuid.uuid4(),
+            foundry_claimed_actor_id=claimed_foundry_actor_id,
+        )
+
+
+@pytest.fixture
+def credentials(monkeypatch: pytest.MonkeyPatch) -> FakeCredentials:
+    fake = FakeCredentials()
+    monkeypatch.setattr(
+        foundry_principal_cache, "read_foundry_credential_generation", fake.read_generation
+    )
+    monkeypatch.setattr(foundry_principal_cache, "resolve_foundry_system_principal", fake.resolve)
+    return fake
+
+
+def _resolve(cache: FoundryPrincipalCache, system_id: uuid.UUID, raw_key: str = _KEY) -> Any:
+    return cache.resolve(
+        object(),  # type: ignore[arg-type]
+        external_system_id=system_id,
+        raw_key=raw_key,
+        claimed_foundry_actor_id=None,
+    )
+
+
+def test_reuses_an_entry_while_the_generation_is_unchanged(
+    credentials: FakeCredentials, fake_clock: FakeClock
+) -> None:
+    cache = FoundryPrincipalCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    system_id = uuid.uuid4()
+
+    first = _resolve(cache, system_id)
+    second = _resolve(cache, system_id)
+
+    assert second == first
+    assert credentials.resolutions == 1
+
+
+def test_a_bumped_generation_forces_a_re_resolve(
+    credentials: FakeCredentials, fake_clock: FakeClock
+) -> None:
+    cache = FoundryPrincipalCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    system_id = uuid.uuid4()
+
+    _resolve(cache, system_id)
+    credentials.generation = 2
+    credentials.valid_key = "rotated-key"
+
+    assert _resolve(cache, system_id) is None
+    assert credentials.resolutions == 2
+
+
+def test_a_missing_system_is_rejected_without_resolving(
+    credentials: FakeCredentials, fake_clock: FakeClock
+) -> None:
+    cache = FoundryPrincipalCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    credentials.generation = None
+
+    assert _resolve(cache, uuid.uuid4()) is None
+    assert credentials.resolutions == 0
+
+
+def test_a_failed_resolution_is_never_cached(
+    credentials: FakeCredentials, fake_clock: FakeClock
+) -> None:
+    cache = FoundryPrincipalCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    system_id = uuid.uuid4()
+
+    assert _resolve(cache, system_id, "wrong-key") is None
+    assert _resolve(cache, system_id, "wrong-key") is None
+    assert credentials.resolutions == 2
+    assert len(cache) == 0
+
+
+def test_a_hit_carries_the_current_requests_claimed_actor(
+    credentials: FakeCredentials, fake_clock: FakeClock
+) -> None:
+    cache = FoundryPrincipalCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    system_id = uuid.uuid4()
+
+    for claimed in ("actor-1", "actor-2"):
+        principal = cache.resolve(
+            object(),  # type: ignore[arg-type]
+            external_system_id=system_id,
+            raw_key=_KEY,
+            claimed_foundry_actor_id=claimed,
+        )
+        assert principal is not None
+        assert principal.foundry_claimed_actor_id == claimed
+    assert credentials.resolutions == 1
@@ -0,0 +1,75 @@
+"""Unit tests for dnd_ai.api.identity_cache.ExternalIdentityCache — reuse,
+positive-only storage, per-issuer keys — with
+resolve_user_by_external_identity replaced by an in-memory fake. TTL and
+LRU mechanics are dnd_ai.caching.GenerationCache's
+(tests/unit/test_caching.py)."""
+
+import uuid
+from typing import Any
+
+import pytest
+
+from dnd_ai.api import identity_cache
+from dnd_ai.api.identity_cache import ExternalIdentityCache
+from tests.unit.conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+_ISSUER = "https://test-idp.example"
+
+
+class FakeIdentities:
+    """Stands in for security.external_identities: counts resolutions so a
+    test can tell a cache hit from a re-resolve."""
+
+    def __init__(self) -> None:
+        self.linked: dict[tuple[str, str], uuid.UUID] = {}
+        self.resolutions = 0
+
+    def resolve(self, _connection: Any, *, issuer: str, subject: str) -> uuid.UUID | None:
+        self.resolutions += 1
+        return self.linked.get((issuer, subject))
+
+
+@pytest.fixture
+def identities(monkeypatch: pytest.MonkeyPatch) -> FakeIdentities:
+    fake = FakeIdentities()
+    monkeypatch.setattr(identity_cache, "resolve_user_by_external_identity", fake.resolve)
+    return fake
+
+
+def _resolve(cache: ExternalIdentityCache, subject: str, issuer: str = _ISSUER) -> Any:
+    return cache.resolve(object(), issuer=issuer, subject=subject)  # type: ignore[arg-type]
+
+
+def test_reuses_an_entry_within_the_ttl(identities: FakeIdentities, fake_clock: FakeClock) -> None:
+    cache = ExternalIdentityCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    user_id = identities.linked[(_ISSUER, "alice")] = uuid.uuid4()
+
+    assert _resolve(cache, "alice") == user_id
+    fake_clock.now += 29
+    assert _resolve(cache, "alice") == user_id
+    assert identities.resolutions == 1
+
+
+def test_an_unknown_identity_is_never_cached(
+    identities: FakeIdentities, fake_clock: FakeClock
+) -> None:
+    cache = ExternalIdentityCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+
+    assert _resolve(cache, "bob") is None
+    user_id = identities.linked[(_ISSUER, "bob")] = uuid.uuid4()
+    assert _resolve(cache, "bob") == user_id
+    assert identities.resolutions == 2
+
+
+def test_the_same_subject_under_another_issuer_is_a_separate_entry(
+    identities: FakeIdentities, fake_clock: FakeClock
+) -> None:
+    cache = ExternalIdentityCache(max_entries=8, ttl_seconds=30, monotonic=fake_clock)
+    identities.linked[(_ISSUER, "alice")] = uuid.uuid4()
+
+    _resolve(cache, "alice")
+
+    assert _resolve(cache, "alice", issuer="https://other-idp.example") is None
+    assert identities.resolutions == 2
@@ -594,6 +594,97 @@ def test_key_material_for_an_existing_kid_is_replaced_after_the_lifespan_expires
     assert second.public_numbers() == rotated.public_key.public_numbers()
 
 
+# ---------------------------------------------------------------------------
+# Parsed-key reuse: a warm cache never re-parses the JWK set
+# ---------------------------------------------------------------------------
+
+
+def _count_jwk_set_parses(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls = [0]
+    original = jwt.PyJWKSet.from_dict
+
+    def counting_from_dict(data: dict[str, object]) -> jwt.PyJWKSet:
+        calls[0] += 1
+        return original(data)
+
+    monkeypatch.setattr(jwt.PyJWKSet, "from_dict", staticmethod(counting_from_dict))
+    return calls
+
+
+def test_a_warm_cache_parses_each_fetched_set_only_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    keypair = generate_test_rsa_keypair()
+    transport = _FakeTransport([keypair])
+    client = _make_client(transport)
+    parses = _count_jwk_set_parses(monkeypatch)
+
+    client.get_signing_key(keypair.kid)  # cold: fetched and parsed by PyJWKClient
+    warm = client.get_signing_key(keypair.kid)  # first lock-free read parses once
+    parses_after_warmup = parses[0]
+    for _ in range(50):
+        assert client.get_signing_key(keypair.kid) is warm
+
+    assert parses[0] == parses_after_warmup
+    assert transport.call_count == 1
+
+
+def test_a_refreshed_set_replaces_the_parsed_keys() -> None:
+    old = generate_test_rsa_keypair()
+    new = generate_test_rsa_keypair()
+    transport = _FakeTransport([old])
+    client = _make_client(transport, cooldown=0.0)
+    client.get_signing_key(old.kid)
+
+    transport.keys = {new.kid: new.public_key}
+    resolved = client.get_signing_key(new.kid)
+
+    assert resolved.public_numbers() == new.public_key.public_numbers()
+    assert transport.call_count == 2
+    with pytest.raises(jwt.PyJWKClientError):
+        client.get_signing_key(old.kid)
+
+
+def _per_call_seconds(fn: Callable[[], object], *, calls: int = 200, rounds: int = 5) -> float:
+    """Best-of-`rounds` mean per-call time — the minimum is the least
+    noise-affected estimate on a shared CI machine."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def test_microbenchmark_warm_signing_key_resolution_skips_jwk_parsing() -> None:
+    """Per-call signing-key resolution on a warm cache, before and after
+    parsed-key reuse. "Before" reproduces exactly what every call used to
+    do — `PyJWKSet.from_dict` over the cached JSON, then `match_kid` —
+    against the same three-key set. The assertion only requires a
+    conservative margin so it stays stable on a loaded machine, and reports
+    both timings when it fails."""
+    keypairs = [generate_test_rsa_keypair() for _ in range(3)]
+    kid = keypairs[-1].kid
+    transport = _FakeTransport(keypairs)
+    client = _make_client(transport)
+    client.get_signing_key(kid)
+    data = {"keys": [_jwk_dict(kp.kid, kp.public_key) for kp in keypairs]}
+
+    def before() -> object:
+        keys = [key for key in jwt.PyJWKSet.from_dict(data).keys if key.key_id]
+        matched = jwt.PyJWKClient.match_kid(keys, kid)
+        assert matched is not None
+        return matched.key
+
+    before_seconds = _per_call_seconds(before)
+    after_seconds = _per_call_seconds(lambda: client.get_signing_key(kid))
+
+    assert after_seconds * 5 < before_seconds, (
+        f"signing-key resolution per call: before {before_seconds * 1e6:.1f} us, "
+        f"after {after_seconds * 1e6:.1f} us"
+    )
+    assert transport.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # get_jwks_client() singleton construction
 # ---------------------------------------------------------------------------
@@ -0,0 +1,105 @@
+"""Unit tests for dnd_ai.commands.ai_npc.NpcTurnGate — one turn at a time
+per agent assignment, the bounded queue behind it, and lane cleanup — with
+no database. The routes' 429 and the provider load it saves are covered
+end to end in tests/database/test_api_ai_async_load.py.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from dnd_ai.commands.ai_npc import NpcTurnGate, NpcTurnGateStats, NpcTurnQueueFullError
+
+pytestmark = pytest.mark.unit
+
+
+def test_turns_for_one_assignment_run_one_at_a_time_in_arrival_order() -> None:
+    gate = NpcTurnGate(max_queued=4)
+    assignment_id = uuid.uuid4()
+    events: list[str] = []
+
+    async def turn(name: str) -> None:
+        async with gate.turn(assignment_id):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+
+    async def run() -> None:
+        await asyncio.gather(turn("a"), turn("b"), turn("c"))
+
+    asyncio.run(run())
+
+    assert events == ["a start", "a end", "b start", "b end", "c start", "c end"]
+
+
+def test_turns_for_different_assignments_overlap() -> None:
+    gate = NpcTurnGate(max_queued=0)
+    running = 0
+    peak = 0
+
+    async def turn() -> None:
+        nonlocal running, peak
+        async with gate.turn(uuid.uuid4()):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def run() -> None:
+        await asyncio.gather(turn(), turn(), turn())
+
+    asyncio.run(run())
+
+    assert peak == 3
+
+
+def test_a_turn_beyond_the_queue_is_refused_and_counted() -> None:
+    gate = NpcTurnGate(max_queued=1)
+    assignment_id = uuid.uuid4()
+
+    async def run() -> NpcTurnGateStats:
+        release = asyncio.Event()
+
+        async def turn() -> None:
+            async with gate.turn(assignment_id):
+                await release.wait()
+
+        running = asyncio.create_task(turn())
+        queued = asyncio.create_task(turn())
+        await asyncio.sleep(0)
+        with pytest.raises(NpcTurnQueueFullError):
+            async with gate.turn(assignment_id):
+                pass
+        busy = gate.stats()
+        release.set()
+        await asyncio.gather(running, queued)
+        return busy
+
+    busy = asyncio.run(run())
+
+    assert busy == NpcTurnGateStats(busy_assignments=1, queued_turns=1, admitted=2, rejected=1)
+    assert gate.stats() == NpcTurnGateStats(
+        busy_assignments=0, queued_turns=0, admitted=2, rejected=1
+    )
+
+
+def test_a_failed_turn_releases_its_lane() -> None:
+    gate = NpcTurnGate(max_queued=0)
+    assignment_id = uuid.uuid4()
+
+    async def run() -> None:
+        with pytest.raises(RuntimeError):
+            async with gate.turn(assignment_id):
+                raise RuntimeError("provider failed")
+        async with gate.turn(assignment_id):
+            pass
+
+    asyncio.run(run())
+
+    assert gate.stats().busy_assignments == 0
+
+
+def test_the_queue_bound_must_not_be_negative() -> None:
+    with pytest.raises(ValueError):
+        NpcTurnGate(max_queued=-1)
@@ -31,7 +31,10 @@ ai.reference_* rules-corpus retrieval tables (4 tables), and
 core.source_documents (1 table) — a same-phase correction pass, since the
 original delivery never added them to this package's own metadata mirror at
 all (caught only once alembic check was actually run against these
-revisions).
+revisions). Revision 099 added security.campaign_security_generations,
+revision 103 ai.reference_corpus_generations, revision 104
+ai.campaign_authorized_sources, and revision 106
+ai.npc_context_generations.
 """
 
 import importlib
@@ -52,13 +55,16 @@ EXPECTED_TABLES = {
         "ai.agent_assignments",
         "ai.agent_roles",
         "ai.agents",
+        "ai.campaign_authorized_sources",
         "ai.change_reviews",
         "ai.context_requests",
         "ai.context_snapshots",
         "ai.generated_outputs",
+        "ai.npc_context_generations",
         "ai.prompt_fragments",
         "ai.prompt_templates",
         "ai.proposed_changes",
+        "ai.reference_corpus_generations",
         "ai.reference_passages",
         "ai.reference_retrieval_results",
         "ai.reference_retrievals",
@@ -254,6 +260,7 @@ EXPECTED_TABLES = {
         "security.campaign_creation_reservations",
         "security.campaign_invitations",
         "security.campaign_memberships",
+        "security.campaign_security_generations",
         "security.capabilities",
         "security.character_relationship_type_capabilities",
         "security.character_relationship_types",
@@ -0,0 +1,136 @@
+"""Unit tests for dnd_ai.domain.prompt_budget — the shipped tokenizers,
+`build_prompt_tokenizer`'s setting-to-tokenizer mapping, and
+`budget_prompt_payload`'s trimming order, stopping point and report."""
+
+import json
+
+import pytest
+
+from dnd_ai.domain.prompt_budget import (
+    ApproximateTokenizer,
+    CharacterTokenizer,
+    PromptBudget,
+    TrimmableSection,
+    budget_prompt_payload,
+    build_prompt_tokenizer,
+)
+
+pytestmark = pytest.mark.unit
+
+_TRIM_ORDER = (
+    TrimmableSection("facts", drop_from_front=True),
+    TrimmableSection("quests"),
+)
+
+
+def _payload() -> dict[str, object]:
+    return {
+        "npc": {"name": "Old Innkeeper"},
+        "facts": [f"fact number {index} about the innkeeper" for index in range(10)],
+        "quests": [{"name": f"quest {index}"} for index in range(5)],
+    }
+
+
+def _total(payload: dict[str, object]) -> int:
+    return ApproximateTokenizer().count(json.dumps(payload, separators=(",", ":")))
+
+
+def test_approximate_tokenizer_counts_word_pieces_and_punctuation() -> None:
+    tokenizer = ApproximateTokenizer()
+
+    assert tokenizer.count("") == 0
+    assert tokenizer.count("the inn") == 2
+    # "innkeeper" is three four-character pieces; "," and "." one each.
+    assert tokenizer.count("innkeeper, hi.") == 6
+
+
+def test_character_tokenizer_counts_four_characters_per_token() -> None:
+    assert CharacterTokenizer().count("") == 0
+    assert CharacterTokenizer().count("abcde") == 2
+
+
+def test_build_prompt_tokenizer_maps_the_setting() -> None:
+    assert build_prompt_tokenizer("approximate").tokenizer_identifier == "approximate-v1"
+    assert build_prompt_tokenizer("characters").tokenizer_identifier == "characters-v1"
+
+
+def test_a_zero_budget_counts_without_trimming() -> None:
+    payload = _payload()
+
+    trimmed, report = budget_prompt_payload(payload, budget=PromptBudget(), trim_order=_TRIM_ORDER)
+
+    assert trimmed == payload
+    assert report.max_tokens == 0
+    assert report.total_tokens == _total(payload)
+    assert [(s.name, s.items, s.trimmed_items) for s in report.sections] == [
+        ("npc", None, 0),
+        ("facts", 10, 0),
+        ("quests", 5, 0),
+    ]
+
+
+def test_a_payload_within_budget_is_untouched() -> None:
+    payload = _payload()
+
+    trimmed, report = budget_prompt_payload(
+        payload, budget=PromptBudget(max_tokens=_total(payload)), trim_order=_TRIM_ORDER
+    )
+
+    assert trimmed == payload
+    assert all(section.trimmed_items == 0 for section in report.sections)
+
+
+def test_the_lowest_priority_section_loses_items_first_from_its_named_end() -> None:
+    payload = _payload()
+    budget = PromptBudget(max_tokens=_total(payload) - 1)
+
+    trimmed, report = budget_prompt_payload(payload, budget=budget, trim_order=_TRIM_ORDER)
+
+    # One fact is enough, and it is the first one.
+    assert trimmed["facts"] == payload["facts"][1:]  # type: ignore[index]
+    assert trimmed["quests"] == payload["quests"]
+    assert report.trimmed_items("facts") == 1
+    assert report.trimmed_items("quests") == 0
+    assert report.total_tokens <= budget.max_tokens
+
+
+def test_the_next_section_is_trimmed_only_once_the_previous_is_empty() -> None:
+    payload = _payload()
+    without_facts = {**payload, "facts": []}
+    budget = PromptBudget(max_tokens=_total(without_facts) - 1)
+
+    trimmed, report = budget_prompt_payload(payload, budget=budget, trim_order=_TRIM_ORDER)
+
+    assert trimmed["facts"] == []
+    assert trimmed["quests"] == payload["quests"][:-1]  # type: ignore[index]
+    assert report.trimmed_items("quests") == 1
+    assert report.total_tokens <= budget.max_tokens
+
+
+def test_untrimmable_sections_are_kept_even_over_budget() -> None:
+    payload = _payload()
+
+    trimmed, report = budget_prompt_payload(
+        payload, budget=PromptBudget(max_tokens=1), trim_order=_TRIM_ORDER
+    )
+
+    assert trimmed == {"npc": payload["npc"], "facts": [], "quests": []}
+    assert report.total_tokens > 1
+    # "[]" — two punctuation tokens.
+    assert report.as_record()["sections"]["quests"] == {
+        "tokens": 2,
+        "items": 0,
+        "trimmed_items": 5,
+    }
+
+
+def test_budgeting_is_deterministic_and_leaves_the_input_alone() -> None:
+    payload = _payload()
+    original = json.dumps(payload)
+    budget = PromptBudget(max_tokens=40)
+
+    first = budget_prompt_payload(payload, budget=budget, trim_order=_TRIM_ORDER)
+    second = budget_prompt_payload(payload, budget=budget, trim_order=_TRIM_ORDER)
+
+    assert first == second
+    assert json.dumps(payload) == original
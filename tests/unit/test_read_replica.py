@@ -0,0 +1,123 @@
+"""Unit tests for dnd_ai.api.read_replica.ReplicaLagMonitor — threshold,
+probe interval, failure fallback — with the replica engine and its lag
+measurement replaced by in-memory fakes."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from dnd_ai.api.read_replica import ReplicaLagMonitor
+from tests.unit.conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+
+class FakeReplica:
+    """Stands in for the replica engine: `lag` is what the next probe
+    measures, `reachable=False` makes connecting fail, and `probes` counts
+    round trips so a test can tell a reused answer from a fresh one."""
+
+    def __init__(self) -> None:
+        self.lag: float | None = 0.5
+        self.reachable = True
+        self.probes = 0
+
+    @contextmanager
+    def connect(self) -> Iterator[object]:
+        if not self.reachable:
+            raise ConnectionRefusedError("replica down")
+        yield object()
+
+    def measure(self, _connection: Any) -> float | None:
+        self.probes += 1
+        return self.lag
+
+
+@pytest.fixture
+def replica() -> FakeReplica:
+    return FakeReplica()
+
+
+def _monitor(fake_clock: FakeClock, replica: FakeReplica) -> ReplicaLagMonitor:
+    return ReplicaLagMonitor(
+        max_lag_seconds=2.0,
+        check_interval_seconds=1.0,
+        monotonic=fake_clock,
+        measure=replica.measure,
+    )
+
+
+def _is_fresh(monitor: ReplicaLagMonitor, replica: FakeReplica) -> bool:
+    return monitor.is_fresh(replica)  # type: ignore[arg-type]
+
+
+def test_a_replica_within_the_threshold_is_fresh(
+    fake_clock: FakeClock, replica: FakeReplica
+) -> None:
+    monitor = _monitor(fake_clock, replica)
+
+    assert _is_fresh(monitor, replica)
+    assert monitor.last_lag_seconds == 0.5
+    assert monitor.fallback_count == 0
+
+
+def test_a_replica_past_the_threshold_falls_back(
+    fake_clock: FakeClock, replica: FakeReplica
+) -> None:
+    replica.lag = 2.5
+    monitor = _monitor(fake_clock, replica)
+
+    assert not _is_fresh(monitor, replica)
+    assert monitor.fallback_count == 1
+
+
+def test_a_standby_that_has_replayed_nothing_is_stale(
+    fake_clock: FakeClock, replica: FakeReplica
+) -> None:
+    replica.lag = None
+    monitor = _monitor(fake_clock, replica)
+
+    assert not _is_fresh(monitor, replica)
+
+
+def test_an_unreachable_replica_falls_back(
+    fake_clock: FakeClock, replica: FakeReplica, caplog: pytest.LogCaptureFixture
+) -> None:
+    replica.reachable = False
+    monitor = _monitor(fake_clock, replica)
+
+    assert not _is_fresh(monitor, replica)
+    assert monitor.last_lag_seconds is None
+    assert "ConnectionRefusedError" in caplog.text
+    assert "replica down" not in caplog.text
+
+
+def test_the_measurement_is_reused_within_the_interval(
+    fake_clock: FakeClock, replica: FakeReplica
+) -> None:
+    monitor = _monitor(fake_clock, replica)
+    assert _is_fresh(monitor, replica)
+
+    replica.lag = 10.0
+    fake_clock.now += 0.5
+    assert _is_fresh(monitor, replica)
+    assert replica.probes == 1
+
+    fake_clock.now += 0.5
+    assert not _is_fresh(monitor, replica)
+    assert replica.probes == 2
+
+
+def test_every_stale_answer_counts_as_a_fallback(
+    fake_clock: FakeClock, replica: FakeReplica
+) -> None:
+    replica.lag = 10.0
+    monitor = _monitor(fake_clock, replica)
+
+    for _ in range(3):
+        assert not _is_fresh(monitor, replica)
+
+    assert replica.probes == 1
+    assert monitor.fallback_count == 3
@@ -0,0 +1,18 @@
+"""Unit tests for the query normalization dnd_ai.commands.reference_corpus.
+ReferenceRetrievalCache keys on, with no database. The cache's own
+mechanics are dnd_ai.caching.GenerationCache's (tests/unit/test_caching.py);
+the triggers that make the corpus generation trustworthy, and the audit rows
+a hit still writes, are covered against a real schema in
+tests/database/test_reference_corpus.py.
+"""
+
+import pytest
+
+from dnd_ai.commands.reference_corpus import _normalize_query_text
+
+pytestmark = pytest.mark.unit
+
+
+def test_query_normalization_ignores_case_and_whitespace() -> None:
+    assert _normalize_query_text("  Fireball\tDamage\n") == "fireball damage"
+    assert _normalize_query_text('"Extra Attack"') == '"extra attack"'
@@ -0,0 +1,127 @@
+"""Unit tests for dnd_ai.api.retrieval_audit.RetrievalAuditWriter's batching,
+back pressure, shutdown flush and per-record retry, with the database write
+(`_insert_retrieval_audits`) replaced by an in-memory fake. The statement
+itself is covered against a real schema in
+tests/database/test_reference_corpus.py.
+"""
+
+import threading
+import uuid
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from dnd_ai.api import retrieval_audit
+from dnd_ai.api.retrieval_audit import RetrievalAuditWriter
+from dnd_ai.commands.reference_corpus import RetrievalAuditRecord
+
+pytestmark = pytest.mark.unit
+
+
+class FakeEngine:
+    @contextmanager
+    def begin(self) -> Iterator[object]:
+        yield object()
+
+
+class FakeInsert:
+    """Records each written batch's size; `gate` lets a test hold the
+    writer mid-write, and `poisoned` ids fail any batch containing them."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[uuid.UUID]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.poisoned: set[uuid.UUID] = set()
+
+    def __call__(self, _connection: Any, records: Sequence[RetrievalAuditRecord]) -> None:
+        self.gate.wait(timeout=5)
+        ids = [record.reference_retrieval_id for record in records]
+        if self.poisoned.intersection(ids):
+            raise RuntimeError("insert failed")
+        self.batches.append(ids)
+
+
+@pytest.fixture
+def insert(monkeypatch: pytest.MonkeyPatch) -> FakeInsert:
+    fake = FakeInsert()
+    monkeypatch.setattr(retrieval_audit, "_insert_retrieval_audits", fake)
+    return fake
+
+
+def _record() -> RetrievalAuditRecord:
+    return RetrievalAuditRecord(
+        reference_retrieval_id=uuid.uuid4(),
+        campaign_id=uuid.uuid4(),
+        ruleset_version_id=uuid.uuid4(),
+        query_text="fireball",
+        requested_by_user_id=None,
+        context_request_id=None,
+        embedding_model=None,
+        passages=(),
+    )
+
+
+def _writer(**overrides: Any) -> RetrievalAuditWriter:
+    kwargs: dict[str, Any] = {"batch_size": 100, "flush_interval_seconds": 0.05, "max_queued": 100}
+    kwargs.update(overrides)
+    return RetrievalAuditWriter(FakeEngine(), **kwargs)  # type: ignore[arg-type]
+
+
+def test_records_are_written_in_batches(insert: FakeInsert) -> None:
+    insert.gate.clear()
+    writer = _writer(batch_size=3, flush_interval_seconds=0.5)
+    records = [_record() for _ in range(7)]
+    for record in records:
+        assert writer.submit(record)
+    insert.gate.set()
+    writer.flush()
+    writer.close()
+
+    assert [len(batch) for batch in insert.batches] == [3, 3, 1]
+    written = [record_id for batch in insert.batches for record_id in batch]
+    assert written == [record.reference_retrieval_id for record in records]
+    assert writer.stats().written == 7
+
+
+def test_a_full_queue_refuses_the_record(insert: FakeInsert) -> None:
+    insert.gate.clear()
+    writer = _writer(max_queued=1)
+    assert writer.submit(_record())
+    # The writer thread may already hold the first record; keep submitting
+    # until the one-slot queue is full.
+    while writer.submit(_record()):
+        pass
+
+    assert writer.stats().refused == 1
+    insert.gate.set()
+    writer.close()
+
+
+def test_close_writes_everything_queued_then_refuses(insert: FakeInsert) -> None:
+    writer = _writer(flush_interval_seconds=60)
+    for _ in range(5):
+        writer.submit(_record())
+
+    writer.close()
+
+    assert sum(len(batch) for batch in insert.batches) == 5
+    assert writer.submit(_record()) is False
+    assert writer.stats().refused == 1
+
+
+def test_a_failed_batch_is_retried_one_record_at_a_time(insert: FakeInsert) -> None:
+    insert.gate.clear()
+    writer = _writer()
+    good, bad = _record(), _record()
+    insert.poisoned.add(bad.reference_retrieval_id)
+    writer.submit(good)
+    writer.submit(bad)
+    insert.gate.set()
+    writer.close()
+
+    assert [good.reference_retrieval_id] in insert.batches
+    stats = writer.stats()
+    assert (stats.written, stats.failed) == (1, 1)
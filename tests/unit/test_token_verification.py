@@ -10,15 +10,17 @@ import base64
 import hashlib
 import hmac
 import json
+import time
 from datetime import timedelta
 
 import jwt
 import pytest
 from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 
 from dnd_ai.domain.errors import AuthenticationError
-from dnd_ai.domain.tokens import verify_bearer_token
-from tests.jwt_helpers import generate_test_rsa_keypair, make_signed_jwt
+from dnd_ai.domain.tokens import VerifiedTokenCache, verify_bearer_token
+from tests.jwt_helpers import RSAKeypair, generate_test_rsa_keypair, make_signed_jwt
 
 pytestmark = pytest.mark.unit
 
@@ -227,3 +229,150 @@ def test_a_token_with_a_non_string_email_claim_is_rejected() -> None:
             audience=_AUDIENCE,
             get_signing_key=lambda kid: keypair.public_key,
         )
+
+
+# ---------------------------------------------------------------------------
+# VerifiedTokenCache
+# ---------------------------------------------------------------------------
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingResolver:
+    def __init__(self, keypair: RSAKeypair) -> None:
+        self._keypair = keypair
+        self.calls = 0
+
+    def __call__(self, kid: str) -> RSAPublicKey:
+        self.calls += 1
+        return self._keypair.public_key
+
+
+def test_a_cached_token_skips_signing_key_resolution() -> None:
+    keypair = generate_test_rsa_keypair()
+    resolver = _CountingResolver(keypair)
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=300)
+    token = make_signed_jwt(keypair, issuer=_ISSUER, audience=_AUDIENCE, subject="user-123")
+
+    first = verify_bearer_token(
+        token, issuer=_ISSUER, audience=_AUDIENCE, get_signing_key=resolver, cache=cache
+    )
+    second = verify_bearer_token(
+        token, issuer=_ISSUER, audience=_AUDIENCE, get_signing_key=resolver, cache=cache
+    )
+
+    assert second == first
+    assert second.subject == "user-123"
+    assert resolver.calls == 1
+
+
+@pytest.mark.parametrize(
+    ("issuer", "audience"),
+    [("https://other-idp.example", _AUDIENCE), (_ISSUER, "other-audience")],
+)
+def test_a_cached_token_is_never_served_for_a_different_issuer_or_audience(
+    issuer: str, audience: str
+) -> None:
+    keypair = generate_test_rsa_keypair()
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=300)
+    token = make_signed_jwt(keypair, issuer=_ISSUER, audience=_AUDIENCE)
+    verify_bearer_token(
+        token,
+        issuer=_ISSUER,
+        audience=_AUDIENCE,
+        get_signing_key=lambda kid: keypair.public_key,
+        cache=cache,
+    )
+
+    with pytest.raises(AuthenticationError):
+        verify_bearer_token(
+            token,
+            issuer=issuer,
+            audience=audience,
+            get_signing_key=lambda kid: keypair.public_key,
+            cache=cache,
+        )
+
+
+def test_a_cached_token_is_reverified_once_its_expiry_minus_leeway_passes() -> None:
+    keypair = generate_test_rsa_keypair()
+    resolver = _CountingResolver(keypair)
+    clock = _FakeClock()
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=3600, clock=clock)
+    token = make_signed_jwt(
+        keypair, issuer=_ISSUER, audience=_AUDIENCE, expires_delta=timedelta(minutes=5)
+    )
+    exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+    verify_bearer_token(
+        token,
+        issuer=_ISSUER,
+        audience=_AUDIENCE,
+        get_signing_key=resolver,
+        leeway_seconds=60,
+        cache=cache,
+    )
+
+    clock.now = exp - 61
+    assert cache.get(token, issuer=_ISSUER, audience=_AUDIENCE) is not None
+    clock.now = exp - 60
+    assert cache.get(token, issuer=_ISSUER, audience=_AUDIENCE) is None
+    assert len(cache) == 0
+
+
+def test_a_cached_token_is_reverified_after_the_max_ttl() -> None:
+    keypair = generate_test_rsa_keypair()
+    resolver = _CountingResolver(keypair)
+    clock = _FakeClock()
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=30, clock=clock)
+    token = make_signed_jwt(keypair, issuer=_ISSUER, audience=_AUDIENCE)
+    verify_bearer_token(
+        token, issuer=_ISSUER, audience=_AUDIENCE, get_signing_key=resolver, cache=cache
+    )
+
+    clock.now += 31
+    verify_bearer_token(
+        token, issuer=_ISSUER, audience=_AUDIENCE, get_signing_key=resolver, cache=cache
+    )
+
+    assert resolver.calls == 2
+
+
+def test_a_token_inside_its_leeway_window_is_accepted_but_not_cached() -> None:
+    keypair = generate_test_rsa_keypair()
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=300)
+    token = make_signed_jwt(
+        keypair, issuer=_ISSUER, audience=_AUDIENCE, expires_delta=timedelta(seconds=30)
+    )
+
+    verify_bearer_token(
+        token,
+        issuer=_ISSUER,
+        audience=_AUDIENCE,
+        get_signing_key=lambda kid: keypair.public_key,
+        cache=cache,
+    )
+
+    assert len(cache) == 0
+
+
+def test_a_rejected_token_is_never_cached() -> None:
+    keypair = generate_test_rsa_keypair()
+    wrong = generate_test_rsa_keypair(kid=keypair.kid)
+    resolver = _CountingResolver(wrong)
+    cache = VerifiedTokenCache(max_entries=8, max_ttl_seconds=300)
+    token = make_signed_jwt(keypair, issuer=_ISSUER, audience=_AUDIENCE)
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            verify_bearer_token(
+                token, issuer=_ISSUER, audience=_AUDIENCE, get_signing_key=resolver, cache=cache
+            )
+
+    assert resolver.calls == 2
+    assert len(cache) == 0